@@ -33,6 +33,7 @@ from app.modules.rh import models as _rh_models
 from app.modules.paie import models as _paie_models
 from app.modules.immobilisations import models as _immobilisations_models
 from app.modules.systeme import models as _systeme_models
+from app.modules.rapports import models as _rapports_models
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,28 @@
+"""add_familles_produits_deleted_at
+
+Revision ID: a8d3e5f91c24
+Revises: f2a9c4e71d38
+Create Date: 2026-10-16
+
+Colonne deleted_at sur familles_produits : suppression logique déjà utilisée
+par le service et le repository (filtre deleted_at IS NULL), absente du schéma.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d3e5f91c24"
+down_revision: Union[str, None] = "f2a9c4e71d38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("familles_produits", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("familles_produits", "deleted_at")
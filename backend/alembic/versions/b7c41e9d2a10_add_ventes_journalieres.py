@@ -0,0 +1,66 @@
+"""add_ventes_journalieres
+
+Revision ID: b7c41e9d2a10
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16
+
+Table de faits ventes_journalieres (agrégat quotidien des factures par entreprise,
+PDV, client et type de facture) pour les rapports CA et tableau de bord.
+Alimentée immédiatement depuis les factures existantes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c41e9d2a10"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ventes_journalieres",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("entreprise_id", sa.Integer(), nullable=False),
+        sa.Column("point_de_vente_id", sa.Integer(), nullable=False),
+        sa.Column("client_id", sa.Integer(), nullable=False),
+        sa.Column("date_vente", sa.Date(), nullable=False),
+        sa.Column("type_facture", sa.String(length=20), nullable=False),
+        sa.Column("montant_ht", sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column("montant_tva", sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column("montant_ttc", sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column("nombre_factures", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["client_id"], ["tiers.id"]),
+        sa.ForeignKeyConstraint(["entreprise_id"], ["entreprises.id"]),
+        sa.ForeignKeyConstraint(["point_de_vente_id"], ["points_de_vente.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "entreprise_id",
+            "date_vente",
+            "point_de_vente_id",
+            "client_id",
+            "type_facture",
+            name="uq_ventes_journalieres_cle",
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO ventes_journalieres (
+            entreprise_id, date_vente, point_de_vente_id, client_id, type_facture,
+            montant_ht, montant_tva, montant_ttc, nombre_factures
+        )
+        SELECT entreprise_id, date_facture, point_de_vente_id, client_id, type_facture,
+               COALESCE(SUM(montant_ht), 0), COALESCE(SUM(montant_tva), 0),
+               COALESCE(SUM(montant_ttc), 0), COUNT(id)
+        FROM factures
+        GROUP BY entreprise_id, date_facture, point_de_vente_id, client_id, type_facture
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ventes_journalieres")
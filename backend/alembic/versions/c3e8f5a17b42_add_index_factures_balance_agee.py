@@ -0,0 +1,32 @@
+"""add_index_factures_balance_agee
+
+Revision ID: c3e8f5a17b42
+Revises: b7c41e9d2a10
+Create Date: 2026-10-16
+
+Index composite factures (entreprise_id, client_id, date_echeance,
+montant_restant_du) pour la balance âgée des créances clients.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8f5a17b42"
+down_revision: Union[str, None] = "b7c41e9d2a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_factures_balance_agee",
+        "factures",
+        ["entreprise_id", "client_id", "date_echeance", "montant_restant_du"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_factures_balance_agee", table_name="factures")
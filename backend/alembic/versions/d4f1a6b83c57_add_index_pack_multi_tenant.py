@@ -0,0 +1,79 @@
+"""add_index_pack_multi_tenant
+
+Revision ID: d4f1a6b83c57
+Revises: c3e8f5a17b42
+Create Date: 2026-10-16
+
+Index composites alignés sur les requêtes des repositories (filtre
+entreprise_id puis tri par date, clé keyset (date, id)), index des lignes
+d'écritures et des mouvements de stock, index partiels deleted_at IS NULL
+pour produits et tiers. Sur PostgreSQL : CREATE INDEX CONCURRENTLY (hors
+transaction, sans bloquer les écritures).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f1a6b83c57"
+down_revision: Union[str, None] = "c3e8f5a17b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_NON_SUPPRIME = sa.text("deleted_at IS NULL")
+
+# (nom, table, colonnes, condition d'index partiel)
+_INDEXES = [
+    ("ix_factures_entreprise_date", "factures", ["entreprise_id", "date_facture", "id"], None),
+    ("ix_reglements_entreprise_date", "reglements", ["entreprise_id", "date_reglement"], None),
+    ("ix_ecritures_comptables_entreprise_date", "ecritures_comptables", ["entreprise_id", "date_ecriture", "id"], None),
+    ("ix_journaux_audit_entreprise_created", "journaux_audit", ["entreprise_id", "created_at", "id"], None),
+    ("ix_lignes_ecritures_ecriture", "lignes_ecritures", ["ecriture_id"], None),
+    ("ix_lignes_ecritures_compte", "lignes_ecritures", ["compte_id"], None),
+    ("ix_mouvements_stock_produit_date", "mouvements_stock", ["produit_id", "date_mouvement", "id"], None),
+    ("ix_mouvements_stock_depot_date", "mouvements_stock", ["depot_id", "date_mouvement", "id"], None),
+    ("ix_mouvements_stock_depot_dest", "mouvements_stock", ["depot_dest_id"], None),
+    ("ix_produits_entreprise_libelle_actifs", "produits", ["entreprise_id", "libelle"], _NON_SUPPRIME),
+    ("ix_tiers_entreprise_raison_sociale_actifs", "tiers", ["entreprise_id", "raison_sociale"], _NON_SUPPRIME),
+]
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    concurrently = _is_postgresql()
+    if concurrently:
+        # CREATE INDEX CONCURRENTLY est interdit dans une transaction
+        with op.get_context().autocommit_block():
+            _create_all(concurrently=True)
+    else:
+        _create_all(concurrently=False)
+
+
+def _create_all(*, concurrently: bool) -> None:
+    for name, table, columns, where in _INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            postgresql_where=where,
+            sqlite_where=where,
+            postgresql_concurrently=concurrently,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    concurrently = _is_postgresql()
+    if concurrently:
+        with op.get_context().autocommit_block():
+            for name, table, _columns, _where in reversed(_INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _columns, _where in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
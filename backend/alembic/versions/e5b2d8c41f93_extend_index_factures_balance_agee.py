@@ -0,0 +1,40 @@
+"""extend_index_factures_balance_agee
+
+Revision ID: e5b2d8c41f93
+Revises: a8d3e5f91c24
+Create Date: 2026-10-16
+
+Index ix_factures_balance_agee recréé avec type_facture (filtre égalité, après
+entreprise_id) et date_facture (repli de COALESCE(date_echeance, date_facture)) :
+la requête de balance âgée est servie par l'index seul.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b2d8c41f93"
+down_revision: Union[str, None] = "a8d3e5f91c24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_factures_balance_agee", table_name="factures")
+    op.create_index(
+        "ix_factures_balance_agee",
+        "factures",
+        ["entreprise_id", "type_facture", "client_id", "date_echeance", "date_facture", "montant_restant_du"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_factures_balance_agee", table_name="factures")
+    op.create_index(
+        "ix_factures_balance_agee",
+        "factures",
+        ["entreprise_id", "client_id", "date_echeance", "montant_restant_du"],
+        unique=False,
+    )
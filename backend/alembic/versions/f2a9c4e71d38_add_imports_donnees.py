@@ -0,0 +1,53 @@
+"""add_imports_donnees
+
+Revision ID: f2a9c4e71d38
+Revises: d4f1a6b83c57
+Create Date: 2026-10-16
+
+Table imports_donnees : suivi des imports en masse CSV/XLSX (produits, tiers,
+employés, plan comptable) exécutés par lots en tâche de fond, avec la
+progression nécessaire à leur reprise.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a9c4e71d38"
+down_revision: Union[str, None] = "d4f1a6b83c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "imports_donnees",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("entreprise_id", sa.Integer(), nullable=False),
+        sa.Column("utilisateur_id", sa.Integer(), nullable=True),
+        sa.Column("type_import", sa.String(length=30), nullable=False),
+        sa.Column("nom_fichier", sa.String(length=255), nullable=False),
+        sa.Column("chemin", sa.String(length=500), nullable=False),
+        sa.Column("statut", sa.String(length=20), nullable=False),
+        sa.Column("lignes_traitees", sa.Integer(), nullable=False),
+        sa.Column("lignes_importees", sa.Integer(), nullable=False),
+        sa.Column("lignes_en_erreur", sa.Integer(), nullable=False),
+        sa.Column("erreurs", sa.JSON(), nullable=True),
+        sa.Column("message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("termine_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["entreprise_id"], ["entreprises.id"]),
+        sa.ForeignKeyConstraint(["utilisateur_id"], ["utilisateurs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_imports_donnees_entreprise_created", "imports_donnees", ["entreprise_id", "created_at"])
+    op.create_index("ix_imports_donnees_statut", "imports_donnees", ["statut"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_imports_donnees_statut", table_name="imports_donnees")
+    op.drop_index("ix_imports_donnees_entreprise_created", table_name="imports_donnees")
+    op.drop_table("imports_donnees")
@@ -30,6 +30,9 @@ class Settings(BaseSettings):
     DEBUG: bool = Field(default=True, description="Mode debug (logs détaillés, traces)")
     HOST: str = Field(default="0.0.0.0", description="Adresse d'écoute du serveur")
     PORT: int = Field(default=9111, ge=1, le=65535, description="Port du serveur")
+    WEB_CONCURRENCY: int = Field(
+        default=1, ge=1, description="Nombre de workers (lu aussi par uvicorn/gunicorn) ; > 1 sans REDIS_URL : caches versionnés (rapports, référentiels, authentification) et ETag désactivés"
+    )
     API_V1_PREFIX: str = Field(default="/api/v1", description="Préfixe des routes API v1")
     TIMEZONE: str = Field(default="Africa/Douala", description="Fuseau horaire (Cameroun)")
     FRONTEND_URL: str = Field(default="http://localhost:3000", description="URL du frontend (CORS, redirections)")
@@ -50,6 +53,14 @@ class Settings(BaseSettings):
     DATABASE_MAX_OVERFLOW: int = Field(default=10, ge=0, description="Connexions supplémentaires autorisées")
     DATABASE_ECHO: bool = Field(default=False, description="Logger les requêtes SQL (debug)")
 
+    # --- SQLite (profil haut débit, ignoré pour PostgreSQL et :memory:) ---
+    SQLITE_TUNED: bool = Field(default=True, description="Profil SQLite : WAL, pragmas, pool de connexions (false = NullPool sans pragma)")
+    SQLITE_POOL_SIZE: int = Field(default=5, ge=1, le=50, description="Connexions SQLite réutilisées")
+    SQLITE_SERIALIZE_WRITES: bool = Field(default=True, description="Écrivain unique : les transactions d'écriture passent une à une")
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(default=5000, ge=0, description="Attente max (ms) d'un verrou SQLite avant « database is locked »")
+    SQLITE_CACHE_SIZE_KB: int = Field(default=65536, ge=0, description="Cache de pages par connexion (Kio)")
+    SQLITE_MMAP_SIZE: int = Field(default=268_435_456, ge=0, description="Taille du mmap SQLite (octets, 0 = désactivé)")
+
     # --- Sécurité & JWT ---
     # Valeur par défaut pour exe Windows sans .env ; en production, définir SECRET_KEY dans .env
     SECRET_KEY: str = Field(
@@ -58,10 +69,30 @@ class Settings(BaseSettings):
         description="Clé secrète pour signature JWT (min 32 caractères)",
     )
     ALGORITHM: str = Field(default="HS256", description="Algorithme de signature JWT")
+    JWT_BACKEND: str = Field(
+        default="jose", description="Implémentation JWT (jose|native : HMAC de la bibliothèque standard, HS256/384/512)"
+    )
+    JWT_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000, ge=0, description="Tokens d'accès vérifiés gardés en cache jusqu'à leur expiration (0 = désactivé)"
+    )
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=60, ge=1, description="Durée de validité du token d'accès (minutes)")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, ge=1, description="Durée de validité du token de rafraîchissement (jours)")
     BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=18, description="Coût bcrypt (hash mot de passe)")
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=2, ge=1, le=32, description="Calculs bcrypt simultanés (threads dédiés, hors boucle d'événements)"
+    )
     RATE_LIMIT_PER_MINUTE: int = Field(default=60, ge=0, description="Requêtes max par minute par IP (0 = désactivé)")
+    RATE_LIMIT_PER_USER_PER_MINUTE: int = Field(
+        default=0, ge=0, description="Requêtes max par minute par utilisateur authentifié (0 = désactivé)"
+    )
+    RATE_LIMIT_ROUTES: str = Field(
+        default="",
+        description="Limites par préfixe de route, par client : \"/api/v1/auth/login=10,/api/v1/rapports=30\"",
+    )
+    RATE_LIMIT_MAX_KEYS: int = Field(default=100_000, ge=1, description="Clients suivis en mémoire par processus (LRU)")
+    AUTH_CACHE_TTL_SECONDS: float = Field(
+        default=60.0, ge=0, description="Durée de vie du cache utilisateur/permissions par rôle (secondes, 0 = désactivé ; désactivé aussi si WEB_CONCURRENCY > 1 sans REDIS_URL)"
+    )
 
     # --- CORS ---
     CORS_ORIGINS: str = Field(
@@ -74,6 +105,11 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = Field(default=20, ge=1, le=500, description="Nombre d'éléments par page par défaut")
     MAX_PAGE_SIZE: int = Field(default=100, ge=1, le=500, description="Nombre max d'éléments par page")
 
+    # --- Rapports ---
+    DASHBOARD_METRIC_TIMEOUT_SECONDS: float = Field(
+        default=5.0, gt=0, description="Délai max (secondes) par indicateur du tableau de bord (au-delà : indisponible)"
+    )
+
     # --- Locale & devise (Cameroun) ---
     DEFAULT_LOCALE: str = Field(default="fr_FR", description="Locale par défaut")
     DEFAULT_CURRENCY_CODE: str = Field(default="XAF", description="Code devise par défaut (FCFA)")
@@ -83,16 +119,56 @@ class Settings(BaseSettings):
     # --- Fichiers ---
     MEDIA_ROOT: str = Field(default="./media", description="Répertoire des uploads et pièces jointes")
     MAX_UPLOAD_SIZE: int = Field(default=10_485_760, ge=0, description="Taille max d'un fichier uploadé (octets, 10 Mo)")
+    IMPORT_MAX_UPLOAD_SIZE: int = Field(
+        default=104_857_600, ge=0, description="Taille max d'un fichier d'import en masse CSV/XLSX (octets, 100 Mo)"
+    )
+    IMPORT_BATCH_SIZE: int = Field(default=1000, ge=1, le=10_000, description="Lignes validées et insérées par transaction lors d'un import")
+    IMPORT_MAX_ERRORS: int = Field(default=1000, ge=0, description="Lignes rejetées détaillées par import (les suivantes sont seulement comptées)")
+    IMPORT_STALE_SECONDS: int = Field(
+        default=300, ge=30, description="Import en cours sans progression depuis ce délai : considéré abandonné et reprenable"
+    )
+    EXPORT_YIELD_PER: int = Field(
+        default=1000, ge=100, le=50_000, description="Lignes lues par aller-retour du curseur serveur lors d'un export en flux"
+    )
+    EXPORT_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="Niveau de compression gzip des exports (si le client accepte gzip)")
 
     # --- Cache & session ---
     REDIS_URL: str | None = Field(default=None, description="URL Redis (vide = cache mémoire)")
-    CACHE_SESSION_TTL_MINUTES: int = Field(default=1440, ge=1, description="TTL du cache de travail (minutes)")
+    CACHE_SESSION_TTL_MINUTES: int = Field(default=1440, ge=0, description="TTL du cache applicatif, ex. référentiels (minutes, 0 = désactivé)")
+    CACHE_MAX_ENTRIES: int = Field(default=4096, ge=1, description="Nombre max d'entrées du cache applicatif en mémoire par processus (LRU)")
     ENABLE_SESSION_RECOVERY: bool = Field(default=True, description="Activer la reprise de session")
+    REPORT_CACHE_TTL_SECONDS: float = Field(
+        default=300.0, ge=0, description="Durée de vie des rapports en cache (secondes, 0 = cache désactivé)"
+    )
+    REPORT_CACHE_MAX_ENTRIES: int = Field(
+        default=1024, ge=1, description="Nombre max de rapports en cache mémoire par processus (LRU)"
+    )
 
     # --- Logging ---
     LOG_LEVEL: str = Field(default="INFO", description="Niveau de log (DEBUG|INFO|WARNING|ERROR)")
     LOG_FORMAT: str = Field(default="json", description="Format des logs (json|text)")
     LOG_FILE: str | None = Field(default=None, description="Fichier de log (vide = console uniquement)")
+    LOG_DEBUG_SAMPLE_RATE: float = Field(default=1.0, ge=0, le=1, description="Fraction des logs DEBUG conservés (0..1)")
+    LOG_QUEUE_SIZE: int = Field(default=10_000, ge=1, description="Capacité de la file de logs vers le thread d'écriture")
+    LOG_ACCESS_ENABLED: bool = Field(default=True, description="Journal d'accès structuré (statut, latency_ms) par requête")
+
+    # --- Métriques ---
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="Exposer GET /metrics (format Prometheus) et instrumenter HTTP/SQL ; sans effet si WEB_CONCURRENCY > 1 (métriques propres au processus)",
+    )
+    SERVER_TIMING_ENABLED: bool = Field(default=True, description="En-tête Server-Timing (temps DB, nombre de requêtes SQL, temps total)")
+    SQL_N_PLUS_ONE_THRESHOLD: int = Field(
+        default=5, ge=2, description="En DEBUG : exécutions d'une même requête SQL au-delà desquelles un N+1 est journalisé"
+    )
+
+    # --- Démarrage ---
+    LAZY_ROUTERS: bool = Field(
+        default=False, description="Importer le routeur d'un module au premier appel de son préfixe (démarrage plus rapide)"
+    )
+    OPENAPI_SCHEMA_FILE: str | None = Field(
+        default=None, description="Schéma OpenAPI pré-calculé (scripts/export_openapi.py) servi tel quel ; vide = généré à la demande"
+    )
 
     # --- Synchronisation (offline / batch) ---
     SYNC_BATCH_SIZE: int = Field(default=100, ge=1, le=10_000, description="Taille des lots pour la synchro")
@@ -115,6 +191,14 @@ class Settings(BaseSettings):
     SENTRY_ENVIRONMENT: str = Field(default="development", description="Environnement Sentry")
     SENTRY_TRACES_SAMPLE_RATE: float = Field(default=0.1, ge=0.0, le=1.0, description="Taux d'échantillonnage des traces")
 
+    def metrics_active(self) -> bool:
+        """
+        /metrics et instrumentation HTTP/SQL actifs. Le registre est propre au
+        processus : avec plusieurs workers, chaque scrape ne verrait qu'un
+        worker au hasard (compteurs incohérents), d'où la désactivation.
+        """
+        return self.METRICS_ENABLED and self.WEB_CONCURRENCY == 1
+
     def cors_origins_list(self) -> list[str]:
         """
         Retourne la liste des origines CORS (chaque valeur est une origine autorisée).
@@ -0,0 +1,261 @@
+# app/core/bulk_import.py
+# -----------------------------------------------------------------------------
+# Import en masse de données de référence (produits, tiers, employés, plan
+# comptable) depuis un fichier CSV ou XLSX, par lots.
+# - iter_rows() : lecture en flux, une ligne à la fois (csv de la bibliothèque
+#   standard ; XLSX via openpyxl en lecture seule, dépendance optionnelle :
+#   pip install "gesco[import]", importée au premier fichier XLSX).
+# - Importer : entité importable (schéma de création, modèle ORM, clé
+#   naturelle unique par entreprise, références). process_batch() valide un
+#   lot avec une requête IN par référence et une pour les clés déjà en base,
+#   puis insère les lignes valides en une seule instruction (executemany).
+# - Références : colonne <champ> (id) ou <préfixe>_code (code lisible, ex.
+#   famille_code), résolues pour tout le lot.
+# Suivi des travaux (table imports_donnees, reprise, tâche de fond) : module
+# Système. Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import csv
+from collections.abc import Iterator
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+IMPORT_EXTENSIONS = (".csv", ".xlsx")
+
+
+class ImportFormatError(Exception):
+    """Fichier illisible (encodage, format, en-tête absent, openpyxl manquant)."""
+
+
+def _header(name: Any) -> str:
+    return str(name or "").strip().lower().replace(" ", "_")
+
+
+def _cell(value: Any) -> str | None:
+    """Cellule XLSX → texte, comme une cellule CSV (le schéma de création convertit)."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == datetime.min.time() else value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _iter_csv(path: Path) -> Iterator[dict[str, Any]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(8192)
+        f.seek(0)
+        # Export Excel en France / Cameroun : séparateur point-virgule
+        delimiter = ";" if sample.count(";") > sample.count(",") else ","
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ImportFormatError("En-tête absent")
+        keys = [_header(h) for h in header]
+        for values in reader:
+            yield {k: v for k, v in zip(keys, values, strict=False) if k}
+
+
+def _iter_xlsx(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        from openpyxl import load_workbook  # dépendance optionnelle
+    except ImportError as err:
+        raise ImportFormatError('Import XLSX indisponible : pip install "gesco[import]"') from err
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header:
+            raise ImportFormatError("En-tête absent")
+        keys = [_header(h) for h in header]
+        for values in rows:
+            yield {k: _cell(v) for k, v in zip(keys, values, strict=False) if k}
+    finally:
+        workbook.close()
+
+
+def iter_rows(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Lignes de données du fichier, dans l'ordre (en-têtes en minuscules, espaces
+    remplacés par _). Les lignes vides sont conservées ({}), pour que le numéro
+    de ligne reste stable d'une reprise à l'autre.
+    """
+    path = Path(path)
+    reader = _iter_xlsx if path.suffix.lower() == ".xlsx" else _iter_csv
+    try:
+        yield from reader(path)
+    except UnicodeDecodeError as err:
+        raise ImportFormatError("Fichier CSV attendu en UTF-8") from err
+    except (csv.Error, OSError) as err:
+        raise ImportFormatError(str(err)) from err
+
+
+class Reference:
+    """Clé étrangère importable par id (<champ>) ou par code (<préfixe>_code)."""
+
+    def __init__(self, field: str, model: type, *, code_column: str = "code", scoped: bool = False) -> None:
+        self.field = field
+        self.code_field = field.removesuffix("_id") + "_code"
+        self.model = model
+        self.code_column = code_column
+        self.scoped = scoped  # True : limitée aux lignes de l'entreprise importée
+
+    async def resolve(self, db: AsyncSession, entreprise_id: int, rows: list[dict[str, Any]]) -> tuple[set[int], dict[str, int]]:
+        """Ids existants et correspondance code → id, en une requête pour tout le lot."""
+        ids: set[int] = set()
+        codes: set[str] = set()
+        for row in rows:
+            if row.get(self.code_field):
+                codes.add(row[self.code_field])
+            elif row.get(self.field):
+                try:
+                    ids.add(int(row[self.field]))
+                except ValueError:
+                    pass  # signalé par la validation du schéma
+        if not ids and not codes:
+            return set(), {}
+        code_col = getattr(self.model, self.code_column)
+        q = select(self.model.id, code_col).where(or_(self.model.id.in_(ids), code_col.in_(codes)))
+        if self.scoped:
+            q = q.where(self.model.entreprise_id == entreprise_id)
+        found = (await db.execute(q)).all()
+        return {r[0] for r in found}, {r[1]: r[0] for r in found}
+
+
+def _errors_text(err: ValidationError) -> str:
+    return " ; ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or 'ligne'} : {e['msg']}" for e in err.errors(include_url=False)
+    )
+
+
+class Importer:
+    """
+    Entité importable. Sous-classes (un fichier imports.py par module) :
+    name, model, schema (schéma de création existant), key (clé naturelle
+    unique par entreprise), references ; check() et values() pour les
+    contrôles et transformations du service de création.
+    """
+
+    name: str
+    model: type
+    schema: type[BaseModel]
+    key: str
+    references: tuple[Reference, ...] = ()
+
+    def __init__(self) -> None:
+        self._columns = {c.key for c in sa_inspect(self.model).column_attrs}
+        self._decimal_fields = {
+            name for name, f in self.schema.model_fields.items() if "Decimal" in str(f.annotation)
+        }
+
+    def check(self, item: BaseModel) -> str | None:
+        """Contrôles métier sans accès base ; message d'erreur ou None."""
+        return None
+
+    def values(self, item: BaseModel) -> dict[str, Any]:
+        """Colonnes insérées (textes nettoyés, énumérations en valeur)."""
+        data = {}
+        for name, value in item.model_dump().items():
+            if name not in self._columns:
+                continue
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, str):
+                value = value.strip() or None
+            data[name] = value
+        return data
+
+    def existing_filter(self) -> list[Any]:
+        """Conditions supplémentaires du contrôle d'unicité (ex. exclure les supprimés)."""
+        return []
+
+    def _prepare(self, row: dict[str, Any], entreprise_id: int, resolved: list[tuple[set[int], dict[str, int]]]) -> tuple[BaseModel | None, str | None]:
+        data: dict[str, Any] = {}
+        for name, value in row.items():
+            if isinstance(value, str):
+                value = value.strip()
+            if value in (None, ""):
+                continue  # valeur par défaut du schéma
+            if name in self._decimal_fields and isinstance(value, str):
+                value = value.replace(" ", "").replace(",", ".")
+            data[name] = value
+        for ref, (ids, codes) in zip(self.references, resolved, strict=True):
+            code = data.pop(ref.code_field, None)
+            if code is not None:
+                if code not in codes:
+                    return None, f"{ref.code_field} inconnu : {code}"
+                data[ref.field] = codes[code]
+            elif ref.field in data and str(data[ref.field]).isdigit() and int(data[ref.field]) not in ids:
+                return None, f"{ref.field} inconnu : {data[ref.field]}"
+        data["entreprise_id"] = entreprise_id
+        try:
+            item = self.schema.model_validate(data)
+        except ValidationError as err:
+            return None, _errors_text(err)
+        return item, self.check(item)
+
+    async def process_batch(
+        self,
+        db: AsyncSession,
+        entreprise_id: int,
+        rows: list[tuple[int, dict[str, Any]]],
+        seen_keys: set[str],
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """
+        Valide et insère un lot de (numéro de ligne, ligne). seen_keys : clés
+        déjà rencontrées dans le fichier (doublons internes). Retourne le
+        nombre de lignes insérées et les erreurs [{ligne, erreur}]. N'effectue
+        pas le commit.
+        """
+        rows = [(n, r) for n, r in rows if any(v not in (None, "") for v in r.values())]
+        if not rows:
+            return 0, []
+        plain = [r for _, r in rows]
+        resolved = [await ref.resolve(db, entreprise_id, plain) for ref in self.references]
+
+        errors: list[dict[str, Any]] = []
+        candidates: list[tuple[int, str, BaseModel]] = []
+        for line, row in rows:
+            item, error = self._prepare(row, entreprise_id, resolved)
+            key = str(getattr(item, self.key, "") or "").strip() if item is not None else ""
+            if error is None and not key:
+                error = f"{self.key} vide"
+            if error is None and key in seen_keys:
+                error = f"{self.key} en double dans le fichier : {key}"
+            if error is not None:
+                errors.append({"ligne": line, "erreur": error})
+                continue
+            seen_keys.add(key)
+            candidates.append((line, key, item))
+
+        if candidates:
+            key_col = getattr(self.model, self.key)
+            q = select(key_col).where(
+                self.model.entreprise_id == entreprise_id,
+                key_col.in_([k for _, k, _ in candidates]),
+                *self.existing_filter(),
+            )
+            existing = set((await db.execute(q)).scalars().all())
+            values = []
+            for line, key, item in candidates:
+                if key in existing:
+                    errors.append({"ligne": line, "erreur": f"{self.key} existe déjà : {key}"})
+                else:
+                    values.append({**self.values(item), self.key: key})
+            if values:
+                await db.execute(insert(self.model), values)
+            inserted = len(values)
+        else:
+            inserted = 0
+        errors.sort(key=lambda e: e["ligne"])
+        return inserted, errors
@@ -0,0 +1,272 @@
+# app/core/cache.py
+# -----------------------------------------------------------------------------
+# Backends de cache clé/valeur asynchrones.
+# - MemoryCacheBackend : LRU borné en mémoire du processus, TTL par entrée.
+# - RedisCacheBackend : cache partagé entre workers (REDIS_URL), valeurs en
+#   octets. Le paquet redis est optionnel (pip install "gesco[cache]") :
+#   import différé au premier usage.
+# - NamespacedCache (get_cache) : cache applicatif à deux niveaux (mémoire du
+#   processus puis Redis), clés préfixées par espace de noms et entreprise,
+#   TTL CACHE_SESSION_TTL_MINUTES, compteurs hits/misses (cache_stats).
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheBackend(ABC):
+    """Interface commune des backends (toutes les méthodes sont asynchrones)."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        return [await self.get(k) for k in keys]
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def incr(self, key: str) -> int: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Cache LRU en mémoire : au plus max_entries clés, la moins récemment lue est
+    évincée en premier. Les entrées expirées sont supprimées à la lecture.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    def get_nowait(self, key: str) -> Any | None:
+        """Lecture synchrone (aucune E/S) : utilisable hors coroutine."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set_nowait(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Écriture synchrone (aucune E/S) avec éviction LRU."""
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    def delete_nowait(self, key: str) -> None:
+        """Suppression synchrone (aucune E/S)."""
+        self._data.pop(key, None)
+
+    async def get(self, key: str) -> Any | None:
+        return self.get_nowait(key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.set_nowait(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.delete_nowait(key)
+
+    async def incr(self, key: str) -> int:
+        value = (self.get_nowait(key) or 0) + 1
+        self.set_nowait(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache partagé Redis (valeurs en octets). Client créé à la première utilisation."""
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis_asyncio  # dépendance optionnelle
+
+            self._client = redis_asyncio.from_url(self._url)
+        return self._client
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._get_client().get(key)
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self._get_client().mget(keys)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        await self._get_client().set(key, value, px=int(ttl * 1000) if ttl else None)
+
+    async def delete(self, key: str) -> None:
+        await self._get_client().delete(key)
+
+    async def incr(self, key: str) -> int:
+        return await self._get_client().incr(key)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_shared_backend: CacheBackend | None = None
+_shared_backend_resolved = False
+
+
+def get_shared_backend() -> CacheBackend | None:
+    """
+    Backend partagé entre workers (Redis) si REDIS_URL est défini, sinon None
+    (chaque processus se contente de son cache mémoire).
+    """
+    global _shared_backend, _shared_backend_resolved
+    if not _shared_backend_resolved:
+        from app.config import get_settings
+
+        url = get_settings().REDIS_URL
+        if url:
+            try:
+                import redis.asyncio  # noqa: F401
+            except ImportError:
+                logger.warning("REDIS_URL défini mais le paquet redis n'est pas installé : cache mémoire uniquement")
+            else:
+                _shared_backend = RedisCacheBackend(url)
+        _shared_backend_resolved = True
+    return _shared_backend
+
+
+# --- Cache applicatif (espaces de noms) ---------------------------------------
+
+_GLOBAL = "*"
+
+# Compteurs par espace de noms : [hits, misses]
+_stats: dict[str, list[int]] = {}
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Hits/misses cumulés par espace de noms depuis le démarrage du processus."""
+    return {ns: {"hits": h, "misses": m} for ns, (h, m) in _stats.items()}
+
+
+def _record(namespace: str, hit: bool) -> None:
+    counters = _stats.setdefault(namespace, [0, 0])
+    counters[0 if hit else 1] += 1
+
+
+class NamespacedCache:
+    """
+    Cache d'un espace de noms (ex. "query:devise"). Clés effectives :
+    gesco:cache:{namespace}:{entreprise_id | *}:{key}. Lecture mémoire puis
+    partagée ; les valeurs partagées sont sérialisées avec pickle (Redis
+    interne de confiance), la mémoire garde l'objet tel quel.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        ttl_seconds: float,
+        local: MemoryCacheBackend,
+        shared: CacheBackend | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self._ttl = ttl_seconds
+        self._local = local
+        self._shared = shared
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _key(self, key: str, entreprise_id: int | None) -> str:
+        return f"gesco:cache:{self.namespace}:{_GLOBAL if entreprise_id is None else entreprise_id}:{key}"
+
+    async def get(self, key: str, entreprise_id: int | None = None) -> Any | None:
+        full_key = self._key(key, entreprise_id)
+        value = self._local.get_nowait(full_key)
+        if value is None and self._shared is not None:
+            try:
+                raw = await self._shared.get(full_key)
+            except Exception:
+                logger.warning("Cache %s : lecture partagée impossible", self.namespace, exc_info=True)
+                raw = None
+            if raw is not None:
+                value = pickle.loads(raw)
+                self._local.set_nowait(full_key, value, self._ttl)
+        _record(self.namespace, value is not None)
+        return value
+
+    async def get_many(self, keys: list[str], entreprise_id: int | None = None) -> list[Any | None]:
+        return [await self.get(k, entreprise_id) for k in keys]
+
+    async def set(self, key: str, value: Any, entreprise_id: int | None = None, ttl: float | None = None) -> None:
+        ttl = ttl or self._ttl
+        full_key = self._key(key, entreprise_id)
+        self._local.set_nowait(full_key, value, ttl)
+        if self._shared is not None:
+            try:
+                await self._shared.set(full_key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ttl)
+            except Exception:
+                logger.warning("Cache %s : écriture partagée impossible", self.namespace, exc_info=True)
+
+    async def delete(self, key: str, entreprise_id: int | None = None) -> None:
+        full_key = self._key(key, entreprise_id)
+        self._local.delete_nowait(full_key)
+        if self._shared is not None:
+            try:
+                await self._shared.delete(full_key)
+            except Exception:
+                logger.warning("Cache %s : suppression partagée impossible", self.namespace, exc_info=True)
+
+
+_local_backend: MemoryCacheBackend | None = None
+_caches: dict[str, NamespacedCache] = {}
+
+
+def get_cache(namespace: str) -> NamespacedCache:
+    """Cache applicatif de l'espace de noms (niveau mémoire commun au processus)."""
+    global _local_backend
+    cache = _caches.get(namespace)
+    if cache is None:
+        from app.config import get_settings
+
+        s = get_settings()
+        if _local_backend is None:
+            _local_backend = MemoryCacheBackend(s.CACHE_MAX_ENTRIES)
+        cache = _caches[namespace] = NamespacedCache(
+            namespace,
+            ttl_seconds=s.CACHE_SESSION_TTL_MINUTES * 60,
+            local=_local_backend,
+            shared=get_shared_backend(),
+        )
+    return cache
+
+
+def clear_caches() -> None:
+    """Vide le niveau mémoire et les compteurs (tests, maintenance)."""
+    if _local_backend is not None:
+        _local_backend.clear()
+    _stats.clear()
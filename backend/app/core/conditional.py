@@ -0,0 +1,70 @@
+# app/core/conditional.py
+# -----------------------------------------------------------------------------
+# GET conditionnels (ETag / If-None-Match) pour les listes quasi statiques
+# (référentiels, catalogue). L'ETag faible est dérivé des compteurs de version
+# des tables lues (app.core.report_cache), de l'entreprise, de l'URL et de la
+# version de l'API : aucune requête SQL ni sérialisation pour répondre 304.
+# Toute écriture commitée via l'ORM sur une table surveillée change l'ETag ;
+# les écritures SQL directes (UPDATE en masse) ne sont pas vues.
+# Sans REDIS_URL et avec WEB_CONCURRENCY > 1, les compteurs ne sont pas
+# partagés entre workers : pas d'ETag (un worker n'ayant pas servi l'écriture
+# répondrait 304 sur une liste périmée).
+# La dépendance de route (ConditionalGet) est dans parametrage.dependencies
+# (elle a besoin de l'utilisateur courant).
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import hashlib
+from collections.abc import Iterable
+
+from starlette.requests import Request
+
+from app.core.logging_config import get_logger
+from app.core.report_cache import get_report_cache, watch_tables
+
+logger = get_logger(__name__)
+
+__all__ = ["cache_control", "compute_etag", "etag_matches", "watch_tables"]
+
+
+def cache_control(max_age: int) -> str:
+    """
+    En-tête Cache-Control : réponse propre à l'utilisateur (private). max_age
+    = 0 : revalidation à chaque affichage (304 si inchangé) ; sinon le
+    navigateur réutilise sa copie max_age secondes sans interroger l'API.
+    """
+    if max_age <= 0:
+        return "private, no-cache"
+    return f"private, max-age={max_age}, must-revalidate"
+
+
+async def compute_etag(request: Request, entreprise_id: int | None, tables: Iterable[str]) -> str | None:
+    """ETag faible de la ressource ; None si les compteurs sont indisponibles ou non partagés (pas de 304)."""
+    cache = get_report_cache()
+    if not cache.consistent:
+        return None
+    try:
+        epoch = await cache.epoch()
+        versions = await cache.versions(entreprise_id, tables)
+    except Exception:
+        logger.warning("ETag : compteurs de version indisponibles", exc_info=True)
+        return None
+    seed = "|".join((
+        epoch,
+        ".".join(map(str, versions)),
+        str(entreprise_id),
+        request.url.path,
+        str(request.query_params),
+        str(getattr(request.app, "version", "")),
+    ))
+    return f'W/"{hashlib.sha1(seed.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Comparaison faible (RFC 9110) de If-None-Match avec l'ETag courant."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
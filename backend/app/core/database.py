@@ -2,6 +2,8 @@
 # -----------------------------------------------------------------------------
 # Connexion et session SQLAlchemy asynchrone pour Gesco.
 # Base déclarative partagée par tous les modèles ORM.
+# SQLite : profil haut débit (WAL, pragmas, pool, écrivain unique), cf. app.core.sqlite.
+# Requêtes SQL suivies par requête HTTP (app.core.query_stats) et pour /metrics.
 # Aucun import depuis app.modules pour éviter les imports circulaires.
 # -----------------------------------------------------------------------------
 
@@ -11,6 +13,18 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 from sqlalchemy.pool import NullPool
 
+from app.core.metrics import install_query_metrics
+from app.core.query_stats import install_query_tracking
+from app.core.report_cache import apply_pending_invalidations
+from app.core.sqlite import (
+    SerializedWriteSession,
+    install_pragmas,
+    is_memory,
+    is_sqlite,
+    sqlite_engine_kwargs,
+    sqlite_pragmas,
+)
+
 # Import différé de get_settings pour éviter chargement circulaire au démarrage
 # (config peut être chargé avant que l'app soit complète)
 
@@ -21,13 +35,20 @@ def _get_database_url() -> str:
     return get_settings().DATABASE_URL
 
 
+def _sqlite_tuned() -> bool:
+    """Profil SQLite haut débit actif (base fichier et SQLITE_TUNED)."""
+    from app.config import get_settings
+    s = get_settings()
+    return is_sqlite(s.DATABASE_URL) and s.SQLITE_TUNED and not is_memory(s.DATABASE_URL)
+
+
 def _get_engine_kwargs() -> dict:
-    """Options du moteur (pool, echo). SQLite utilise NullPool."""
+    """Options du moteur (pool, echo). SQLite : profil de app.core.sqlite."""
     from app.config import get_settings
     s = get_settings()
     url = s.DATABASE_URL
-    if "sqlite" in url:
-        return {"poolclass": NullPool, "echo": s.DATABASE_ECHO}
+    if is_sqlite(url):
+        return sqlite_engine_kwargs(s)
     return {
         "pool_size": s.DATABASE_POOL_SIZE,
         "max_overflow": s.DATABASE_MAX_OVERFLOW,
@@ -35,6 +56,14 @@ def _get_engine_kwargs() -> dict:
     }
 
 
+def pool_capacity() -> int | None:
+    """Connexions simultanées max du moteur (pool_size + max_overflow) ; None si illimité (NullPool)."""
+    kwargs = _get_engine_kwargs()
+    if kwargs.get("poolclass") is NullPool:
+        return None
+    return kwargs["pool_size"] + kwargs["max_overflow"]
+
+
 class Base(DeclarativeBase):
     """
     Base déclarative SQLAlchemy. Tous les modèles du projet héritent de Base.
@@ -60,13 +89,27 @@ def get_engine():
     """Retourne le moteur asynchrone (création paresseuse)."""
     global _engine
     if _engine is None:
+        from app.config import get_settings
         _engine = create_async_engine(
             _get_database_url(),
             **_get_engine_kwargs(),
         )
+        if _sqlite_tuned():
+            install_pragmas(_engine.sync_engine, sqlite_pragmas(get_settings()))
+        install_query_tracking(_engine.sync_engine)
+        if get_settings().metrics_active():
+            install_query_metrics()
     return _engine
 
 
+def _session_class() -> type[AsyncSession]:
+    """SerializedWriteSession pour SQLite (écrivain unique), AsyncSession sinon."""
+    from app.config import get_settings
+    if _sqlite_tuned() and get_settings().SQLITE_SERIALIZE_WRITES:
+        return SerializedWriteSession
+    return AsyncSession
+
+
 # Factory de sessions (créée à la première utilisation pour retarder l'accès à get_engine)
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
@@ -77,7 +120,7 @@ def _get_session_factory() -> async_sessionmaker[AsyncSession]:
     if _session_factory is None:
         _session_factory = async_sessionmaker(
             bind=get_engine(),
-            class_=AsyncSession,
+            class_=_session_class(),
             expire_on_commit=False,
             autoflush=False,
             autocommit=False,
@@ -85,6 +128,14 @@ def _get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Sessionmaker partagé, pour ouvrir des sessions hors injection FastAPI
+    (ex. requêtes concurrentes sur des connexions distinctes du pool).
+    """
+    return _get_session_factory()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Générateur de session asynchrone pour l'injection FastAPI.
@@ -95,6 +146,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            await apply_pending_invalidations(session)
         except Exception:  # rollback on any error, then re-raise
             await session.rollback()
             raise
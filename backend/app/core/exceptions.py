@@ -63,3 +63,13 @@ class BadRequestError(AppHTTPException):
     ) -> None:
         super().__init__(status_code=400, detail=detail, code=code)
 
+
+
+class NotModifiedError(HTTPException):
+    """
+    Réponse 304 à un GET conditionnel (If-None-Match) : sans corps, hors
+    AppHTTPException (gestionnaire dédié, pas de contenu JSON d'erreur).
+    """
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__(status_code=304, detail="Non modifié", headers=headers)
@@ -0,0 +1,164 @@
+# app/core/export.py
+# -----------------------------------------------------------------------------
+# Exports en flux des listes volumineuses (factures, règlements, mouvements de
+# stock, journal d'audit) : exercice complet en une requête, sans pagination.
+# - La requête filtrée de la liste (repository) est relue avec les seules
+#   colonnes du schéma de réponse, via un curseur côté serveur
+#   (AsyncSession.stream, yield_per = EXPORT_YIELD_PER) : la mémoire reste
+#   bornée à un lot de lignes, quel que soit le volume exporté.
+# - Formats : CSV (séparateur ;, BOM UTF-8 pour Excel) ou NDJSON (mêmes
+#   valeurs que la réponse JSON de la liste).
+# - Compression gzip à la volée si le client l'accepte (Accept-Encoding).
+# Le flux ouvre sa propre session : la session de la requête (get_db) est
+# fermée avant l'envoi du corps. Les contrôles d'accès sont faits par la route
+# avant de construire la réponse.
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+
+from app.config import get_settings
+from app.core.database import get_session_factory
+from app.core.responses import NDJSON_MEDIA_TYPE, dumps
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+
+# Documentation OpenAPI des routes d'export (responses=EXPORT_RESPONSES)
+EXPORT_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "Fichier CSV ou NDJSON (gzip si Accept-Encoding le permet)",
+        "content": {"text/csv": {}, NDJSON_MEDIA_TYPE: {}},
+    },
+}
+
+
+class ExportFormat(str, Enum):
+    """Format d'un export en flux."""
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Accept-Encoding contient gzip (ou *) sans q=0."""
+    for part in (accept_encoding or "").lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip() in ("gzip", "*"):
+            q = params.strip().removeprefix("q=")
+            try:
+                return not params or float(q) > 0
+            except ValueError:
+                return True
+    return False
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict | list):
+        return dumps(value).decode("utf-8")
+    return value
+
+
+def _encode_csv(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator="\r\n")
+    writer.writerows([_csv_value(v) for v in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_ndjson(names: Sequence[str], rows: Sequence[Sequence[Any]]) -> bytes:
+    return b"".join(dumps(dict(zip(names, row, strict=True))) + b"\n" for row in rows)
+
+
+async def stream_partitions(q: Select, *, yield_per: int | None = None) -> AsyncIterator[Sequence[Any]]:
+    """
+    Lignes de q par lots de yield_per, lues par un curseur côté serveur dans
+    une session dédiée (fermée en fin de flux ou si le client se déconnecte).
+    """
+    yield_per = yield_per or get_settings().EXPORT_YIELD_PER
+    async with get_session_factory()() as session:
+        result = await session.stream(q.execution_options(yield_per=yield_per))
+        async for partition in result.partitions():
+            yield partition
+
+
+class ExportResponse(StreamingResponse):
+    """
+    Export en flux de q (requête ORM filtrée et triée d'une liste) : colonnes
+    du schéma de réponse, en CSV ou NDJSON, compressé si le client accepte gzip.
+    """
+
+    media_type = "text/csv"
+
+    def __init__(
+        self,
+        q: Select,
+        *,
+        schema: type[BaseModel],
+        request: Request,
+        filename: str,
+        format: ExportFormat = ExportFormat.csv,
+        status_code: int = 200,
+    ) -> None:
+        model = q.column_descriptions[0]["entity"]
+        self._names = list(schema.model_fields)
+        self._query = q.with_only_columns(*(getattr(model, name) for name in self._names))
+        self._format = ExportFormat(format)
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename}.{self._format.value}"',
+            "Vary": "Accept-Encoding",
+        }
+        gzip = accepts_gzip(request.headers.get("accept-encoding"))
+        if gzip:
+            headers["Content-Encoding"] = "gzip"
+        media_type = CSV_MEDIA_TYPE if self._format == ExportFormat.csv else NDJSON_MEDIA_TYPE
+        body = self._body()
+        super().__init__(
+            self._gzip(body) if gzip else body, status_code=status_code, headers=headers, media_type=media_type
+        )
+
+    async def _body(self) -> AsyncIterator[bytes]:
+        if self._format == ExportFormat.csv:
+            yield b"\xef\xbb\xbf" + _encode_csv([self._names])
+        async for rows in stream_partitions(self._query):
+            if self._format == ExportFormat.csv:
+                yield _encode_csv(rows)
+            else:
+                yield _encode_ndjson(self._names, rows)
+
+    @staticmethod
+    async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Flux gzip (wbits=31 : en-tête et CRC gzip), un bloc compressé par lot."""
+        compressor = zlib.compressobj(get_settings().EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)
+        async for chunk in chunks:
+            # Z_SYNC_FLUSH : le client reçoit chaque lot sans attendre la fin de l'export
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+__all__ = [
+    "CSV_MEDIA_TYPE",
+    "EXPORT_RESPONSES",
+    "ExportFormat",
+    "ExportResponse",
+    "accepts_gzip",
+    "stream_partitions",
+]
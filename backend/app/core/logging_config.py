@@ -1,55 +1,261 @@
 # app/core/logging_config.py
 # -----------------------------------------------------------------------------
 # Configuration du logging à partir des paramètres (LOG_LEVEL, LOG_FORMAT, LOG_FILE).
+# - Les handlers (console, fichier) tournent dans le thread d'un QueueListener :
+#   la boucle d'événements ne fait que déposer l'enregistrement dans une file
+#   bornée (enregistrements perdus comptés si la file est pleine).
+# - Format json : une ligne JSON par enregistrement (orjson), avec le contexte
+#   de la requête (request_id, entreprise_id, user_id, route) et les champs
+#   passés via extra= (ex. latency_ms, status).
+# - Échantillonnage des logs DEBUG (LOG_DEBUG_SAMPLE_RATE).
+# - LogContextMiddleware : request_id (X-Request-ID), journal d'accès ; la route
+#   est liée dès le routage par bind_route_log_context (dépendance globale).
 # -----------------------------------------------------------------------------
 
+import atexit
 import logging
+import queue
+import random
 import sys
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+from starlette.requests import Request
+
+# Contexte de la requête courante (dict mutable partagé par la tâche de la requête)
+_log_context: ContextVar[dict[str, Any] | None] = ContextVar("gesco_log_context", default=None)
+
+# Attributs standard d'un LogRecord : tout autre attribut vient de extra= ou du contexte
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+_listener: QueueListener | None = None
+
+
+def bind_log_context(**fields: Any) -> None:
+    """Ajoute des champs au contexte de log de la requête courante (sans effet hors requête)."""
+    context = _log_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def bind_route_log_context(request: Request) -> None:
+    """
+    Dépendance globale de l'application (FastAPI(dependencies=...)) : ajoute
+    le modèle de route au contexte dès la résolution du routage, avant les
+    autres dépendances (authentification, session) et le handler.
+    """
+    route = getattr(request.scope.get("route"), "path", None)
+    if route:
+        bind_log_context(route=route)
+
+
+def get_log_context() -> dict[str, Any]:
+    """Copie du contexte de log courant (vide hors requête)."""
+    return dict(_log_context.get() or {})
+
+
+class JsonFormatter(logging.Formatter):
+    """Une ligne JSON par enregistrement, sérialisée avec orjson (échappement correct)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return orjson.dumps(data, default=str).decode("utf-8")
+
+
+class _ContextFilter(logging.Filter):
+    """Copie le contexte de la requête sur l'enregistrement (dans le thread appelant)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        if context:
+            for key, value in context.items():
+                if not hasattr(record, key):
+                    setattr(record, key, value)
+        return True
+
+
+class _DebugSamplingFilter(logging.Filter):
+    """Ne garde qu'une fraction `rate` des enregistrements DEBUG."""
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1.0 or random.random() < self.rate
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler sur file bornée : jamais bloquant, pertes comptées."""
+
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _NonBlockingQueueHandler.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Message et trace figés dans le thread appelant ; le formatage final
+        # (json ou texte) est fait par les handlers du listener.
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def dropped_records() -> int:
+    """Nombre d'enregistrements perdus (file pleine) depuis le démarrage."""
+    return _NonBlockingQueueHandler.dropped
 
 
 def setup_logging(
     level: str = "INFO",
     format_type: str = "json",
     log_file: str | None = None,
+    *,
+    debug_sample_rate: float = 1.0,
+    queue_size: int = 10_000,
 ) -> None:
     """
     Configure le logger racine de l'application.
     :param level: DEBUG | INFO | WARNING | ERROR
     :param format_type: json | text
     :param log_file: Chemin du fichier de log (None = console uniquement)
+    :param debug_sample_rate: Fraction des logs DEBUG conservés (0..1)
+    :param queue_size: Capacité de la file vers le thread d'écriture
     """
+    global _listener
+    shutdown_logging()
     log_level = getattr(logging, level.upper(), logging.INFO)
     if format_type == "json":
         # Format structuré pour ingestion (ex: ELK)
-        formatter = logging.Formatter(
-            '{"time":"%(asctime)s","level":"%(levelname)s","name":"%(name)s","message":"%(message)s"}',
-            datefmt="%Y-%m-%dT%H:%M:%S",
-        )
+        formatter: logging.Formatter = JsonFormatter()
     else:
         formatter = logging.Formatter(
             "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-    root = logging.getLogger()
-    root.setLevel(log_level)
-    # Retirer les handlers existants pour éviter doublons
-    for h in root.handlers[:]:
-        root.removeHandler(h)
     # Console
     console = logging.StreamHandler(sys.stdout)
     console.setFormatter(formatter)
-    root.addHandler(console)
+    handlers: list[logging.Handler] = [console]
     # Fichier optionnel
     if log_file:
         try:
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
             file_handler.setFormatter(formatter)
-            root.addHandler(file_handler)
+            handlers.append(file_handler)
         except OSError:
-            root.warning("Impossible d'ouvrir le fichier de log %s", log_file)
+            print(f"Impossible d'ouvrir le fichier de log {log_file}", file=sys.stderr)
+
+    queue_handler = _NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+    queue_handler.addFilter(_DebugSamplingFilter(debug_sample_rate))
+    queue_handler.addFilter(_ContextFilter())
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    # Retirer les handlers existants pour éviter doublons
+    for h in root.handlers[:]:
+        root.removeHandler(h)
+    root.addHandler(queue_handler)
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Vide la file et arrête le thread d'écriture (appelé à l'arrêt de l'application)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
     """Retourne un logger pour le module donné."""
     return logging.getLogger(name)
 
+
+_access_logger = get_logger("gesco.access")
+
+
+class LogContextMiddleware:
+    """
+    Middleware ASGI pur : ouvre le contexte de log de la requête (request_id
+    repris de X-Request-ID ou généré) renvoyé dans la réponse, puis écrit une
+    ligne d'accès avec statut et latency_ms. route est liée au routage
+    (bind_route_log_context), entreprise_id et user_id par l'authentification.
+    """
+
+    def __init__(self, app, *, access_log: bool = True) -> None:
+        self.app = app
+        self.access_log = access_log
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        context: dict[str, Any] = {"request_id": request_id or uuid.uuid4().hex}
+        token = _log_context.set(context)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER.lower().encode("latin-1"), context["request_id"].encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Routes hors dépendances globales (docs, montages) : route lue après coup
+            route = getattr(scope.get("route"), "path", None)
+            if route:
+                context["route"] = route
+            if self.access_log:
+                _access_logger.info(
+                    "%s %s %d",
+                    scope.get("method", ""),
+                    scope.get("path", ""),
+                    status,
+                    extra={"status": status, "latency_ms": round((time.perf_counter() - start) * 1000, 2)},
+                )
+            _log_context.reset(token)
@@ -0,0 +1,323 @@
+# app/core/metrics.py
+# -----------------------------------------------------------------------------
+# Métriques au format texte Prometheus (exposition 0.0.4), sans dépendance ni
+# service externe : compteurs, jauges et histogrammes en mémoire du processus.
+# - MetricsMiddleware (ASGI pur) : latence par modèle de route, requêtes en
+#   cours, taille des réponses, requêtes SQL par requête HTTP.
+# - install_query_metrics() : durée des requêtes SQL, mesurée par les
+#   événements du moteur posés par app.core.query_stats.
+# - render_metrics() : ajoute à l'exposition les jauges du pool de connexions,
+#   les ratios de hits des caches et les logs perdus (lus au moment du scrape).
+# Registre propre au processus : exposé seulement avec un worker
+# (Settings.metrics_active, WEB_CONCURRENCY = 1).
+# Coût par requête : quelques additions et un bisect, aucun verrou (tout est
+# mis à jour depuis le thread de la boucle d'événements).
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import cache_stats
+from app.core.logging_config import dropped_records
+from app.core.query_stats import add_query_observer, track_queries
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SQL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# Route non résolue (404, middleware) : un seul libellé pour borner la cardinalité
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Lignes d'exposition : HELP, TYPE puis une ligne par série."""
+
+
+class Counter(_Metric):
+    """Compteur monotone, par combinaison de libellés."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Jauge : valeur courante, par combinaison de libellés."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def render(self) -> list[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in self._values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """Histogramme à bornes fixes (compteurs par tranche, cumulés au rendu)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Iterable[str] = (), *, buckets: Iterable[float]
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # libellés → [compteurs par tranche (+Inf en dernier), somme]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += n
+                le = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(total)}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ensemble ordonné de métriques rendues ensemble par render()."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> Any:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.register(
+    Counter("gesco_http_requests_total", "Requêtes HTTP traitées.", ("method", "route", "status"))
+)
+HTTP_LATENCY = REGISTRY.register(
+    Histogram(
+        "gesco_http_request_duration_seconds",
+        "Durée des requêtes HTTP par modèle de route.",
+        ("method", "route"),
+        buckets=LATENCY_BUCKETS,
+    )
+)
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge("gesco_http_requests_in_flight", "Requêtes HTTP en cours."))
+HTTP_IN_FLIGHT.set(0)
+HTTP_RESPONSE_SIZE = REGISTRY.register(
+    Histogram(
+        "gesco_http_response_size_bytes",
+        "Taille du corps des réponses HTTP.",
+        ("method", "route"),
+        buckets=SIZE_BUCKETS,
+    )
+)
+HTTP_SQL_STATEMENTS = REGISTRY.register(
+    Histogram(
+        "gesco_http_sql_statements_per_request",
+        "Requêtes SQL exécutées par requête HTTP.",
+        ("method", "route"),
+        buckets=COUNT_BUCKETS,
+    )
+)
+SQL_DURATION = REGISTRY.register(
+    Histogram(
+        "gesco_sql_statement_duration_seconds",
+        "Durée des requêtes SQL par type d'instruction.",
+        ("statement",),
+        buckets=SQL_BUCKETS,
+    )
+)
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if path else UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI pur : mesure chaque requête HTTP. Le libellé de route est
+    le modèle (ex. /api/v1/commercial/factures/{id}), lu dans
+    scope["route"] renseigné par le routeur FastAPI, jamais le chemin brut.
+    """
+
+    def __init__(self, app: ASGIApp, *, exclude_paths: Iterable[str] = ("/metrics",)) -> None:
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            with track_queries() as stats:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            method = scope.get("method", "")
+            route = _route_template(scope)
+            HTTP_REQUESTS.inc(method, route, str(status))
+            HTTP_LATENCY.observe(elapsed, method, route)
+            HTTP_RESPONSE_SIZE.observe(size, method, route)
+            HTTP_SQL_STATEMENTS.observe(stats.statements, method, route)
+
+
+def _statement_kind(statement: str) -> str:
+    head = statement.lstrip()[:10].split(None, 1)
+    return head[0].upper() if head else "OTHER"
+
+
+def install_query_metrics() -> None:
+    """Histogramme de durée des requêtes SQL (requiert install_query_tracking sur le moteur)."""
+    add_query_observer(_observe_statement)
+
+
+def _observe_statement(statement: str, duration: float) -> None:
+    SQL_DURATION.observe(duration, _statement_kind(statement))
+
+
+def _pool_gauges(engine: Any) -> list[str]:
+    pool = engine.sync_engine.pool
+    gauge = Gauge("gesco_db_pool_connections", "État du pool de connexions SQLAlchemy.", ("state",))
+    # NullPool / StaticPool n'exposent pas ces compteurs
+    for state, attr in (("size", "size"), ("checked_out", "checkedout"), ("overflow", "overflow")):
+        fn = getattr(pool, attr, None)
+        if callable(fn):
+            gauge.set(fn(), state)
+    return gauge.render()
+
+
+def _cache_gauges(stats: dict[str, dict[str, int]]) -> list[str]:
+    hits = Counter("gesco_cache_hits_total", "Lectures servies par le cache applicatif.", ("namespace",))
+    misses = Counter("gesco_cache_misses_total", "Lectures absentes du cache applicatif.", ("namespace",))
+    ratio = Gauge("gesco_cache_hit_ratio", "Ratio hits / lectures du cache applicatif.", ("namespace",))
+    for namespace, s in stats.items():
+        hits.inc(namespace, amount=s["hits"])
+        misses.inc(namespace, amount=s["misses"])
+        total = s["hits"] + s["misses"]
+        ratio.set(s["hits"] / total if total else 0.0, namespace)
+    return hits.render() + misses.render() + ratio.render()
+
+
+def _log_counters(dropped: int) -> list[str]:
+    counter = Counter("gesco_log_records_dropped_total", "Enregistrements de log perdus (file d'écriture pleine).")
+    counter.inc(amount=dropped)
+    return counter.render()
+
+
+def render_metrics(engine: Any | None = None) -> str:
+    """Exposition complète : métriques du registre, pool de connexions, caches, logs perdus."""
+    lines = [REGISTRY.render().rstrip("\n")]
+    if engine is not None:
+        lines.extend(_pool_gauges(engine))
+    lines.extend(_cache_gauges(cache_stats()))
+    lines.extend(_log_counters(dropped_records()))
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "REGISTRY",
+    "install_query_metrics",
+    "render_metrics",
+]
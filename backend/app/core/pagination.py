@@ -0,0 +1,171 @@
+# app/core/pagination.py
+# -----------------------------------------------------------------------------
+# Pagination des listes : paginate() exécute la page et, selon include_total,
+# aucun comptage (none), un COUNT(*) exact sur la même requête filtrée (exact)
+# ou l'estimation du planificateur PostgreSQL (estimate, repli sur exact
+# ailleurs ou pour les petits volumes). Les filtres ne sont écrits qu'une fois.
+#
+# Pagination par curseur (keyset) pour les listes volumineuses.
+# Le curseur, opaque pour le client (base64url), encode la clé de tri de la
+# dernière ligne renvoyée (ex. date_facture, id) : la page suivante filtre
+# (date_facture, id) < (valeurs du curseur) au lieu de sauter N lignes avec
+# OFFSET, coût constant quelle que soit la profondeur. Le curseur de la page
+# suivante est renvoyé dans l'en-tête X-Next-Cursor (corps inchangé).
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import base64
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from fastapi import Response
+from sqlalchemy import Select, func, literal, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.exceptions import BadRequestError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# En dessous de ce nombre de lignes estimées, le COUNT exact est peu coûteux
+# et l'estimation du planificateur peu fiable : on compte.
+_ESTIMATE_EXACT_THRESHOLD = 1000
+
+
+class TotalMode(str, Enum):
+    """Calcul du total d'une liste paginée."""
+    none = "none"
+    exact = "exact"
+    estimate = "estimate"
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, python_type: type) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return python_type(value)
+
+
+class Keyset:
+    """
+    Clé de tri d'une liste paginée par curseur : colonnes en ordre décroissant,
+    la dernière doit être unique (id) pour départager les ex aequo.
+    """
+
+    def __init__(self, *columns: InstrumentedAttribute) -> None:
+        self.columns = columns
+
+    def encode(self, item: Any) -> str:
+        """Curseur opaque pointant après item (objet ORM de la liste)."""
+        values = [_to_json(getattr(item, c.key)) for c in self.columns]
+        raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    def decode(self, cursor: str) -> tuple[Any, ...]:
+        """Valeurs de la clé de tri contenues dans le curseur ; 400 si curseur invalide."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError(cursor)
+            return tuple(_from_json(v, c.type.python_type) for v, c in zip(values, self.columns, strict=True))
+        except (ValueError, TypeError):
+            raise BadRequestError(detail="Curseur de pagination invalide.", code="INVALID_CURSOR") from None
+
+    def order(self, q: Select) -> Select:
+        """Trie par la clé (décroissant), sans pagination (ex. export en flux)."""
+        return q.order_by(*(c.desc() for c in self.columns))
+
+    def apply(self, q: Select, *, cursor: str | None, skip: int, limit: int) -> Select:
+        """
+        Trie par la clé (décroissant) et pagine : après le curseur s'il est
+        fourni (skip ignoré), sinon OFFSET classique.
+        """
+        q = self.order(q)
+        if cursor:
+            values = (literal(v, c.type) for v, c in zip(self.decode(cursor), self.columns, strict=True))
+            q = q.where(tuple_(*self.columns) < tuple_(*values))
+        else:
+            q = q.offset(skip)
+        return q.limit(limit)
+
+    def next_cursor(self, items: Sequence[Any], limit: int) -> str | None:
+        """Curseur de la page suivante ; None si la page n'est pas pleine (fin de liste)."""
+        if len(items) < limit or not items:
+            return None
+        return self.encode(items[-1])
+
+
+def set_next_cursor(response: Response, cursor: str | None) -> None:
+    """Ajoute l'en-tête X-Next-Cursor à la réponse s'il reste des lignes à lire (cursor non None)."""
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+async def _count_exact(db: AsyncSession, q: Select) -> int:
+    count_q = select(func.count()).select_from(q.order_by(None).subquery())
+    return (await db.execute(count_q)).scalar_one() or 0
+
+
+async def _count_estimate(db: AsyncSession, q: Select) -> int:
+    """Nombre de lignes estimé par EXPLAIN (PostgreSQL) ; COUNT exact sinon."""
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return await _count_exact(db, q)
+    try:
+        sql = str(q.order_by(None).compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    except SQLAlchemyError:  # paramètre non représentable en littéral
+        return await _count_exact(db, q)
+    conn = await db.connection()
+    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < _ESTIMATE_EXACT_THRESHOLD:
+        return await _count_exact(db, q)
+    return estimate
+
+
+async def paginate(
+    db: AsyncSession,
+    q: Select,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    include_total: TotalMode | str = TotalMode.exact,
+    keyset: Keyset | None = None,
+    cursor: str | None = None,
+) -> tuple[list[Any], int | None]:
+    """
+    Exécute une page de q (filtrée, triée sauf si keyset) et son total éventuel.
+    Retourne (éléments, total) ; total vaut None avec include_total=none.
+    Avec keyset : tri par la clé et pagination après cursor s'il est fourni.
+    """
+    include_total = TotalMode(include_total)
+    total: int | None = None
+    if include_total is TotalMode.exact:
+        total = await _count_exact(db, q)
+    elif include_total is TotalMode.estimate:
+        total = await _count_estimate(db, q)
+    if keyset is not None:
+        page_q = keyset.apply(q, cursor=cursor, skip=skip, limit=limit)
+    else:
+        page_q = q.offset(skip).limit(limit)
+    r = await db.execute(page_q)
+    return list(r.scalars().all()), total
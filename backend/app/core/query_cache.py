@@ -0,0 +1,102 @@
+# app/core/query_cache.py
+# -----------------------------------------------------------------------------
+# Décorateur cached_query pour les méthodes de lecture des repositories de
+# référentiels quasi statiques (devises, taux TVA, unités, états document...).
+# Le résultat est mis en cache (get_cache("query:<table>")) sous forme de
+# colonnes ; chaque appel reconstruit des instances ORM transitoires (jamais
+# partagées entre requêtes ni attachées à la session). La clé inclut les
+# versions de la table tenues par report_cache : toute écriture commitée sur
+# la table change la clé, sans purge explicite. Sans REDIS_URL et avec
+# WEB_CONCURRENCY > 1, ces versions ne sont pas partagées entre workers :
+# lecture directe, sans cache.
+# À réserver aux lectures pour affichage : pas aux méthodes dont le résultat
+# est modifié puis flushé (get_or_404 → update) ni aux contrôles d'unicité.
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import functools
+import hashlib
+import inspect
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from sqlalchemy import inspect as sa_inspect
+
+from app.core.cache import get_cache
+from app.core.logging_config import get_logger
+from app.core.report_cache import get_report_cache, watch_tables
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def _columns(model: type, obj: Any) -> dict[str, Any]:
+    return {attr.key: getattr(obj, attr.key) for attr in sa_inspect(model).column_attrs}
+
+
+def _dump(model: type, result: Any) -> tuple:
+    """Résultat → forme sérialisable : entité, None, liste ou (liste, total)."""
+    if result is None:
+        return ("none",)
+    if isinstance(result, model):
+        return ("one", _columns(model, result))
+    if isinstance(result, tuple):
+        items, total = result
+        return ("page", [_columns(model, o) for o in items], total)
+    return ("list", [_columns(model, o) for o in result])
+
+
+def _load(model: type, data: tuple) -> Any:
+    kind = data[0]
+    if kind == "none":
+        return None
+    if kind == "one":
+        return model(**data[1])
+    if kind == "page":
+        return [model(**c) for c in data[1]], data[2]
+    return [model(**c) for c in data[1]]
+
+
+def cached_query(model: type, *, entreprise_arg: str | None = None) -> Callable[[F], F]:
+    """
+    Met en cache une méthode de lecture d'un repository de model.
+    entreprise_arg : nom du paramètre portant l'entreprise_id (cache et
+    invalidation par entreprise) ; None pour un référentiel global.
+    """
+    table = model.__table__.name
+    watch_tables(table)
+
+    def decorator(fn: F) -> F:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache = get_cache(f"query:{table}")
+            if not cache.enabled or not get_report_cache().consistent:
+                return await fn(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "self"}
+            entreprise_id = params.get(entreprise_arg) if entreprise_arg else None
+            try:
+                versions = await get_report_cache().versions(entreprise_id, (table,))
+            except Exception:  # compteurs indisponibles : lecture directe
+                logger.warning("Cache %s : versions indisponibles", table, exc_info=True)
+                return await fn(self, *args, **kwargs)
+            digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            key = f"{fn.__name__}:{'.'.join(map(str, versions))}:{digest}"
+            data = await cache.get(key, entreprise_id)
+            if data is None:
+                result = await fn(self, *args, **kwargs)
+                await cache.set(key, _dump(model, result), entreprise_id)
+                return result
+            return _load(model, data)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+__all__ = ["cached_query"]
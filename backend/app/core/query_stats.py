@@ -0,0 +1,178 @@
+# app/core/query_stats.py
+# -----------------------------------------------------------------------------
+# Suivi des requêtes SQL par requête HTTP (ou par bloc de code) :
+# - install_query_tracking(engine) : chronomètre chaque requête du moteur via
+#   before/after_cursor_execute et l'impute aux suivis actifs (contextvar).
+# - track_queries() : ouvre un suivi (imbriquable : un suivi parent cumule
+#   les requêtes de ses enfants). Utilisé par les middlewares et les tests.
+# - QueryStatsMiddleware : en-tête Server-Timing (temps DB, nombre de
+#   requêtes, temps total) et, en DEBUG, log des formes de requête répétées
+#   (N+1 suspecté).
+# - add_query_observer(fn) : abonnement à chaque requête (ex. métriques).
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+QueryObserver = Callable[[str, float], None]
+_observers: list[QueryObserver] = []
+
+
+class QueryStats:
+    """Requêtes SQL d'un suivi : nombre, temps DB cumulé, formes (si collectées)."""
+
+    __slots__ = ("statements", "db_seconds", "shapes", "parent")
+
+    def __init__(self, *, collect_shapes: bool = False, parent: "QueryStats | None" = None) -> None:
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.shapes: Counter[str] | None = Counter() if collect_shapes else None
+        self.parent = parent
+
+    def record(self, statement: str, duration: float) -> None:
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.statements += 1
+            stats.db_seconds += duration
+            if stats.shapes is not None:
+                stats.shapes[statement_shape(statement)] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Formes exécutées au moins threshold fois (N+1 suspecté), les plus fréquentes d'abord."""
+        if self.shapes is None:
+            return []
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("gesco_query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """Forme d'une requête : SQL paramétré, espaces normalisés (les valeurs sont des paramètres liés)."""
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def current_query_stats() -> QueryStats | None:
+    """Suivi actif du contexte courant (None hors requête HTTP / bloc suivi)."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries(*, collect_shapes: bool = False) -> Iterator[QueryStats]:
+    """
+    Compte les requêtes SQL exécutées dans le bloc (y compris celles d'un
+    appel ASGI fait depuis la même tâche, ex. httpx.ASGITransport en test).
+    """
+    stats = QueryStats(collect_shapes=collect_shapes, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def add_query_observer(observer: QueryObserver) -> None:
+    """Appelle observer(statement, durée) après chaque requête SQL (idempotent)."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def install_query_tracking(sync_engine: Engine) -> None:
+    """Chronomètre chaque requête SQL du moteur (idempotent)."""
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault("gesco_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    starts = conn.info.get("gesco_query_start")
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    for observer in _observers:
+        observer(statement, duration)
+
+
+def server_timing(stats: QueryStats, total_seconds: float) -> str:
+    """Valeur de l'en-tête Server-Timing (durées en millisecondes)."""
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.statements} SQL", '
+        f"app;dur={total_seconds * 1000:.2f}"
+    )
+
+
+class QueryStatsMiddleware:
+    """
+    Middleware ASGI pur : suit les requêtes SQL de chaque requête HTTP.
+    Ajoute Server-Timing à la réponse (temps mesurés à l'envoi des en-têtes,
+    donc hors corps streamé). Si le logger est en DEBUG, journalise les
+    formes répétées au moins n_plus_one_threshold fois.
+    """
+
+    def __init__(self, app: ASGIApp, *, server_timing: bool = True, n_plus_one_threshold: int = 5) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        with track_queries(collect_shapes=logger.isEnabledFor(logging.DEBUG)) as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if self.server_timing and message["type"] == "http.response.start":
+                    value = server_timing(stats, time.perf_counter() - start)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", value.encode("latin-1"))]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        for shape, n in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "N+1 suspecté : %s %s — %d exécutions de : %s",
+                scope.get("method", ""),
+                scope.get("path", ""),
+                n,
+                shape[:500],
+            )
+
+
+__all__ = [
+    "QueryStats",
+    "QueryStatsMiddleware",
+    "add_query_observer",
+    "current_query_stats",
+    "install_query_tracking",
+    "server_timing",
+    "statement_shape",
+    "track_queries",
+]
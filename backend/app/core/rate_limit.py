@@ -1,57 +1,254 @@
 # app/core/rate_limit.py
 # -----------------------------------------------------------------------------
-# Middleware de limitation du débit (requêtes par minute par IP).
-# Désactivé si requests_per_minute <= 0.
+# Limitation du débit (middleware ASGI pur, sans BaseHTTPMiddleware : aucune
+# mise en tampon des réponses en flux).
+# Algorithme GCRA (équivalent d'un seau à jetons) : un seul horodatage par
+# clé (TAT, heure d'arrivée théorique), travail O(1) par requête.
+# Limites cumulables :
+# - par IP (RATE_LIMIT_PER_MINUTE) ;
+# - par utilisateur authentifié (RATE_LIMIT_PER_USER_PER_MINUTE, clé = sub du JWT) ;
+# - par route (RATE_LIMIT_ROUTES, préfixe de chemin, par utilisateur ou IP).
+# Backends : MemoryRateLimitBackend (LRU borné de clés, un processus, utilisé
+# aussi dans les tests) ; RedisRateLimitBackend (REDIS_URL, script Lua
+# atomique) pour que la limite tienne sur plusieurs workers. Redis
+# indisponible : repli sur le backend mémoire du processus.
+# Désactivé si toutes les limites valent 0.
 # -----------------------------------------------------------------------------
 
 import time
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import NamedTuple
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+from app.core.logging_config import get_logger
+from app.core.responses import ORJSONResponse
 
+logger = get_logger(__name__)
 
-def _get_client_ip(request: Request) -> str:
+_PERIOD_SECONDS = 60.0
+_DEFAULT_MAX_KEYS = 100_000
+
+
+class RouteLimit(NamedTuple):
+    """Limite propre aux chemins commençant par prefix (requêtes par minute)."""
+    prefix: str
+    requests_per_minute: int
+
+
+def parse_route_limits(value: str | None) -> list[RouteLimit]:
+    """
+    Lit RATE_LIMIT_ROUTES : "préfixe=limite" séparés par des virgules
+    (ex. "/api/v1/auth/login=10,/api/v1/rapports=30"). Le préfixe le plus long
+    l'emporte quand plusieurs correspondent.
+    """
+    limits = []
+    for part in (value or "").split(","):
+        prefix, sep, rpm = part.strip().rpartition("=")
+        if not sep or not prefix.strip():
+            continue
+        limits.append(RouteLimit(prefix.strip(), int(rpm)))
+    return sorted(limits, key=lambda r: len(r.prefix), reverse=True)
+
+
+class RateLimitBackend(ABC):
+    """Interface commune : hit() consomme une requête pour key."""
+
+    @abstractmethod
+    async def hit(self, key: str, requests_per_minute: int) -> float:
+        """Retourne 0 si la requête est acceptée, sinon le délai (secondes) avant de réessayer."""
+
+
+def _gcra(tat: float | None, now: float, requests_per_minute: int) -> tuple[float | None, float]:
+    """
+    Un pas GCRA : (nouveau TAT ou None si refus, délai avant réessai).
+    Rafale autorisée = requests_per_minute, puis une requête tous les 60 / rpm s.
+    """
+    interval = _PERIOD_SECONDS / requests_per_minute
+    new_tat = max(tat or now, now) + interval
+    allow_at = new_tat - _PERIOD_SECONDS
+    if now < allow_at:
+        return None, allow_at - now
+    return new_tat, 0.0
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """TAT par clé dans un LRU borné (max_keys) : mémoire constante quel que soit le nombre d'IP."""
+
+    def __init__(self, max_keys: int = _DEFAULT_MAX_KEYS) -> None:
+        self._max_keys = max_keys
+        self._tat: OrderedDict[str, float] = OrderedDict()
+
+    def hit_nowait(self, key: str, requests_per_minute: int) -> float:
+        now = time.monotonic()
+        new_tat, retry_after = _gcra(self._tat.get(key), now, requests_per_minute)
+        if new_tat is not None:
+            self._tat[key] = new_tat
+            self._tat.move_to_end(key)
+            if len(self._tat) > self._max_keys:
+                self._tat.popitem(last=False)
+        return retry_after
+
+    async def hit(self, key: str, requests_per_minute: int) -> float:
+        return self.hit_nowait(key, requests_per_minute)
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+# GCRA atomique côté Redis. KEYS[1] = clé ; ARGV = now, interval, période (secondes).
+_GCRA_LUA = """
+local tat = tonumber(redis.call('GET', KEYS[1]))
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+if tat == nil or tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if now < allow_at then return tostring(allow_at - now) end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return '0'
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """TAT partagés dans Redis (expiration automatique) ; repli mémoire en cas d'erreur."""
+
+    def __init__(self, url: str, fallback: MemoryRateLimitBackend | None = None) -> None:
+        self._url = url
+        self._client = None
+        self._script = None
+        self._fallback = fallback or MemoryRateLimitBackend()
+
+    def _get_script(self):
+        if self._script is None:
+            import redis.asyncio as redis_asyncio  # dépendance optionnelle
+
+            self._client = redis_asyncio.from_url(self._url)
+            self._script = self._client.register_script(_GCRA_LUA)
+        return self._script
+
+    async def hit(self, key: str, requests_per_minute: int) -> float:
+        try:
+            result = await self._get_script()(
+                keys=[f"gesco:ratelimit:{key}"],
+                args=[time.time(), _PERIOD_SECONDS / requests_per_minute, _PERIOD_SECONDS],
+            )
+        except Exception:
+            logger.warning("Limitation du débit : Redis indisponible, limite locale au processus", exc_info=True)
+            return self._fallback.hit_nowait(key, requests_per_minute)
+        return float(result)
+
+
+def get_rate_limit_backend(max_keys: int = _DEFAULT_MAX_KEYS) -> RateLimitBackend:
+    """Redis si REDIS_URL est défini et le paquet redis installé, sinon mémoire."""
+    from app.config import get_settings
+
+    url = get_settings().REDIS_URL
+    if url:
+        try:
+            import redis.asyncio  # noqa: F401
+        except ImportError:
+            logger.warning("REDIS_URL défini mais le paquet redis n'est pas installé : limite locale au processus")
+        else:
+            return RedisRateLimitBackend(url, MemoryRateLimitBackend(max_keys))
+    return MemoryRateLimitBackend(max_keys)
+
+
+def _header(scope, name: bytes) -> str | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _get_client_ip(scope) -> str:
     """Retourne l'IP du client (X-Forwarded-For si derrière proxy, sinon client.host)."""
-    forwarded = request.headers.get("x-forwarded-for")
+    forwarded = _header(scope, b"x-forwarded-for")
     if forwarded:
         return forwarded.split(",")[0].strip()
-    if request.client:
-        return request.client.host
+    client = scope.get("client")
+    if client:
+        return client[0]
     return "unknown"
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+def _get_user_id(scope) -> str | None:
+    """Identifiant (sub) du JWT Bearer s'il est valide, sinon None."""
+    auth = _header(scope, b"authorization")
+    if not auth:
+        return None
+    token = auth.strip()
+    if token.upper().startswith("BEARER "):
+        token = token[7:].strip()
+    from app.core.security import decode_access_token
+
+    payload = decode_access_token(token) if token else None
+    sub = payload.get("sub") if payload else None
+    return str(sub) if sub is not None else None
+
+
+class RateLimitMiddleware:
     """
-    Limite le nombre de requêtes par minute par IP (sliding window).
-    Si la limite est dépassée, renvoie 429 Too Many Requests.
+    Middleware ASGI : applique les limites IP, utilisateur et route ; au premier
+    dépassement renvoie 429 Too Many Requests avec l'en-tête Retry-After.
     """
 
-    def __init__(self, app, requests_per_minute: int):
-        super().__init__(app)
+    def __init__(
+        self,
+        app,
+        requests_per_minute: int,
+        *,
+        per_user_per_minute: int = 0,
+        route_limits: list[RouteLimit] | None = None,
+        backend: RateLimitBackend | None = None,
+        max_keys: int = _DEFAULT_MAX_KEYS,
+    ) -> None:
+        self.app = app
         self.requests_per_minute = requests_per_minute
-        self._store: defaultdict[str, list[float]] = defaultdict(list)
-        self._window_seconds = 60.0
+        self.per_user_per_minute = per_user_per_minute
+        self.route_limits = [r for r in route_limits or [] if r.requests_per_minute > 0]
+        self._backend = backend
+        self._max_keys = max_keys
+        self._enabled = requests_per_minute > 0 or per_user_per_minute > 0 or bool(self.route_limits)
 
-    def _clean_old(self, ip: str) -> None:
-        now = time.monotonic()
-        cutoff = now - self._window_seconds
-        self._store[ip] = [t for t in self._store[ip] if t > cutoff]
-
-    async def dispatch(self, request: Request, call_next):
-        if self.requests_per_minute <= 0:
-            return await call_next(request)
-        ip = _get_client_ip(request)
-        self._clean_old(ip)
-        if len(self._store[ip]) >= self.requests_per_minute:
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "detail": "Trop de requêtes. Réessayez plus tard.",
-                    "code": "RATE_LIMIT_EXCEEDED",
-                },
-            )
-        self._store[ip].append(time.monotonic())
-        return await call_next(request)
+    @property
+    def backend(self) -> RateLimitBackend:
+        if self._backend is None:
+            self._backend = get_rate_limit_backend(self._max_keys)
+        return self._backend
+
+    def _limits(self, scope) -> list[tuple[str, int]]:
+        """(clé, limite) applicables à la requête."""
+        ip = _get_client_ip(scope)
+        user_id = _get_user_id(scope) if self.per_user_per_minute > 0 or self.route_limits else None
+        limits = []
+        if self.requests_per_minute > 0:
+            limits.append((f"ip:{ip}", self.requests_per_minute))
+        if user_id is not None and self.per_user_per_minute > 0:
+            limits.append((f"user:{user_id}", self.per_user_per_minute))
+        path = scope.get("path", "")
+        for route in self.route_limits:
+            if path.startswith(route.prefix):
+                client = f"user:{user_id}" if user_id is not None else f"ip:{ip}"
+                limits.append((f"route:{route.prefix}:{client}", route.requests_per_minute))
+                break
+        return limits
 
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self._enabled:
+            await self.app(scope, receive, send)
+            return
+        for key, rpm in self._limits(scope):
+            retry_after = await self.backend.hit(key, rpm)
+            if retry_after > 0:
+                response = ORJSONResponse(
+                    status_code=429,
+                    content={
+                        "detail": "Trop de requêtes. Réessayez plus tard.",
+                        "code": "RATE_LIMIT_EXCEEDED",
+                    },
+                    headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
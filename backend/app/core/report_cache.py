@@ -0,0 +1,231 @@
+# app/core/report_cache.py
+# -----------------------------------------------------------------------------
+# Cache des résultats de rapports, invalidé par compteurs de version.
+# Clé = (rapport, entreprise_id, paramètres, versions des tables lues).
+# Chaque écriture commitée sur une table surveillée incrémente le compteur
+# (entreprise_id, table) : les entrées calculées avant l'écriture ne sont
+# plus jamais adressées, sans purge explicite. Les objets sans entreprise_id
+# (ex. stocks) incrémentent le compteur global de la table.
+# Niveaux : LRU mémoire du processus (REPORT_CACHE_MAX_ENTRIES, TTL) puis
+# Redis (REDIS_URL) partagé entre workers, qui porte aussi les compteurs.
+# Sans REDIS_URL, les compteurs sont propres au processus : une écriture
+# servie par un worker n'invalide pas les autres. Le cache est donc désactivé
+# si WEB_CONCURRENCY > 1 sans backend partagé.
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import hashlib
+import json
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, get_shared_backend
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Clé de Session.info : écritures (entreprise_id | None, table) en attente de commit
+_PENDING_WRITES = "report_cache_writes"
+_GLOBAL = "*"
+
+# Tables dont les écritures invalident les rapports (déclarées par les modules)
+_watched_tables: set[str] = set()
+
+
+def watch_tables(*tables: str) -> None:
+    """Déclare des tables lues par des rapports en cache (à appeler à l'import du module)."""
+    _watched_tables.update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_writes(session: Session, _flush_context) -> None:
+    """Mémorise les (entreprise_id, table) modifiés par le flush, jusqu'au commit."""
+    if not _watched_tables:
+        return
+    pending = None
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(getattr(obj, "__table__", None), "name", None)
+        if table not in _watched_tables:
+            continue
+        if pending is None:
+            pending = session.info.setdefault(_PENDING_WRITES, set())
+        pending.add((getattr(obj, "entreprise_id", None), table))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_writes(session: Session) -> None:
+    session.info.pop(_PENDING_WRITES, None)
+
+
+class ReportCache:
+    """Cache à deux niveaux (mémoire + partagé optionnel) pour les rapports."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        shared: CacheBackend | None = None,
+        workers: int = 1,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._local = MemoryCacheBackend(max_entries)
+        self._shared = shared
+        # Compteurs de version locaux (utilisés sans backend partagé)
+        self._versions: dict[str, int] = {}
+        # Époque des compteurs locaux : repartent de zéro à chaque démarrage
+        self._epoch = uuid.uuid4().hex[:12]
+        self._consistent = shared is not None or workers <= 1
+
+    @property
+    def consistent(self) -> bool:
+        """Compteurs de version communs à tous les workers (backend partagé ou processus unique)."""
+        return self._consistent
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._consistent
+
+    @staticmethod
+    def _version_key(entreprise_id: int | str | None, table: str) -> str:
+        return f"gesco:version:{table}:{_GLOBAL if entreprise_id is None else entreprise_id}"
+
+    async def _get_versions(self, entreprise_id: int | None, tables: tuple[str, ...]) -> list[int]:
+        keys = [k for t in tables for k in (self._version_key(entreprise_id, t), self._version_key(None, t))]
+        if self._shared is None:
+            return [self._versions.get(k, 0) for k in keys]
+        return [int(v or 0) for v in await self._shared.get_many(keys)]
+
+    async def versions(self, entreprise_id: int | None, tables: Iterable[str]) -> list[int]:
+        """Versions courantes (entreprise puis globale) des tables, aussi utilisées par app.core.query_cache."""
+        return await self._get_versions(entreprise_id, tuple(tables))
+
+    async def epoch(self) -> str:
+        """
+        Identifiant de la série de compteurs : change quand les compteurs
+        repartent de zéro (redémarrage sans backend partagé, Redis vidé).
+        Deux versions ne sont comparables qu'à époque égale (ETag).
+        """
+        if self._shared is None:
+            return self._epoch
+        key = "gesco:version:epoch"
+        value = await self._shared.get(key)
+        if value is None:
+            value = self._epoch.encode("ascii")
+            await self._shared.set(key, value)
+        return value.decode("ascii") if isinstance(value, bytes) else str(value)
+
+    async def bump(self, writes: Iterable[tuple[int | None, str]]) -> None:
+        """Incrémente les compteurs (entreprise_id, table) : invalide les rapports concernés."""
+        for entreprise_id, table in writes:
+            key = self._version_key(entreprise_id, table)
+            if self._shared is None:
+                self._versions[key] = self._versions.get(key, 0) + 1
+            else:
+                await self._shared.incr(key)
+
+    async def get_or_compute(
+        self,
+        *,
+        report: str,
+        entreprise_id: int,
+        params: dict,
+        tables: Iterable[str],
+        schema: type[M],
+        compute: Callable[[], Awaitable[M]],
+        cacheable: Callable[[M], bool] | None = None,
+    ) -> M:
+        """
+        Retourne le rapport en cache pour ces paramètres et versions, sinon le
+        calcule et le stocke (sauf si cacheable(résultat) est faux).
+        """
+        if not self.enabled:
+            return await compute()
+        tables = tuple(sorted(tables))
+        try:
+            versions = await self._get_versions(entreprise_id, tables)
+        except Exception:  # backend partagé indisponible : pas de cache plutôt qu'une erreur
+            logger.warning("Cache rapports : compteurs de version indisponibles", exc_info=True)
+            return await compute()
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        key = f"gesco:rapport:{report}:{entreprise_id}:{digest}:{'.'.join(map(str, versions))}"
+
+        value = self._local.get_nowait(key)
+        if value is not None:
+            return value
+        if self._shared is not None:
+            try:
+                raw = await self._shared.get(key)
+            except Exception:
+                logger.warning("Cache rapports : lecture partagée impossible", exc_info=True)
+                raw = None
+            if raw is not None:
+                value = schema.model_validate_json(raw)
+                self._local.set_nowait(key, value, self._ttl)
+                return value
+
+        value = await compute()
+        if cacheable is not None and not cacheable(value):
+            return value
+        self._local.set_nowait(key, value, self._ttl)
+        if self._shared is not None:
+            try:
+                await self._shared.set(key, value.model_dump_json().encode("utf-8"), self._ttl)
+            except Exception:
+                logger.warning("Cache rapports : écriture partagée impossible", exc_info=True)
+        return value
+
+    def clear(self) -> None:
+        """Vide le niveau mémoire et les compteurs locaux (tests, maintenance)."""
+        self._local.clear()
+        self._versions.clear()
+        self._epoch = uuid.uuid4().hex[:12]
+
+
+_report_cache: ReportCache | None = None
+
+
+def get_report_cache() -> ReportCache:
+    """Instance unique du cache de rapports (création paresseuse depuis la config)."""
+    global _report_cache
+    if _report_cache is None:
+        from app.config import get_settings
+
+        s = get_settings()
+        _report_cache = ReportCache(
+            ttl_seconds=s.REPORT_CACHE_TTL_SECONDS,
+            max_entries=s.REPORT_CACHE_MAX_ENTRIES,
+            shared=get_shared_backend(),
+            workers=s.WEB_CONCURRENCY,
+        )
+        if not _report_cache.consistent:
+            logger.warning(
+                "Cache rapports désactivé : WEB_CONCURRENCY=%d sans REDIS_URL (compteurs non partagés)",
+                s.WEB_CONCURRENCY,
+            )
+    return _report_cache
+
+
+async def apply_pending_invalidations(session: AsyncSession) -> None:
+    """
+    À appeler après un commit réussi : incrémente les versions des tables
+    écrites dans la transaction. Une erreur est journalisée sans faire échouer
+    la requête (les entrées concernées expirent au plus tard après le TTL).
+    """
+    writes = session.info.pop(_PENDING_WRITES, None)
+    if not writes:
+        return
+    try:
+        await get_report_cache().bump(writes)
+    except Exception:
+        logger.warning("Cache rapports : invalidation impossible", exc_info=True)
@@ -0,0 +1,95 @@
+# app/core/responses.py
+# -----------------------------------------------------------------------------
+# Classes de réponse HTTP sérialisées avec orjson.
+# - ORJSONResponse : réponse par défaut de l'application (create_app) et des
+#   gestionnaires d'exceptions. Le contenu arrive déjà encodé par FastAPI
+#   (Decimal → chaîne via response_model, date/datetime → ISO 8601) : la sortie
+#   est identique à JSONResponse, l'encodage est 5 à 10 fois plus rapide.
+# - NDJSONResponse : flux application/x-ndjson (un objet JSON par ligne) pour
+#   les listes volumineuses, sans construire le document complet en mémoire.
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+from collections.abc import AsyncIterable, Iterable
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Types non natifs pour orjson, encodés comme FastAPI/Pydantic le font."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    raise TypeError(f"Type non sérialisable en JSON : {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Sérialise en JSON (octets UTF-8) avec les mêmes conventions que l'API."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encodée avec orjson (même sortie, plus rapide)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Réponse NDJSON : chaque élément de items est sérialisé sur sa propre ligne.
+    Avec schema, chaque élément (ex. objet ORM) est validé par le schéma de
+    réponse de la route avant encodage (mêmes champs que la réponse JSON).
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(
+        self,
+        items: Iterable[Any] | AsyncIterable[Any],
+        *,
+        schema: type[BaseModel] | None = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._schema = schema
+        super().__init__(self._lines(items), status_code=status_code, headers=headers, media_type=self.media_type)
+
+    def _encode(self, item: Any) -> bytes:
+        if self._schema is not None:
+            item = self._schema.model_validate(item).model_dump(mode="json")
+        return dumps(item) + b"\n"
+
+    async def _lines(self, items: Iterable[Any] | AsyncIterable[Any]):
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                yield self._encode(item)
+        else:
+            for item in items:
+                yield self._encode(item)
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Le client demande un flux NDJSON (en-tête Accept: application/x-ndjson)."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+__all__ = [
+    "NDJSON_MEDIA_TYPE",
+    "NDJSONResponse",
+    "ORJSONResponse",
+    "dumps",
+    "wants_ndjson",
+]
@@ -3,18 +3,43 @@
 # Sécurité : hash des mots de passe (bcrypt) et tokens JWT (création / décodage).
 # Aucun import des modèles Utilisateur ou d'autres modules métier pour éviter
 # les imports circulaires. Les infos utilisateur sont passées en paramètre.
+# passlib (bcrypt) et jose sont importés au premier usage, pas au démarrage.
+# Dans les handlers async : hash_password_async / verify_password_async, qui
+# exécutent bcrypt (~250 ms à 12 rounds, GIL relâché) dans un pool de threads
+# dédié, derrière un sémaphore : la boucle d'événements n'est jamais bloquée et
+# une vague de connexions attend son tour sans saturer le processus.
+# Tokens JWT : backend JWT_BACKEND (jose, ou native = HMAC de la bibliothèque
+# standard, HS256/384/512, tokens interchangeables). Les tokens d'accès déjà
+# vérifiés sont gardés dans un LRU borné (clé = SHA-256 du token) jusqu'à leur
+# expiration : les appels suivants avec le même token ne relisent ni la config
+# ni la signature.
 # -----------------------------------------------------------------------------
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import orjson
 
 from app.config import get_settings
+from app.core.cache import MemoryCacheBackend
 
-# Contexte Passlib pour bcrypt (rounds injecté dans hash_password via config)
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def _pwd_context():
+    """Contexte Passlib pour bcrypt (rounds injecté dans hash_password via config), créé au premier usage."""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class InvalidTokenError(Exception):
+    """Token mal formé, signature invalide, algorithme inattendu ou token expiré."""
 
 
 def _get_secret_and_algorithm() -> tuple[str, str]:
@@ -30,7 +55,7 @@ def hash_password(plain_password: str) -> str:
     Le coût bcrypt est lu depuis la config (BCRYPT_ROUNDS).
     """
     rounds = get_settings().BCRYPT_ROUNDS
-    return _pwd_context.hash(plain_password, rounds=rounds)
+    return _pwd_context().hash(plain_password, rounds=rounds)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -38,7 +63,57 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Vérifie qu'un mot de passe en clair correspond au hash stocké.
     Retourne True si conforme, False sinon.
     """
-    return _pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Hash bcrypt ($2b$<rounds>$...) d'un coût différent de BCRYPT_ROUNDS (à recalculer)."""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != get_settings().BCRYPT_ROUNDS
+
+
+# Pool dédié au hachage (créé au premier usage) et sémaphore de la boucle courante
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+async def _run_hashing(fn, *args):
+    """
+    Exécute fn(*args) dans le pool de hachage. L'attente d'une place se fait
+    sur le sémaphore (annulable si le client abandonne), pas dans la file du
+    pool : au plus PASSWORD_HASH_WORKERS calculs bcrypt en même temps.
+    """
+    global _hash_executor, _hash_slots
+    workers = get_settings().PASSWORD_HASH_WORKERS
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gesco-bcrypt")
+    loop = asyncio.get_running_loop()
+    if _hash_slots is None or _hash_slots[0] is not loop:
+        _hash_slots = (loop, asyncio.Semaphore(workers))
+    async with _hash_slots[1]:
+        return await loop.run_in_executor(_hash_executor, fn, *args)
+
+
+async def hash_password_async(plain_password: str) -> str:
+    """hash_password hors de la boucle d'événements (handlers async)."""
+    return await _run_hashing(hash_password, plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password hors de la boucle d'événements (handlers async)."""
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_hashing() -> None:
+    """Arrête le pool de hachage (arrêt de l'application)."""
+    global _hash_executor, _hash_slots
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+    _hash_slots = None
 
 
 def create_access_token(
@@ -66,7 +141,7 @@ def create_access_token(
     }
     if extra_claims:
         to_encode.update(extra_claims)
-    return jwt.encode(to_encode, secret, algorithm=algorithm)
+    return _jwt_backend()[0](to_encode, secret, algorithm)
 
 
 def create_refresh_token(
@@ -91,22 +166,30 @@ def create_refresh_token(
     }
     if extra_claims:
         to_encode.update(extra_claims)
-    return jwt.encode(to_encode, secret, algorithm=algorithm)
+    return _jwt_backend()[0](to_encode, secret, algorithm)
 
 
 def decode_access_token(token: str) -> dict[str, Any] | None:
     """
     Décode et valide un token JWT d'accès. Vérifie la signature, l'expiration et type=access.
+    Token déjà vérifié et non expiré : payload relu dans le cache (partagé, ne pas le modifier).
     :return: Payload (dict) si valide, None si token invalide ou expiré.
     """
-    secret, algorithm = _get_secret_and_algorithm()
-    try:
-        payload = jwt.decode(token, secret, algorithms=[algorithm])
-        if payload.get("type") not in (None, "access"):
-            return None
-        return payload
-    except JWTError:
+    cache = _verified_tokens()
+    if cache is not None:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = cache.get_nowait(key)
+        if payload is not None:
+            return payload
+    payload = _decode(token)
+    if payload is None or payload.get("type") not in (None, "access"):
         return None
+    exp = payload.get("exp")
+    if cache is not None and isinstance(exp, int | float):
+        ttl = exp - time.time()
+        if ttl > 0:
+            cache.set_nowait(key, payload, ttl)
+    return payload
 
 
 def decode_refresh_token(token: str) -> dict[str, Any] | None:
@@ -114,12 +197,122 @@ def decode_refresh_token(token: str) -> dict[str, Any] | None:
     Décode et valide un token JWT de rafraîchissement. Vérifie la signature, l'expiration et type=refresh.
     :return: Payload (dict) si valide, None si token invalide ou expiré.
     """
+    payload = _decode(token)
+    if payload is None or payload.get("type") != "refresh":
+        return None
+    return payload
+
+
+# Tokens d'accès vérifiés (créé au premier usage ; None si JWT_CACHE_MAX_ENTRIES = 0)
+_token_cache: MemoryCacheBackend | None = None
+_token_cache_ready = False
+
+
+def _verified_tokens() -> MemoryCacheBackend | None:
+    global _token_cache, _token_cache_ready
+    if not _token_cache_ready:
+        max_entries = get_settings().JWT_CACHE_MAX_ENTRIES
+        _token_cache = MemoryCacheBackend(max_entries=max_entries) if max_entries else None
+        _token_cache_ready = True
+    return _token_cache
+
+
+def clear_token_cache() -> None:
+    """Vide le cache des tokens vérifiés (relu depuis la config au prochain décodage)."""
+    global _token_cache, _token_cache_ready
+    _token_cache = None
+    _token_cache_ready = False
+
+
+def _decode(token: str) -> dict[str, Any] | None:
+    """Vérifie signature et expiration avec le backend configuré ; None si invalide."""
     secret, algorithm = _get_secret_and_algorithm()
     try:
-        payload = jwt.decode(token, secret, algorithms=[algorithm])
-        if payload.get("type") != "refresh":
-            return None
-        return payload
-    except JWTError:
+        return _jwt_backend()[1](token, secret, algorithm)
+    except InvalidTokenError:
         return None
 
+
+def _jwt_backend():
+    """(encode, decode) du backend JWT_BACKEND."""
+    if get_settings().JWT_BACKEND == "native":
+        return native_jwt_encode, native_jwt_decode
+    return jose_jwt_encode, jose_jwt_decode
+
+
+def jose_jwt_encode(claims: dict[str, Any], secret: str, algorithm: str) -> str:
+    from jose import jwt
+    return jwt.encode(claims, secret, algorithm=algorithm)
+
+
+def jose_jwt_decode(token: str, secret: str, algorithm: str) -> dict[str, Any]:
+    from jose import JWTError, jwt
+    try:
+        return jwt.decode(token, secret, algorithms=[algorithm])
+    except JWTError as err:
+        raise InvalidTokenError(str(err)) from err
+
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _hmac_digest(algorithm: str):
+    try:
+        return _HMAC_DIGESTS[algorithm]
+    except KeyError:
+        raise ValueError(f"Algorithme JWT non pris en charge par le backend natif : {algorithm}") from None
+
+
+def _timestamp(value: Any) -> Any:
+    # Comme jose : datetime → secondes Unix entières (exp, iat, nbf)
+    return int(value.timestamp()) if isinstance(value, datetime) else value
+
+
+def native_jwt_encode(claims: dict[str, Any], secret: str, algorithm: str) -> str:
+    """Token HS256/384/512 (en-tête, payload orjson, signature HMAC) compatible jose."""
+    digest = _hmac_digest(algorithm)
+    claims = {k: _timestamp(v) if k in ("exp", "iat", "nbf") else v for k, v in claims.items()}
+    signing_input = (
+        _b64url_encode(orjson.dumps({"alg": algorithm, "typ": "JWT"}))
+        + b"."
+        + _b64url_encode(orjson.dumps(claims))
+    )
+    signature = hmac.new(secret.encode(), signing_input, digest).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+
+def native_jwt_decode(token: str, secret: str, algorithm: str) -> dict[str, Any]:
+    """Vérifie l'algorithme annoncé, la signature (temps constant), exp et nbf."""
+    digest = _hmac_digest(algorithm)
+    try:
+        signing_input, _, signature = token.encode("ascii").rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        header = orjson.loads(_b64url_decode(header_b64))
+        expected = hmac.new(secret.encode(), signing_input, digest).digest()
+        if not isinstance(header, dict) or header.get("alg") != algorithm:
+            raise InvalidTokenError("Algorithme inattendu")
+        if not hmac.compare_digest(_b64url_decode(signature), expected):
+            raise InvalidTokenError("Signature invalide")
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError as err:  # base64, JSON ou caractères non ASCII
+        raise InvalidTokenError("Token mal formé") from err
+    if not isinstance(payload, dict):
+        raise InvalidTokenError("Payload invalide")
+    now = time.time()
+    for claim in ("exp", "nbf"):
+        value = payload.get(claim)
+        if value is not None and not isinstance(value, int | float):
+            raise InvalidTokenError(f"Claim {claim} invalide")
+    if payload.get("exp") is not None and payload["exp"] < now:
+        raise InvalidTokenError("Token expiré")
+    if payload.get("nbf") is not None and payload["nbf"] > now:
+        raise InvalidTokenError("Token pas encore valide")
+    return payload
@@ -0,0 +1,180 @@
+# app/core/sqlite.py
+# -----------------------------------------------------------------------------
+# Profil SQLite haut débit (déploiement par défaut, postes de caisse en réseau).
+# - Pragmas appliqués à chaque connexion : journal WAL (lecteurs non bloqués
+#   par l'écrivain), synchronous=NORMAL (sûr en WAL), busy_timeout, cache_size,
+#   mmap_size, clés étrangères.
+# - Petit pool de connexions réutilisées au lieu d'une connexion par requête.
+# - Écrivain unique : SQLite n'accepte qu'une transaction d'écriture à la fois ;
+#   SerializedWriteSession prend un verrou asyncio avant la première écriture
+#   (tout flush, y compris l'autoflush déclenché par un SELECT, ou
+#   INSERT/UPDATE/DELETE) et le rend au commit/rollback/close, les écritures
+#   concurrentes attendent leur tour au lieu d'échouer avec « database is
+#   locked ». Les lectures sans objet en attente ne prennent pas le verrou.
+# Désactivé par SQLITE_TUNED=false (comportement historique : NullPool, sans
+# pragma). Les bases :memory: gardent NullPool.
+# Aucun import depuis app.modules pour éviter les imports circulaires.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import weakref
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.util import await_only
+
+# Un verrou d'écriture par boucle d'événements (les tests en créent plusieurs)
+_write_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+
+def is_sqlite(url: str) -> bool:
+    """URL SQLAlchemy SQLite (sqlite:// ou sqlite+aiosqlite://)."""
+    return url.startswith("sqlite")
+
+
+def is_memory(url: str) -> bool:
+    """Base en mémoire (:memory:, mode=memory ou URL sans chemin)."""
+    return ":memory:" in url or "mode=memory" in url or "///" not in url
+
+
+def sqlite_pragmas(settings: Any) -> list[str]:
+    """Pragmas du profil (ordre d'exécution à l'ouverture de la connexion)."""
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}",
+        # Valeur négative = taille en Kio (indépendante de page_size)
+        f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}",
+        f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA foreign_keys=ON",
+    ]
+
+
+def sqlite_engine_kwargs(settings: Any) -> dict:
+    """Options create_async_engine pour SQLite selon le profil."""
+    url = settings.DATABASE_URL
+    if not settings.SQLITE_TUNED or is_memory(url):
+        return {"poolclass": NullPool, "echo": settings.DATABASE_ECHO}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.SQLITE_POOL_SIZE,
+        "max_overflow": 0,
+        "pool_pre_ping": False,
+        "echo": settings.DATABASE_ECHO,
+        # Le verrou d'écriture attend côté asyncio ; busy_timeout reste le filet
+        # pour les autres processus (scripts, Alembic).
+        "connect_args": {"timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000},
+    }
+
+
+def install_pragmas(sync_engine: Engine, pragmas: list[str]) -> None:
+    """Exécute les pragmas sur chaque nouvelle connexion DBAPI du moteur."""
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _write_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _write_locks.get(loop)
+    if lock is None:
+        lock = _write_locks[loop] = asyncio.Lock()
+    return lock
+
+
+def _is_write(statement: Any) -> bool:
+    return bool(getattr(statement, "is_dml", False))
+
+
+class _WriterSession(Session):
+    """Session synchrone d'une SerializedWriteSession : porte le verrou d'écriture tenu."""
+
+    write_lock: asyncio.Lock | None = None
+
+
+@event.listens_for(_WriterSession, "before_flush")
+def _lock_before_flush(session: _WriterSession, _flush_context, _instances) -> None:
+    """
+    Tout flush prend le verrou, y compris l'autoflush d'une lecture (execute,
+    get, refresh...) : le flush s'exécute dans le greenlet de l'AsyncSession,
+    await_only y attend le verrou sans bloquer la boucle d'événements.
+    """
+    if session.write_lock is None:
+        lock = _write_lock()
+        await_only(lock.acquire())
+        session.write_lock = lock
+
+
+class SerializedWriteSession(AsyncSession):
+    """
+    AsyncSession dont les transactions d'écriture passent une à une.
+    Le verrou est pris avant la première écriture de la transaction (flush
+    ou instruction DML) et rendu à sa fin (commit, rollback ou close).
+    """
+
+    sync_session_class = _WriterSession
+
+    async def _acquire_writer(self) -> None:
+        if self.sync_session.write_lock is None:
+            lock = _write_lock()
+            await lock.acquire()
+            self.sync_session.write_lock = lock
+
+    def _release_writer(self) -> None:
+        lock, self.sync_session.write_lock = self.sync_session.write_lock, None
+        if lock is not None:
+            lock.release()
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any):
+        if _is_write(statement):
+            await self._acquire_writer()
+        return await super().execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any):
+        if _is_write(statement):
+            await self._acquire_writer()
+        return await super().scalar(statement, *args, **kwargs)
+
+    async def scalars(self, statement: Any, *args: Any, **kwargs: Any):
+        if _is_write(statement):
+            await self._acquire_writer()
+        return await super().scalars(statement, *args, **kwargs)
+
+    async def commit(self) -> None:
+        try:
+            await super().commit()
+        finally:
+            self._release_writer()
+
+    async def rollback(self) -> None:
+        try:
+            await super().rollback()
+        finally:
+            self._release_writer()
+
+    async def close(self) -> None:
+        try:
+            await super().close()
+        finally:
+            self._release_writer()
+
+
+__all__ = [
+    "SerializedWriteSession",
+    "install_pragmas",
+    "is_memory",
+    "is_sqlite",
+    "sqlite_engine_kwargs",
+    "sqlite_pragmas",
+]
@@ -0,0 +1,166 @@
+# app/core/startup.py
+# -----------------------------------------------------------------------------
+# Temps de démarrage : mesure et réduction.
+# - timed_import() : import d'un module chronométré (coût marginal : les
+#   dépendances déjà chargées par un module précédent ne sont pas recomptées).
+# - Phases exposées sur /metrics (gesco_startup_seconds{phase}) et journalisées
+#   au démarrage : import:<module>, app (create_app), ready (application prête),
+#   first_request (première requête servie).
+# - LazyRouters : routeurs des modules importés au premier appel de leur
+#   préfixe (LAZY_ROUTERS) au lieu de tous au démarrage.
+# - load_openapi_schema() : schéma OpenAPI sérialisé au build
+#   (scripts/export_openapi.py) et relu depuis le disque (OPENAPI_SCHEMA_FILE).
+# Détail complet des imports : python -X importtime -c "import app.main".
+# Aucun import depuis app.modules au chargement (imports par nom, à la demande).
+# -----------------------------------------------------------------------------
+
+import importlib
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.logging_config import get_logger
+from app.core.metrics import REGISTRY, Gauge
+
+logger = get_logger(__name__)
+
+STARTUP_SECONDS = REGISTRY.register(
+    Gauge("gesco_startup_seconds", "Durées de démarrage (imports de modules, création de l'app, prêt, première requête).", ("phase",))
+)
+
+# Origine des phases ready / first_request : début de create_app()
+_origin: float | None = None
+_timings: dict[str, float] = {}
+
+
+def mark_origin() -> None:
+    """Fixe l'origine des mesures (appelé au début de create_app)."""
+    global _origin
+    _origin = time.perf_counter()
+
+
+def record_phase(phase: str, seconds: float | None = None) -> float:
+    """Enregistre une phase ; sans durée, temps écoulé depuis l'origine."""
+    if seconds is None:
+        seconds = time.perf_counter() - (_origin if _origin is not None else time.perf_counter())
+    _timings[phase] = seconds
+    STARTUP_SECONDS.set(seconds, phase)
+    return seconds
+
+
+def startup_timings() -> dict[str, float]:
+    """Copie des durées mesurées (secondes)."""
+    return dict(_timings)
+
+
+def timed_import(name: str) -> ModuleType:
+    """Importe un module et enregistre la durée sous la phase import:<name>."""
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    record_phase(f"import:{name}", time.perf_counter() - start)
+    return module
+
+
+def log_startup_timings(top: int = 5) -> None:
+    """Journalise la synthèse du démarrage (imports les plus coûteux en tête)."""
+    imports = sorted(
+        ((phase.removeprefix("import:"), s) for phase, s in _timings.items() if phase.startswith("import:")),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    detail = ", ".join(f"{name} {s * 1000:.0f} ms" for name, s in imports[:top])
+    logger.info(
+        "Démarrage en %.0f ms (imports : %s)",
+        _timings.get("ready", 0.0) * 1000,
+        detail or "aucun",
+        extra={"startup_ms": {phase: round(s * 1000, 1) for phase, s in _timings.items()}},
+    )
+
+
+class FirstRequestTimer:
+    """Middleware ASGI pur : enregistre la phase first_request une seule fois."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.done = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.done or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if not self.done:
+                self.done = True
+                record_phase("first_request")
+
+
+class LazyRouters:
+    """
+    Routeurs des modules métier (app.modules.<nom>.router, préfixe /<nom>).
+    install() : aucun import au démarrage ; une requête sans route dont le
+    chemin commence par <prefix>/<nom> importe et enregistre le routeur du
+    module, puis est routée à nouveau. load_all() : tout charger (mode
+    classique, génération du schéma OpenAPI).
+    """
+
+    def __init__(self, app: Any, prefix: str, modules: Iterable[str]) -> None:
+        self.app = app
+        self.prefix = prefix
+        self.modules = tuple(modules)
+        self.loaded: set[str] = set()
+        self._models_loaded = False
+        self._not_found = app.router.default
+
+    def load(self, name: str) -> bool:
+        """Importe et enregistre le routeur du module ; False s'il l'était déjà."""
+        if name in self.loaded:
+            return False
+        if not self._models_loaded:
+            # Tous les modèles d'abord : clés étrangères et relations entre
+            # modules résolues quel que soit le premier routeur chargé.
+            for module in self.modules:
+                importlib.import_module(f"app.modules.{module}.models")
+            self._models_loaded = True
+        router = timed_import(f"app.modules.{name}.router").router
+        self.app.include_router(router, prefix=self.prefix)
+        self.loaded.add(name)
+        return True
+
+    def load_all(self) -> None:
+        for name in self.modules:
+            self.load(name)
+
+    def install(self) -> None:
+        """Branche le chargement à la demande sur le routeur de l'application."""
+        self.app.router.default = self._default
+
+    def _module_for(self, path: str) -> str | None:
+        if not path.startswith(self.prefix + "/"):
+            return None
+        name = path[len(self.prefix) + 1:].split("/", 1)[0]
+        return name if name in self.modules else None
+
+    async def _default(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Import synchrone (une fois par module) : pas d'attente entre le test
+        # et l'enregistrement, donc pas de double chargement concurrent.
+        name = self._module_for(scope.get("path", "")) if scope["type"] == "http" else None
+        if name is not None and self.load(name):
+            await self.app.router.app(scope, receive, send)
+            return
+        await self._not_found(scope, receive, send)
+
+
+def load_openapi_schema(path: str | Path) -> dict[str, Any] | None:
+    """Schéma OpenAPI pré-calculé ; None (avec avertissement) si absent ou illisible."""
+    try:
+        return orjson.loads(Path(path).read_bytes())
+    except (OSError, orjson.JSONDecodeError) as exc:
+        logger.warning("Schéma OpenAPI pré-calculé ignoré (%s) : %s", path, exc)
+        return None
@@ -3,38 +3,74 @@
 # Point d'entrée FastAPI (Clean Architecture : couche Présentation).
 # - Crée l'application via create_app(), enregistre les 15 routeurs sous /api/v1.
 # - Gestion des erreurs (AppHTTPException, HTTPException, Exception), CORS, lifespan.
-# - Rate limiting, logging, création du répertoire DB SQLite au démarrage.
-# - Endpoints racine : GET / (infos API), GET /health (santé sans DB).
-# - OpenAPI : tags, schéma JWT Bearer pour Authorize dans /docs.
+# - GET conditionnels : NotModifiedError → 304 sans corps (ETag, Cache-Control).
+# - Réponses JSON encodées avec orjson (ORJSONResponse par défaut).
+# - Rate limiting, logging structuré non bloquant (request_id), création du répertoire DB SQLite au démarrage.
+# - Endpoints racine : GET / (infos API), GET /health (santé sans DB),
+#   GET /metrics (format Prometheus, si METRICS_ENABLED et un seul worker).
+# - Server-Timing (temps DB / requêtes SQL) sur chaque réponse.
+# - OpenAPI : tags, schéma JWT Bearer pour Authorize dans /docs ; schéma
+#   pré-calculé relu depuis le disque si OPENAPI_SCHEMA_FILE.
+# - Démarrage : routeurs importés par nom et chronométrés (app.core.startup),
+#   à la demande si LAZY_ROUTERS.
 # -----------------------------------------------------------------------------
 
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse, Response
 
 from app.config import get_settings
 from app.core.database import get_engine
-from app.core.exceptions import AppHTTPException
-from app.core.logging_config import setup_logging
-from app.core.rate_limit import RateLimitMiddleware
-from app.modules.achats.router import router as achats_router
-from app.modules.auth.router import router as auth_router
-from app.modules.catalogue.router import router as catalogue_router
-from app.modules.commercial.router import router as commercial_router
-from app.modules.comptabilite.router import router as comptabilite_router
-from app.modules.immobilisations.router import router as immobilisations_router
-from app.modules.paie.router import router as paie_router
-from app.modules.parametrage.router import router as parametrage_router
-from app.modules.partenaires.router import router as partenaires_router
-from app.modules.rapports.router import router as rapports_router
-from app.modules.rh.router import router as rh_router
-from app.modules.stock.router import router as stock_router
-from app.modules.systeme.router import router as systeme_router
-from app.modules.tresorerie.router import router as tresorerie_router
+from app.core.exceptions import AppHTTPException, NotModifiedError
+from app.core.logging_config import (
+    REQUEST_ID_HEADER,
+    LogContextMiddleware,
+    bind_route_log_context,
+    get_logger,
+    setup_logging,
+    shutdown_logging,
+)
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.rate_limit import RateLimitMiddleware, parse_route_limits
+from app.core.responses import ORJSONResponse
+from app.core.security import shutdown_password_hashing
+from app.core.startup import (
+    FirstRequestTimer,
+    LazyRouters,
+    load_openapi_schema,
+    log_startup_timings,
+    mark_origin,
+    record_phase,
+)
+
+logger = get_logger(__name__)
+
+# Routeurs API v1 (ordre = priorité métier, cf. docs/MODULES_PRIORITES.md), préfixe /<module>
+# P0: auth, parametrage | P1: catalogue, partenaires | P2: commercial, achats, stock
+# P3: tresorerie, comptabilite | P4: rh, paie | P5: systeme, rapports, immobilisations
+ROUTER_MODULES = (
+    "auth",
+    "parametrage",
+    "catalogue",
+    "partenaires",
+    "commercial",
+    "achats",
+    "stock",
+    "tresorerie",
+    "comptabilite",
+    "rh",
+    "paie",
+    "systeme",
+    "rapports",
+    "immobilisations",
+)
 
 
 def _error_response(status_code: int, detail: Any, code: str | None = None) -> dict:
@@ -45,19 +81,35 @@ def _error_response(status_code: int, detail: Any, code: str | None = None) -> d
     return body
 
 
+async def _resume_imports() -> None:
+    """Reprend les imports en masse interrompus (sans bloquer le démarrage en cas d'erreur)."""
+    from app.modules.systeme.services.import_donnees import resume_pending_imports
+
+    try:
+        await resume_pending_imports()
+    except Exception:
+        logger.warning("Reprise des imports en masse impossible", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Cycle de vie : démarrage et arrêt propre.
     - Configuration du logging (LOG_LEVEL, LOG_FORMAT, LOG_FILE).
     - Création du répertoire app/db si SQLite.
-    - Au shutdown, fermeture du pool de connexions DB (évite fuites).
+    - Synthèse des temps de démarrage (imports, prêt).
+    - Reprise des imports en masse interrompus ; au shutdown, imports en
+      cours marqués interrompus.
+    - Au shutdown, fermeture du pool de connexions DB (évite fuites), arrêt
+      du pool de hachage des mots de passe puis vidage de la file de logs.
     """
     settings = get_settings()
     setup_logging(
         level=settings.LOG_LEVEL,
         format_type=settings.LOG_FORMAT,
         log_file=settings.LOG_FILE or None,
+        debug_sample_rate=settings.LOG_DEBUG_SAMPLE_RATE,
+        queue_size=settings.LOG_QUEUE_SIZE,
     )
     if "sqlite" in settings.DATABASE_URL:
         # Créer le répertoire parent du fichier SQLite si nécessaire
@@ -68,9 +120,17 @@ async def lifespan(app: FastAPI):
                 parent = Path(db_path).parent
                 if parent and str(parent) != ".":
                     parent.mkdir(parents=True, exist_ok=True)
+    record_phase("ready")
+    log_startup_timings()
+    await _resume_imports()
     yield
+    from app.modules.systeme.services.import_donnees import shutdown_imports
+
+    await shutdown_imports()
     engine = get_engine()
     await engine.dispose()
+    shutdown_password_hashing()
+    shutdown_logging()
 
 
 # Tags OpenAPI segmentés par table/ressource (un tag par ressource pour /docs)
@@ -148,14 +208,18 @@ OPENAPI_TAGS = [
     {"name": "Système - Journal d'audit", "description": "Traçabilité des actions (création, modification, connexion)."},
     {"name": "Système - Notifications", "description": "Notifications in-app par utilisateur."},
     {"name": "Système - Licences logicielles", "description": "Licences logicielles par entreprise."},
+    {"name": "Système - Imports", "description": "Import en masse CSV/XLSX (produits, tiers, employés, plan comptable), par lots en tâche de fond."},
     # Rapports
     {"name": "Rapports - Chiffre d'affaires", "description": "Chiffre d'affaires sur une période."},
-    {"name": "Rapports - Tableau de bord", "description": "Synthèse (CA, factures, commandes, employés actifs)."},
+    {"name": "Rapports - Séries CA", "description": "Séries CA par jour/semaine/mois/trimestre et comparaison N-1."},
+    {"name": "Rapports - Tableau de bord", "description": "Synthèse (CA, factures, commandes, employés actifs, alertes stock, créances échues, masse salariale)."},
+    {"name": "Rapports - Balance âgée", "description": "Créances clients par ancienneté d'échéance (non échu, 0-30, 31-60, 61-90, > 90 jours)."},
 ]
 
 
 def create_app() -> FastAPI:
     """Factory de l'application (testable, sans effets de bord à l'import)."""
+    mark_origin()
     settings = get_settings()
     app = FastAPI(
         title=settings.APP_NAME,
@@ -165,6 +229,9 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_tags=OPENAPI_TAGS,
+        default_response_class=ORJSONResponse,
+        # Route dans le contexte de log dès le routage (avant auth et handler)
+        dependencies=[Depends(bind_route_log_context)],
     )
 
     # --- Gestionnaires d'exceptions (réponse JSON cohérente) ---
@@ -172,18 +239,25 @@ def create_app() -> FastAPI:
     async def app_http_exception_handler(
         _request: Request,
         exc: AppHTTPException,
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=_error_response(exc.status_code, exc.detail, getattr(exc, "code", None)),
         )
 
+    @app.exception_handler(NotModifiedError)
+    async def not_modified_handler(
+        _request: Request,
+        exc: NotModifiedError,
+    ) -> Response:
+        return Response(status_code=304, headers=exc.headers)
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(
         _request: Request,
         exc: HTTPException,
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=_error_response(exc.status_code, exc.detail),
         )
@@ -192,52 +266,90 @@ def create_app() -> FastAPI:
     async def unhandled_exception_handler(
         _request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Erreur serveur non gérée : réponse 500 cohérente (évite d'exposer les détails)."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=_error_response(500, "Erreur interne du serveur", code="INTERNAL_ERROR"),
         )
 
-    # --- CORS (ajouté en premier = couche externe) ---
+    # --- Middlewares : add_middleware insère en tête, le dernier ajouté est le
+    # plus externe. Ordre à la réception : LogContext → FirstRequestTimer →
+    # Metrics → QueryStats → RateLimit → CORS → routes (inverse à la réponse).
+
+    # --- CORS (ajouté en premier = couche la plus interne, juste avant les routes) ---
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins_list(),
         allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "Server-Timing", REQUEST_ID_HEADER, "ETag"],
     )
 
-    # --- Rate limiting (dernière couche avant les routes = exécuté en premier à la réception) ---
+    # --- Rate limiting (sous les couches de log, métriques et suivi SQL : les 429 y sont mesurés) ---
     app.add_middleware(
         RateLimitMiddleware,
         requests_per_minute=settings.RATE_LIMIT_PER_MINUTE,
+        per_user_per_minute=settings.RATE_LIMIT_PER_USER_PER_MINUTE,
+        route_limits=parse_route_limits(settings.RATE_LIMIT_ROUTES),
+        max_keys=settings.RATE_LIMIT_MAX_KEYS,
     )
 
-    # --- Routeurs API v1 (ordre = priorité métier, cf. docs/MODULES_PRIORITES.md) ---
-    # P0: auth, parametrage | P1: catalogue, partenaires | P2: commercial, achats, stock
-    # P3: tresorerie, comptabilite | P4: rh, paie | P5: systeme, rapports, immobilisations
+    # --- Suivi SQL par requête : Server-Timing, N+1 en DEBUG ---
+    app.add_middleware(
+        QueryStatsMiddleware,
+        server_timing=settings.SERVER_TIMING_ENABLED,
+        n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+    )
+
+    # --- Métriques (externe au rate limiting : mesure aussi les réponses 429) ---
+    if settings.METRICS_ENABLED and not settings.metrics_active():
+        logger.warning(
+            "/metrics désactivé : WEB_CONCURRENCY=%d (métriques propres à chaque worker, scrape incohérent)",
+            settings.WEB_CONCURRENCY,
+        )
+    if settings.metrics_active():
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get(
+            "/metrics",
+            summary="Métriques Prometheus",
+            description="Latence par route, requêtes en cours, tailles de réponse, requêtes SQL, pool de connexions et caches. Sans authentification (à restreindre au réseau de supervision).",
+            response_class=PlainTextResponse,
+            include_in_schema=False,
+        )
+        async def metrics() -> PlainTextResponse:
+            """Exposition texte des métriques du processus (unique worker)."""
+            return PlainTextResponse(render_metrics(get_engine()), media_type=METRICS_CONTENT_TYPE)
+
+    # --- Temps jusqu'à la première requête servie (gesco_startup_seconds) ---
+    app.add_middleware(FirstRequestTimer)
+
+    # --- Contexte de log (request_id, route) et journal d'accès : couche la plus externe ---
+    app.add_middleware(LogContextMiddleware, access_log=settings.LOG_ACCESS_ENABLED)
+
+    # --- Routeurs API v1 : tous au démarrage, ou au premier appel de leur préfixe ---
     # Préfixe sans slash final pour éviter double slash (ex. GET /api/v1/auth/entreprises)
     prefix = settings.API_V1_PREFIX.rstrip("/") or "/api/v1"
-    app.include_router(auth_router, prefix=prefix)
-    app.include_router(parametrage_router, prefix=prefix)
-    app.include_router(catalogue_router, prefix=prefix)
-    app.include_router(partenaires_router, prefix=prefix)
-    app.include_router(commercial_router, prefix=prefix)
-    app.include_router(achats_router, prefix=prefix)
-    app.include_router(stock_router, prefix=prefix)
-    app.include_router(tresorerie_router, prefix=prefix)
-    app.include_router(comptabilite_router, prefix=prefix)
-    app.include_router(rh_router, prefix=prefix)
-    app.include_router(paie_router, prefix=prefix)
-    app.include_router(systeme_router, prefix=prefix)
-    app.include_router(rapports_router, prefix=prefix)
-    app.include_router(immobilisations_router, prefix=prefix)
+    routers = LazyRouters(app, prefix, ROUTER_MODULES)
+    if settings.LAZY_ROUTERS:
+        routers.install()
+    else:
+        routers.load_all()
+    app.state.routers = routers
 
     # --- OpenAPI : schéma JWT Bearer pour "Authorize" dans /docs ---
     def custom_openapi():
         if app.openapi_schema is not None:
             return app.openapi_schema
+        if settings.OPENAPI_SCHEMA_FILE:
+            # Schéma sérialisé au build (scripts/export_openapi.py) : ni import des routeurs ni génération
+            schema = load_openapi_schema(settings.OPENAPI_SCHEMA_FILE)
+            if schema is not None:
+                app.openapi_schema = schema
+                return app.openapi_schema
+        routers.load_all()
         from fastapi.openapi.utils import get_openapi
         openapi_schema = get_openapi(
             title=app.title,
@@ -259,6 +371,7 @@ def create_app() -> FastAPI:
 
     app.openapi = custom_openapi
 
+    record_phase("app")
     return app
 
 
@@ -1,7 +1,8 @@
 # app/modules/achats/repositories/commande_fournisseur_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.achats.models import CommandeFournisseur
 
 
@@ -20,19 +21,15 @@ class CommandeFournisseurRepository:
         fournisseur_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[CommandeFournisseur], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CommandeFournisseur], int | None]:
         q = select(CommandeFournisseur)
-        count_q = select(func.count()).select_from(CommandeFournisseur)
         if entreprise_id is not None:
             q = q.where(CommandeFournisseur.entreprise_id == entreprise_id)
-            count_q = count_q.where(CommandeFournisseur.entreprise_id == entreprise_id)
         if fournisseur_id is not None:
             q = q.where(CommandeFournisseur.fournisseur_id == fournisseur_id)
-            count_q = count_q.where(CommandeFournisseur.fournisseur_id == fournisseur_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(CommandeFournisseur.date_commande.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(CommandeFournisseur.date_commande.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_numero(
         self, entreprise_id: int, numero: str, exclude_id: int | None = None
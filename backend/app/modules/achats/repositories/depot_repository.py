@@ -1,7 +1,8 @@
 # app/modules/achats/repositories/depot_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.achats.models import Depot
 
 
@@ -14,14 +15,11 @@ class DepotRepository:
         return r.scalar_one_or_none()
 
     async def find_all(
-        self, *, entreprise_id: int, skip: int = 0, limit: int = 100
-    ) -> tuple[list[Depot], int]:
+        self, *, entreprise_id: int, skip: int = 0, limit: int = 100, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Depot], int | None]:
         q = select(Depot).where(Depot.entreprise_id == entreprise_id)
-        count_q = select(func.count()).select_from(Depot).where(Depot.entreprise_id == entreprise_id)
-        total = (await self._db.execute(count_q)).scalar() or 0
-        q = q.order_by(Depot.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Depot.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_code(self, entreprise_id: int, code: str, exclude_id: int | None = None) -> bool:
         q = select(Depot.id).where(Depot.entreprise_id == entreprise_id, Depot.code == code)
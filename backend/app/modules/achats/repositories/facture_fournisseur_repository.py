@@ -1,7 +1,8 @@
 # app/modules/achats/repositories/facture_fournisseur_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.achats.models import FactureFournisseur
 
 
@@ -20,19 +21,15 @@ class FactureFournisseurRepository:
         fournisseur_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[FactureFournisseur], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[FactureFournisseur], int | None]:
         q = select(FactureFournisseur)
-        count_q = select(func.count()).select_from(FactureFournisseur)
         if entreprise_id is not None:
             q = q.where(FactureFournisseur.entreprise_id == entreprise_id)
-            count_q = count_q.where(FactureFournisseur.entreprise_id == entreprise_id)
         if fournisseur_id is not None:
             q = q.where(FactureFournisseur.fournisseur_id == fournisseur_id)
-            count_q = count_q.where(FactureFournisseur.fournisseur_id == fournisseur_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(FactureFournisseur.date_facture.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(FactureFournisseur.date_facture.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: FactureFournisseur) -> FactureFournisseur:
         self._db.add(entity)
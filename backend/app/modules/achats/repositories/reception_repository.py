@@ -1,7 +1,8 @@
 # app/modules/achats/repositories/reception_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.achats.models import Reception
 
 
@@ -14,16 +15,11 @@ class ReceptionRepository:
         return r.scalar_one_or_none()
 
     async def find_by_commande(
-        self, commande_fournisseur_id: int, *, skip: int = 0, limit: int = 100
-    ) -> tuple[list[Reception], int]:
+        self, commande_fournisseur_id: int, *, skip: int = 0, limit: int = 100, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Reception], int | None]:
         q = select(Reception).where(Reception.commande_fournisseur_id == commande_fournisseur_id)
-        count_q = select(func.count()).select_from(Reception).where(
-            Reception.commande_fournisseur_id == commande_fournisseur_id
-        )
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Reception.date_reception.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Reception.date_reception.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Reception) -> Reception:
         self._db.add(entity)
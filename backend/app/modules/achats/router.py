@@ -9,6 +9,7 @@ from fastapi import APIRouter, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.achats import schemas
 from app.modules.achats.services import (
     CommandeFournisseurService,
@@ -35,7 +36,7 @@ async def list_depots(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
 ):
-    items, _ = await DepotService(db).get_all(entreprise_id=entreprise_id, skip=skip, limit=limit)
+    items, _ = await DepotService(db).get_all(entreprise_id=entreprise_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
@@ -81,7 +82,7 @@ async def list_commandes_fournisseurs(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await CommandeFournisseurService(db).get_all(
-        entreprise_id=entreprise_id, fournisseur_id=fournisseur_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, fournisseur_id=fournisseur_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -94,7 +95,7 @@ async def list_receptions_by_commande(
     cmd = await CommandeFournisseurService(db).get_or_404(commande_id)
     if cmd.entreprise_id != current_user.entreprise_id:
         raise ForbiddenError(detail="Accès à une autre entreprise non autorisé", code="FORBIDDEN_ENTREPRISE")
-    items, _ = await ReceptionService(db).get_by_commande(commande_id, skip=skip, limit=limit)
+    items, _ = await ReceptionService(db).get_by_commande(commande_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
@@ -162,7 +163,7 @@ async def list_factures_fournisseurs(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await FactureFournisseurService(db).get_all(
-        entreprise_id=entreprise_id, fournisseur_id=fournisseur_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, fournisseur_id=fournisseur_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.models import CommandeFournisseur
 from app.modules.achats.repositories import CommandeFournisseurRepository, DepotRepository
 from app.modules.achats.schemas import CommandeFournisseurCreate, CommandeFournisseurUpdate
@@ -45,13 +46,15 @@ class CommandeFournisseurService(BaseAchatsService):
         fournisseur_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[CommandeFournisseur], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CommandeFournisseur], int | None]:
         """Liste les commandes fournisseurs avec filtres et pagination."""
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             fournisseur_id=fournisseur_id,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: CommandeFournisseurCreate) -> CommandeFournisseur:
@@ -6,6 +6,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.models import Depot
 from app.modules.achats.repositories import DepotRepository
 from app.modules.achats.schemas import DepotCreate, DepotUpdate
@@ -33,9 +34,9 @@ class DepotService(BaseAchatsService):
         return ent
 
     async def get_all(
-        self, *, entreprise_id: int, skip: int = 0, limit: int = 100
-    ) -> tuple[list[Depot], int]:
-        return await self._repo.find_all(entreprise_id=entreprise_id, skip=skip, limit=limit)
+        self, *, entreprise_id: int, skip: int = 0, limit: int = 100, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Depot], int | None]:
+        return await self._repo.find_all(entreprise_id=entreprise_id, skip=skip, limit=limit, include_total=include_total)
 
     async def create(self, data: DepotCreate) -> Depot:
         if await self._entreprise_repo.find_by_id(data.entreprise_id) is None:
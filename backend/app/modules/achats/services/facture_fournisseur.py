@@ -7,6 +7,7 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.models import FactureFournisseur, StatutPaiementFournisseur, TypeFactureFournisseur
 from app.modules.achats.repositories import (
     CommandeFournisseurRepository,
@@ -48,13 +49,15 @@ class FactureFournisseurService(BaseAchatsService):
         fournisseur_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[FactureFournisseur], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[FactureFournisseur], int | None]:
         """Liste les factures fournisseurs avec filtres et pagination."""
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             fournisseur_id=fournisseur_id,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     def _validate_montants(self, montant_ttc: Decimal | None, montant_restant_du: Decimal | None) -> None:
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.models import Reception, StatutReception
 from app.modules.achats.repositories import (
     CommandeFournisseurRepository,
@@ -37,11 +38,12 @@ class ReceptionService(BaseAchatsService):
         return ent
 
     async def get_by_commande(
-        self, commande_fournisseur_id: int, *, skip: int = 0, limit: int = 100
-    ) -> tuple[list[Reception], int]:
+        self, commande_fournisseur_id: int, *, skip: int = 0, limit: int = 100, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Reception], int | None]:
         """Liste les réceptions d'une commande fournisseur avec pagination."""
         return await self._repo.find_by_commande(
-            commande_fournisseur_id, skip=skip, limit=limit
+            commande_fournisseur_id, skip=skip, limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: ReceptionCreate) -> Reception:
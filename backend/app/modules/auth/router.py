@@ -9,6 +9,7 @@
 from fastapi import APIRouter
 
 from app.core.dependencies import DbSession
+from app.core.pagination import TotalMode
 from app.modules.auth import schemas as auth_schemas
 from app.modules.auth.service import login as auth_login, refresh_access_token as auth_refresh
 from app.modules.parametrage.services.entreprise import EntrepriseService
@@ -25,7 +26,7 @@ router = APIRouter(prefix="/auth", tags=["Authentification"])
 async def list_entreprises_login(db: DbSession):
     """Retourne id et raison_sociale des entreprises actives (pour le formulaire de login)."""
     service = EntrepriseService(db)
-    items, _ = await service.get_entreprises(skip=0, limit=500, actif_only=True)
+    items, _ = await service.get_entreprises(skip=0, limit=500, actif_only=True, include_total=TotalMode.none)
     return [auth_schemas.EntrepriseOption(id=e.id, raison_sociale=e.raison_sociale) for e in items]
 
 
@@ -2,6 +2,8 @@
 # -----------------------------------------------------------------------------
 # Logique d'authentification : vérification login/mot de passe et création du
 # token JWT. Utilise UtilisateurService (parametrage) et core.security.
+# bcrypt hors boucle d'événements ; hash recalculé à la connexion si
+# BCRYPT_ROUNDS a changé depuis sa création.
 # -----------------------------------------------------------------------------
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,7 +13,9 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
-    verify_password,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
 )
 from app.modules.parametrage.services.messages import Messages
 from app.modules.parametrage.services.utilisateur import UtilisateurService
@@ -34,8 +38,11 @@ async def login(
         raise UnauthorizedError(detail="Identifiants incorrects.")
     if not user.actif:
         raise UnauthorizedError(detail=Messages.UTILISATEUR_DESACTIVATED)
-    if not verify_password(password, user.mot_de_passe_hash):
+    if not await verify_password_async(password, user.mot_de_passe_hash):
         raise UnauthorizedError(detail="Identifiants incorrects.")
+    if password_needs_rehash(user.mot_de_passe_hash):
+        # Mot de passe en clair disponible : nouveau hash au coût courant (commit en fin de requête)
+        user.mot_de_passe_hash = await hash_password_async(password)
     access_token = create_access_token(
         subject=user.id,
         extra_claims={"entreprise_id": user.entreprise_id},
@@ -0,0 +1,36 @@
+# app/modules/catalogue/imports.py
+# -----------------------------------------------------------------------------
+# Import en masse des produits (app.core.bulk_import). Mêmes contrôles que
+# ProduitService.create, résolus pour tout le lot : famille (de l'entreprise),
+# unités de vente / d'achat et taux de TVA, par id ou par code
+# (famille_code, unite_vente_code, unite_achat_code, taux_tva_code).
+# -----------------------------------------------------------------------------
+
+from app.core.bulk_import import Importer, Reference
+from app.modules.catalogue.models import FamilleProduit, Produit, TauxTva, UniteMesure
+from app.modules.catalogue.schemas import ProduitCreate
+from app.modules.catalogue.services.messages import Messages
+from app.shared.regulations import is_pays_code_valide
+
+
+class ProduitImporter(Importer):
+    name = "produits"
+    model = Produit
+    schema = ProduitCreate
+    key = "code"
+    references = (
+        Reference("famille_id", FamilleProduit, scoped=True),
+        Reference("unite_vente_id", UniteMesure),
+        Reference("unite_achat_id", UniteMesure),
+        Reference("taux_tva_id", TauxTva),
+    )
+
+    def check(self, item: ProduitCreate) -> str | None:
+        if item.pays_origine and not is_pays_code_valide(item.pays_origine):
+            return Messages.PRODUIT_PAYS_ORIGINE_INVALIDE
+        return None
+
+    def existing_filter(self) -> list:
+        # Comme ProduitRepository.exists_by_entreprise_and_code : un produit
+        # supprimé libère son code.
+        return [Produit.deleted_at.is_(None)]
@@ -3,9 +3,10 @@
 # Repository Conditionnement (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.catalogue.models import Conditionnement
 
 
@@ -23,17 +24,15 @@ class ConditionnementRepository:
         entreprise_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Conditionnement], int]:
+    ) -> tuple[list[Conditionnement], int | None]:
         q = select(Conditionnement)
-        count_q = select(func.count()).select_from(Conditionnement)
         if entreprise_id is not None:
             q = q.where(Conditionnement.entreprise_id == entreprise_id)
-            count_q = count_q.where(Conditionnement.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(Conditionnement.actif.is_(True))
-            count_q = count_q.where(Conditionnement.actif.is_(True))
         if search and search.strip():
             term = f"%{search.strip()}%"
             f = or_(
@@ -41,11 +40,8 @@ class ConditionnementRepository:
                 Conditionnement.libelle.ilike(term),
             )
             q = q.where(f)
-            count_q = count_q.where(f)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Conditionnement.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Conditionnement.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_code(
         self,
@@ -3,9 +3,10 @@
 # Repository FamilleProduit (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.catalogue.models import FamilleProduit
 
 
@@ -28,18 +29,16 @@ class FamilleProduitRepository:
         entreprise_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[FamilleProduit], int]:
+    ) -> tuple[list[FamilleProduit], int | None]:
         base = FamilleProduit.deleted_at.is_(None)
         q = select(FamilleProduit).where(base)
-        count_q = select(func.count()).select_from(FamilleProduit).where(base)
         if entreprise_id is not None:
             q = q.where(FamilleProduit.entreprise_id == entreprise_id)
-            count_q = count_q.where(FamilleProduit.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(FamilleProduit.actif.is_(True))
-            count_q = count_q.where(FamilleProduit.actif.is_(True))
         if search and search.strip():
             term = f"%{search.strip()}%"
             f = or_(
@@ -47,11 +46,8 @@ class FamilleProduitRepository:
                 FamilleProduit.libelle.ilike(term),
             )
             q = q.where(f)
-            count_q = count_q.where(f)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(FamilleProduit.ordre_affichage, FamilleProduit.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(FamilleProduit.ordre_affichage, FamilleProduit.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_code(
         self,
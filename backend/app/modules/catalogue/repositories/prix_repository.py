@@ -3,8 +3,9 @@
 # Repository PrixProduit (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.pagination import TotalMode, paginate
 from app.modules.catalogue.models import PrixProduit, Produit
 
 
@@ -22,13 +23,11 @@ class PrixProduitRepository:
         *,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[PrixProduit], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PrixProduit], int | None]:
         q = select(PrixProduit).where(PrixProduit.produit_id == produit_id)
-        count_q = select(func.count()).select_from(PrixProduit).where(PrixProduit.produit_id == produit_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(PrixProduit.date_debut.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(PrixProduit.date_debut.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def find_all(
         self,
@@ -36,16 +35,13 @@ class PrixProduitRepository:
         entreprise_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[PrixProduit], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PrixProduit], int | None]:
         q = select(PrixProduit)
-        count_q = select(func.count()).select_from(PrixProduit)
         if entreprise_id is not None:
             q = q.join(Produit, PrixProduit.produit_id == Produit.id).where(Produit.entreprise_id == entreprise_id, Produit.deleted_at.is_(None))
-            count_q = count_q.join(Produit, PrixProduit.produit_id == Produit.id).where(Produit.entreprise_id == entreprise_id, Produit.deleted_at.is_(None))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(PrixProduit.produit_id, PrixProduit.date_debut.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(PrixProduit.produit_id, PrixProduit.date_debut.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: PrixProduit) -> PrixProduit:
         self._db.add(entity)
@@ -3,9 +3,10 @@
 # Repository Produit (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.catalogue.models import Produit
 
 
@@ -29,21 +30,18 @@ class ProduitRepository:
         famille_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Produit], int]:
+    ) -> tuple[list[Produit], int | None]:
         base = Produit.deleted_at.is_(None)
         q = select(Produit).where(base)
-        count_q = select(func.count()).select_from(Produit).where(base)
         if entreprise_id is not None:
             q = q.where(Produit.entreprise_id == entreprise_id)
-            count_q = count_q.where(Produit.entreprise_id == entreprise_id)
         if famille_id is not None:
             q = q.where(Produit.famille_id == famille_id)
-            count_q = count_q.where(Produit.famille_id == famille_id)
         if actif_only:
             q = q.where(Produit.actif.is_(True))
-            count_q = count_q.where(Produit.actif.is_(True))
         if search and search.strip():
             term = f"%{search.strip()}%"
             f = or_(
@@ -52,11 +50,8 @@ class ProduitRepository:
                 Produit.code_barre.ilike(term),
             )
             q = q.where(f)
-            count_q = count_q.where(f)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Produit.libelle).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Produit.libelle)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_code(
         self,
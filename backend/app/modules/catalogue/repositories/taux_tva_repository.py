@@ -6,6 +6,7 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.query_cache import cached_query
 from app.modules.catalogue.models import TauxTva
 
 
@@ -23,6 +24,7 @@ class TauxTvaRepository:
         )
         return r.scalar_one_or_none()
 
+    @cached_query(TauxTva)
     async def find_all(
         self,
         *,
@@ -3,9 +3,10 @@
 # Repository VarianteProduit (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.catalogue.models import VarianteProduit
 
 
@@ -23,17 +24,14 @@ class VarianteProduitRepository:
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
-    ) -> tuple[list[VarianteProduit], int]:
+    ) -> tuple[list[VarianteProduit], int | None]:
         q = select(VarianteProduit).where(VarianteProduit.produit_id == produit_id)
-        count_q = select(func.count()).select_from(VarianteProduit).where(VarianteProduit.produit_id == produit_id)
         if actif_only:
             q = q.where(VarianteProduit.actif.is_(True))
-            count_q = count_q.where(VarianteProduit.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(VarianteProduit.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(VarianteProduit.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_produit_and_code(
         self,
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.catalogue import schemas
 from app.modules.catalogue.services import (
     CanalVenteService,
@@ -21,7 +22,12 @@ from app.modules.catalogue.services import (
     UniteMesureService,
     VarianteProduitService,
 )
-from app.modules.parametrage.dependencies import CurrentUser, ValidatedEntrepriseId
+from app.modules.parametrage.dependencies import (
+    REFERENTIEL_MAX_AGE,
+    ConditionalGet,
+    CurrentUser,
+    ValidatedEntrepriseId,
+)
 
 router = APIRouter(prefix="/catalogue")
 
@@ -45,8 +51,9 @@ async def list_unites_mesure(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     actif_only: bool = False,
+    _etag: None = ConditionalGet("unites_mesure", max_age=REFERENTIEL_MAX_AGE),
 ):
-    """Liste des unités de mesure."""
+    """Liste des unités de mesure (ETag : 304 si inchangée)."""
     return await UniteMesureService(db).get_all(skip=skip, limit=limit, actif_only=actif_only)
 
 
@@ -83,8 +90,9 @@ async def list_taux_tva(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     actif_only: bool = False,
+    _etag: None = ConditionalGet("taux_tva", max_age=REFERENTIEL_MAX_AGE),
 ):
-    """Liste des taux de TVA."""
+    """Liste des taux de TVA (ETag : 304 si inchangée)."""
     return await TauxTvaService(db).get_all(skip=skip, limit=limit, actif_only=actif_only)
 
 
@@ -123,10 +131,12 @@ async def list_familles_produits(
     limit: int = Query(100, ge=1, le=200),
     actif_only: bool = False,
     search: str | None = None,
+    _etag: None = ConditionalGet("familles_produits"),
 ):
-    """Liste des familles de produits."""
+    """Liste des familles de produits (ETag : 304 si inchangée)."""
     items, _ = await FamilleProduitService(db).get_all(
-        entreprise_id=entreprise_id, skip=skip, limit=limit, actif_only=actif_only, search=search
+        entreprise_id=entreprise_id, skip=skip, limit=limit, actif_only=actif_only, search=search,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -180,7 +190,8 @@ async def list_conditionnements(
 ):
     """Liste des conditionnements."""
     items, _ = await ConditionnementService(db).get_all(
-        entreprise_id=entreprise_id, skip=skip, limit=limit, actif_only=actif_only, search=search
+        entreprise_id=entreprise_id, skip=skip, limit=limit, actif_only=actif_only, search=search,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -232,8 +243,9 @@ async def list_produits(
     limit: int = Query(100, ge=1, le=200),
     actif_only: bool = False,
     search: str | None = None,
+    _etag: None = ConditionalGet("produits"),
 ):
-    """Liste des produits."""
+    """Liste des produits (ETag : 304 si inchangée)."""
     items, _ = await ProduitService(db).get_all(
         entreprise_id=entreprise_id,
         famille_id=famille_id,
@@ -241,6 +253,7 @@ async def list_produits(
         limit=limit,
         actif_only=actif_only,
         search=search,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -281,7 +294,7 @@ async def list_prix_by_produit(
     prod = await ProduitService(db).get_or_404(produit_id)
     if prod.entreprise_id != current_user.entreprise_id:
         raise ForbiddenError(detail="Accès à une autre entreprise non autorisé", code="FORBIDDEN_ENTREPRISE")
-    items, _ = await PrixProduitService(db).get_by_produit(produit_id, skip=skip, limit=limit)
+    items, _ = await PrixProduitService(db).get_by_produit(produit_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
@@ -299,7 +312,7 @@ async def list_variantes_by_produit(
     if prod.entreprise_id != current_user.entreprise_id:
         raise ForbiddenError(detail="Accès à une autre entreprise non autorisé", code="FORBIDDEN_ENTREPRISE")
     items, _ = await VarianteProduitService(db).get_by_produit(
-        produit_id, skip=skip, limit=limit, actif_only=actif_only
+        produit_id, skip=skip, limit=limit, actif_only=actif_only, include_total=TotalMode.none
     )
     return items
 
@@ -386,7 +399,8 @@ async def list_canaux_vente(
 ):
     """Liste des canaux de vente."""
     items, _ = await CanalVenteService(db).get_all(
-        entreprise_id=entreprise_id, skip=skip, limit=limit, actif_only=actif_only, search=search
+        entreprise_id=entreprise_id, skip=skip, limit=limit, actif_only=actif_only, search=search,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -437,7 +451,7 @@ async def list_prix_produits(
     limit: int = Query(100, ge=1, le=200),
 ):
     """Liste des prix produits de l'entreprise."""
-    items, _ = await PrixProduitService(db).get_all(entreprise_id=entreprise_id, skip=skip, limit=limit)
+    items, _ = await PrixProduitService(db).get_all(entreprise_id=entreprise_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
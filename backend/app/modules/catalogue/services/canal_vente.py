@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.catalogue.models import CanalVente
 from app.modules.catalogue.repositories import CanalVenteRepository
 from app.modules.catalogue.schemas import CanalVenteCreate, CanalVenteUpdate
@@ -41,15 +42,17 @@ class CanalVenteService(BaseCatalogueService):
         entreprise_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[CanalVente], int]:
+    ) -> tuple[list[CanalVente], int | None]:
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             skip=skip,
             limit=limit,
             actif_only=actif_only,
             search=search,
+            include_total=include_total,
         )
 
     async def create(self, data: CanalVenteCreate) -> CanalVente:
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.catalogue.models import FamilleProduit
 from app.modules.catalogue.repositories import FamilleProduitRepository
 from app.modules.catalogue.schemas import FamilleProduitCreate, FamilleProduitUpdate
@@ -43,15 +44,17 @@ class FamilleProduitService(BaseCatalogueService):
         entreprise_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[FamilleProduit], int]:
+    ) -> tuple[list[FamilleProduit], int | None]:
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             skip=skip,
             limit=limit,
             actif_only=actif_only,
             search=search,
+            include_total=include_total,
         )
 
     async def create(self, data: FamilleProduitCreate) -> FamilleProduit:
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.catalogue.models import PrixProduit
 from app.modules.catalogue.repositories import (
     CanalVenteRepository,
@@ -43,8 +44,9 @@ class PrixProduitService(BaseCatalogueService):
         *,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[PrixProduit], int]:
-        return await self._repo.find_by_produit(produit_id, skip=skip, limit=limit)
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PrixProduit], int | None]:
+        return await self._repo.find_by_produit(produit_id, skip=skip, limit=limit, include_total=include_total)
 
     async def get_all(
         self,
@@ -52,8 +54,9 @@ class PrixProduitService(BaseCatalogueService):
         entreprise_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[PrixProduit], int]:
-        return await self._repo.find_all(entreprise_id=entreprise_id, skip=skip, limit=limit)
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PrixProduit], int | None]:
+        return await self._repo.find_all(entreprise_id=entreprise_id, skip=skip, limit=limit, include_total=include_total)
 
     async def create(self, data: PrixProduitCreate) -> PrixProduit:
         if await self._produit_repo.find_by_id(data.produit_id) is None:
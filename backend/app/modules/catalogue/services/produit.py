@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.catalogue.models import Produit
 from app.modules.catalogue.repositories import (
     FamilleProduitRepository,
@@ -53,9 +54,10 @@ class ProduitService(BaseCatalogueService):
         famille_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Produit], int]:
+    ) -> tuple[list[Produit], int | None]:
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             famille_id=famille_id,
@@ -63,6 +65,7 @@ class ProduitService(BaseCatalogueService):
             limit=limit,
             actif_only=actif_only,
             search=search,
+            include_total=include_total,
         )
 
     async def create(self, data: ProduitCreate) -> Produit:
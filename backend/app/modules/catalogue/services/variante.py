@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.catalogue.models import VarianteProduit
 from app.modules.catalogue.repositories import ProduitRepository, VarianteProduitRepository
 from app.modules.catalogue.schemas import VarianteProduitCreate, VarianteProduitUpdate
@@ -36,10 +37,12 @@ class VarianteProduitService(BaseCatalogueService):
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
-    ) -> tuple[list[VarianteProduit], int]:
+    ) -> tuple[list[VarianteProduit], int | None]:
         return await self._repo.find_by_produit(
-            produit_id, skip=skip, limit=limit, actif_only=actif_only
+            produit_id, skip=skip, limit=limit, actif_only=actif_only,
+            include_total=include_total,
         )
 
     async def create(self, data: VarianteProduitCreate) -> VarianteProduit:
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -123,6 +124,17 @@ class Facture(Base):
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Balance âgée : filtre entreprise et type, regroupement client, tranches sur
+        # COALESCE(échéance, date facture) et reste dû lus dans l'index (couvrant)
+        Index(
+            "ix_factures_balance_agee",
+            "entreprise_id", "type_facture", "client_id", "date_echeance", "date_facture", "montant_restant_du",
+        ),
+        # Liste paginée (keyset) : entreprise puis (date_facture, id) décroissants
+        Index("ix_factures_entreprise_date", "entreprise_id", "date_facture", "id"),
+    )
+
 
 # --- Bon de livraison --------------------------------------------------------
 class BonLivraison(Base):
@@ -1,7 +1,8 @@
 # app/modules/commercial/repositories/bon_livraison_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.commercial.models import BonLivraison
 
 
@@ -20,19 +21,15 @@ class BonLivraisonRepository:
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[BonLivraison], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[BonLivraison], int | None]:
         q = select(BonLivraison)
-        count_q = select(func.count()).select_from(BonLivraison)
         if entreprise_id is not None:
             q = q.where(BonLivraison.entreprise_id == entreprise_id)
-            count_q = count_q.where(BonLivraison.entreprise_id == entreprise_id)
         if client_id is not None:
             q = q.where(BonLivraison.client_id == client_id)
-            count_q = count_q.where(BonLivraison.client_id == client_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(BonLivraison.date_livraison.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(BonLivraison.date_livraison.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_numero(
         self, entreprise_id: int, numero: str, exclude_id: int | None = None
@@ -2,6 +2,7 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.commercial.models import Commande
 
 
@@ -20,19 +21,20 @@ class CommandeRepository:
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Commande], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Commande], int | None]:
         q = select(Commande)
-        count_q = select(func.count()).select_from(Commande)
         if entreprise_id is not None:
             q = q.where(Commande.entreprise_id == entreprise_id)
-            count_q = count_q.where(Commande.entreprise_id == entreprise_id)
         if client_id is not None:
             q = q.where(Commande.client_id == client_id)
-            count_q = count_q.where(Commande.client_id == client_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Commande.date_commande.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Commande.date_commande.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
+
+    async def count_by_entreprise(self, entreprise_id: int) -> int:
+        """Nombre de commandes de l'entreprise (COUNT SQL)."""
+        q = select(func.count()).select_from(Commande).where(Commande.entreprise_id == entreprise_id)
+        return (await self._db.execute(q)).scalar_one() or 0
 
     async def exists_by_entreprise_and_numero(
         self, entreprise_id: int, numero: str, exclude_id: int | None = None
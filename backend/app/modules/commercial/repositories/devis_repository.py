@@ -1,7 +1,8 @@
 # app/modules/commercial/repositories/devis_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.commercial.models import Devis
 
 
@@ -20,19 +21,15 @@ class DevisRepository:
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Devis], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Devis], int | None]:
         q = select(Devis)
-        count_q = select(func.count()).select_from(Devis)
         if entreprise_id is not None:
             q = q.where(Devis.entreprise_id == entreprise_id)
-            count_q = count_q.where(Devis.entreprise_id == entreprise_id)
         if client_id is not None:
             q = q.where(Devis.client_id == client_id)
-            count_q = count_q.where(Devis.client_id == client_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Devis.date_devis.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Devis.date_devis.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_numero(
         self, entreprise_id: int, numero: str, exclude_id: int | None = None
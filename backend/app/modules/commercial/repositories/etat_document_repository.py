@@ -2,6 +2,7 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.query_cache import cached_query
 from app.modules.commercial.models import EtatDocument
 
 
@@ -22,6 +23,7 @@ class EtatDocumentRepository:
         )
         return r.scalar_one_or_none()
 
+    @cached_query(EtatDocument)
     async def find_all(
         self,
         *,
@@ -1,11 +1,17 @@
 # app/modules/commercial/repositories/facture_repository.py
-from sqlalchemy import func, select
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import Keyset, TotalMode, paginate
 from app.modules.commercial.models import Facture
 
 
 class FactureRepository:
+    KEYSET = Keyset(Facture.date_facture, Facture.id)
+
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
 
@@ -13,6 +19,14 @@ class FactureRepository:
         r = await self._db.execute(select(Facture).where(Facture.id == id))
         return r.scalar_one_or_none()
 
+    def _base_query(self, entreprise_id: int | None = None, client_id: int | None = None) -> Select:
+        q = select(Facture)
+        if entreprise_id is not None:
+            q = q.where(Facture.entreprise_id == entreprise_id)
+        if client_id is not None:
+            q = q.where(Facture.client_id == client_id)
+        return q
+
     async def find_all(
         self,
         *,
@@ -20,19 +34,50 @@ class FactureRepository:
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Facture], int]:
-        q = select(Facture)
-        count_q = select(func.count()).select_from(Facture)
-        if entreprise_id is not None:
-            q = q.where(Facture.entreprise_id == entreprise_id)
-            count_q = count_q.where(Facture.entreprise_id == entreprise_id)
-        if client_id is not None:
-            q = q.where(Facture.client_id == client_id)
-            count_q = count_q.where(Facture.client_id == client_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Facture.date_facture.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        cursor: str | None = None,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Facture], int | None]:
+        q = self._base_query(entreprise_id=entreprise_id, client_id=client_id)
+        return await paginate(
+            self._db, q, skip=skip, limit=limit, include_total=include_total, keyset=self.KEYSET, cursor=cursor
+        )
+
+    def export_query(self, *, entreprise_id: int | None = None, client_id: int | None = None) -> Select:
+        """Requête de la liste (mêmes filtres, même ordre) pour un export en flux."""
+        q = self._base_query(entreprise_id=entreprise_id, client_id=client_id)
+        return self.KEYSET.order(q)
+
+    async def get_totaux_periode(
+        self,
+        entreprise_id: int,
+        *,
+        date_debut: date | None = None,
+        date_fin: date | None = None,
+    ) -> tuple[Decimal, int]:
+        """Somme des montants TTC et nombre de factures sur la période (agrégat SQL, un aller-retour)."""
+        q = select(
+            func.coalesce(func.sum(Facture.montant_ttc), 0),
+            func.count(Facture.id),
+        ).where(Facture.entreprise_id == entreprise_id)
+        if date_debut is not None:
+            q = q.where(Facture.date_facture >= date_debut)
+        if date_fin is not None:
+            q = q.where(Facture.date_facture <= date_fin)
+        montant, nb = (await self._db.execute(q)).one()
+        return Decimal(str(montant or 0)), nb or 0
+
+    async def get_creances_echues(self, entreprise_id: int, date_reference: date) -> tuple[Decimal, int]:
+        """Reste dû total et nombre de factures échues (date_echeance < date_reference) non soldées."""
+        q = select(
+            func.coalesce(func.sum(Facture.montant_restant_du), 0),
+            func.count(Facture.id),
+        ).where(
+            Facture.entreprise_id == entreprise_id,
+            Facture.montant_restant_du > 0,
+            Facture.date_echeance < date_reference,
+        )
+        montant, nb = (await self._db.execute(q)).one()
+        return Decimal(str(montant or 0)), nb or 0
 
     async def exists_by_entreprise_and_numero(
         self, entreprise_id: int, numero: str, exclude_id: int | None = None
@@ -5,10 +5,13 @@
 # à l'entreprise de l'utilisateur. Adapté toute structure, tout secteur.
 # -----------------------------------------------------------------------------
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.export import EXPORT_RESPONSES, ExportFormat, ExportResponse
+from app.core.pagination import TotalMode, set_next_cursor
+from app.core.responses import NDJSONResponse, wants_ndjson
 from app.modules.commercial import schemas
 from app.modules.commercial.services import (
     BonLivraisonService,
@@ -17,7 +20,12 @@ from app.modules.commercial.services import (
     EtatDocumentService,
     FactureService,
 )
-from app.modules.parametrage.dependencies import CurrentUser, ValidatedEntrepriseId
+from app.modules.parametrage.dependencies import (
+    REFERENTIEL_MAX_AGE,
+    ConditionalGet,
+    CurrentUser,
+    ValidatedEntrepriseId,
+)
 
 router = APIRouter(prefix="/commercial")
 
@@ -34,6 +42,7 @@ async def list_etats_document(
     db: DbSession, current_user: CurrentUser,
     type_document: str | None = None,
     skip: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=200),
+    _etag: None = ConditionalGet("etats_document", max_age=REFERENTIEL_MAX_AGE),
 ):
     return await EtatDocumentService(db).get_all(type_document=type_document, skip=skip, limit=limit)
 
@@ -64,7 +73,7 @@ async def list_devis(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await DevisService(db).get_all(
-        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -103,7 +112,7 @@ async def list_commandes(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await CommandeService(db).get_all(
-        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -137,16 +146,38 @@ async def list_factures(
     db: DbSession,
     current_user: CurrentUser,
     entreprise_id: ValidatedEntrepriseId,
+    request: Request,
+    response: Response,
     client_id: int | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    cursor: str | None = Query(None, description="Curseur X-Next-Cursor de la page précédente (remplace skip)"),
 ):
-    items, _ = await FactureService(db).get_all(
-        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+    service = FactureService(db)
+    items, _ = await service.get_all(
+        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit, cursor=cursor,
+        include_total=TotalMode.none,
     )
+    set_next_cursor(response, service.next_cursor(items, limit))
+    if wants_ndjson(request):
+        return NDJSONResponse(items, schema=schemas.FactureResponse, headers=dict(response.headers))
     return items
 
 
+@router.get("/factures/export", response_class=ExportResponse, responses=EXPORT_RESPONSES, tags=[TAG_FACTURES])
+async def export_factures(
+    db: DbSession,
+    current_user: CurrentUser,
+    entreprise_id: ValidatedEntrepriseId,
+    request: Request,
+    client_id: int | None = None,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv ou ndjson"),
+):
+    """Toutes les factures filtrées, en flux (curseur serveur, gzip si accepté)."""
+    q = FactureService(db).export_query(entreprise_id=entreprise_id, client_id=client_id)
+    return ExportResponse(q, schema=schemas.FactureResponse, request=request, filename="factures", format=format)
+
+
 @router.get("/factures/{id}", response_model=schemas.FactureResponse, tags=[TAG_FACTURES])
 async def get_facture(db: DbSession, current_user: CurrentUser, id: int):
     ent = await FactureService(db).get_or_404(id)
@@ -178,7 +209,7 @@ async def list_bons_livraison(
     skip: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await BonLivraisonService(db).get_all(
-        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
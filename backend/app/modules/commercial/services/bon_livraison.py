@@ -1,6 +1,7 @@
 # app/modules/commercial/services/bon_livraison.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.commercial.models import BonLivraison
 from app.modules.commercial.repositories import (
     BonLivraisonRepository,
@@ -44,9 +45,11 @@ class BonLivraisonService(BaseCommercialService):
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[BonLivraison], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[BonLivraison], int | None]:
         return await self._repo.find_all(
-            entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+            entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: BonLivraisonCreate) -> BonLivraison:
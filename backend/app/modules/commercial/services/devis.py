@@ -1,6 +1,7 @@
 # app/modules/commercial/services/devis.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.commercial.models import Devis
 from app.modules.commercial.repositories import DevisRepository, EtatDocumentRepository
 from app.modules.commercial.schemas import DevisCreate, DevisUpdate
@@ -42,9 +43,11 @@ class DevisService(BaseCommercialService):
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Devis], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Devis], int | None]:
         return await self._repo.find_all(
-            entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+            entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: DevisCreate) -> Devis:
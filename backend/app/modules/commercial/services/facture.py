@@ -1,8 +1,10 @@
 # app/modules/commercial/services/facture.py
-from decimal import Decimal
+from collections.abc import Sequence
 
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.commercial.models import Facture, TypeFacture
 from app.modules.commercial.repositories import (
     CommandeRepository,
@@ -18,6 +20,18 @@ from app.modules.parametrage.repositories import (
     PointVenteRepository,
 )
 from app.modules.partenaires.repositories import TiersRepository
+from app.modules.rapports.repositories import VenteJournaliereRepository
+
+# Champs dont la modification change l'agrégat ventes_journalieres de la facture
+_CHAMPS_AGREGES = frozenset({
+    "date_facture",
+    "point_de_vente_id",
+    "client_id",
+    "type_facture",
+    "montant_ht",
+    "montant_tva",
+    "montant_ttc",
+})
 
 
 class FactureService(BaseCommercialService):
@@ -32,6 +46,7 @@ class FactureService(BaseCommercialService):
         self._commande_repo = CommandeRepository(db)
         self._etat_repo = EtatDocumentRepository(db)
         self._devise_repo = DeviseRepository(db)
+        self._ventes_repo = VenteJournaliereRepository(db)
 
     async def get_by_id(self, id: int) -> Facture | None:
         return await self._repo.find_by_id(id)
@@ -49,11 +64,22 @@ class FactureService(BaseCommercialService):
         client_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Facture], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+        cursor: str | None = None,
+    ) -> tuple[list[Facture], int | None]:
         return await self._repo.find_all(
-            entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit
+            entreprise_id=entreprise_id, client_id=client_id, skip=skip, limit=limit, cursor=cursor,
+            include_total=include_total,
         )
 
+    def next_cursor(self, items: Sequence[Facture], limit: int) -> str | None:
+        """Curseur X-Next-Cursor après une page de get_all ; None en fin de liste."""
+        return self._repo.KEYSET.next_cursor(items, limit)
+
+    def export_query(self, *, entreprise_id: int | None = None, client_id: int | None = None) -> Select:
+        """Requête d'export en flux (mêmes filtres que get_all)."""
+        return self._repo.export_query(entreprise_id=entreprise_id, client_id=client_id)
+
     async def create(self, data: FactureCreate) -> Facture:
         if await self._entreprise_repo.find_by_id(data.entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
@@ -87,13 +113,13 @@ class FactureService(BaseCommercialService):
             montant_tva=data.montant_tva,
             montant_ttc=data.montant_ttc,
             montant_restant_du=data.montant_restant_du,
-            remise_globale_pct=Decimal("0"),
-            remise_globale_montant=Decimal("0"),
             devise_id=data.devise_id,
             mention_legale=data.mention_legale,
             notes=data.notes,
         )
-        return await self._repo.add(ent)
+        ent = await self._repo.add(ent)
+        await self._ventes_repo.ajouter_facture(ent)
+        return ent
 
     async def update(self, id: int, data: FactureUpdate) -> Facture:
         ent = await self.get_or_404(id)
@@ -102,7 +128,13 @@ class FactureService(BaseCommercialService):
             self._validate_enum(update_data["type_facture"], TypeFacture, Messages.FACTURE_TYPE_INVALIDE)
         if "etat_id" in update_data and await self._etat_repo.find_by_id(update_data["etat_id"]) is None:
             self._raise_not_found(Messages.ETAT_DOCUMENT_NOT_FOUND)
+        agregat_modifie = not _CHAMPS_AGREGES.isdisjoint(update_data)
+        if agregat_modifie:
+            await self._ventes_repo.ajouter_facture(ent, signe=-1)
         for key, value in update_data.items():
             setattr(ent, key, value)
-        return await self._repo.update(ent)
+        ent = await self._repo.update(ent)
+        if agregat_modifie:
+            await self._ventes_repo.ajouter_facture(ent)
+        return ent
 
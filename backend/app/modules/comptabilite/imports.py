@@ -0,0 +1,25 @@
+# app/modules/comptabilite/imports.py
+# -----------------------------------------------------------------------------
+# Import en masse du plan comptable (app.core.bulk_import). Mêmes contrôles
+# que CompteComptableService.create : numéro unique par entreprise, sens
+# normal valide (debit / credit).
+# -----------------------------------------------------------------------------
+
+from app.core.bulk_import import Importer
+from app.modules.comptabilite.models import CompteComptable, SensCompte
+from app.modules.comptabilite.schemas import CompteComptableCreate
+from app.modules.comptabilite.services.messages import Messages
+
+_SENS = {e.value for e in SensCompte}
+
+
+class CompteComptableImporter(Importer):
+    name = "comptes_comptables"
+    model = CompteComptable
+    schema = CompteComptableCreate
+    key = "numero"
+
+    def check(self, item: CompteComptableCreate) -> str | None:
+        if item.sens_normal not in _SENS:
+            return Messages.SENS_COMPTE_INVALIDE.format(valeur=item.sens_normal)
+        return None
@@ -17,6 +17,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -120,6 +121,11 @@ class EcritureComptable(Base):
     created_by_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("utilisateurs.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Liste paginée (keyset) : entreprise puis (date_ecriture, id) décroissants
+        Index("ix_ecritures_comptables_entreprise_date", "entreprise_id", "date_ecriture", "id"),
+    )
+
 
 # --- Ligne d'écriture (détail) ----------------------------------------------
 class LigneEcriture(Base):
@@ -136,3 +142,8 @@ class LigneEcriture(Base):
     debit: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=Decimal("0"))
     credit: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=Decimal("0"))
 
+    __table_args__ = (
+        Index("ix_lignes_ecritures_ecriture", "ecriture_id"),
+        Index("ix_lignes_ecritures_compte", "compte_id"),
+    )
+
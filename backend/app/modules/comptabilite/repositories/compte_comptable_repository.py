@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository CompteComptable (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.comptabilite.models import CompteComptable
 
 
@@ -35,19 +36,13 @@ class CompteComptableRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[CompteComptable], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CompteComptable], int | None]:
         q = select(CompteComptable).where(CompteComptable.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(CompteComptable.actif.is_(True))
-        count_q = select(func.count()).select_from(CompteComptable).where(
-            CompteComptable.entreprise_id == entreprise_id
-        )
-        if actif_only:
-            count_q = count_q.where(CompteComptable.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(CompteComptable.numero).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(CompteComptable.numero)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: CompteComptable) -> CompteComptable:
         self._db.add(entity)
@@ -4,13 +4,16 @@
 # -----------------------------------------------------------------------------
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import Keyset, TotalMode, paginate
 from app.modules.comptabilite.models import EcritureComptable
 
 
 class EcritureComptableRepository:
+    KEYSET = Keyset(EcritureComptable.date_ecriture, EcritureComptable.id)
+
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
 
@@ -28,7 +31,9 @@ class EcritureComptableRepository:
         date_to: date | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[EcritureComptable], int]:
+        cursor: str | None = None,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[EcritureComptable], int | None]:
         q = select(EcritureComptable)
         if entreprise_id is not None:
             q = q.where(EcritureComptable.entreprise_id == entreprise_id)
@@ -40,21 +45,9 @@ class EcritureComptableRepository:
             q = q.where(EcritureComptable.date_ecriture >= date_from)
         if date_to is not None:
             q = q.where(EcritureComptable.date_ecriture <= date_to)
-        count_q = select(func.count()).select_from(EcritureComptable)
-        if entreprise_id is not None:
-            count_q = count_q.where(EcritureComptable.entreprise_id == entreprise_id)
-        if journal_id is not None:
-            count_q = count_q.where(EcritureComptable.journal_id == journal_id)
-        if periode_id is not None:
-            count_q = count_q.where(EcritureComptable.periode_id == periode_id)
-        if date_from is not None:
-            count_q = count_q.where(EcritureComptable.date_ecriture >= date_from)
-        if date_to is not None:
-            count_q = count_q.where(EcritureComptable.date_ecriture <= date_to)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(EcritureComptable.date_ecriture.desc(), EcritureComptable.id.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        return await paginate(
+            self._db, q, skip=skip, limit=limit, include_total=include_total, keyset=self.KEYSET, cursor=cursor
+        )
 
     async def add(self, entity: EcritureComptable) -> EcritureComptable:
         self._db.add(entity)
@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository PeriodeComptable (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.comptabilite.models import PeriodeComptable
 
 
@@ -22,15 +23,11 @@ class PeriodeComptableRepository:
         *,
         skip: int = 0,
         limit: int = 50,
-    ) -> tuple[list[PeriodeComptable], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PeriodeComptable], int | None]:
         q = select(PeriodeComptable).where(PeriodeComptable.entreprise_id == entreprise_id)
-        count_q = select(func.count()).select_from(PeriodeComptable).where(
-            PeriodeComptable.entreprise_id == entreprise_id
-        )
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(PeriodeComptable.date_debut.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(PeriodeComptable.date_debut.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: PeriodeComptable) -> PeriodeComptable:
         self._db.add(entity)
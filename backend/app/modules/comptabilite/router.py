@@ -5,10 +5,11 @@
 # à l'entreprise de l'utilisateur. Adapté toute structure, tout secteur (OHADA/CEMAC).
 # -----------------------------------------------------------------------------
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode, set_next_cursor
 from app.modules.comptabilite import schemas
 from app.modules.comptabilite.services import (
     CompteComptableService,
@@ -37,7 +38,7 @@ async def list_comptes_comptables(
     limit: int = Query(500, ge=1, le=1000),
 ):
     items, _ = await CompteComptableService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -76,7 +77,7 @@ async def list_journaux_comptables(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await JournalComptableService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -114,7 +115,7 @@ async def list_periodes_comptables(
     limit: int = Query(50, ge=1, le=100),
 ):
     items, _ = await PeriodeComptableService(db).get_all(
-        entreprise_id=entreprise_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -148,14 +149,17 @@ async def list_ecritures_comptables(
     db: DbSession,
     current_user: CurrentUser,
     entreprise_id: ValidatedEntrepriseId,
+    response: Response,
     journal_id: int | None = None,
     periode_id: int | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    cursor: str | None = Query(None, description="Curseur X-Next-Cursor de la page précédente (remplace skip)"),
 ):
-    items, _ = await EcritureComptableService(db).get_all(
+    service = EcritureComptableService(db)
+    items, _ = await service.get_all(
         entreprise_id=entreprise_id,
         journal_id=journal_id,
         periode_id=periode_id,
@@ -163,7 +167,10 @@ async def list_ecritures_comptables(
         date_to=date_to,
         skip=skip,
         limit=limit,
+        cursor=cursor,
+        include_total=TotalMode.none,
     )
+    set_next_cursor(response, service.next_cursor(items, limit))
     return items
 
 
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.comptabilite.models import CompteComptable, SensCompte
 from app.modules.comptabilite.repositories import CompteComptableRepository
 from app.modules.comptabilite.schemas import CompteComptableCreate, CompteComptableUpdate
@@ -42,7 +43,8 @@ class CompteComptableService(BaseComptabiliteService):
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[CompteComptable], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CompteComptable], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -50,6 +52,7 @@ class CompteComptableService(BaseComptabiliteService):
             actif_only=actif_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: CompteComptableCreate) -> CompteComptable:
@@ -3,8 +3,11 @@
 # Service métier : écritures comptables (en-tête + lignes, équilibre débit/crédit).
 # -----------------------------------------------------------------------------
 
+from collections.abc import Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.comptabilite.models import EcritureComptable, LigneEcriture
 from app.modules.comptabilite.repositories import (
     CompteComptableRepository,
@@ -50,7 +53,9 @@ class EcritureComptableService(BaseComptabiliteService):
         date_to: str | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[EcritureComptable], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+        cursor: str | None = None,
+    ) -> tuple[list[EcritureComptable], int | None]:
         from datetime import datetime as dt
         date_from_d = None
         date_to_d = None
@@ -72,8 +77,14 @@ class EcritureComptableService(BaseComptabiliteService):
             date_to=date_to_d,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
+    def next_cursor(self, items: Sequence[EcritureComptable], limit: int) -> str | None:
+        """Curseur X-Next-Cursor après une page de get_all ; None en fin de liste."""
+        return self._repo.KEYSET.next_cursor(items, limit)
+
     async def get_with_lignes(self, id: int) -> tuple[EcritureComptable, list[LigneEcriture]]:
         ent = await self.get_or_404(id)
         lignes = await self._ligne_repo.find_by_ecriture(ent.id)
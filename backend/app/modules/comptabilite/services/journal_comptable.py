@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.comptabilite.models import JournalComptable
 from app.modules.comptabilite.repositories import JournalComptableRepository
 from app.modules.comptabilite.schemas import JournalComptableCreate, JournalComptableUpdate
@@ -37,7 +38,8 @@ class JournalComptableService(BaseComptabiliteService):
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[JournalComptable], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[JournalComptable], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -45,6 +47,7 @@ class JournalComptableService(BaseComptabiliteService):
             actif_only=actif_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: JournalComptableCreate) -> JournalComptable:
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.comptabilite.models import PeriodeComptable
 from app.modules.comptabilite.repositories import PeriodeComptableRepository
 from app.modules.comptabilite.schemas import PeriodeComptableCreate, PeriodeComptableUpdate
@@ -36,10 +37,11 @@ class PeriodeComptableService(BaseComptabiliteService):
         *,
         skip: int = 0,
         limit: int = 50,
-    ) -> tuple[list[PeriodeComptable], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PeriodeComptable], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
-        return await self._repo.find_all(entreprise_id=entreprise_id, skip=skip, limit=limit)
+        return await self._repo.find_all(entreprise_id=entreprise_id, skip=skip, limit=limit, include_total=include_total)
 
     async def create(self, data: PeriodeComptableCreate) -> PeriodeComptable:
         if await self._entreprise_repo.find_by_id(data.entreprise_id) is None:
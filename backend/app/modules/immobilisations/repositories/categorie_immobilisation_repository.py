@@ -1,7 +1,8 @@
 # app/modules/immobilisations/repositories/categorie_immobilisation_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.immobilisations.models import CategorieImmobilisation
 
 
@@ -23,12 +24,16 @@ class CategorieImmobilisationRepository:
         r = await self._db.execute(q)
         return r.scalar_one_or_none() is not None
 
-    async def find_all(self, entreprise_id: int, skip: int = 0, limit: int = 100) -> tuple[list[CategorieImmobilisation], int]:
+    async def find_all(
+        self,
+        entreprise_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CategorieImmobilisation], int | None]:
         q = select(CategorieImmobilisation).where(CategorieImmobilisation.entreprise_id == entreprise_id)
-        total = (await self._db.execute(select(func.count()).select_from(CategorieImmobilisation).where(CategorieImmobilisation.entreprise_id == entreprise_id))).scalar_one() or 0
-        q = q.order_by(CategorieImmobilisation.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(CategorieImmobilisation.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: CategorieImmobilisation) -> CategorieImmobilisation:
         self._db.add(entity)
@@ -1,7 +1,8 @@
 # app/modules/immobilisations/repositories/immobilisation_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.immobilisations.models import Immobilisation
 
 
@@ -31,21 +32,15 @@ class ImmobilisationRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Immobilisation], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Immobilisation], int | None]:
         q = select(Immobilisation).where(Immobilisation.entreprise_id == entreprise_id)
         if categorie_id is not None:
             q = q.where(Immobilisation.categorie_id == categorie_id)
         if actif_only:
             q = q.where(Immobilisation.actif.is_(True))
-        count_q = select(func.count()).select_from(Immobilisation).where(Immobilisation.entreprise_id == entreprise_id)
-        if categorie_id is not None:
-            count_q = count_q.where(Immobilisation.categorie_id == categorie_id)
-        if actif_only:
-            count_q = count_q.where(Immobilisation.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Immobilisation.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Immobilisation.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Immobilisation) -> Immobilisation:
         self._db.add(entity)
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.immobilisations import schemas
 from app.modules.immobilisations.services import (
     CategorieImmobilisationService,
@@ -32,7 +33,7 @@ async def list_categories(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
 ):
-    items, _ = await CategorieImmobilisationService(db).get_all(entreprise_id, skip=skip, limit=limit)
+    items, _ = await CategorieImmobilisationService(db).get_all(entreprise_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
@@ -76,6 +77,7 @@ async def list_immobilisations(
         actif_only=actif_only,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -1,6 +1,7 @@
 # app/modules/immobilisations/services/categorie_immobilisation.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.immobilisations.models import CategorieImmobilisation
 from app.modules.immobilisations.repositories import CategorieImmobilisationRepository
 from app.modules.immobilisations.schemas import (
@@ -27,10 +28,10 @@ class CategorieImmobilisationService(BaseImmobilisationsService):
             self._raise_not_found(Messages.CATEGORIE_NOT_FOUND)
         return ent
 
-    async def get_all(self, entreprise_id: int, skip: int = 0, limit: int = 100) -> tuple[list[CategorieImmobilisation], int]:
+    async def get_all(self, entreprise_id: int, skip: int = 0, limit: int = 100, include_total: TotalMode | str = TotalMode.exact) -> tuple[list[CategorieImmobilisation], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
-        return await self._repo.find_all(entreprise_id, skip=skip, limit=limit)
+        return await self._repo.find_all(entreprise_id, skip=skip, limit=limit, include_total=include_total)
 
     async def create(self, data: CategorieImmobilisationCreate) -> CategorieImmobilisation:
         if await self._entreprise_repo.find_by_id(data.entreprise_id) is None:
@@ -1,6 +1,7 @@
 # app/modules/immobilisations/services/immobilisation.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.immobilisations.models import Immobilisation
 from app.modules.immobilisations.repositories import (
     CategorieImmobilisationRepository,
@@ -38,7 +39,8 @@ class ImmobilisationService(BaseImmobilisationsService):
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Immobilisation], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Immobilisation], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -47,6 +49,7 @@ class ImmobilisationService(BaseImmobilisationsService):
             actif_only=actif_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: ImmobilisationCreate) -> Immobilisation:
@@ -1,9 +1,13 @@
 # app/modules/paie/repositories/bulletin_paie_repository.py
+from datetime import date
+from decimal import Decimal
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.modules.paie.models import BulletinPaie
+from app.core.pagination import TotalMode, paginate
+from app.modules.paie.models import BulletinPaie, PeriodePaie
 
 
 class BulletinPaieRepository:
@@ -42,7 +46,8 @@ class BulletinPaieRepository:
         statut: str | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[BulletinPaie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[BulletinPaie], int | None]:
         q = select(BulletinPaie).where(BulletinPaie.entreprise_id == entreprise_id)
         if employe_id is not None:
             q = q.where(BulletinPaie.employe_id == employe_id)
@@ -50,19 +55,27 @@ class BulletinPaieRepository:
             q = q.where(BulletinPaie.periode_paie_id == periode_paie_id)
         if statut is not None:
             q = q.where(BulletinPaie.statut == statut)
-        count_q = select(func.count()).select_from(BulletinPaie).where(
-            BulletinPaie.entreprise_id == entreprise_id
+        q = q.order_by(BulletinPaie.periode_paie_id.desc(), BulletinPaie.employe_id)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
+
+    async def get_masse_salariale(
+        self,
+        entreprise_id: int,
+        *,
+        date_debut: date | None = None,
+        date_fin: date | None = None,
+    ) -> Decimal:
+        """Somme des salaires bruts des bulletins dont la période de paie chevauche [date_debut, date_fin]."""
+        q = (
+            select(func.coalesce(func.sum(BulletinPaie.salaire_brut), 0))
+            .join(PeriodePaie, BulletinPaie.periode_paie_id == PeriodePaie.id)
+            .where(BulletinPaie.entreprise_id == entreprise_id)
         )
-        if employe_id is not None:
-            count_q = count_q.where(BulletinPaie.employe_id == employe_id)
-        if periode_paie_id is not None:
-            count_q = count_q.where(BulletinPaie.periode_paie_id == periode_paie_id)
-        if statut is not None:
-            count_q = count_q.where(BulletinPaie.statut == statut)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(BulletinPaie.periode_paie_id.desc(), BulletinPaie.employe_id).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        if date_debut is not None:
+            q = q.where(PeriodePaie.date_fin >= date_debut)
+        if date_fin is not None:
+            q = q.where(PeriodePaie.date_debut <= date_fin)
+        return Decimal(str((await self._db.execute(q)).scalar_one() or 0))
 
     async def add(self, entity: BulletinPaie) -> BulletinPaie:
         self._db.add(entity)
@@ -1,7 +1,8 @@
 # app/modules/paie/repositories/periode_paie_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.paie.models import PeriodePaie
 
 
@@ -32,19 +33,13 @@ class PeriodePaieRepository:
         cloturee: bool | None = None,
         skip: int = 0,
         limit: int = 24,
-    ) -> tuple[list[PeriodePaie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PeriodePaie], int | None]:
         q = select(PeriodePaie).where(PeriodePaie.entreprise_id == entreprise_id)
         if cloturee is not None:
             q = q.where(PeriodePaie.cloturee.is_(cloturee))
-        count_q = select(func.count()).select_from(PeriodePaie).where(
-            PeriodePaie.entreprise_id == entreprise_id
-        )
-        if cloturee is not None:
-            count_q = count_q.where(PeriodePaie.cloturee.is_(cloturee))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(PeriodePaie.annee.desc(), PeriodePaie.mois.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(PeriodePaie.annee.desc(), PeriodePaie.mois.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: PeriodePaie) -> PeriodePaie:
         self._db.add(entity)
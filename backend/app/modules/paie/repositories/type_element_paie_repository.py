@@ -1,7 +1,8 @@
 # app/modules/paie/repositories/type_element_paie_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.paie.models import TypeElementPaie
 
 
@@ -33,23 +34,15 @@ class TypeElementPaieRepository:
         type_filter: str | None = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> tuple[list[TypeElementPaie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[TypeElementPaie], int | None]:
         q = select(TypeElementPaie).where(TypeElementPaie.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(TypeElementPaie.actif.is_(True))
         if type_filter:
             q = q.where(TypeElementPaie.type == type_filter)
-        count_q = select(func.count()).select_from(TypeElementPaie).where(
-            TypeElementPaie.entreprise_id == entreprise_id
-        )
-        if actif_only:
-            count_q = count_q.where(TypeElementPaie.actif.is_(True))
-        if type_filter:
-            count_q = count_q.where(TypeElementPaie.type == type_filter)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(TypeElementPaie.ordre_affichage, TypeElementPaie.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(TypeElementPaie.ordre_affichage, TypeElementPaie.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: TypeElementPaie) -> TypeElementPaie:
         self._db.add(entity)
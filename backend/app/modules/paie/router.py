@@ -8,6 +8,7 @@ from fastapi import APIRouter, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.paie import schemas
 from app.modules.paie.services import (
     BulletinPaieService,
@@ -34,7 +35,7 @@ async def list_periodes_paie(
     limit: int = Query(24, ge=1, le=60),
 ):
     items, _ = await PeriodePaieService(db).get_all(
-        entreprise_id=entreprise_id, cloturee=cloturee, skip=skip, limit=limit
+        entreprise_id=entreprise_id, cloturee=cloturee, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -79,6 +80,7 @@ async def list_types_element_paie(
         type_filter=type_filter,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -125,6 +127,7 @@ async def list_bulletins_paie(
         statut=statut,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
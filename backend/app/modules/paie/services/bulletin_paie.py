@@ -1,6 +1,7 @@
 # app/modules/paie/services/bulletin_paie.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.paie.models import BulletinPaie, LigneBulletinPaie
 from app.modules.paie.repositories import (
     BulletinPaieRepository,
@@ -51,7 +52,8 @@ class BulletinPaieService(BasePaieService):
         statut: str | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[BulletinPaie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[BulletinPaie], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -61,6 +63,7 @@ class BulletinPaieService(BasePaieService):
             statut=statut,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: BulletinPaieCreate) -> BulletinPaie:
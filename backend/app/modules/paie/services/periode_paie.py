@@ -1,6 +1,7 @@
 # app/modules/paie/services/periode_paie.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.paie.models import PeriodePaie
 from app.modules.paie.repositories import PeriodePaieRepository
 from app.modules.paie.schemas import PeriodePaieCreate, PeriodePaieUpdate
@@ -31,7 +32,8 @@ class PeriodePaieService(BasePaieService):
         cloturee: bool | None = None,
         skip: int = 0,
         limit: int = 24,
-    ) -> tuple[list[PeriodePaie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[PeriodePaie], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -39,6 +41,7 @@ class PeriodePaieService(BasePaieService):
             cloturee=cloturee,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: PeriodePaieCreate) -> PeriodePaie:
@@ -1,6 +1,7 @@
 # app/modules/paie/services/type_element_paie.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.paie.models import TypeElementPaie
 from app.modules.paie.repositories import TypeElementPaieRepository
 from app.modules.paie.schemas import TypeElementPaieCreate, TypeElementPaieUpdate
@@ -32,7 +33,8 @@ class TypeElementPaieService(BasePaieService):
         type_filter: str | None = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> tuple[list[TypeElementPaie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[TypeElementPaie], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -41,6 +43,7 @@ class TypeElementPaieService(BasePaieService):
             type_filter=type_filter,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: TypeElementPaieCreate) -> TypeElementPaie:
@@ -1,21 +1,32 @@
 # app/modules/parametrage/dependencies.py
 # -----------------------------------------------------------------------------
 # Dépendances FastAPI spécifiques au module Paramétrage : get_current_user,
-# isolation multi-tenant (entreprise_id validé), autorisation par permissions.
+# isolation multi-tenant (entreprise_id validé), autorisation par permissions,
+# GET conditionnels (ConditionalGet : ETag, 304 sans requête SQL).
+# Utilisateur et permissions du rôle sont lus via principal_cache : aucune
+# requête SQL sur le chemin chaud tant que les versions des tables lues
+# (partagées entre workers) n'ont pas changé.
 # Placé ici (et non dans core) pour éviter que core dépende des modules métier,
 # ce qui supprimerait tout risque d'import circulaire.
 # -----------------------------------------------------------------------------
 
 from typing import Annotated
 
-from fastapi import Depends, Query, Request
+from fastapi import Depends, Query, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional import cache_control, compute_etag, etag_matches, watch_tables
 from app.core.database import get_db
-from app.core.exceptions import ForbiddenError, UnauthorizedError
+from app.core.exceptions import ForbiddenError, NotModifiedError, UnauthorizedError
+from app.core.logging_config import bind_log_context
 from app.core.security import decode_access_token
-from app.modules.parametrage.models import Utilisateur
+from app.modules.parametrage.principal_cache import (
+    ROLE_TABLES,
+    USER_TABLES,
+    Principal,
+    get_principal_cache,
+)
 from app.modules.parametrage.repositories import UtilisateurRepository
 from app.modules.parametrage.services.messages import Messages
 
@@ -42,11 +53,16 @@ async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_http_bearer)],
-) -> Utilisateur:
+) -> Principal:
     """
     Dépendance FastAPI : récupère l'utilisateur authentifié à partir du token JWT.
     - Token depuis Authorization: Bearer <token> ou Authorization: <token>.
     - Si pas de token ou token invalide/expiré : lève UnauthorizedError (401).
+    - Token déjà vérifié : payload relu dans le cache de decode_access_token.
+    - Principal (id, entreprise_id, role_id, actif) lu en cache, sinon en base ;
+      entrée valable tant que la version de la table utilisateurs (entreprise
+      du token) n'a pas changé.
+    - user_id et entreprise_id ajoutés au contexte de log (route : déjà liée au routage).
     """
     token = _extract_token(credentials, request)
     if not token:
@@ -59,17 +75,24 @@ async def get_current_user(
         user_id = int(user_id_str)
     except (ValueError, TypeError) as err:
         raise UnauthorizedError(detail="Token invalide") from err
-    repo = UtilisateurRepository(db)
-    user = await repo.find_by_id(user_id)
-    if not user:
-        raise UnauthorizedError(detail="Utilisateur non trouvé")
-    if not user.actif:
+    cache = get_principal_cache()
+    versions = await cache.versions(payload.get("entreprise_id"), USER_TABLES)
+    principal = cache.get_principal(user_id, versions)
+    if principal is None:
+        user = await UtilisateurRepository(db).find_by_id(user_id)
+        if not user:
+            raise UnauthorizedError(detail="Utilisateur non trouvé")
+        principal = Principal(id=user.id, entreprise_id=user.entreprise_id, role_id=user.role_id, actif=user.actif)
+        if principal.entreprise_id == payload.get("entreprise_id"):
+            cache.set_principal(principal, versions)
+    if not principal.actif:
         raise UnauthorizedError(detail=Messages.UTILISATEUR_DESACTIVATED)
-    return user
+    bind_log_context(user_id=principal.id, entreprise_id=principal.entreprise_id)
+    return principal
 
 
 # Alias pour annotation dans les routes : CurrentUser = Depends(get_current_user)
-CurrentUser = Annotated[Utilisateur, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 def get_validated_entreprise_id(
@@ -95,7 +118,7 @@ ValidatedEntrepriseId = Annotated[int, Depends(get_validated_entreprise_id)]
 
 
 async def _check_permission(
-    current_user: Utilisateur,
+    current_user: Principal,
     db: AsyncSession,
     module: str,
     action: str,
@@ -104,11 +127,17 @@ async def _check_permission(
     Vérifie que le rôle de l'utilisateur possède la permission (module, action).
     Si le rôle n'a aucune permission affectée (perms vide), l'accès est autorisé (rétrocompatibilité).
     Sinon lève ForbiddenError si (module, action) n'est pas dans la liste.
+    Ensemble des permissions du rôle lu en cache (tant que les versions des
+    tables rôles / permissions n'ont pas changé), sinon en base.
     """
     from app.modules.parametrage.repositories import PermissionRepository
 
-    repo = PermissionRepository(db)
-    perms = await repo.find_permissions_by_role_id(current_user.role_id)
+    cache = get_principal_cache()
+    versions = await cache.versions(current_user.entreprise_id, ROLE_TABLES)
+    perms = cache.get_permissions(current_user.role_id, versions)
+    if perms is None:
+        perms = frozenset(await PermissionRepository(db).find_permissions_by_role_id(current_user.role_id))
+        cache.set_permissions(current_user.role_id, perms, versions)
     if not perms:
         return  # Aucune permission définie pour ce rôle : accès autorisé (comportement par défaut)
     if (module, action) not in perms:
@@ -124,10 +153,39 @@ def RequirePermission(module: str, action: str):  # noqa: N802
     À utiliser après CurrentUser : RequirePermission("parametrage", "read").
     """
     async def _dep(
-        current_user: Annotated[Utilisateur, Depends(get_current_user)],
+        current_user: CurrentUser,
         db: Annotated[AsyncSession, Depends(get_db)],
     ) -> None:
         await _check_permission(current_user, db, module, action)
 
     return Depends(_dep)
 
+
+
+# --- GET conditionnels (ETag / If-None-Match) ---------------------------------
+
+
+# Référentiels globaux (devises, taux TVA, unités, états document) : copie
+# navigateur réutilisée une minute, puis revalidation (304 si inchangés).
+REFERENTIEL_MAX_AGE = 60
+
+
+def ConditionalGet(*tables: str, max_age: int = 0):  # noqa: N802
+    """
+    Dépendance FastAPI pour une liste lue dans tables : ETag faible et
+    Cache-Control (max_age, cf. app.core.conditional) sur la réponse ; 304 sans
+    corps, avant toute requête de la route, si If-None-Match correspond.
+    À déclarer après CurrentUser / RequirePermission (401 et 403 d'abord).
+    """
+    watch_tables(*tables)
+
+    async def _dep(current_user: CurrentUser, request: Request, response: Response) -> None:
+        etag = await compute_etag(request, current_user.entreprise_id, tables)
+        if etag is None:
+            return
+        headers = {"ETag": etag, "Cache-Control": cache_control(max_age)}
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            raise NotModifiedError(headers=headers)
+        response.headers.update(headers)
+
+    return Depends(_dep)
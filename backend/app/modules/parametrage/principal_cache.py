@@ -0,0 +1,153 @@
+# app/modules/parametrage/principal_cache.py
+# -----------------------------------------------------------------------------
+# Cache en mémoire du processus pour l'authentification et l'autorisation.
+# - Principal (id, entreprise_id, role_id, actif) par utilisateur : évite la
+#   lecture de l'utilisateur à chaque requête authentifiée.
+# - Ensemble compilé des (module, action) par rôle : évite la jointure
+#   permission_role ↔ permission à chaque RequirePermission.
+# Durée de vie AUTH_CACHE_TTL_SECONDS (0 = désactivé). Chaque entrée porte les
+# versions (app.core.report_cache) des tables lues : une écriture commitée par
+# n'importe quel worker (Redis) rend l'entrée caduque à la requête suivante.
+# Sans compteurs partagés (WEB_CONCURRENCY > 1 sans REDIS_URL), cache désactivé.
+# Les services Paramétrage invalident en plus explicitement (utilisateur, rôle,
+# liaison permission-rôle) : tout de suite, puis à nouveau après le commit pour
+# écarter une relecture concurrente de l'état non commité.
+# -----------------------------------------------------------------------------
+
+from typing import NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCacheBackend
+from app.core.logging_config import get_logger
+from app.core.report_cache import get_report_cache, watch_tables
+
+logger = get_logger(__name__)
+
+# Clé de Session.info : clés de cache à invalider de nouveau après le commit
+_PENDING_INVALIDATIONS = "principal_cache_invalidations"
+
+_MAX_ENTRIES = 10_000
+
+# Tables lues pour un principal, pour les permissions compilées d'un rôle
+USER_TABLES = ("utilisateurs",)
+ROLE_TABLES = ("roles", "permissions", "permissions_roles")
+watch_tables(*USER_TABLES, *ROLE_TABLES)
+
+Versions = tuple[int, ...]
+
+
+class Principal(NamedTuple):
+    """Utilisateur authentifié, tel que vu par les routes (CurrentUser)."""
+    id: int
+    entreprise_id: int
+    role_id: int
+    actif: bool
+
+
+class PrincipalCache:
+    """Principals par utilisateur et permissions compilées par rôle, avec TTL."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = _MAX_ENTRIES) -> None:
+        self._ttl = ttl_seconds
+        self._data = MemoryCacheBackend(max_entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @staticmethod
+    def user_key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    @staticmethod
+    def role_key(role_id: int) -> str:
+        return f"role:{role_id}"
+
+    def _get(self, key: str, versions: Versions | None):
+        if versions is None or not self.enabled:
+            return None
+        entry = self._data.get_nowait(key)
+        if entry is None or entry[0] != versions:
+            return None
+        return entry[1]
+
+    def _set(self, key: str, versions: Versions | None, value) -> None:
+        if versions is not None and self.enabled:
+            self._data.set_nowait(key, (versions, value), self._ttl)
+
+    async def versions(self, entreprise_id: int | None, tables: tuple[str, ...]) -> Versions | None:
+        """Versions courantes des tables ; None si cache désactivé ou compteurs indisponibles."""
+        if not self.enabled:
+            return None
+        try:
+            return tuple(await get_report_cache().versions(entreprise_id, tables))
+        except Exception:
+            logger.warning("Cache principal : compteurs de version indisponibles", exc_info=True)
+            return None
+
+    def get_principal(self, user_id: int, versions: Versions | None) -> Principal | None:
+        return self._get(self.user_key(user_id), versions)
+
+    def set_principal(self, principal: Principal, versions: Versions | None) -> None:
+        self._set(self.user_key(principal.id), versions, principal)
+
+    def get_permissions(self, role_id: int, versions: Versions | None) -> frozenset[tuple[str, str]] | None:
+        return self._get(self.role_key(role_id), versions)
+
+    def set_permissions(self, role_id: int, perms: frozenset[tuple[str, str]], versions: Versions | None) -> None:
+        self._set(self.role_key(role_id), versions, perms)
+
+    def discard(self, key: str) -> None:
+        self._data.delete_nowait(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_principal_cache: PrincipalCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """
+    Instance unique du processus (créée au premier appel depuis la config).
+    Désactivée si les compteurs de version ne sont pas partagés entre workers.
+    """
+    global _principal_cache
+    if _principal_cache is None:
+        from app.config import get_settings
+
+        ttl = get_settings().AUTH_CACHE_TTL_SECONDS if get_report_cache().consistent else 0
+        _principal_cache = PrincipalCache(ttl_seconds=ttl)
+    return _principal_cache
+
+
+def _invalidate(db: AsyncSession, key: str) -> None:
+    get_principal_cache().discard(key)
+    db.sync_session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(key)
+
+
+def invalidate_user(db: AsyncSession, user_id: int) -> None:
+    """À appeler par les services qui modifient un utilisateur (rôle, actif, suppression)."""
+    _invalidate(db, PrincipalCache.user_key(user_id))
+
+
+def invalidate_role(db: AsyncSession, role_id: int) -> None:
+    """À appeler par les services qui modifient un rôle ou ses liaisons permission-rôle."""
+    _invalidate(db, PrincipalCache.role_key(role_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    keys = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if keys:
+        cache = get_principal_cache()
+        for key in keys:
+            cache.discard(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -6,6 +6,8 @@
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
+from app.core.query_cache import cached_query
 from app.modules.parametrage.models import Devise
 
 
@@ -21,24 +23,23 @@ class DeviseRepository:
         r = await self._db.execute(select(Devise).where(Devise.code == code.strip().upper()))
         return r.scalar_one_or_none()
 
+    @cached_query(Devise)
     async def find_all(
         self,
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         inactif_only: bool = False,
         search: str | None = None,
         decimales: int | None = None,
-    ) -> tuple[list[Devise], int]:
+    ) -> tuple[list[Devise], int | None]:
         base = select(Devise)
-        count_q = select(func.count()).select_from(Devise)
         if actif_only:
             base = base.where(Devise.actif.is_(True))
-            count_q = count_q.where(Devise.actif.is_(True))
         elif inactif_only:
             base = base.where(Devise.actif.is_(False))
-            count_q = count_q.where(Devise.actif.is_(False))
         if search and search.strip():
             term = f"%{search.strip()}%"
             cond = or_(
@@ -47,14 +48,10 @@ class DeviseRepository:
                 Devise.symbole.ilike(term),
             )
             base = base.where(cond)
-            count_q = count_q.where(cond)
         if decimales is not None:
             base = base.where(Devise.decimales == decimales)
-            count_q = count_q.where(Devise.decimales == decimales)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        base = base.order_by(Devise.code).offset(skip).limit(limit)
-        r = await self._db.execute(base)
-        return list(r.scalars().all()), total
+        base = base.order_by(Devise.code)
+        return await paginate(self._db, base, skip=skip, limit=limit, include_total=include_total)
 
     async def get_stats(self) -> dict:
         """Statistiques globales sur les devises."""
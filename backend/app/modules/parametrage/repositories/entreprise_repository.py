@@ -7,6 +7,7 @@
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.parametrage.models import Entreprise
 
 
@@ -25,19 +26,17 @@ class EntrepriseRepository:
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         inactif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Entreprise], int]:
+    ) -> tuple[list[Entreprise], int | None]:
         base = Entreprise.deleted_at.is_(None)
         q = select(Entreprise).where(base)
-        count_q = select(func.count()).select_from(Entreprise).where(base)
         if actif_only:
             q = q.where(Entreprise.actif.is_(True))
-            count_q = count_q.where(Entreprise.actif.is_(True))
         elif inactif_only:
             q = q.where(Entreprise.actif.is_(False))
-            count_q = count_q.where(Entreprise.actif.is_(False))
         if search and search.strip():
             term = f"%{search.strip()}%"
             f = or_(
@@ -46,11 +45,8 @@ class EntrepriseRepository:
                 Entreprise.niu.ilike(term),
             )
             q = q.where(f)
-            count_q = count_q.where(f)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Entreprise.raison_sociale).offset(skip).limit(limit)
-        result = await self._db.execute(q)
-        return list(result.scalars().all()), total
+        q = q.order_by(Entreprise.raison_sociale)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_code(self, code: str) -> bool:
         r = await self._db.execute(select(Entreprise.id).where(Entreprise.code == code).limit(1))
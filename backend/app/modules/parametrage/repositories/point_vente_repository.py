@@ -8,6 +8,7 @@ from datetime import datetime
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.parametrage.models import PointDeVente
 
 
@@ -27,25 +28,20 @@ class PointVenteRepository:
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         inactif_only: bool = False,
         search: str | None = None,
         type_filter: str | None = None,
-    ) -> tuple[list[PointDeVente], int]:
+    ) -> tuple[list[PointDeVente], int | None]:
         base = select(PointDeVente).where(
             PointDeVente.entreprise_id == entreprise_id,
             PointDeVente.deleted_at.is_(None),
         )
-        count_q = select(func.count()).select_from(PointDeVente).where(
-            PointDeVente.entreprise_id == entreprise_id,
-            PointDeVente.deleted_at.is_(None),
-        )
         if actif_only:
             base = base.where(PointDeVente.actif.is_(True))
-            count_q = count_q.where(PointDeVente.actif.is_(True))
         elif inactif_only:
             base = base.where(PointDeVente.actif.is_(False))
-            count_q = count_q.where(PointDeVente.actif.is_(False))
         if search and search.strip():
             term = f"%{search.strip()}%"
             cond = or_(
@@ -54,14 +50,10 @@ class PointVenteRepository:
                 PointDeVente.ville.ilike(term),
             )
             base = base.where(cond)
-            count_q = count_q.where(cond)
         if type_filter and type_filter.strip():
             base = base.where(PointDeVente.type == type_filter.strip())
-            count_q = count_q.where(PointDeVente.type == type_filter.strip())
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        base = base.order_by(PointDeVente.code).offset(skip).limit(limit)
-        r = await self._db.execute(base)
-        return list(r.scalars().all()), total
+        base = base.order_by(PointDeVente.code)
+        return await paginate(self._db, base, skip=skip, limit=limit, include_total=include_total)
 
     async def get_stats(self, entreprise_id: int) -> dict:
         """Statistiques des points de vente d'une entreprise (hors supprimés)."""
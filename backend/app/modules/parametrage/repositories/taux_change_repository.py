@@ -8,6 +8,7 @@ from datetime import date
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.parametrage.models import TauxChange
 
 
@@ -44,29 +45,23 @@ class TauxChangeRepository:
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         devise_from_id: int | None = None,
         devise_to_id: int | None = None,
         date_effet_min: date | None = None,
         date_effet_max: date | None = None,
-    ) -> tuple[list[TauxChange], int]:
+    ) -> tuple[list[TauxChange], int | None]:
         q = select(TauxChange)
-        count_q = select(func.count()).select_from(TauxChange)
         if devise_from_id is not None:
             q = q.where(TauxChange.devise_from_id == devise_from_id)
-            count_q = count_q.where(TauxChange.devise_from_id == devise_from_id)
         if devise_to_id is not None:
             q = q.where(TauxChange.devise_to_id == devise_to_id)
-            count_q = count_q.where(TauxChange.devise_to_id == devise_to_id)
         if date_effet_min is not None:
             q = q.where(TauxChange.date_effet >= date_effet_min)
-            count_q = count_q.where(TauxChange.date_effet >= date_effet_min)
         if date_effet_max is not None:
             q = q.where(TauxChange.date_effet <= date_effet_max)
-            count_q = count_q.where(TauxChange.date_effet <= date_effet_max)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(TauxChange.date_effet.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(TauxChange.date_effet.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def get_stats(self) -> dict:
         """Statistiques globales : total de taux de change."""
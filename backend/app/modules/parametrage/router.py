@@ -10,8 +10,15 @@ from fastapi.responses import Response
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.parametrage import schemas
-from app.modules.parametrage.dependencies import CurrentUser, RequirePermission, ValidatedEntrepriseId
+from app.modules.parametrage.dependencies import (
+    REFERENTIEL_MAX_AGE,
+    ConditionalGet,
+    CurrentUser,
+    RequirePermission,
+    ValidatedEntrepriseId,
+)
 from app.modules.parametrage.services.affectation_utilisateur_pdv import (
     AffectationUtilisateurPdvService,
 )
@@ -57,6 +64,7 @@ async def list_entreprises(
     _perm: None = RequirePermission("parametrage", "read"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    include_total: TotalMode = Query(TotalMode.exact, description="Total : exact, estimate (statistiques PostgreSQL) ou none"),
     actif_only: bool = False,
     inactif_only: bool = False,
     search: str | None = None,
@@ -64,7 +72,12 @@ async def list_entreprises(
     """Liste paginée des entreprises (items + total pour la pagination)."""
     service = EntrepriseService(db)
     items, total = await service.get_entreprises(
-        skip=skip, limit=limit, actif_only=actif_only, inactif_only=inactif_only, search=search
+        skip=skip,
+        limit=limit,
+        actif_only=actif_only,
+        inactif_only=inactif_only,
+        search=search,
+        include_total=include_total,
     )
     return schemas.ListEntreprisesResponse(items=items, total=total)
 
@@ -138,12 +151,14 @@ async def list_devises(
     _perm: None = RequirePermission("parametrage", "read"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    include_total: TotalMode = Query(TotalMode.exact, description="Total : exact, estimate (statistiques PostgreSQL) ou none"),
     actif_only: bool = False,
     inactif_only: bool = Query(False, description="Si True, ne retourne que les devises inactives"),
     search: str | None = Query(None, description="Recherche sur code, libellé, symbole"),
     decimales: int | None = Query(None, ge=0, le=6, description="Filtrer par nombre de décimales"),
+    _etag: None = ConditionalGet("devises", max_age=REFERENTIEL_MAX_AGE),
 ):
-    """Liste paginée des devises (items + total)."""
+    """Liste paginée des devises (items + total). ETag : 304 si inchangée."""
     items, total = await DeviseService(db).get_devises(
         skip=skip,
         limit=limit,
@@ -151,6 +166,7 @@ async def list_devises(
         inactif_only=inactif_only,
         search=search,
         decimales=decimales,
+        include_total=include_total,
     )
     return schemas.ListDevisesResponse(items=items, total=total)
 
@@ -222,6 +238,7 @@ async def list_taux_change(
     _perm: None = RequirePermission("parametrage", "read"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    include_total: TotalMode = Query(TotalMode.exact, description="Total : exact, estimate (statistiques PostgreSQL) ou none"),
     devise_from_id: int | None = None,
     devise_to_id: int | None = None,
     date_effet_min: str | None = Query(None, description="Date d'effet min (YYYY-MM-DD)"),
@@ -238,6 +255,7 @@ async def list_taux_change(
         devise_to_id=devise_to_id,
         date_effet_min=d_min,
         date_effet_max=d_max,
+        include_total=include_total,
     )
     return schemas.ListTauxChangeResponse(items=items, total=total)
 
@@ -311,6 +329,7 @@ async def list_points_vente(
     _perm: None = RequirePermission("parametrage", "read"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    include_total: TotalMode = Query(TotalMode.exact, description="Total : exact, estimate (statistiques PostgreSQL) ou none"),
     actif_only: bool = False,
     inactif_only: bool = Query(False, description="Si True, ne retourne que les points inactifs"),
     search: str | None = Query(None, description="Recherche sur code, libellé, ville"),
@@ -327,6 +346,7 @@ async def list_points_vente(
         inactif_only=inactif_only,
         search=search,
         type_filter=type,
+        include_total=include_total,
     )
     return schemas.ListPointsVenteResponse(items=items, total=total)
 
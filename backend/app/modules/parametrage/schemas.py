@@ -46,7 +46,7 @@ class DeviseResponse(BaseModel):
 class ListDevisesResponse(BaseModel):
     """Réponse paginée de la liste des devises."""
     items: list[DeviseResponse] = Field(..., description="Liste des devises")
-    total: int = Field(..., description="Nombre total (pour pagination)")
+    total: int | None = Field(..., description="Nombre total (pour pagination ; null si include_total=none)")
 
 
 class DeviseStatsResponse(BaseModel):
@@ -88,7 +88,7 @@ class TauxChangeResponse(BaseModel):
 class ListTauxChangeResponse(BaseModel):
     """Réponse paginée de la liste des taux de change."""
     items: list[TauxChangeResponse] = Field(..., description="Liste des taux")
-    total: int = Field(..., description="Nombre total (pour pagination)")
+    total: int | None = Field(..., description="Nombre total (pour pagination ; null si include_total=none)")
 
 
 class TauxChangeStatsResponse(BaseModel):
@@ -181,7 +181,7 @@ class EntrepriseResponse(BaseModel):
 class ListEntreprisesResponse(BaseModel):
     """Réponse paginée de la liste des entreprises."""
     items: list[EntrepriseResponse] = Field(..., description="Liste des entreprises")
-    total: int = Field(..., description="Nombre total d'entreprises (pour pagination)")
+    total: int | None = Field(..., description="Nombre total d'entreprises (pour pagination ; null si include_total=none)")
 
 
 class EntrepriseStatsResponse(BaseModel):
@@ -252,7 +252,7 @@ class PointDeVenteResponse(BaseModel):
 class ListPointsVenteResponse(BaseModel):
     """Réponse paginée de la liste des points de vente d'une entreprise."""
     items: list[PointDeVenteResponse] = Field(..., description="Liste des points de vente")
-    total: int = Field(..., description="Nombre total (pour pagination)")
+    total: int | None = Field(..., description="Nombre total (pour pagination ; null si include_total=none)")
 
 
 class PointVenteStatsResponse(BaseModel):
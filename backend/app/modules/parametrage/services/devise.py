@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.models import Devise
 from app.modules.parametrage.repositories import DeviseRepository
 from app.modules.parametrage.repositories.taux_change_repository import TauxChangeRepository
@@ -40,11 +41,12 @@ class DeviseService(BaseParametrageService):
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         inactif_only: bool = False,
         search: str | None = None,
         decimales: int | None = None,
-    ) -> tuple[list[Devise], int]:
+    ) -> tuple[list[Devise], int | None]:
         """Liste les devises avec filtres optionnels (recherche texte, statut, décimales). Retourne (items, total)."""
         return await self._repo.find_all(
             skip=skip,
@@ -53,6 +55,7 @@ class DeviseService(BaseParametrageService):
             inactif_only=inactif_only,
             search=search,
             decimales=decimales,
+            include_total=include_total,
         )
 
     async def get_stats(self) -> dict:
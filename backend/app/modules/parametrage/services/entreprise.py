@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.models import Entreprise
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.parametrage.schemas import EntrepriseCreate, EntrepriseUpdate
@@ -37,10 +38,11 @@ class EntrepriseService(BaseParametrageService):
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         inactif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Entreprise], int]:
+    ) -> tuple[list[Entreprise], int | None]:
         """Liste globale des entreprises (sans filtre entreprise_id).
         Convention : les autres modules utilisent get_all(entreprise_id, ...) pour une liste scopée."""
         return await self._repo.find_all(
@@ -49,6 +51,7 @@ class EntrepriseService(BaseParametrageService):
             actif_only=actif_only,
             inactif_only=inactif_only,
             search=search,
+            include_total=include_total,
         )
 
     async def get_stats(self) -> dict:
@@ -6,6 +6,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.parametrage.models import Permission, PermissionRole
+from app.modules.parametrage.principal_cache import invalidate_role
 from app.modules.parametrage.repositories import PermissionRepository, RoleRepository
 from app.modules.parametrage.schemas import (
     PermissionCreate,
@@ -97,11 +98,13 @@ class PermissionService(BaseParametrageService):
         if await self._repo.find_permission_role(data.role_id, data.permission_id):
             self._raise_conflict(Messages.PERMISSION_ROLE_ALREADY)
         pr = PermissionRole(role_id=data.role_id, permission_id=data.permission_id)
+        invalidate_role(self._db, data.role_id)
         return await self._repo.add_permission_role(pr)
 
     async def remove_permission_from_role(self, role_id: int, permission_id: int) -> None:
         pr = await self._repo.find_permission_role(role_id, permission_id)
         if pr is None:
             self._raise_not_found(Messages.PERMISSION_ROLE_NOT_FOUND)
+        invalidate_role(self._db, role_id)
         await self._repo.delete(pr)
 
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.models import PointDeVente
 from app.modules.parametrage.repositories import EntrepriseRepository, PointVenteRepository
 from app.modules.parametrage.schemas import PointDeVenteCreate, PointDeVenteUpdate
@@ -35,11 +36,12 @@ class PointVenteService(BaseParametrageService):
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         inactif_only: bool = False,
         search: str | None = None,
         type_filter: str | None = None,
-    ) -> tuple[list[PointDeVente], int]:
+    ) -> tuple[list[PointDeVente], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_by_entreprise(
@@ -50,6 +52,7 @@ class PointVenteService(BaseParametrageService):
             inactif_only=inactif_only,
             search=search,
             type_filter=type_filter,
+            include_total=include_total,
         )
 
     async def get_stats(self, entreprise_id: int) -> dict:
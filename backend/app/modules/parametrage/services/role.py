@@ -6,6 +6,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.parametrage.models import Role
+from app.modules.parametrage.principal_cache import invalidate_role
 from app.modules.parametrage.repositories import EntrepriseRepository, RoleRepository
 from app.modules.parametrage.schemas import RoleCreate, RoleUpdate
 from app.modules.parametrage.services.base import BaseParametrageService
@@ -70,5 +71,6 @@ class RoleService(BaseParametrageService):
             role.code = code
         if data.libelle is not None:
             role.libelle = data.libelle.strip() or role.libelle
+        invalidate_role(self._db, role_id)
         return await self._repo.update(role)
 
@@ -7,6 +7,7 @@ from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.models import TauxChange
 from app.modules.parametrage.repositories import DeviseRepository, TauxChangeRepository
 from app.modules.parametrage.schemas import TauxChangeCreate, TauxChangeUpdate
@@ -50,11 +51,12 @@ class TauxChangeService(BaseParametrageService):
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         devise_from_id: int | None = None,
         devise_to_id: int | None = None,
         date_effet_min: date | None = None,
         date_effet_max: date | None = None,
-    ) -> tuple[list[TauxChange], int]:
+    ) -> tuple[list[TauxChange], int | None]:
         return await self._repo.find_all(
             skip=skip,
             limit=limit,
@@ -62,6 +64,7 @@ class TauxChangeService(BaseParametrageService):
             devise_to_id=devise_to_id,
             date_effet_min=date_effet_min,
             date_effet_max=date_effet_max,
+            include_total=include_total,
         )
 
     async def create(self, data: TauxChangeCreate) -> TauxChange:
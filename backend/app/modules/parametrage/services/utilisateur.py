@@ -7,8 +7,9 @@ from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_password_async
 from app.modules.parametrage.models import Utilisateur
+from app.modules.parametrage.principal_cache import invalidate_user
 from app.modules.parametrage.repositories import (
     EntrepriseRepository,
     PointVenteRepository,
@@ -80,7 +81,7 @@ class UtilisateurService(BaseParametrageService):
             point_de_vente_id=data.point_de_vente_id,
             role_id=data.role_id,
             login=login,
-            mot_de_passe_hash=hash_password(data.mot_de_passe),
+            mot_de_passe_hash=await hash_password_async(data.mot_de_passe),
             email=data.email,
             nom=(data.nom or "").strip(),
             prenom=(data.prenom or "").strip() if data.prenom else None,
@@ -110,7 +111,8 @@ class UtilisateurService(BaseParametrageService):
         if data.actif is not None:
             user.actif = data.actif
         if data.mot_de_passe is not None and data.mot_de_passe.strip():
-            user.mot_de_passe_hash = hash_password(data.mot_de_passe)
+            user.mot_de_passe_hash = await hash_password_async(data.mot_de_passe)
+        invalidate_user(self._db, utilisateur_id)
         return await self._repo.update(user)
 
     async def set_derniere_connexion(self, utilisateur_id: int) -> None:
@@ -139,9 +141,9 @@ class UtilisateurService(BaseParametrageService):
         if utilisateur_id == current_user_id:
             if not (data.ancien_mot_de_passe or "").strip():
                 self._raise_bad_request(Messages.UTILISATEUR_MOT_DE_PASSE_INCORRECT)
-            if not verify_password(data.ancien_mot_de_passe, user.mot_de_passe_hash):
+            if not await verify_password_async(data.ancien_mot_de_passe, user.mot_de_passe_hash):
                 self._raise_bad_request(Messages.UTILISATEUR_MOT_DE_PASSE_INCORRECT)
-        user.mot_de_passe_hash = hash_password(nouveau)
+        user.mot_de_passe_hash = await hash_password_async(nouveau)
         await self._repo.update(user)
 
     async def delete_soft(self, utilisateur_id: int) -> None:
@@ -151,5 +153,6 @@ class UtilisateurService(BaseParametrageService):
             self._raise_not_found(Messages.UTILISATEUR_NOT_FOUND)
         user.deleted_at = datetime.now(UTC)
         user.actif = False
+        invalidate_user(self._db, utilisateur_id)
         await self._repo.update(user)
 
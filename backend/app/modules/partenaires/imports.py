@@ -0,0 +1,29 @@
+# app/modules/partenaires/imports.py
+# -----------------------------------------------------------------------------
+# Import en masse des tiers (app.core.bulk_import). Mêmes contrôles que
+# TiersService.create, résolus pour tout le lot : type de tiers et canal de
+# vente (de l'entreprise), par id ou par code (type_tiers_code, canal_vente_code).
+# -----------------------------------------------------------------------------
+
+from app.core.bulk_import import Importer, Reference
+from app.modules.catalogue.models import CanalVente
+from app.modules.partenaires.models import Tiers, TypeTiers
+from app.modules.partenaires.schemas import TiersCreate
+
+
+class TiersImporter(Importer):
+    # Clé unique (entreprise_id, code) en base, tiers supprimés compris :
+    # pas de filtre sur deleted_at.
+    name = "tiers"
+    model = Tiers
+    schema = TiersCreate
+    key = "code"
+    references = (
+        Reference("type_tiers_id", TypeTiers),
+        Reference("canal_vente_id", CanalVente, scoped=True),
+    )
+
+    def values(self, item: TiersCreate) -> dict:
+        data = super().values(item)
+        data["pays"] = data.get("pays") or "CMR"
+        return data
@@ -13,11 +13,13 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -76,6 +78,14 @@ class Tiers(Base):
 
     __table_args__ = (
         UniqueConstraint("entreprise_id", "code", name="uq_tiers_entreprise_code"),
+        # Index partiel : les listes ne lisent que les tiers non supprimés, triés par raison sociale
+        Index(
+            "ix_tiers_entreprise_raison_sociale_actifs",
+            "entreprise_id",
+            "raison_sociale",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
     )
 
 
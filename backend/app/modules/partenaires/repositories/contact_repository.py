@@ -3,9 +3,10 @@
 # Repository Contact (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.partenaires.models import Contact
 
 
@@ -23,17 +24,14 @@ class ContactRepository:
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
-    ) -> tuple[list[Contact], int]:
+    ) -> tuple[list[Contact], int | None]:
         q = select(Contact).where(Contact.tiers_id == tiers_id)
-        count_q = select(func.count()).select_from(Contact).where(Contact.tiers_id == tiers_id)
         if actif_only:
             q = q.where(Contact.actif.is_(True))
-            count_q = count_q.where(Contact.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Contact.est_principal.desc(), Contact.nom).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Contact.est_principal.desc(), Contact.nom)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Contact) -> Contact:
         self._db.add(entity)
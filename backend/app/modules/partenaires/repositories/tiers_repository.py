@@ -3,9 +3,10 @@
 # Repository Tiers (couche Infrastructure).
 # -----------------------------------------------------------------------------
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.partenaires.models import Tiers
 
 
@@ -29,21 +30,18 @@ class TiersRepository:
         type_tiers_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Tiers], int]:
+    ) -> tuple[list[Tiers], int | None]:
         base = Tiers.deleted_at.is_(None)
         q = select(Tiers).where(base)
-        count_q = select(func.count()).select_from(Tiers).where(base)
         if entreprise_id is not None:
             q = q.where(Tiers.entreprise_id == entreprise_id)
-            count_q = count_q.where(Tiers.entreprise_id == entreprise_id)
         if type_tiers_id is not None:
             q = q.where(Tiers.type_tiers_id == type_tiers_id)
-            count_q = count_q.where(Tiers.type_tiers_id == type_tiers_id)
         if actif_only:
             q = q.where(Tiers.actif.is_(True))
-            count_q = count_q.where(Tiers.actif.is_(True))
         if search and search.strip():
             term = f"%{search.strip()}%"
             f = or_(
@@ -52,11 +50,8 @@ class TiersRepository:
                 Tiers.niu.ilike(term),
             )
             q = q.where(f)
-            count_q = count_q.where(f)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Tiers.raison_sociale).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Tiers.raison_sociale)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def exists_by_entreprise_and_code(
         self,
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.parametrage.dependencies import CurrentUser, ValidatedEntrepriseId
 from app.modules.partenaires import schemas
 from app.modules.partenaires.services import ContactService, TiersService, TypeTiersService
@@ -87,6 +88,7 @@ async def list_tiers(
         limit=limit,
         actif_only=actif_only,
         search=search,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -117,7 +119,7 @@ async def list_contacts_by_tiers(
     if tiers.entreprise_id != current_user.entreprise_id:
         raise ForbiddenError(detail="Accès à une autre entreprise non autorisé", code="FORBIDDEN_ENTREPRISE")
     items, _ = await ContactService(db).get_by_tiers(
-        tiers_id, skip=skip, limit=limit, actif_only=actif_only
+        tiers_id, skip=skip, limit=limit, actif_only=actif_only, include_total=TotalMode.none
     )
     return items
 
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.partenaires.models import Contact
 from app.modules.partenaires.repositories import ContactRepository, TiersRepository
 from app.modules.partenaires.schemas import ContactCreate, ContactUpdate
@@ -35,10 +36,12 @@ class ContactService(BasePartenairesService):
         *,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
-    ) -> tuple[list[Contact], int]:
+    ) -> tuple[list[Contact], int | None]:
         return await self._repo.find_by_tiers(
-            tiers_id, skip=skip, limit=limit, actif_only=actif_only
+            tiers_id, skip=skip, limit=limit, actif_only=actif_only,
+            include_total=include_total,
         )
 
     async def create(self, data: ContactCreate) -> Contact:
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.catalogue.repositories import CanalVenteRepository
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.partenaires.models import Tiers
@@ -33,9 +34,10 @@ class TiersService(BasePartenairesService):
         type_tiers_id: int | None = None,
         skip: int = 0,
         limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
         actif_only: bool = False,
         search: str | None = None,
-    ) -> tuple[list[Tiers], int]:
+    ) -> tuple[list[Tiers], int | None]:
         """Liste des tiers avec total."""
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
@@ -44,6 +46,7 @@ class TiersService(BasePartenairesService):
             limit=limit,
             actif_only=actif_only,
             search=search,
+            include_total=include_total,
         )
 
     async def get_or_404(self, id: int) -> Tiers:
@@ -0,0 +1,67 @@
+# app/modules/rapports/models.py
+# -----------------------------------------------------------------------------
+# Modèles ORM du module Rapports : tables de faits agrégées pour le reporting.
+# ventes_journalieres : une ligne par (entreprise, PDV, client, jour, type facture)
+# avec les sommes HT/TVA/TTC et le nombre de factures. Maintenue à chaque
+# création/modification de facture (FactureService) et reconstructible
+# (scripts/rebuild_ventes_journalieres.py). Dépend de Paramétrage, Partenaires.
+# -----------------------------------------------------------------------------
+
+from datetime import date
+from decimal import Decimal
+from enum import Enum as PyEnum
+
+from sqlalchemy import Date, ForeignKey, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class GranulariteSerie(str, PyEnum):
+    """Pas de regroupement des séries temporelles."""
+    jour = "jour"
+    semaine = "semaine"
+    mois = "mois"
+    trimestre = "trimestre"
+
+
+class VentilationSerie(str, PyEnum):
+    """Dimension de ventilation optionnelle des séries."""
+    aucune = "aucune"
+    point_de_vente = "point_de_vente"
+    client = "client"
+
+
+class TriBalanceAgee(str, PyEnum):
+    """Critère de tri des clients de la balance âgée (exposition)."""
+    total = "total"
+    echu = "echu"
+    plus_90_jours = "plus_90_jours"
+
+
+# --- Ventes journalières (table de faits) --------------------------------------
+class VenteJournaliere(Base):
+    """Agrégat quotidien des factures clients. Table : ventes_journalieres."""
+    __tablename__ = "ventes_journalieres"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entreprise_id: Mapped[int] = mapped_column(Integer, ForeignKey("entreprises.id"), nullable=False)
+    point_de_vente_id: Mapped[int] = mapped_column(Integer, ForeignKey("points_de_vente.id"), nullable=False)
+    client_id: Mapped[int] = mapped_column(Integer, ForeignKey("tiers.id"), nullable=False)
+    date_vente: Mapped[date] = mapped_column(Date, nullable=False)
+    type_facture: Mapped[str] = mapped_column(String(20), nullable=False)
+    montant_ht: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    montant_tva: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    montant_ttc: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    nombre_factures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "entreprise_id",
+            "date_vente",
+            "point_de_vente_id",
+            "client_id",
+            "type_facture",
+            name="uq_ventes_journalieres_cle",
+        ),
+    )
@@ -0,0 +1,13 @@
+# app/modules/rapports/repositories
+# -----------------------------------------------------------------------------
+# Couche Infrastructure : repositories du module Rapports (tables de faits, balance âgée).
+# -----------------------------------------------------------------------------
+from app.modules.rapports.repositories.balance_agee_repository import BalanceAgeeRepository
+from app.modules.rapports.repositories.vente_journaliere_repository import (
+    VenteJournaliereRepository,
+)
+
+__all__ = [
+    "BalanceAgeeRepository",
+    "VenteJournaliereRepository",
+]
@@ -0,0 +1,105 @@
+# app/modules/rapports/repositories/balance_agee_repository.py
+# -----------------------------------------------------------------------------
+# Balance âgée des créances clients (couche Infrastructure).
+# Reste dû des factures réparti par ancienneté d'échéance (non échu, 0-30,
+# 31-60, 61-90, > 90 jours) en une seule requête SUM(CASE ...) GROUP BY client.
+# Bornes calculées en Python (dates liées) : requête identique SQLite/PostgreSQL
+# et servie par l'index couvrant ix_factures_balance_agee (entreprise_id,
+# type_facture, client_id, date_echeance, date_facture, montant_restant_du).
+# -----------------------------------------------------------------------------
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.commercial.models import Facture, TypeFacture
+from app.modules.partenaires.models import Tiers
+from app.modules.rapports.models import TriBalanceAgee
+
+TRANCHES = ("non_echu", "echu_0_30", "echu_31_60", "echu_61_90", "echu_plus_90")
+
+
+def _somme_si(condition: Any) -> Any:
+    return func.coalesce(func.sum(case((condition, Facture.montant_restant_du), else_=0)), 0)
+
+
+class BalanceAgeeRepository:
+    """Agrégats de la balance âgée par client."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    def _agregat_par_client(self, entreprise_id: int, date_reference: date, client_id: int | None) -> Any:
+        """Sous-requête : une ligne par client avec reste dû par tranche, total et nombre de factures."""
+        echeance = func.coalesce(Facture.date_echeance, Facture.date_facture)
+        j30, j60, j90 = (date_reference - timedelta(days=n) for n in (30, 60, 90))
+        q = (
+            select(
+                Facture.client_id.label("client_id"),
+                _somme_si(echeance >= date_reference).label("non_echu"),
+                _somme_si(and_(echeance < date_reference, echeance >= j30)).label("echu_0_30"),
+                _somme_si(and_(echeance < j30, echeance >= j60)).label("echu_31_60"),
+                _somme_si(and_(echeance < j60, echeance >= j90)).label("echu_61_90"),
+                _somme_si(echeance < j90).label("echu_plus_90"),
+                _somme_si(echeance < date_reference).label("echu"),
+                func.sum(Facture.montant_restant_du).label("total"),
+                func.count(Facture.id).label("nombre_factures"),
+            )
+            .where(
+                Facture.entreprise_id == entreprise_id,
+                # Seules les factures portent une créance (avoir, proforma, duplicata exclus)
+                Facture.type_facture == TypeFacture.facture.value,
+                Facture.montant_restant_du > 0,
+            )
+            .group_by(Facture.client_id)
+        )
+        if client_id is not None:
+            q = q.where(Facture.client_id == client_id)
+        return q.subquery("balance")
+
+    async def get_balance(
+        self,
+        entreprise_id: int,
+        date_reference: date,
+        *,
+        client_id: int | None = None,
+        tri: str = TriBalanceAgee.total.value,
+        decroissant: bool = True,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """
+        Retourne (lignes de la page triées par exposition, totaux toutes pages).
+        Totaux : montants par tranche, total, nombre_factures et nombre_clients.
+        """
+        agg = self._agregat_par_client(entreprise_id, date_reference, client_id)
+        colonne_tri = {
+            TriBalanceAgee.total.value: agg.c.total,
+            TriBalanceAgee.echu.value: agg.c.echu,
+            TriBalanceAgee.plus_90_jours.value: agg.c.echu_plus_90,
+        }[tri]
+        page_q = (
+            select(agg, Tiers.code.label("client_code"), Tiers.raison_sociale.label("client_raison_sociale"))
+            .join(Tiers, Tiers.id == agg.c.client_id)
+            .order_by(colonne_tri.desc() if decroissant else colonne_tri.asc(), agg.c.client_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        totaux_q = select(
+            *(func.coalesce(func.sum(agg.c[nom]), 0).label(nom) for nom in (*TRANCHES, "total")),
+            func.coalesce(func.sum(agg.c.nombre_factures), 0).label("nombre_factures"),
+            func.count().label("nombre_clients"),
+        )
+        lignes = [self._decimaux(dict(r)) for r in (await self._db.execute(page_q)).mappings()]
+        totaux = self._decimaux(dict((await self._db.execute(totaux_q)).mappings().one()))
+        return lignes, totaux
+
+    @staticmethod
+    def _decimaux(ligne: dict[str, Any]) -> dict[str, Any]:
+        """Montants en Decimal (SQLite renvoie des flottants pour les SUM)."""
+        for nom in (*TRANCHES, "echu", "total"):
+            if nom in ligne:
+                ligne[nom] = Decimal(str(ligne[nom] or 0)).quantize(Decimal("0.01"))
+        return ligne
@@ -0,0 +1,246 @@
+# app/modules/rapports/repositories/vente_journaliere_repository.py
+# -----------------------------------------------------------------------------
+# Repository VenteJournaliere (couche Infrastructure).
+# Maintenance incrémentale de la table de faits (upsert par delta),
+# reconstruction complète depuis factures (INSERT ... SELECT ... GROUP BY) et
+# séries temporelles N / N-1 en une seule requête GROUP BY.
+# -----------------------------------------------------------------------------
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import (
+    Date,
+    Integer,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.commercial.models import Facture
+from app.modules.rapports.models import GranulariteSerie, VenteJournaliere, VentilationSerie
+
+_CLE = ("entreprise_id", "date_vente", "point_de_vente_id", "client_id", "type_facture")
+_MESURES = ("montant_ht", "montant_tva", "montant_ttc", "nombre_factures")
+
+_TRONCATURE_POSTGRESQL = {
+    GranulariteSerie.semaine.value: "week",
+    GranulariteSerie.mois.value: "month",
+    GranulariteSerie.trimestre.value: "quarter",
+}
+
+
+def _plus_un_an(col: Any, dialect: str) -> Any:
+    """
+    Expression SQL : date + 1 an (ramène une vente N-1 sur le calendrier N).
+    29 février → 28 février sur tous les SGBD (règle de _moins_un_an du service) :
+    SQLite déborderait sur le 1er mars, PostgreSQL ramène déjà au 28.
+    """
+    if dialect == "sqlite":
+        return case(
+            (func.strftime("%m-%d", col) == "02-29", func.date(col, "-1 day", "+1 year", type_=Date)),
+            else_=func.date(col, "+1 year", type_=Date),
+        )
+    return cast(col + literal_column("INTERVAL '1 year'"), Date)
+
+
+def _debut_periode(col: Any, granularite: str, dialect: str) -> Any:
+    """Expression SQL : premier jour du pas (jour, semaine ISO lundi, mois, trimestre)."""
+    if granularite == GranulariteSerie.jour.value:
+        return col
+    if dialect == "sqlite":
+        if granularite == GranulariteSerie.semaine.value:
+            return func.date(col, "weekday 0", "-6 days", type_=Date)
+        if granularite == GranulariteSerie.mois.value:
+            return func.date(col, "start of month", type_=Date)
+        decalage = (cast(func.strftime("%m", col), Integer) - 1) % 3
+        return func.date(col, "start of month", func.printf("-%d months", decalage), type_=Date)
+    # Unité en littéral SQL : expression identique dans SELECT et GROUP BY
+    return cast(func.date_trunc(literal_column(f"'{_TRONCATURE_POSTGRESQL[granularite]}'"), col), Date)
+
+
+class VenteJournaliereRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def ajouter_facture(self, facture: Facture, *, signe: int = 1) -> None:
+        """Ajoute (signe=1) ou retire (signe=-1) la contribution d'une facture à son agrégat du jour."""
+        await self.appliquer_delta(
+            entreprise_id=facture.entreprise_id,
+            date_vente=facture.date_facture,
+            point_de_vente_id=facture.point_de_vente_id,
+            client_id=facture.client_id,
+            type_facture=facture.type_facture,
+            montant_ht=signe * (facture.montant_ht or Decimal("0")),
+            montant_tva=signe * (facture.montant_tva or Decimal("0")),
+            montant_ttc=signe * (facture.montant_ttc or Decimal("0")),
+            nombre_factures=signe,
+        )
+
+    async def appliquer_delta(
+        self,
+        *,
+        entreprise_id: int,
+        date_vente: date,
+        point_de_vente_id: int,
+        client_id: int,
+        type_facture: str,
+        montant_ht: Decimal,
+        montant_tva: Decimal,
+        montant_ttc: Decimal,
+        nombre_factures: int,
+    ) -> None:
+        """Upsert atomique : crée la ligne du jour ou incrémente ses sommes."""
+        values = {
+            "entreprise_id": entreprise_id,
+            "date_vente": date_vente,
+            "point_de_vente_id": point_de_vente_id,
+            "client_id": client_id,
+            "type_facture": type_facture,
+            "montant_ht": montant_ht,
+            "montant_tva": montant_tva,
+            "montant_ttc": montant_ttc,
+            "nombre_factures": nombre_factures,
+        }
+        dialect = self._db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(VenteJournaliere).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(_CLE),
+                set_={m: getattr(VenteJournaliere, m) + getattr(stmt.excluded, m) for m in _MESURES},
+            )
+            await self._db.execute(stmt)
+            return
+        # Autres SGBD : UPDATE puis INSERT si aucune ligne existante
+        r = await self._db.execute(
+            update(VenteJournaliere)
+            .where(*(getattr(VenteJournaliere, c) == values[c] for c in _CLE))
+            .values({m: getattr(VenteJournaliere, m) + values[m] for m in _MESURES})
+        )
+        if r.rowcount == 0:
+            await self._db.execute(insert(VenteJournaliere).values(**values))
+
+    async def get_totaux_periode(
+        self,
+        entreprise_id: int,
+        *,
+        date_debut: date | None = None,
+        date_fin: date | None = None,
+    ) -> tuple[Decimal, int]:
+        """Somme TTC et nombre de factures sur la période, lus depuis la table de faits."""
+        q = select(
+            func.coalesce(func.sum(VenteJournaliere.montant_ttc), 0),
+            func.coalesce(func.sum(VenteJournaliere.nombre_factures), 0),
+        ).where(VenteJournaliere.entreprise_id == entreprise_id)
+        if date_debut is not None:
+            q = q.where(VenteJournaliere.date_vente >= date_debut)
+        if date_fin is not None:
+            q = q.where(VenteJournaliere.date_vente <= date_fin)
+        montant, nb = (await self._db.execute(q)).one()
+        return Decimal(str(montant or 0)), int(nb or 0)
+
+    async def reconstruire(self, entreprise_id: int | None = None) -> int:
+        """
+        Reconstruit la table de faits depuis factures (toutes entreprises si None).
+        Retourne le nombre de lignes agrégées insérées.
+        """
+        purge = delete(VenteJournaliere)
+        source = select(
+            Facture.entreprise_id,
+            Facture.date_facture,
+            Facture.point_de_vente_id,
+            Facture.client_id,
+            Facture.type_facture,
+            func.coalesce(func.sum(Facture.montant_ht), 0),
+            func.coalesce(func.sum(Facture.montant_tva), 0),
+            func.coalesce(func.sum(Facture.montant_ttc), 0),
+            func.count(Facture.id),
+        ).group_by(
+            Facture.entreprise_id,
+            Facture.date_facture,
+            Facture.point_de_vente_id,
+            Facture.client_id,
+            Facture.type_facture,
+        )
+        if entreprise_id is not None:
+            purge = purge.where(VenteJournaliere.entreprise_id == entreprise_id)
+            source = source.where(Facture.entreprise_id == entreprise_id)
+        await self._db.execute(purge)
+        r = await self._db.execute(
+            insert(VenteJournaliere).from_select(list(_CLE + _MESURES), source)
+        )
+        return r.rowcount or 0
+
+    async def get_serie(
+        self,
+        entreprise_id: int,
+        *,
+        date_debut: date,
+        date_fin: date,
+        granularite: str,
+        ventilation: str = VentilationSerie.aucune.value,
+        date_debut_precedente: date | None = None,
+        date_fin_precedente: date | None = None,
+    ) -> list[tuple[date, int | None, Decimal, int, Decimal, int]]:
+        """
+        Série CA par pas de temps (et dimension optionnelle) en une requête :
+        UNION ALL des lignes N et N-1 (dates N-1 décalées d'un an) puis GROUP BY.
+        Retourne (periode_debut, dimension_id, ttc, nb, ttc_n1, nb_n1) triés par période.
+        """
+        dialect = self._db.get_bind().dialect.name
+        dimension = {
+            VentilationSerie.point_de_vente.value: VenteJournaliere.point_de_vente_id,
+            VentilationSerie.client.value: VenteJournaliere.client_id,
+        }.get(ventilation)
+        zero = literal(0)
+
+        def _source(debut: date, fin: date, precedent: bool):
+            jour = _plus_un_an(VenteJournaliere.date_vente, dialect) if precedent else VenteJournaliere.date_vente
+            mesures = [VenteJournaliere.montant_ttc, VenteJournaliere.nombre_factures]
+            mesures = [zero, zero, *mesures] if precedent else [*mesures, zero, zero]
+            return select(
+                jour.label("jour"),
+                (dimension if dimension is not None else literal(None, Integer)).label("dimension_id"),
+                mesures[0].label("ttc"),
+                mesures[1].label("nb"),
+                mesures[2].label("ttc_n1"),
+                mesures[3].label("nb_n1"),
+            ).where(
+                VenteJournaliere.entreprise_id == entreprise_id,
+                VenteJournaliere.date_vente >= debut,
+                VenteJournaliere.date_vente <= fin,
+            )
+
+        sources = [_source(date_debut, date_fin, precedent=False)]
+        if date_debut_precedente is not None and date_fin_precedente is not None:
+            sources.append(_source(date_debut_precedente, date_fin_precedente, precedent=True))
+        lignes = union_all(*sources).subquery() if len(sources) > 1 else sources[0].subquery()
+
+        periode = _debut_periode(lignes.c.jour, granularite, dialect).label("periode_debut")
+        q = (
+            select(
+                periode,
+                lignes.c.dimension_id,
+                func.coalesce(func.sum(lignes.c.ttc), 0),
+                func.coalesce(func.sum(lignes.c.nb), 0),
+                func.coalesce(func.sum(lignes.c.ttc_n1), 0),
+                func.coalesce(func.sum(lignes.c.nb_n1), 0),
+            )
+            .group_by(periode, lignes.c.dimension_id)
+            .order_by(periode, lignes.c.dimension_id)
+        )
+        r = await self._db.execute(q)
+        return [
+            (p, dim, Decimal(str(ttc or 0)), int(nb or 0), Decimal(str(ttc_n1 or 0)), int(nb_n1 or 0))
+            for p, dim, ttc, nb, ttc_n1, nb_n1 in r.all()
+        ]
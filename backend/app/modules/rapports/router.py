@@ -17,7 +17,9 @@ from app.modules.rapports.services import RapportsService
 router = APIRouter(prefix="/rapports")
 
 TAG_CHIFFRE_AFFAIRES = "Rapports - Chiffre d'affaires"
+TAG_SERIE_CA = "Rapports - Séries CA"
 TAG_DASHBOARD = "Rapports - Tableau de bord"
+TAG_BALANCE_AGEE = "Rapports - Balance âgée"
 
 
 @router.get("/chiffre-affaires", response_model=schemas.ChiffreAffairesPeriode, tags=[TAG_CHIFFRE_AFFAIRES])
@@ -32,6 +34,28 @@ async def rapport_chiffre_affaires(
     return await RapportsService(db).get_chiffre_affaires(entreprise_id, date_debut, date_fin)
 
 
+@router.get("/chiffre-affaires/serie", response_model=schemas.SerieChiffreAffaires, tags=[TAG_SERIE_CA])
+async def rapport_serie_chiffre_affaires(
+    db: DbSession,
+    current_user: CurrentUser,
+    entreprise_id: ValidatedEntrepriseId,
+    date_debut: date = Query(..., description="Début de période"),
+    date_fin: date = Query(..., description="Fin de période"),
+    granularite: str = Query("mois", description="Pas : jour, semaine, mois ou trimestre"),
+    ventilation: str = Query("aucune", description="Ventilation : aucune, point_de_vente ou client"),
+    comparer_annee_precedente: bool = Query(True, description="Inclure la même série sur N-1"),
+):
+    """Série du CA TTC par pas de temps (une seule requête GROUP BY), avec comparaison N-1."""
+    return await RapportsService(db).get_serie_chiffre_affaires(
+        entreprise_id,
+        date_debut,
+        date_fin,
+        granularite=granularite,
+        ventilation=ventilation,
+        comparer_annee_precedente=comparer_annee_precedente,
+    )
+
+
 @router.get("/dashboard", response_model=schemas.SyntheseDashboard, tags=[TAG_DASHBOARD])
 async def rapport_dashboard(
     db: DbSession,
@@ -40,6 +64,29 @@ async def rapport_dashboard(
     date_debut: date | None = Query(None, description="Filtre début période (optionnel)"),
     date_fin: date | None = Query(None, description="Filtre fin période (optionnel)"),
 ):
-    """Synthèse tableau de bord : CA, nombre de factures, commandes, employés actifs."""
+    """Synthèse tableau de bord (indicateurs calculés en parallèle, résultat partiel si un indicateur échoue)."""
     return await RapportsService(db).get_synthese_dashboard(entreprise_id, date_debut, date_fin)
 
+
+@router.get("/balance-agee", response_model=schemas.BalanceAgee, tags=[TAG_BALANCE_AGEE])
+async def rapport_balance_agee(
+    db: DbSession,
+    current_user: CurrentUser,
+    entreprise_id: ValidatedEntrepriseId,
+    date_reference: date | None = Query(None, description="Date d'arrêté (défaut : aujourd'hui)"),
+    client_id: int | None = Query(None, description="Limiter à un client"),
+    tri: str = Query("total", description="Tri des clients : total, echu ou plus_90_jours"),
+    decroissant: bool = Query(True, description="Plus forte exposition en premier"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+):
+    """Balance âgée des créances clients (non échu, 0-30, 31-60, 61-90, > 90 jours), paginée par client."""
+    return await RapportsService(db).get_balance_agee(
+        entreprise_id,
+        date_reference=date_reference,
+        client_id=client_id,
+        tri=tri,
+        decroissant=decroissant,
+        skip=skip,
+        limit=limit,
+    )
@@ -34,4 +34,64 @@ class SyntheseDashboard(BaseModel):
     nb_factures: int = 0
     nb_commandes: int = 0
     nb_employes_actifs: int = 0
+    nb_alertes_stock: int = 0
+    creances_echues: Decimal = Field(default=Decimal("0"))
+    nb_factures_echues: int = 0
+    masse_salariale: Decimal = Field(default=Decimal("0"))
+    metriques_indisponibles: list[str] = Field(
+        default_factory=list,
+        description="Indicateurs en erreur ou hors délai (valeurs par défaut renvoyées)",
+    )
 
+
+
+class PointSerieChiffreAffaires(BaseModel):
+    """Un pas de la série CA (période, dimension optionnelle) avec la même période N-1."""
+    periode_debut: date
+    dimension_id: int | None = None
+    montant_ttc: Decimal = Field(default=Decimal("0"))
+    nombre_factures: int = 0
+    montant_ttc_annee_precedente: Decimal = Field(default=Decimal("0"))
+    nombre_factures_annee_precedente: int = 0
+
+
+class SerieChiffreAffaires(BaseModel):
+    """Série temporelle du CA (jour/semaine/mois/trimestre) et comparaison N-1."""
+    entreprise_id: int
+    date_debut: date
+    date_fin: date
+    granularite: str
+    ventilation: str
+    points: list[PointSerieChiffreAffaires] = Field(default_factory=list)
+    total_ttc: Decimal = Field(default=Decimal("0"))
+    total_ttc_annee_precedente: Decimal = Field(default=Decimal("0"))
+
+
+class TranchesBalanceAgee(BaseModel):
+    """Reste dû par ancienneté d'échéance (jours de retard à la date de référence)."""
+    non_echu: Decimal = Field(default=Decimal("0"))
+    echu_0_30: Decimal = Field(default=Decimal("0"))
+    echu_31_60: Decimal = Field(default=Decimal("0"))
+    echu_61_90: Decimal = Field(default=Decimal("0"))
+    echu_plus_90: Decimal = Field(default=Decimal("0"))
+    total: Decimal = Field(default=Decimal("0"))
+    nombre_factures: int = 0
+
+
+class LigneBalanceAgee(TranchesBalanceAgee):
+    """Créances d'un client."""
+    client_id: int
+    client_code: str
+    client_raison_sociale: str
+
+
+class BalanceAgee(BaseModel):
+    """Balance âgée des créances clients (page de clients + totaux toutes pages)."""
+    entreprise_id: int
+    date_reference: date
+    tri: str
+    nombre_clients: int = 0
+    skip: int = 0
+    limit: int = 100
+    lignes: list[LigneBalanceAgee] = Field(default_factory=list)
+    totaux: TranchesBalanceAgee = Field(default_factory=TranchesBalanceAgee)
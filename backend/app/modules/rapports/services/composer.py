@@ -0,0 +1,173 @@
+# app/modules/rapports/services/composer.py
+# -----------------------------------------------------------------------------
+# Composition concurrente des indicateurs du tableau de bord.
+# Chaque indicateur s'exécute dans sa propre session (connexion distincte du
+# pool) : les requêtes partent en parallèle et la durée totale est celle de
+# l'indicateur le plus lent. Le parallélisme est borné par un sémaphore
+# partagé par tous les tableaux de bord (moitié du pool, le reste aux
+# sessions des requêtes) ; au-delà, les indicateurs attendent leur tour.
+# Un indicateur en erreur ou hors délai (DASHBOARD_METRIC_TIMEOUT_SECONDS,
+# compté une fois sa connexion obtenue) est listé dans
+# metriques_indisponibles sans bloquer les autres (résultat partiel).
+# Nouvel indicateur : fonction décorée @metrique_dashboard("nom") qui renvoie
+# les champs de SyntheseDashboard qu'elle alimente.
+# -----------------------------------------------------------------------------
+import asyncio
+import contextlib
+import weakref
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import Any, NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.core.database import get_session_factory, pool_capacity
+from app.core.logging_config import get_logger
+from app.modules.commercial.repositories import CommandeRepository, FactureRepository
+from app.modules.paie.repositories import BulletinPaieRepository
+from app.modules.rapports.repositories import VenteJournaliereRepository
+from app.modules.rh.repositories import EmployeRepository
+from app.modules.stock.repositories import StockRepository
+
+logger = get_logger(__name__)
+
+
+class ContexteDashboard(NamedTuple):
+    """Paramètres communs à tous les indicateurs d'une synthèse."""
+    entreprise_id: int
+    date_debut: date | None
+    date_fin: date | None
+    date_reference: date
+
+
+MetriqueDashboard = Callable[[AsyncSession, ContexteDashboard], Awaitable[dict[str, Any]]]
+
+_METRIQUES: dict[str, MetriqueDashboard] = {}
+
+
+def metrique_dashboard(nom: str) -> Callable[[MetriqueDashboard], MetriqueDashboard]:
+    """Enregistre un indicateur du tableau de bord sous le nom donné."""
+    def _decorateur(fn: MetriqueDashboard) -> MetriqueDashboard:
+        _METRIQUES[nom] = fn
+        return fn
+    return _decorateur
+
+
+# --- Indicateurs ---------------------------------------------------------------
+
+
+@metrique_dashboard("chiffre_affaires")
+async def _chiffre_affaires(db: AsyncSession, ctx: ContexteDashboard) -> dict[str, Any]:
+    ca, nb = await VenteJournaliereRepository(db).get_totaux_periode(
+        ctx.entreprise_id, date_debut=ctx.date_debut, date_fin=ctx.date_fin
+    )
+    return {"ca_periode": ca, "nb_factures": nb}
+
+
+@metrique_dashboard("commandes")
+async def _commandes(db: AsyncSession, ctx: ContexteDashboard) -> dict[str, Any]:
+    return {"nb_commandes": await CommandeRepository(db).count_by_entreprise(ctx.entreprise_id)}
+
+
+@metrique_dashboard("employes_actifs")
+async def _employes_actifs(db: AsyncSession, ctx: ContexteDashboard) -> dict[str, Any]:
+    nb = await EmployeRepository(db).count_by_entreprise(ctx.entreprise_id, actif_only=True)
+    return {"nb_employes_actifs": nb}
+
+
+@metrique_dashboard("alertes_stock")
+async def _alertes_stock(db: AsyncSession, ctx: ContexteDashboard) -> dict[str, Any]:
+    return {"nb_alertes_stock": await StockRepository(db).count_alertes(ctx.entreprise_id)}
+
+
+@metrique_dashboard("creances_echues")
+async def _creances_echues(db: AsyncSession, ctx: ContexteDashboard) -> dict[str, Any]:
+    montant, nb = await FactureRepository(db).get_creances_echues(ctx.entreprise_id, ctx.date_reference)
+    return {"creances_echues": montant, "nb_factures_echues": nb}
+
+
+@metrique_dashboard("masse_salariale")
+async def _masse_salariale(db: AsyncSession, ctx: ContexteDashboard) -> dict[str, Any]:
+    montant = await BulletinPaieRepository(db).get_masse_salariale(
+        ctx.entreprise_id, date_debut=ctx.date_debut, date_fin=ctx.date_fin
+    )
+    return {"masse_salariale": montant}
+
+
+# --- Composition ------------------------------------------------------------------
+
+# Un sémaphore par boucle d'événements (les tests en créent plusieurs)
+_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def _shared_slots() -> asyncio.Semaphore | None:
+    """
+    Sessions d'indicateurs ouvertes simultanément, toutes compositions
+    confondues : moitié du pool (au moins 1). None si le pool est illimité.
+    """
+    capacity = pool_capacity()
+    if capacity is None:
+        return None
+    loop = asyncio.get_running_loop()
+    slots = _slots.get(loop)
+    if slots is None:
+        slots = _slots[loop] = asyncio.Semaphore(max(1, capacity // 2))
+    return slots
+
+
+class DashboardComposer:
+    """Exécute les indicateurs enregistrés en parallèle, chacun sur sa propre session."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        timeout: float | None = None,
+        metriques: dict[str, MetriqueDashboard] | None = None,
+        slots: asyncio.Semaphore | None = None,
+    ) -> None:
+        self._session_factory = session_factory or get_session_factory()
+        self._timeout = timeout if timeout is not None else get_settings().DASHBOARD_METRIC_TIMEOUT_SECONDS
+        self._metriques = metriques if metriques is not None else _METRIQUES
+        self._slots = slots
+
+    async def composer(self, ctx: ContexteDashboard) -> tuple[dict[str, Any], list[str]]:
+        """
+        Lance tous les indicateurs simultanément.
+        Retourne (valeurs fusionnées, noms des indicateurs indisponibles).
+        """
+        noms = list(self._metriques)
+        slots = self._slots or _shared_slots()
+        resultats = await asyncio.gather(
+            *(self._executer(nom, self._metriques[nom], ctx, slots) for nom in noms)
+        )
+        valeurs: dict[str, Any] = {}
+        indisponibles: list[str] = []
+        for nom, resultat in zip(noms, resultats, strict=True):
+            if resultat is None:
+                indisponibles.append(nom)
+            else:
+                valeurs.update(resultat)
+        return valeurs, indisponibles
+
+    async def _executer(
+        self,
+        nom: str,
+        metrique: MetriqueDashboard,
+        ctx: ContexteDashboard,
+        slots: asyncio.Semaphore | None,
+    ) -> dict[str, Any] | None:
+        """
+        Exécute un indicateur avec délai max ; None si erreur ou dépassement.
+        L'attente d'une place et d'une connexion du pool n'entre pas dans le délai.
+        """
+        try:
+            async with slots or contextlib.nullcontext(), self._session_factory() as session:
+                await session.connection()
+                return await asyncio.wait_for(metrique(session, ctx), timeout=self._timeout)
+        except TimeoutError:
+            logger.warning("Indicateur dashboard %s hors délai (%.1fs)", nom, self._timeout)
+        except Exception:  # indicateur isolé : les autres restent servis
+            logger.exception("Indicateur dashboard %s en erreur", nom)
+        return None
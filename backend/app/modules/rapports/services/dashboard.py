@@ -1,18 +1,70 @@
 # app/modules/rapports/services/dashboard.py
 # -----------------------------------------------------------------------------
-# Service métier Rapports : chiffre d'affaires, synthèse tableau de bord.
-# Agrège des données via les services commercial et RH.
+# Service métier Rapports : chiffre d'affaires, séries CA N / N-1,
+# synthèse tableau de bord, balance âgée des créances clients.
+# CA et nombre de factures lus dans la table de faits ventes_journalieres
+# (quelques centaines de lignes agrégées au lieu de toutes les factures) ;
+# indicateurs du tableau de bord calculés en parallèle (DashboardComposer).
+# Résultats mis en cache (app.core.report_cache) par entreprise et paramètres,
+# invalidés dès qu'une écriture est commitée sur une table lue (_TABLES_*).
 # -----------------------------------------------------------------------------
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.report_cache import get_report_cache, watch_tables
 from app.modules.parametrage.repositories import EntrepriseRepository
-from app.modules.rapports.schemas import ChiffreAffairesPeriode, SyntheseDashboard
+from app.modules.rapports.models import GranulariteSerie, TriBalanceAgee, VentilationSerie
+from app.modules.rapports.repositories import BalanceAgeeRepository, VenteJournaliereRepository
+from app.modules.rapports.schemas import (
+    BalanceAgee,
+    ChiffreAffairesPeriode,
+    PointSerieChiffreAffaires,
+    SerieChiffreAffaires,
+    SyntheseDashboard,
+)
 from app.modules.rapports.services.base import BaseRapportsService
+from app.modules.rapports.services.composer import ContexteDashboard, DashboardComposer
 from app.modules.rapports.services.messages import Messages
 
+# Tables lues par chaque rapport (leurs écritures invalident le cache)
+_TABLES_CA = ("ventes_journalieres", "factures")  # table de faits écrite en SQL Core avec les factures
+_TABLES_DASHBOARD = (
+    "ventes_journalieres", "factures", "commandes", "employes", "stocks", "produits", "bulletins_paie",
+)
+_TABLES_BALANCE_AGEE = ("factures", "tiers")
+watch_tables(*_TABLES_CA, *_TABLES_DASHBOARD, *_TABLES_BALANCE_AGEE)
+
+
+def _moins_un_an(d: date) -> date:
+    """Même jour l'année précédente (29 février → 28 février)."""
+    try:
+        return d.replace(year=d.year - 1)
+    except ValueError:
+        return d.replace(year=d.year - 1, day=28)
+
+
+def _plus_un_an(d: date) -> date:
+    """Même jour l'année suivante (29 février → 28 février), comme le décalage SQL des séries N-1."""
+    try:
+        return d.replace(year=d.year + 1)
+    except ValueError:
+        return d.replace(year=d.year + 1, day=28)
+
+
+def _periode_precedente(date_debut: date, date_fin: date) -> tuple[date, date]:
+    """
+    Période N-1 dont les jours, décalés d'un an, tombent dans [date_debut, date_fin] :
+    fin au 28 février → 29 février N-1 inclus ; début au 29 février → 1er mars N-1.
+    """
+    debut, fin = _moins_un_an(date_debut), _moins_un_an(date_fin)
+    if _plus_un_an(debut) < date_debut:
+        debut += timedelta(days=1)
+    if _plus_un_an(fin + timedelta(days=1)) <= date_fin:
+        fin += timedelta(days=1)
+    return debut, fin
+
 
 class RapportsService(BaseRapportsService):
     """Service des rapports (CA, dashboard)."""
@@ -20,6 +72,8 @@ class RapportsService(BaseRapportsService):
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(db)
         self._entreprise_repo = EntrepriseRepository(db)
+        self._ventes_repo = VenteJournaliereRepository(db)
+        self._balance_repo = BalanceAgeeRepository(db)
 
     async def get_chiffre_affaires(
         self,
@@ -28,26 +82,104 @@ class RapportsService(BaseRapportsService):
         date_fin: date,
     ) -> ChiffreAffairesPeriode:
         """Calcule le CA (somme montant_ttc des factures) sur la période."""
-        from app.modules.commercial.services import FactureService
+        if await self._entreprise_repo.find_by_id(entreprise_id) is None:
+            self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
 
+        async def _calculer() -> ChiffreAffairesPeriode:
+            montant_total, nb = await self._ventes_repo.get_totaux_periode(
+                entreprise_id, date_debut=date_debut, date_fin=date_fin
+            )
+            return ChiffreAffairesPeriode(
+                entreprise_id=entreprise_id,
+                date_debut=date_debut,
+                date_fin=date_fin,
+                montant_total_ttc=montant_total,
+                nombre_factures=nb,
+            )
+
+        return await get_report_cache().get_or_compute(
+            report="chiffre_affaires",
+            entreprise_id=entreprise_id,
+            params={"date_debut": date_debut, "date_fin": date_fin},
+            tables=_TABLES_CA,
+            schema=ChiffreAffairesPeriode,
+            compute=_calculer,
+        )
+
+    async def get_serie_chiffre_affaires(
+        self,
+        entreprise_id: int,
+        date_debut: date,
+        date_fin: date,
+        *,
+        granularite: str = GranulariteSerie.mois.value,
+        ventilation: str = VentilationSerie.aucune.value,
+        comparer_annee_precedente: bool = True,
+    ) -> SerieChiffreAffaires:
+        """Série CA par jour/semaine/mois/trimestre (ventilée ou non), avec la même série N-1."""
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
+        if date_fin < date_debut:
+            self._raise_bad_request(Messages.PERIODE_INVALIDE)
+        self._validate_enum(granularite, GranulariteSerie, Messages.GRANULARITE_INVALIDE)
+        self._validate_enum(ventilation, VentilationSerie, Messages.VENTILATION_INVALIDE)
 
-        items, _ = await FactureService(self._db).get_all(
-            entreprise_id=entreprise_id, skip=0, limit=10_000
+        return await get_report_cache().get_or_compute(
+            report="serie_chiffre_affaires",
+            entreprise_id=entreprise_id,
+            params={
+                "date_debut": date_debut,
+                "date_fin": date_fin,
+                "granularite": granularite,
+                "ventilation": ventilation,
+                "comparer_annee_precedente": comparer_annee_precedente,
+            },
+            tables=_TABLES_CA,
+            schema=SerieChiffreAffaires,
+            compute=lambda: self._calculer_serie(
+                entreprise_id, date_debut, date_fin, granularite, ventilation, comparer_annee_precedente
+            ),
         )
-        montant_total = Decimal("0")
-        nb = 0
-        for f in items:
-            if date_debut <= getattr(f, "date_facture", date.min) <= date_fin:
-                montant_total += getattr(f, "montant_ttc", 0) or Decimal("0")
-                nb += 1
-        return ChiffreAffairesPeriode(
+
+    async def _calculer_serie(
+        self,
+        entreprise_id: int,
+        date_debut: date,
+        date_fin: date,
+        granularite: str,
+        ventilation: str,
+        comparer_annee_precedente: bool,
+    ) -> SerieChiffreAffaires:
+        debut_n1, fin_n1 = _periode_precedente(date_debut, date_fin) if comparer_annee_precedente else (None, None)
+        lignes = await self._ventes_repo.get_serie(
+            entreprise_id,
+            date_debut=date_debut,
+            date_fin=date_fin,
+            granularite=granularite,
+            ventilation=ventilation,
+            date_debut_precedente=debut_n1,
+            date_fin_precedente=fin_n1,
+        )
+        points = [
+            PointSerieChiffreAffaires(
+                periode_debut=periode_debut,
+                dimension_id=dimension_id,
+                montant_ttc=ttc,
+                nombre_factures=nb,
+                montant_ttc_annee_precedente=ttc_n1,
+                nombre_factures_annee_precedente=nb_n1,
+            )
+            for periode_debut, dimension_id, ttc, nb, ttc_n1, nb_n1 in lignes
+        ]
+        return SerieChiffreAffaires(
             entreprise_id=entreprise_id,
             date_debut=date_debut,
             date_fin=date_fin,
-            montant_total_ttc=montant_total,
-            nombre_factures=nb,
+            granularite=granularite,
+            ventilation=ventilation,
+            points=points,
+            total_ttc=sum((p.montant_ttc for p in points), Decimal("0")),
+            total_ttc_annee_precedente=sum((p.montant_ttc_annee_precedente for p in points), Decimal("0")),
         )
 
     async def get_synthese_dashboard(
@@ -56,46 +188,97 @@ class RapportsService(BaseRapportsService):
         date_debut: date | None = None,
         date_fin: date | None = None,
     ) -> SyntheseDashboard:
-        """Synthèse tableau de bord : CA, nb factures, nb commandes, nb employés actifs."""
-        from app.modules.commercial.services import CommandeService, FactureService
-        from app.modules.rh.services import EmployeService
-
+        """
+        Synthèse tableau de bord : CA, factures, commandes, employés actifs, alertes stock,
+        créances échues, masse salariale. Indicateurs exécutés en parallèle ; ceux en
+        erreur ou hors délai sont listés dans metriques_indisponibles.
+        """
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
 
-        factures, nb_f = await FactureService(self._db).get_all(
-            entreprise_id=entreprise_id, skip=0, limit=10_000
-        )
-        commandes, nb_c = await CommandeService(self._db).get_all(
-            entreprise_id=entreprise_id, skip=0, limit=1
-        )
-        employes, nb_e = await EmployeService(self._db).get_all(
-            entreprise_id=entreprise_id, actif_only=True, skip=0, limit=10_000
+        ctx = ContexteDashboard(
+            entreprise_id=entreprise_id,
+            date_debut=date_debut,
+            date_fin=date_fin,
+            date_reference=date.today(),
         )
 
-        ca = Decimal("0")
-        nb_factures_periode = 0
-        for f in factures:
-            d = getattr(f, "date_facture", None)
-            if d is None:
-                continue
-            if date_debut is not None and d < date_debut:
-                continue
-            if date_fin is not None and d > date_fin:
-                continue
-            ca += getattr(f, "montant_ttc", 0) or Decimal("0")
-            nb_factures_periode += 1
-
-        periode_label = None
-        if date_debut and date_fin:
-            periode_label = f"{date_debut} / {date_fin}"
-
-        return SyntheseDashboard(
+        async def _calculer() -> SyntheseDashboard:
+            valeurs, indisponibles = await DashboardComposer().composer(ctx)
+            periode_label = None
+            if date_debut and date_fin:
+                periode_label = f"{date_debut} / {date_fin}"
+            return SyntheseDashboard(
+                entreprise_id=entreprise_id,
+                periode_label=periode_label,
+                metriques_indisponibles=indisponibles,
+                **valeurs,
+            )
+
+        # Résultat partiel (indicateur en erreur / hors délai) : jamais mis en cache
+        return await get_report_cache().get_or_compute(
+            report="synthese_dashboard",
             entreprise_id=entreprise_id,
-            periode_label=periode_label,
-            ca_periode=ca,
-            nb_factures=nb_factures_periode,
-            nb_commandes=nb_c,
-            nb_employes_actifs=nb_e,
+            params=ctx._asdict(),
+            tables=_TABLES_DASHBOARD,
+            schema=SyntheseDashboard,
+            compute=_calculer,
+            cacheable=lambda synthese: not synthese.metriques_indisponibles,
         )
 
+    async def get_balance_agee(
+        self,
+        entreprise_id: int,
+        *,
+        date_reference: date | None = None,
+        client_id: int | None = None,
+        tri: str = TriBalanceAgee.total.value,
+        decroissant: bool = True,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> BalanceAgee:
+        """
+        Balance âgée : reste dû des factures par client et par tranche d'ancienneté
+        (non échu, 0-30, 31-60, 61-90, > 90 jours), clients triés par exposition.
+        """
+        if await self._entreprise_repo.find_by_id(entreprise_id) is None:
+            self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
+        self._validate_enum(tri, TriBalanceAgee, Messages.TRI_BALANCE_INVALIDE)
+        date_reference = date_reference or date.today()
+
+        async def _calculer() -> BalanceAgee:
+            lignes, totaux = await self._balance_repo.get_balance(
+                entreprise_id,
+                date_reference,
+                client_id=client_id,
+                tri=tri,
+                decroissant=decroissant,
+                skip=skip,
+                limit=limit,
+            )
+            return BalanceAgee(
+                entreprise_id=entreprise_id,
+                date_reference=date_reference,
+                tri=tri,
+                nombre_clients=totaux.pop("nombre_clients"),
+                skip=skip,
+                limit=limit,
+                lignes=lignes,
+                totaux=totaux,
+            )
+
+        return await get_report_cache().get_or_compute(
+            report="balance_agee",
+            entreprise_id=entreprise_id,
+            params={
+                "date_reference": date_reference,
+                "client_id": client_id,
+                "tri": tri,
+                "decroissant": decroissant,
+                "skip": skip,
+                "limit": limit,
+            },
+            tables=_TABLES_BALANCE_AGEE,
+            schema=BalanceAgee,
+            compute=_calculer,
+        )
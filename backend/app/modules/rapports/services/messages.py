@@ -1,4 +1,7 @@
 # app/modules/rapports/services/messages.py
 class Messages:
     ENTREPRISE_NOT_FOUND = "L'entreprise indiquée n'existe pas."
-
+    PERIODE_INVALIDE = "La date de fin doit être postérieure ou égale à la date de début."
+    GRANULARITE_INVALIDE = "Granularité « {valeur} » invalide (jour, semaine, mois, trimestre)."
+    VENTILATION_INVALIDE = "Ventilation « {valeur} » invalide (aucune, point_de_vente, client)."
+    TRI_BALANCE_INVALIDE = "Tri « {valeur} » invalide (total, echu, plus_90_jours)."
@@ -0,0 +1,25 @@
+# app/modules/rh/imports.py
+# -----------------------------------------------------------------------------
+# Import en masse des employés (app.core.bulk_import). Mêmes contrôles que
+# EmployeService.create, résolus pour tout le lot : devise, département, poste
+# et type de contrat (de l'entreprise), par id ou par code (devise_code,
+# departement_code, poste_code, type_contrat_code).
+# -----------------------------------------------------------------------------
+
+from app.core.bulk_import import Importer, Reference
+from app.modules.parametrage.models import Devise
+from app.modules.rh.models import Departement, Employe, Poste, TypeContrat
+from app.modules.rh.schemas import EmployeCreate
+
+
+class EmployeImporter(Importer):
+    name = "employes"
+    model = Employe
+    schema = EmployeCreate
+    key = "matricule"
+    references = (
+        Reference("devise_id", Devise),
+        Reference("departement_id", Departement, scoped=True),
+        Reference("poste_id", Poste, scoped=True),
+        Reference("type_contrat_id", TypeContrat, scoped=True),
+    )
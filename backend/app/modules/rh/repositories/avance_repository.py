@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository Avance (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import Avance
 
 
@@ -24,23 +25,15 @@ class AvanceRepository:
         rembourse: bool | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Avance], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Avance], int | None]:
         q = select(Avance).where(Avance.entreprise_id == entreprise_id)
         if employe_id is not None:
             q = q.where(Avance.employe_id == employe_id)
         if rembourse is not None:
             q = q.where(Avance.rembourse.is_(rembourse))
-        count_q = select(func.count()).select_from(Avance).where(
-            Avance.entreprise_id == entreprise_id
-        )
-        if employe_id is not None:
-            count_q = count_q.where(Avance.employe_id == employe_id)
-        if rembourse is not None:
-            count_q = count_q.where(Avance.rembourse.is_(rembourse))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Avance.date_avance.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Avance.date_avance.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Avance) -> Avance:
         self._db.add(entity)
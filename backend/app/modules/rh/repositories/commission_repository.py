@@ -1,7 +1,8 @@
 # app/modules/rh/repositories/commission_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import Commission
 
 
@@ -21,23 +22,15 @@ class CommissionRepository:
         payee: bool | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Commission], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Commission], int | None]:
         q = select(Commission).where(Commission.entreprise_id == entreprise_id)
         if employe_id is not None:
             q = q.where(Commission.employe_id == employe_id)
         if payee is not None:
             q = q.where(Commission.payee.is_(payee))
-        count_q = select(func.count()).select_from(Commission).where(
-            Commission.entreprise_id == entreprise_id
-        )
-        if employe_id is not None:
-            count_q = count_q.where(Commission.employe_id == employe_id)
-        if payee is not None:
-            count_q = count_q.where(Commission.payee.is_(payee))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Commission.date_fin.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Commission.date_fin.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Commission) -> Commission:
         self._db.add(entity)
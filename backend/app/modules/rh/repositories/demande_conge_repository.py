@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository DemandeConge (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import DemandeConge
 
 
@@ -24,23 +25,15 @@ class DemandeCongeRepository:
         statut: str | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[DemandeConge], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[DemandeConge], int | None]:
         q = select(DemandeConge).where(DemandeConge.entreprise_id == entreprise_id)
         if employe_id is not None:
             q = q.where(DemandeConge.employe_id == employe_id)
         if statut is not None:
             q = q.where(DemandeConge.statut == statut)
-        count_q = select(func.count()).select_from(DemandeConge).where(
-            DemandeConge.entreprise_id == entreprise_id
-        )
-        if employe_id is not None:
-            count_q = count_q.where(DemandeConge.employe_id == employe_id)
-        if statut is not None:
-            count_q = count_q.where(DemandeConge.statut == statut)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(DemandeConge.date_debut.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(DemandeConge.date_debut.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: DemandeConge) -> DemandeConge:
         self._db.add(entity)
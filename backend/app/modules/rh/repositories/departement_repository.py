@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository Département (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import Departement
 
 
@@ -35,19 +36,13 @@ class DepartementRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Departement], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Departement], int | None]:
         q = select(Departement).where(Departement.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(Departement.actif.is_(True))
-        count_q = select(func.count()).select_from(Departement).where(
-            Departement.entreprise_id == entreprise_id
-        )
-        if actif_only:
-            count_q = count_q.where(Departement.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Departement.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Departement.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Departement) -> Departement:
         self._db.add(entity)
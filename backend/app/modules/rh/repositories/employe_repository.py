@@ -5,6 +5,7 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import Employe
 
 
@@ -37,7 +38,8 @@ class EmployeRepository:
         poste_id: int | None = None,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[Employe], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Employe], int | None]:
         q = select(Employe).where(Employe.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(Employe.actif.is_(True))
@@ -45,19 +47,15 @@ class EmployeRepository:
             q = q.where(Employe.departement_id == departement_id)
         if poste_id is not None:
             q = q.where(Employe.poste_id == poste_id)
-        count_q = select(func.count()).select_from(Employe).where(
-            Employe.entreprise_id == entreprise_id
-        )
+        q = q.order_by(Employe.matricule)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
+
+    async def count_by_entreprise(self, entreprise_id: int, *, actif_only: bool = False) -> int:
+        """Nombre d'employés de l'entreprise (COUNT SQL), optionnellement actifs uniquement."""
+        q = select(func.count()).select_from(Employe).where(Employe.entreprise_id == entreprise_id)
         if actif_only:
-            count_q = count_q.where(Employe.actif.is_(True))
-        if departement_id is not None:
-            count_q = count_q.where(Employe.departement_id == departement_id)
-        if poste_id is not None:
-            count_q = count_q.where(Employe.poste_id == poste_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Employe.matricule).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+            q = q.where(Employe.actif.is_(True))
+        return (await self._db.execute(q)).scalar_one() or 0
 
     async def add(self, entity: Employe) -> Employe:
         self._db.add(entity)
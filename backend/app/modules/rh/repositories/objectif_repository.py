@@ -1,7 +1,8 @@
 # app/modules/rh/repositories/objectif_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import Objectif
 
 
@@ -20,19 +21,13 @@ class ObjectifRepository:
         employe_id: int | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Objectif], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Objectif], int | None]:
         q = select(Objectif).where(Objectif.entreprise_id == entreprise_id)
         if employe_id is not None:
             q = q.where(Objectif.employe_id == employe_id)
-        count_q = select(func.count()).select_from(Objectif).where(
-            Objectif.entreprise_id == entreprise_id
-        )
-        if employe_id is not None:
-            count_q = count_q.where(Objectif.employe_id == employe_id)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Objectif.date_debut.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Objectif.date_debut.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Objectif) -> Objectif:
         self._db.add(entity)
@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository Poste (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import Poste
 
 
@@ -36,23 +37,15 @@ class PosteRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Poste], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Poste], int | None]:
         q = select(Poste).where(Poste.entreprise_id == entreprise_id)
         if departement_id is not None:
             q = q.where(Poste.departement_id == departement_id)
         if actif_only:
             q = q.where(Poste.actif.is_(True))
-        count_q = select(func.count()).select_from(Poste).where(
-            Poste.entreprise_id == entreprise_id
-        )
-        if departement_id is not None:
-            count_q = count_q.where(Poste.departement_id == departement_id)
-        if actif_only:
-            count_q = count_q.where(Poste.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Poste.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Poste.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Poste) -> Poste:
         self._db.add(entity)
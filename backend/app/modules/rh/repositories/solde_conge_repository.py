@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository SoldeConge (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import SoldeConge
 
 
@@ -37,23 +38,15 @@ class SoldeCongeRepository:
         annee: int | None = None,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[SoldeConge], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[SoldeConge], int | None]:
         q = select(SoldeConge).where(SoldeConge.entreprise_id == entreprise_id)
         if employe_id is not None:
             q = q.where(SoldeConge.employe_id == employe_id)
         if annee is not None:
             q = q.where(SoldeConge.annee == annee)
-        count_q = select(func.count()).select_from(SoldeConge).where(
-            SoldeConge.entreprise_id == entreprise_id
-        )
-        if employe_id is not None:
-            count_q = count_q.where(SoldeConge.employe_id == employe_id)
-        if annee is not None:
-            count_q = count_q.where(SoldeConge.annee == annee)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(SoldeConge.employe_id, SoldeConge.type_conge_id, SoldeConge.annee).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(SoldeConge.employe_id, SoldeConge.type_conge_id, SoldeConge.annee)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: SoldeConge) -> SoldeConge:
         self._db.add(entity)
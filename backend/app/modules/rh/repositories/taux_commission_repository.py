@@ -1,7 +1,8 @@
 # app/modules/rh/repositories/taux_commission_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import TauxCommission
 
 
@@ -32,19 +33,13 @@ class TauxCommissionRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[TauxCommission], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[TauxCommission], int | None]:
         q = select(TauxCommission).where(TauxCommission.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(TauxCommission.actif.is_(True))
-        count_q = select(func.count()).select_from(TauxCommission).where(
-            TauxCommission.entreprise_id == entreprise_id
-        )
-        if actif_only:
-            count_q = count_q.where(TauxCommission.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(TauxCommission.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(TauxCommission.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: TauxCommission) -> TauxCommission:
         self._db.add(entity)
@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository TypeContrat (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.rh.models import TypeContrat
 
 
@@ -35,19 +36,13 @@ class TypeContratRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[TypeContrat], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[TypeContrat], int | None]:
         q = select(TypeContrat).where(TypeContrat.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(TypeContrat.actif.is_(True))
-        count_q = select(func.count()).select_from(TypeContrat).where(
-            TypeContrat.entreprise_id == entreprise_id
-        )
-        if actif_only:
-            count_q = count_q.where(TypeContrat.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(TypeContrat.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(TypeContrat.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: TypeContrat) -> TypeContrat:
         self._db.add(entity)
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.pagination import TotalMode
 from app.modules.parametrage.dependencies import CurrentUser, ValidatedEntrepriseId
 from app.modules.rh import schemas
 from app.modules.rh.services import (
@@ -50,7 +51,7 @@ async def list_departements(
     limit: int = Query(200, ge=1, le=500),
 ):
     items, _ = await DepartementService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -95,6 +96,7 @@ async def list_postes(
         actif_only=actif_only,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -133,7 +135,7 @@ async def list_types_contrat(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await TypeContratService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -180,6 +182,7 @@ async def list_employes(
         poste_id=poste_id,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -218,7 +221,7 @@ async def list_types_conge(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await TypeCongeService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -263,6 +266,7 @@ async def list_demandes_conge(
         statut=statut,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -307,6 +311,7 @@ async def list_soldes_conge(
         annee=annee,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -345,7 +350,7 @@ async def list_objectifs(
     limit: int = Query(200, ge=1, le=500),
 ):
     items, _ = await ObjectifService(db).get_all(
-        entreprise_id=entreprise_id, employe_id=employe_id, skip=skip, limit=limit
+        entreprise_id=entreprise_id, employe_id=employe_id, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -384,7 +389,7 @@ async def list_taux_commissions(
     limit: int = Query(100, ge=1, le=200),
 ):
     items, _ = await TauxCommissionService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -429,6 +434,7 @@ async def list_commissions(
         payee=payee,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -473,6 +479,7 @@ async def list_avances(
         rembourse=rembourse,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import Avance
 from app.modules.rh.repositories import AvanceRepository, EmployeRepository
@@ -36,7 +37,8 @@ class AvanceService(BaseRHService):
         rembourse: bool | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Avance], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Avance], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -45,6 +47,7 @@ class AvanceService(BaseRHService):
             rembourse=rembourse,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: AvanceCreate, created_by_id: int | None = None) -> Avance:
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import Commission
 from app.modules.rh.repositories import CommissionRepository, EmployeRepository
@@ -36,7 +37,8 @@ class CommissionService(BaseRHService):
         payee: bool | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Commission], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Commission], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -45,6 +47,7 @@ class CommissionService(BaseRHService):
             payee=payee,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: CommissionCreate) -> Commission:
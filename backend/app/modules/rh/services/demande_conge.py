@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import DemandeConge
 from app.modules.rh.repositories import (
@@ -45,7 +46,8 @@ class DemandeCongeService(BaseRHService):
         statut: str | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[DemandeConge], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[DemandeConge], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -54,6 +56,7 @@ class DemandeCongeService(BaseRHService):
             statut=statut,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     def _validate_statut(self, statut: str) -> None:
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import DeviseRepository, EntrepriseRepository
 from app.modules.rh.models import Employe
 from app.modules.rh.repositories import EmployeRepository
@@ -37,7 +38,8 @@ class EmployeService(BaseRHService):
         poste_id: int | None = None,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[Employe], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Employe], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -47,6 +49,7 @@ class EmployeService(BaseRHService):
             poste_id=poste_id,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: EmployeCreate) -> Employe:
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import Objectif
 from app.modules.rh.repositories import EmployeRepository, ObjectifRepository
@@ -35,7 +36,8 @@ class ObjectifService(BaseRHService):
         employe_id: int | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Objectif], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Objectif], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -43,6 +45,7 @@ class ObjectifService(BaseRHService):
             employe_id=employe_id,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: ObjectifCreate) -> Objectif:
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import Poste
 from app.modules.rh.repositories import PosteRepository
@@ -35,7 +36,8 @@ class PosteService(BaseRHService):
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[Poste], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Poste], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -44,6 +46,7 @@ class PosteService(BaseRHService):
             actif_only=actif_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: PosteCreate) -> Poste:
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import SoldeConge
 from app.modules.rh.repositories import EmployeRepository, SoldeCongeRepository, TypeCongeRepository
@@ -37,7 +38,8 @@ class SoldeCongeService(BaseRHService):
         annee: int | None = None,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[SoldeConge], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[SoldeConge], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -46,6 +48,7 @@ class SoldeCongeService(BaseRHService):
             annee=annee,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: SoldeCongeCreate) -> SoldeConge:
@@ -4,6 +4,7 @@
 # -----------------------------------------------------------------------------
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.rh.models import TypeConge
 from app.modules.rh.repositories import TypeCongeRepository
@@ -34,7 +35,8 @@ class TypeCongeService(BaseRHService):
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[TypeConge], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[TypeConge], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -42,6 +44,7 @@ class TypeCongeService(BaseRHService):
             actif_only=actif_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: TypeCongeCreate) -> TypeConge:
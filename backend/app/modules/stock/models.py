@@ -14,6 +14,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -90,3 +91,10 @@ class MouvementStock(Base):
     created_by_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("utilisateurs.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Historique par produit ou par dépôt (source ou destination), trié par (date_mouvement, id)
+        Index("ix_mouvements_stock_produit_date", "produit_id", "date_mouvement", "id"),
+        Index("ix_mouvements_stock_depot_date", "depot_id", "date_mouvement", "id"),
+        Index("ix_mouvements_stock_depot_dest", "depot_dest_id"),
+    )
+
@@ -4,13 +4,16 @@
 # -----------------------------------------------------------------------------
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import Keyset, TotalMode, paginate
 from app.modules.stock.models import MouvementStock
 
 
 class MouvementStockRepository:
+    KEYSET = Keyset(MouvementStock.date_mouvement, MouvementStock.id)
+
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
 
@@ -25,7 +28,7 @@ class MouvementStockRepository:
         type_mouvement: str | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ):
+    ) -> Select:
         q = select(MouvementStock)
         if depot_id is not None:
             q = q.where(
@@ -51,29 +54,29 @@ class MouvementStockRepository:
         date_to: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[MouvementStock], int]:
+        cursor: str | None = None,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[MouvementStock], int | None]:
         q = self._base_query(depot_id=depot_id, produit_id=produit_id, type_mouvement=type_mouvement, date_from=date_from, date_to=date_to)
-        count_q = select(func.count()).select_from(MouvementStock)
-        if depot_id is not None:
-            count_q = count_q.where(
-                (MouvementStock.depot_id == depot_id) | (MouvementStock.depot_dest_id == depot_id)
-            )
-        if produit_id is not None:
-            count_q = count_q.where(MouvementStock.produit_id == produit_id)
-        if type_mouvement is not None:
-            count_q = count_q.where(MouvementStock.type_mouvement == type_mouvement)
-        if date_from is not None:
-            count_q = count_q.where(MouvementStock.date_mouvement >= date_from)
-        if date_to is not None:
-            count_q = count_q.where(MouvementStock.date_mouvement <= date_to)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(MouvementStock.date_mouvement.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        return await paginate(
+            self._db, q, skip=skip, limit=limit, include_total=include_total, keyset=self.KEYSET, cursor=cursor
+        )
+
+    def export_query(
+        self,
+        *,
+        depot_id: int | None = None,
+        produit_id: int | None = None,
+        type_mouvement: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> Select:
+        """Requête de la liste (mêmes filtres, même ordre) pour un export en flux."""
+        q = self._base_query(depot_id=depot_id, produit_id=produit_id, type_mouvement=type_mouvement, date_from=date_from, date_to=date_to)
+        return self.KEYSET.order(q)
 
     async def add(self, entity: MouvementStock) -> MouvementStock:
         self._db.add(entity)
         await self._db.flush()
         await self._db.refresh(entity)
         return entity
-
@@ -2,9 +2,12 @@
 # -----------------------------------------------------------------------------
 # Repository Stock (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
+from app.modules.achats.models import Depot
+from app.modules.catalogue.models import Produit
 from app.modules.stock.models import Stock
 
 
@@ -28,22 +31,35 @@ class StockRepository:
         return r.scalar_one_or_none()
 
     async def find_by_depot(
-        self, depot_id: int, *, skip: int = 0, limit: int = 200
-    ) -> tuple[list[Stock], int]:
-        base = select(Stock).where(Stock.depot_id == depot_id)
-        total = (await self._db.execute(select(func.count()).select_from(Stock).where(Stock.depot_id == depot_id))).scalar_one() or 0
-        q = base.offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        self, depot_id: int, *, skip: int = 0, limit: int = 200, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Stock], int | None]:
+        q = select(Stock).where(Stock.depot_id == depot_id)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def find_by_produit(
-        self, produit_id: int, *, skip: int = 0, limit: int = 200
-    ) -> tuple[list[Stock], int]:
-        base = select(Stock).where(Stock.produit_id == produit_id)
-        total = (await self._db.execute(select(func.count()).select_from(Stock).where(Stock.produit_id == produit_id))).scalar_one() or 0
-        q = base.offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        self, produit_id: int, *, skip: int = 0, limit: int = 200, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Stock], int | None]:
+        q = select(Stock).where(Stock.produit_id == produit_id)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
+
+    async def count_alertes(self, entreprise_id: int) -> int:
+        """Nombre de lignes de stock sous le seuil min ou au-dessus du seuil max (mêmes règles qu'AlerteService)."""
+        q = (
+            select(func.count())
+            .select_from(Stock)
+            .join(Produit, Stock.produit_id == Produit.id)
+            .join(Depot, Stock.depot_id == Depot.id)
+            .where(Depot.entreprise_id == entreprise_id)
+            .where(Produit.gerer_stock.is_(True))
+            .where(Produit.deleted_at.is_(None))
+            .where(
+                or_(
+                    Stock.quantite < Produit.seuil_alerte_min,
+                    (Produit.seuil_alerte_max.isnot(None)) & (Stock.quantite > Produit.seuil_alerte_max),
+                )
+            )
+        )
+        return (await self._db.execute(q)).scalar_one() or 0
 
     async def add(self, entity: Stock) -> Stock:
         self._db.add(entity)
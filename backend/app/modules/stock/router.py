@@ -5,10 +5,12 @@
 # validé. Extension monde réel : toutes structures, tous secteurs.
 # -----------------------------------------------------------------------------
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.export import EXPORT_RESPONSES, ExportFormat, ExportResponse
+from app.core.pagination import TotalMode, set_next_cursor
 from app.modules.achats.repositories import DepotRepository
 from app.modules.catalogue.repositories import ProduitRepository
 from app.modules.parametrage.dependencies import CurrentUser
@@ -47,7 +49,7 @@ async def list_stocks_by_depot(
 ):
     depot = await DepotRepository(db).find_by_id(depot_id)
     _check_depot_entreprise(depot, current_user)
-    items, _ = await StockService(db).get_by_depot(depot_id, skip=skip, limit=limit)
+    items, _ = await StockService(db).get_by_depot(depot_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
@@ -93,7 +95,7 @@ async def list_stocks_by_produit(
 ):
     produit = await ProduitRepository(db).find_by_id(produit_id)
     _check_produit_entreprise(produit, current_user)
-    items, _ = await StockService(db).get_by_produit(produit_id, skip=skip, limit=limit)
+    items, _ = await StockService(db).get_by_produit(produit_id, skip=skip, limit=limit, include_total=TotalMode.none)
     return items
 
 
@@ -102,6 +104,7 @@ async def list_stocks_by_produit(
 async def list_mouvements(
     db: DbSession,
     current_user: CurrentUser,
+    response: Response,
     depot_id: int,
     produit_id: int | None = None,
     type_mouvement: str | None = None,
@@ -109,10 +112,12 @@ async def list_mouvements(
     date_to: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    cursor: str | None = Query(None, description="Curseur X-Next-Cursor de la page précédente (remplace skip)"),
 ):
     depot = await DepotRepository(db).find_by_id(depot_id)
     _check_depot_entreprise(depot, current_user)
-    items, _ = await MouvementService(db).list_mouvements(
+    service = MouvementService(db)
+    items, _ = await service.list_mouvements(
         depot_id=depot_id,
         produit_id=produit_id,
         type_mouvement=type_mouvement,
@@ -120,10 +125,40 @@ async def list_mouvements(
         date_to=date_to,
         skip=skip,
         limit=limit,
+        cursor=cursor,
+        include_total=TotalMode.none,
     )
+    set_next_cursor(response, service.next_cursor(items, limit))
     return items
 
 
+@router.get("/mouvements/export", response_class=ExportResponse, responses=EXPORT_RESPONSES, tags=[TAG_MOUVEMENTS])
+async def export_mouvements(
+    db: DbSession,
+    current_user: CurrentUser,
+    request: Request,
+    depot_id: int,
+    produit_id: int | None = None,
+    type_mouvement: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv ou ndjson"),
+):
+    """Tous les mouvements du dépôt filtrés, en flux (curseur serveur, gzip si accepté)."""
+    depot = await DepotRepository(db).find_by_id(depot_id)
+    _check_depot_entreprise(depot, current_user)
+    q = MouvementService(db).export_query(
+        depot_id=depot_id,
+        produit_id=produit_id,
+        type_mouvement=type_mouvement,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return ExportResponse(
+        q, schema=schemas.MouvementStockResponse, request=request, filename="mouvements_stock", format=format
+    )
+
+
 @router.get("/mouvements/{id}", response_model=schemas.MouvementStockResponse, tags=[TAG_MOUVEMENTS])
 async def get_mouvement(db: DbSession, current_user: CurrentUser, id: int):
     ent = await MouvementService(db).get_or_404(id)
@@ -3,10 +3,13 @@
 # Service métier : mouvements de stock (création + mise à jour des stocks).
 # -----------------------------------------------------------------------------
 
+from collections.abc import Sequence
 from datetime import datetime
 
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.repositories import DepotRepository
 from app.modules.catalogue.repositories import ProduitRepository, VarianteProduitRepository
 from app.modules.stock.models import MouvementStock, ReferenceTypeMouvement, TypeMouvementStock
@@ -39,6 +42,15 @@ class MouvementService(BaseStockService):
         if value not in valid:
             self._raise_bad_request(Messages.REFERENCE_TYPE_INVALIDE.format(valeur=value))
 
+    def _parse_datetime(self, value: str | None) -> datetime | None:
+        """Date-heure ISO des filtres de période ; 400 si invalide."""
+        if value is None:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            self._raise_bad_request(Messages.DATE_MOUVEMENT_INVALIDE)
+
     async def get_by_id(self, id: int) -> MouvementStock | None:
         return await self._repo.find_by_id(id)
 
@@ -58,27 +70,41 @@ class MouvementService(BaseStockService):
         date_to: str | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[MouvementStock], int]:
-        date_from_dt = None
-        date_to_dt = None
-        if date_from is not None:
-            try:
-                date_from_dt = datetime.fromisoformat(date_from.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                self._raise_bad_request(Messages.DATE_MOUVEMENT_INVALIDE)
-        if date_to is not None:
-            try:
-                date_to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                self._raise_bad_request(Messages.DATE_MOUVEMENT_INVALIDE)
+        include_total: TotalMode | str = TotalMode.exact,
+        cursor: str | None = None,
+    ) -> tuple[list[MouvementStock], int | None]:
         return await self._repo.find_all(
             depot_id=depot_id,
             produit_id=produit_id,
             type_mouvement=type_mouvement,
-            date_from=date_from_dt,
-            date_to=date_to_dt,
+            date_from=self._parse_datetime(date_from),
+            date_to=self._parse_datetime(date_to),
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+    def next_cursor(self, items: Sequence[MouvementStock], limit: int) -> str | None:
+        """Curseur X-Next-Cursor après une page de list_mouvements ; None en fin de liste."""
+        return self._repo.KEYSET.next_cursor(items, limit)
+
+    def export_query(
+        self,
+        *,
+        depot_id: int | None = None,
+        produit_id: int | None = None,
+        type_mouvement: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> Select:
+        """Requête d'export en flux (mêmes filtres que list_mouvements)."""
+        return self._repo.export_query(
+            depot_id=depot_id,
+            produit_id=produit_id,
+            type_mouvement=type_mouvement,
+            date_from=self._parse_datetime(date_from),
+            date_to=self._parse_datetime(date_to),
         )
 
     async def create(
@@ -7,6 +7,7 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.repositories import DepotRepository
 from app.modules.catalogue.repositories import ProduitRepository
 from app.modules.stock.models import Stock
@@ -45,18 +46,18 @@ class StockService(BaseStockService):
         return ent
 
     async def get_by_depot(
-        self, depot_id: int, *, skip: int = 0, limit: int = 200
-    ) -> tuple[list[Stock], int]:
+        self, depot_id: int, *, skip: int = 0, limit: int = 200, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Stock], int | None]:
         if await self._depot_repo.find_by_id(depot_id) is None:
             self._raise_not_found(Messages.DEPOT_NOT_FOUND)
-        return await self._repo.find_by_depot(depot_id, skip=skip, limit=limit)
+        return await self._repo.find_by_depot(depot_id, skip=skip, limit=limit, include_total=include_total)
 
     async def get_by_produit(
-        self, produit_id: int, *, skip: int = 0, limit: int = 200
-    ) -> tuple[list[Stock], int]:
+        self, produit_id: int, *, skip: int = 0, limit: int = 200, include_total: TotalMode | str = TotalMode.exact
+    ) -> tuple[list[Stock], int | None]:
         if await self._produit_repo.find_by_id(produit_id) is None:
             self._raise_not_found(Messages.PRODUIT_NOT_FOUND)
-        return await self._repo.find_by_produit(produit_id, skip=skip, limit=limit)
+        return await self._repo.find_by_produit(produit_id, skip=skip, limit=limit, include_total=include_total)
 
     async def get_quantite(
         self, depot_id: int, produit_id: int, variante_id: int | None = None
@@ -1,11 +1,12 @@
 # app/modules/systeme/models.py
 # -----------------------------------------------------------------------------
 # Modèles ORM du module Système : paramètres applicatifs, journal d'audit,
-# notifications, licences. Dépend de Paramétrage (entreprises, utilisateurs).
+# notifications, licences, imports en masse. Dépend de Paramétrage (entreprises, utilisateurs).
 # Extension monde réel : isolation multi-tenant, toutes structures, tous secteurs.
 # -----------------------------------------------------------------------------
 
 from datetime import date, datetime
+from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
@@ -14,6 +15,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -70,6 +72,11 @@ class JournalAudit(Base):
     user_agent: Mapped[str] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Liste paginée (keyset) : entreprise puis (created_at, id) décroissants
+        Index("ix_journaux_audit_entreprise_created", "entreprise_id", "created_at", "id"),
+    )
+
 
 # --- Notification -------------------------------------------------------------
 class Notification(Base):
@@ -113,3 +120,43 @@ class LicenceLogicielle(Base):
         UniqueConstraint("entreprise_id", "cle_licence", name="uq_licences_logicielles_entreprise_cle"),
     )
 
+
+# --- Import en masse ---------------------------------------------------------
+class StatutImport(str, PyEnum):
+    """Cycle de vie d'un import en masse."""
+    en_attente = "en_attente"
+    en_cours = "en_cours"
+    interrompu = "interrompu"  # Arrêt du serveur : repris au démarrage suivant
+    termine = "termine"
+    echoue = "echoue"  # Erreur bloquante : reprise manuelle (POST .../reprendre)
+
+
+class ImportDonnees(Base):
+    """
+    Import en masse d'un fichier CSV / XLSX (produits, tiers, employés, plan
+    comptable), exécuté en tâche de fond par lots. lignes_traitees : lignes du
+    fichier déjà traitées (reprise au lot suivant après interruption).
+    Table : imports_donnees.
+    """
+    __tablename__ = "imports_donnees"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entreprise_id: Mapped[int] = mapped_column(Integer, ForeignKey("entreprises.id"), nullable=False)
+    utilisateur_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("utilisateurs.id"), nullable=True)
+    type_import: Mapped[str] = mapped_column(String(30), nullable=False)  # produits, tiers, employes, comptes_comptables
+    nom_fichier: Mapped[str] = mapped_column(String(255), nullable=False)
+    chemin: Mapped[str] = mapped_column(String(500), nullable=False)
+    statut: Mapped[str] = mapped_column(String(20), nullable=False, default="en_attente")  # StatutImport
+    lignes_traitees: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lignes_importees: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lignes_en_erreur: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    erreurs: Mapped[list | None] = mapped_column(JSON, nullable=True, default=list)  # [{ligne, erreur}], tronqué à IMPORT_MAX_ERRORS
+    message: Mapped[str | None] = mapped_column(Text, nullable=True)  # Erreur bloquante (fichier illisible...)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    termine_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_imports_donnees_entreprise_created", "entreprise_id", "created_at"),
+        Index("ix_imports_donnees_statut", "statut"),
+    )
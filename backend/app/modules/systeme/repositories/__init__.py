@@ -1,4 +1,5 @@
 # app/modules/systeme/repositories
+from app.modules.systeme.repositories.import_donnees_repository import ImportDonneesRepository
 from app.modules.systeme.repositories.journal_audit_repository import JournalAuditRepository
 from app.modules.systeme.repositories.licence_logicielle_repository import (
     LicenceLogicielleRepository,
@@ -11,5 +12,6 @@ __all__ = [
     "JournalAuditRepository",
     "NotificationRepository",
     "LicenceLogicielleRepository",
+    "ImportDonneesRepository",
 ]
 
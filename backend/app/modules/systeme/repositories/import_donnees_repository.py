@@ -0,0 +1,62 @@
+# app/modules/systeme/repositories/import_donnees_repository.py
+from datetime import datetime
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import TotalMode, paginate
+from app.modules.systeme.models import ImportDonnees, StatutImport
+
+
+def _claimable(statuts: tuple[StatutImport, ...], stale_before: datetime):
+    """Statuts repris, ou en cours sans progression depuis stale_before (processus disparu)."""
+    return or_(
+        ImportDonnees.statut.in_([s.value for s in statuts]),
+        and_(ImportDonnees.statut == StatutImport.en_cours.value, ImportDonnees.updated_at < stale_before),
+    )
+
+
+class ImportDonneesRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def find_by_id(self, id: int) -> ImportDonnees | None:
+        r = await self._db.execute(select(ImportDonnees).where(ImportDonnees.id == id))
+        return r.scalar_one_or_none()
+
+    async def find_all(
+        self,
+        entreprise_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[ImportDonnees], int | None]:
+        q = (
+            select(ImportDonnees)
+            .where(ImportDonnees.entreprise_id == entreprise_id)
+            .order_by(ImportDonnees.created_at.desc(), ImportDonnees.id.desc())
+        )
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
+
+    async def find_claimable_ids(self, statuts: tuple[StatutImport, ...], stale_before: datetime) -> list[int]:
+        r = await self._db.execute(
+            select(ImportDonnees.id).where(_claimable(statuts, stale_before)).order_by(ImportDonnees.id)
+        )
+        return list(r.scalars().all())
+
+    async def claim(self, id: int, statuts: tuple[StatutImport, ...], stale_before: datetime) -> bool:
+        """Passe l'import en cours si reprenable ; False si un autre processus l'a pris."""
+        r = await self._db.execute(
+            update(ImportDonnees)
+            .where(ImportDonnees.id == id, _claimable(statuts, stale_before))
+            .values(statut=StatutImport.en_cours.value, message=None, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        return r.rowcount == 1
+
+    async def add(self, entity: ImportDonnees) -> ImportDonnees:
+        self._db.add(entity)
+        await self._db.flush()
+        await self._db.refresh(entity)
+        return entity
@@ -1,9 +1,10 @@
 # app/modules/systeme/repositories/licence_logicielle_repository.py
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.systeme.models import LicenceLogicielle
 
 
@@ -47,7 +48,8 @@ class LicenceLogicielleRepository:
         valide_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[LicenceLogicielle], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[LicenceLogicielle], int | None]:
         q = select(LicenceLogicielle)
         if entreprise_id is not None:
             q = q.where(LicenceLogicielle.entreprise_id == entreprise_id)
@@ -55,17 +57,8 @@ class LicenceLogicielleRepository:
             q = q.where(LicenceLogicielle.actif.is_(True))
         if valide_only:
             q = q.where(LicenceLogicielle.date_fin >= date.today())
-        count_q = select(func.count()).select_from(LicenceLogicielle)
-        if entreprise_id is not None:
-            count_q = count_q.where(LicenceLogicielle.entreprise_id == entreprise_id)
-        if actif_only:
-            count_q = count_q.where(LicenceLogicielle.actif.is_(True))
-        if valide_only:
-            count_q = count_q.where(LicenceLogicielle.date_fin >= date.today())
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(LicenceLogicielle.date_fin.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(LicenceLogicielle.date_fin.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: LicenceLogicielle) -> LicenceLogicielle:
         self._db.add(entity)
@@ -1,7 +1,8 @@
 # app/modules/systeme/repositories/notification_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.systeme.models import Notification
 
 
@@ -20,19 +21,13 @@ class NotificationRepository:
         lue: bool | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Notification], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Notification], int | None]:
         q = select(Notification).where(Notification.utilisateur_id == utilisateur_id)
         if lue is not None:
             q = q.where(Notification.lue.is_(lue))
-        count_q = select(func.count()).select_from(Notification).where(
-            Notification.utilisateur_id == utilisateur_id
-        )
-        if lue is not None:
-            count_q = count_q.where(Notification.lue.is_(lue))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(Notification.created_at.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: Notification) -> Notification:
         self._db.add(entity)
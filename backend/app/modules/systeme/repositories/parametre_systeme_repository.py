@@ -1,7 +1,8 @@
 # app/modules/systeme/repositories/parametre_systeme_repository.py
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.systeme.models import ParametreSysteme
 
 
@@ -40,19 +41,13 @@ class ParametreSystemeRepository:
         categorie: str | None = None,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[ParametreSysteme], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[ParametreSysteme], int | None]:
         q = select(ParametreSysteme).where(ParametreSysteme.entreprise_id == entreprise_id)
         if categorie is not None:
             q = q.where(ParametreSysteme.categorie == categorie)
-        count_q = select(func.count()).select_from(ParametreSysteme).where(
-            ParametreSysteme.entreprise_id == entreprise_id
-        )
-        if categorie is not None:
-            count_q = count_q.where(ParametreSysteme.categorie == categorie)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(ParametreSysteme.categorie, ParametreSysteme.cle).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(ParametreSysteme.categorie, ParametreSysteme.cle)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: ParametreSysteme) -> ParametreSysteme:
         self._db.add(entity)
@@ -2,23 +2,29 @@
 # -----------------------------------------------------------------------------
 # Routes API v1 pour le module Système. Isolation multi-tenant : listes par
 # ValidatedEntrepriseId ; GET/PATCH/POST parametre et licence vérifient entreprise ;
-# audit scopé par entreprise. Extension monde réel, tous secteurs.
+# audit scopé par entreprise. Imports en masse CSV/XLSX exécutés en tâche de
+# fond (202 puis suivi par GET). Extension monde réel, tous secteurs.
 # -----------------------------------------------------------------------------
 
 from datetime import datetime
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, BackgroundTasks, File, Form, Query, Request, Response, UploadFile
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.export import EXPORT_RESPONSES, ExportFormat, ExportResponse
+from app.core.pagination import TotalMode, set_next_cursor
+from app.core.responses import NDJSONResponse, wants_ndjson
 from app.modules.parametrage.dependencies import CurrentUser, ValidatedEntrepriseId
 from app.modules.systeme import schemas
 from app.modules.systeme.services import (
     AuditService,
+    ImportDonneesService,
     LicenceLogicielleService,
     NotificationService,
     ParametreSystemeService,
 )
+from app.modules.systeme.services.import_donnees import IMPORTERS, launch_import
 
 router = APIRouter(prefix="/systeme")
 
@@ -26,6 +32,7 @@ TAG_PARAMETRES = "Système - Paramètres"
 TAG_JOURNAL_AUDIT = "Système - Journal d'audit"
 TAG_NOTIFICATIONS = "Système - Notifications"
 TAG_LICENCES = "Système - Licences logicielles"
+TAG_IMPORTS = "Système - Imports"
 
 
 # --- Paramètres système ---
@@ -43,6 +50,7 @@ async def list_parametres_systeme(
         categorie=categorie,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -76,6 +84,8 @@ async def list_journal_audit(
     db: DbSession,
     current_user: CurrentUser,
     entreprise_id: ValidatedEntrepriseId,
+    request: Request,
+    response: Response,
     utilisateur_id: int | None = Query(None, description="Filtrer par utilisateur"),
     action: str | None = Query(None, description="Filtrer par action"),
     module: str | None = Query(None, description="Filtrer par module"),
@@ -83,8 +93,10 @@ async def list_journal_audit(
     date_fin: datetime | None = Query(None, description="Fin de période"),
     skip: int = Query(0, ge=0),
     limit: int = Query(200, ge=1, le=500),
+    cursor: str | None = Query(None, description="Curseur X-Next-Cursor de la page précédente (remplace skip)"),
 ):
-    items, _ = await AuditService(db).get_all(
+    service = AuditService(db)
+    items, _ = await service.get_all(
         entreprise_id=entreprise_id,
         utilisateur_id=utilisateur_id,
         action=action,
@@ -93,10 +105,40 @@ async def list_journal_audit(
         date_fin=date_fin,
         skip=skip,
         limit=limit,
+        cursor=cursor,
+        include_total=TotalMode.none,
     )
+    set_next_cursor(response, service.next_cursor(items, limit))
+    if wants_ndjson(request):
+        return NDJSONResponse(items, schema=schemas.JournalAuditResponse, headers=dict(response.headers))
     return items
 
 
+@router.get("/audit/export", response_class=ExportResponse, responses=EXPORT_RESPONSES, tags=[TAG_JOURNAL_AUDIT])
+async def export_journal_audit(
+    db: DbSession,
+    current_user: CurrentUser,
+    entreprise_id: ValidatedEntrepriseId,
+    request: Request,
+    utilisateur_id: int | None = Query(None, description="Filtrer par utilisateur"),
+    action: str | None = Query(None, description="Filtrer par action"),
+    module: str | None = Query(None, description="Filtrer par module"),
+    date_debut: datetime | None = Query(None, description="Début de période"),
+    date_fin: datetime | None = Query(None, description="Fin de période"),
+    format: ExportFormat = Query(ExportFormat.csv, description="csv ou ndjson"),
+):
+    """Tout le journal d'audit filtré, en flux (curseur serveur, gzip si accepté)."""
+    q = AuditService(db).export_query(
+        entreprise_id=entreprise_id,
+        utilisateur_id=utilisateur_id,
+        action=action,
+        module=module,
+        date_debut=date_debut,
+        date_fin=date_fin,
+    )
+    return ExportResponse(q, schema=schemas.JournalAuditResponse, request=request, filename="journal_audit", format=format)
+
+
 @router.get("/audit/{id}", response_model=schemas.JournalAuditResponse, tags=[TAG_JOURNAL_AUDIT])
 async def get_journal_audit(db: DbSession, current_user: CurrentUser, id: int):
     ent = await AuditService(db).get_or_404(id)
@@ -126,6 +168,7 @@ async def list_notifications(
         lue=lue,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -168,6 +211,7 @@ async def list_licences(
         valide_only=valide_only,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -237,3 +281,63 @@ async def info_prolongations_licence(db: DbSession, current_user: CurrentUser, i
     info = LicenceLogicielleService(db).get_info_prolongations(ent.type_licence, ent.nombre_prolongations or 0)
     return schemas.LicenceProlongationsInfo(**info)
 
+
+# --- Imports en masse ---
+@router.post("/imports", response_model=schemas.ImportDonneesResponse, status_code=202, tags=[TAG_IMPORTS])
+async def create_import(
+    db: DbSession,
+    current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
+    type_import: str = Form(..., description=f"Entité importée : {', '.join(IMPORTERS)}"),
+    fichier: UploadFile = File(..., description="CSV (UTF-8, séparateur , ou ;) ou XLSX, ligne d'en-tête = noms des champs"),
+):
+    """
+    Dépose un fichier d'import pour l'entreprise de l'utilisateur. Les lignes
+    sont validées et insérées par lots en tâche de fond : suivre l'avancement
+    et les lignes rejetées via GET /systeme/imports/{id}. Références par id
+    (famille_id) ou par code (famille_code).
+    """
+    ent = await ImportDonneesService(db).create(
+        entreprise_id=current_user.entreprise_id,
+        utilisateur_id=current_user.id,
+        type_import=type_import,
+        fichier=fichier,
+    )
+    # Après le commit de la requête : la tâche lit l'import en base
+    background_tasks.add_task(launch_import, ent.id)
+    return ent
+
+
+@router.get("/imports", response_model=list[schemas.ImportDonneesResponse], tags=[TAG_IMPORTS])
+async def list_imports(
+    db: DbSession,
+    current_user: CurrentUser,
+    entreprise_id: ValidatedEntrepriseId,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+):
+    items, _ = await ImportDonneesService(db).get_all(
+        entreprise_id, skip=skip, limit=limit, include_total=TotalMode.none
+    )
+    return items
+
+
+@router.get("/imports/{id}", response_model=schemas.ImportDonneesDetailResponse, tags=[TAG_IMPORTS])
+async def get_import(db: DbSession, current_user: CurrentUser, id: int):
+    """Avancement de l'import et lignes rejetées (numéro de ligne, motif)."""
+    ent = await ImportDonneesService(db).get_or_404(id)
+    if ent.entreprise_id != current_user.entreprise_id:
+        raise ForbiddenError(detail="Accès à une autre entreprise non autorisé", code="FORBIDDEN_ENTREPRISE")
+    return ent
+
+
+@router.post("/imports/{id}/reprendre", response_model=schemas.ImportDonneesResponse, status_code=202, tags=[TAG_IMPORTS])
+async def reprendre_import(db: DbSession, current_user: CurrentUser, background_tasks: BackgroundTasks, id: int):
+    """Reprend un import interrompu ou échoué à la première ligne non traitée (409 sinon)."""
+    service = ImportDonneesService(db)
+    ent = await service.get_or_404(id)
+    if ent.entreprise_id != current_user.entreprise_id:
+        raise ForbiddenError(detail="Accès à une autre entreprise non autorisé", code="FORBIDDEN_ENTREPRISE")
+    ent = await service.reprendre(ent)
+    background_tasks.add_task(launch_import, ent.id, claimed=True)
+    return ent
@@ -167,3 +167,31 @@ class LicenceValideResponse(BaseModel):
     message: str
     date_fin: date | None = None
 
+
+# --- Import en masse ---
+class ImportErreurLigne(BaseModel):
+    """Ligne rejetée (numéro de ligne du fichier, en-tête = ligne 1)."""
+    ligne: int
+    erreur: str
+
+
+class ImportDonneesResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    entreprise_id: int
+    utilisateur_id: int | None = None
+    type_import: str
+    nom_fichier: str
+    statut: str
+    lignes_traitees: int
+    lignes_importees: int
+    lignes_en_erreur: int
+    message: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    termine_at: datetime | None = None
+
+
+class ImportDonneesDetailResponse(ImportDonneesResponse):
+    """Import avec le détail des lignes rejetées (tronqué à IMPORT_MAX_ERRORS)."""
+    erreurs: list[ImportErreurLigne] | None = None
@@ -1,5 +1,6 @@
 # app/modules/systeme/services
 from app.modules.systeme.services.audit import AuditService
+from app.modules.systeme.services.import_donnees import ImportDonneesService
 from app.modules.systeme.services.licence_logicielle import LicenceLogicielleService
 from app.modules.systeme.services.notification import NotificationService
 from app.modules.systeme.services.parametre_systeme import ParametreSystemeService
@@ -9,5 +10,6 @@ __all__ = [
     "AuditService",
     "NotificationService",
     "LicenceLogicielleService",
+    "ImportDonneesService",
 ]
 
@@ -1,9 +1,12 @@
 # app/modules/systeme/services/audit.py
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.systeme.models import JournalAudit
 from app.modules.systeme.repositories import JournalAuditRepository
 from app.modules.systeme.schemas import JournalAuditCreate
@@ -36,7 +39,9 @@ class AuditService(BaseSystemeService):
         date_fin: datetime | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[JournalAudit], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+        cursor: str | None = None,
+    ) -> tuple[list[JournalAudit], int | None]:
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             utilisateur_id=utilisateur_id,
@@ -46,6 +51,32 @@ class AuditService(BaseSystemeService):
             date_fin=date_fin,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+    def next_cursor(self, items: Sequence[JournalAudit], limit: int) -> str | None:
+        """Curseur X-Next-Cursor après une page de get_all ; None en fin de liste."""
+        return self._repo.KEYSET.next_cursor(items, limit)
+
+    def export_query(
+        self,
+        *,
+        entreprise_id: int | None = None,
+        utilisateur_id: int | None = None,
+        action: str | None = None,
+        module: str | None = None,
+        date_debut: datetime | None = None,
+        date_fin: datetime | None = None,
+    ) -> Select:
+        """Requête d'export en flux (mêmes filtres que get_all)."""
+        return self._repo.export_query(
+            entreprise_id=entreprise_id,
+            utilisateur_id=utilisateur_id,
+            action=action,
+            module=module,
+            date_debut=date_debut,
+            date_fin=date_fin,
         )
 
     async def log(
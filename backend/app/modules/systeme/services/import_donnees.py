@@ -0,0 +1,255 @@
+# app/modules/systeme/services/import_donnees.py
+# -----------------------------------------------------------------------------
+# Imports en masse (app.core.bulk_import) : dépôt du fichier, suivi, exécution
+# en tâche de fond.
+# - ImportDonneesService.create : fichier écrit par blocs sous
+#   MEDIA_ROOT/imports (IMPORT_MAX_UPLOAD_SIZE), ligne imports_donnees.
+# - start_import : tâche asyncio du processus. Chaque lot (IMPORT_BATCH_SIZE)
+#   est validé, inséré et compté dans la même transaction : une reprise
+#   repart de lignes_traitees, sans doublon ni ligne perdue.
+# - Un import n'est exécuté que par le processus qui l'a pris (UPDATE
+#   conditionnel) : arrêt propre → interrompu, repris au démarrage suivant ;
+#   processus disparu → reprenable après IMPORT_STALE_SECONDS sans progression.
+# Importeurs déclarés par module (app.modules.<module>.imports), chargés au
+# premier usage.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import importlib
+import itertools
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core.bulk_import import IMPORT_EXTENSIONS, Importer, ImportFormatError, iter_rows
+from app.core.database import get_session_factory
+from app.core.logging_config import get_logger
+from app.core.pagination import TotalMode
+from app.core.report_cache import get_report_cache
+from app.modules.systeme.models import ImportDonnees, StatutImport
+from app.modules.systeme.repositories import ImportDonneesRepository
+from app.modules.systeme.services.base import BaseSystemeService
+from app.modules.systeme.services.messages import Messages
+
+logger = get_logger(__name__)
+
+# Type d'import → importeur (module:classe)
+IMPORTERS = {
+    "produits": "app.modules.catalogue.imports:ProduitImporter",
+    "tiers": "app.modules.partenaires.imports:TiersImporter",
+    "employes": "app.modules.rh.imports:EmployeImporter",
+    "comptes_comptables": "app.modules.comptabilite.imports:CompteComptableImporter",
+}
+
+# Statuts repris automatiquement au démarrage / manuellement (POST .../reprendre)
+_REPRISE_DEMARRAGE = (StatutImport.en_attente, StatutImport.interrompu)
+_REPRISE_MANUELLE = (StatutImport.interrompu, StatutImport.echoue)
+
+_CHUNK_SIZE = 1 << 20
+
+
+def load_importer(type_import: str) -> Importer:
+    module, _, name = IMPORTERS[type_import].partition(":")
+    return getattr(importlib.import_module(module), name)()
+
+
+def _stale_before() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=get_settings().IMPORT_STALE_SECONDS)
+
+
+class ImportDonneesService(BaseSystemeService):
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(db)
+        self._repo = ImportDonneesRepository(db)
+
+    async def get_or_404(self, id: int) -> ImportDonnees:
+        ent = await self._repo.find_by_id(id)
+        if ent is None:
+            self._raise_not_found(Messages.IMPORT_NOT_FOUND)
+        return ent
+
+    async def get_all(
+        self,
+        entreprise_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[ImportDonnees], int | None]:
+        return await self._repo.find_all(entreprise_id, skip=skip, limit=limit, include_total=include_total)
+
+    async def create(
+        self,
+        *,
+        entreprise_id: int,
+        utilisateur_id: int | None,
+        type_import: str,
+        fichier: UploadFile,
+    ) -> ImportDonnees:
+        """Enregistre le fichier et l'import (en attente ; lancer ensuite start_import)."""
+        if type_import not in IMPORTERS:
+            self._raise_bad_request(Messages.IMPORT_TYPE_INVALIDE.format(valeurs=", ".join(IMPORTERS)))
+        extension = Path(fichier.filename or "").suffix.lower()
+        if extension not in IMPORT_EXTENSIONS:
+            self._raise_bad_request(Messages.IMPORT_FORMAT_INVALIDE)
+        max_size = get_settings().IMPORT_MAX_UPLOAD_SIZE
+        directory = Path(get_settings().MEDIA_ROOT) / "imports"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{uuid.uuid4().hex}{extension}"
+        try:
+            size = 0
+            with open(path, "wb") as out:
+                while chunk := await fichier.read(_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_size and size > max_size:
+                        self._raise_bad_request(Messages.IMPORT_FICHIER_TROP_VOLUMINEUX.format(max=max_size))
+                    await asyncio.to_thread(out.write, chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return await self._repo.add(
+            ImportDonnees(
+                entreprise_id=entreprise_id,
+                utilisateur_id=utilisateur_id,
+                type_import=type_import,
+                nom_fichier=(fichier.filename or path.name)[:255],
+                chemin=str(path),
+                statut=StatutImport.en_attente.value,
+            )
+        )
+
+    async def reprendre(self, ent: ImportDonnees) -> ImportDonnees:
+        """Reprend un import interrompu ou échoué (lancer ensuite start_import(claimed=True))."""
+        if not await self._repo.claim(ent.id, _REPRISE_MANUELLE, _stale_before()):
+            self._raise_conflict(Messages.IMPORT_NON_REPRENABLE)
+        await self._db.refresh(ent)
+        return ent
+
+
+# --- Exécution en tâche de fond ------------------------------------------------
+
+_tasks: dict[int, asyncio.Task] = {}
+
+
+def start_import(import_id: int, *, claimed: bool = False) -> asyncio.Task:
+    """
+    Lance l'import dans la boucle courante (une tâche par import). claimed :
+    import déjà passé en cours par l'appelant ; sinon pris s'il est en attente.
+    """
+    task = _tasks.get(import_id)
+    if task is None or task.done():
+        task = asyncio.create_task(_run_import(import_id, claimed), name=f"gesco-import-{import_id}")
+        _tasks[import_id] = task
+        task.add_done_callback(lambda t: _tasks.pop(import_id, None) if _tasks.get(import_id) is t else None)
+    return task
+
+
+async def launch_import(import_id: int, *, claimed: bool = False) -> None:
+    """
+    Tâche de fond de la route (BackgroundTasks, après le commit de la requête).
+    Coroutine : exécutée dans la boucle d'événements, où start_import peut créer
+    sa tâche (une fonction synchrone serait appelée dans le pool de threads).
+    """
+    start_import(import_id, claimed=claimed)
+
+
+def running_import(import_id: int) -> asyncio.Task | None:
+    """Tâche de l'import si elle s'exécute dans ce processus."""
+    return _tasks.get(import_id)
+
+
+async def resume_pending_imports() -> int:
+    """Au démarrage : reprend les imports en attente, interrompus ou abandonnés."""
+    async with get_session_factory()() as db:
+        repo = ImportDonneesRepository(db)
+        stale_before = _stale_before()
+        ids = await repo.find_claimable_ids(_REPRISE_DEMARRAGE, stale_before)
+        claimed = [i for i in ids if await repo.claim(i, _REPRISE_DEMARRAGE, stale_before)]
+        await db.commit()
+    for import_id in claimed:
+        start_import(import_id, claimed=True)
+    if claimed:
+        logger.info("Imports repris : %s", ", ".join(map(str, claimed)))
+    return len(claimed)
+
+
+async def shutdown_imports() -> None:
+    """Arrêt de l'application : imports en cours marqués interrompus (repris au démarrage)."""
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _set_statut(import_id: int, statut: StatutImport, message: str | None = None) -> None:
+    async with get_session_factory()() as db:
+        ent = await ImportDonneesRepository(db).find_by_id(import_id)
+        if ent is None:
+            return
+        ent.statut = statut.value
+        ent.message = message
+        if statut == StatutImport.termine:
+            ent.termine_at = datetime.utcnow()
+        await db.commit()
+
+
+async def _run_import(import_id: int, claimed: bool) -> None:
+    factory = get_session_factory()
+    settings = get_settings()
+    async with factory() as db:
+        repo = ImportDonneesRepository(db)
+        if not claimed:
+            claimed = await repo.claim(import_id, (StatutImport.en_attente,), _stale_before())
+            await db.commit()
+        ent = await repo.find_by_id(import_id) if claimed else None
+    if ent is None:
+        return
+
+    entreprise_id, chemin = ent.entreprise_id, ent.chemin
+    source = iter_rows(chemin)
+    # Numéro de ligne du fichier (en-tête = ligne 1) ; lignes déjà traitées sautées
+    rows = itertools.islice(enumerate(source, start=2), ent.lignes_traitees, None)
+    seen_keys: set[str] = set()
+    try:
+        importer = load_importer(ent.type_import)
+        table = importer.model.__table__.name
+        while True:
+            # Lecture / décodage du lot hors de la boucle d'événements
+            batch = await asyncio.to_thread(lambda: list(itertools.islice(rows, settings.IMPORT_BATCH_SIZE)))
+            if not batch:
+                break
+            async with factory() as db:
+                inserted, errors = await importer.process_batch(db, entreprise_id, batch, seen_keys)
+                ent = await ImportDonneesRepository(db).find_by_id(import_id)
+                ent.lignes_traitees += len(batch)
+                ent.lignes_importees += inserted
+                ent.lignes_en_erreur += len(errors)
+                room = settings.IMPORT_MAX_ERRORS - len(ent.erreurs or [])
+                if errors and room > 0:
+                    ent.erreurs = [*(ent.erreurs or []), *errors[:room]]
+                await db.commit()
+            if inserted:
+                # Insertion hors unité de travail ORM : invalider caches et ETag
+                await get_report_cache().bump([(entreprise_id, table)])
+    except asyncio.CancelledError:
+        await _set_statut(import_id, StatutImport.interrompu)
+        raise
+    except ImportFormatError as err:
+        await _set_statut(import_id, StatutImport.echoue, str(err))
+        return
+    except Exception as err:
+        logger.exception("Import %s : échec", import_id)
+        await _set_statut(import_id, StatutImport.echoue, f"Erreur interne : {type(err).__name__}")
+        return
+    finally:
+        try:
+            source.close()
+        except ValueError:  # générateur encore en cours dans le thread de lecture
+            pass
+    await _set_statut(import_id, StatutImport.termine)
+    Path(chemin).unlink(missing_ok=True)
+    logger.info("Import %s terminé (%s, %s lignes importées)", import_id, ent.type_import, ent.lignes_importees)
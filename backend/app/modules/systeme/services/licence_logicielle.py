@@ -4,6 +4,7 @@ from datetime import date, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.systeme.models import LicenceLogicielle
 from app.modules.systeme.repositories import LicenceLogicielleRepository
@@ -72,7 +73,8 @@ class LicenceLogicielleService(BaseSystemeService):
         valide_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[LicenceLogicielle], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[LicenceLogicielle], int | None]:
         if entreprise_id is not None and await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -81,6 +83,7 @@ class LicenceLogicielleService(BaseSystemeService):
             valide_only=valide_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def verifier_validite(self, entreprise_id: int) -> tuple[bool, str, date | None]:
@@ -16,4 +16,8 @@ class Messages:
     LICENCE_INACTIVE = "La licence est désactivée."
     LICENCE_TYPE_INVALIDE = "Type de licence invalide. Valeurs : trial, standard, premium."
     LICENCE_PROLONGATION_MAX_ATTEINT = "Nombre maximum de prolongations atteint ({max}) pour une licence {type}. Impossible de prolonger."
-
+    IMPORT_NOT_FOUND = "L'import indiqué n'existe pas."
+    IMPORT_TYPE_INVALIDE = "Type d'import invalide. Valeurs : {valeurs}."
+    IMPORT_FORMAT_INVALIDE = "Format de fichier non pris en charge (CSV ou XLSX attendu)."
+    IMPORT_FICHIER_TROP_VOLUMINEUX = "Fichier trop volumineux (maximum {max} octets)."
+    IMPORT_NON_REPRENABLE = "Cet import est terminé ou déjà en cours d'exécution."
@@ -1,6 +1,7 @@
 # app/modules/systeme/services/notification.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import UtilisateurRepository
 from app.modules.systeme.models import Notification
 from app.modules.systeme.repositories import NotificationRepository
@@ -31,12 +32,14 @@ class NotificationService(BaseSystemeService):
         lue: bool | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Notification], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Notification], int | None]:
         return await self._repo.find_all(
             utilisateur_id=utilisateur_id,
             lue=lue,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def get_or_404_for_user(self, id: int, utilisateur_id: int) -> Notification:
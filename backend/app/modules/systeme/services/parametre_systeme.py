@@ -1,6 +1,7 @@
 # app/modules/systeme/services/parametre_systeme.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.systeme.models import ParametreSysteme
 from app.modules.systeme.repositories import ParametreSystemeRepository
@@ -38,7 +39,8 @@ class ParametreSystemeService(BaseSystemeService):
         categorie: str | None = None,
         skip: int = 0,
         limit: int = 500,
-    ) -> tuple[list[ParametreSysteme], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[ParametreSysteme], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -46,6 +48,7 @@ class ParametreSystemeService(BaseSystemeService):
             categorie=categorie.strip() if categorie else None,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: ParametreSystemeCreate) -> ParametreSysteme:
@@ -2,9 +2,10 @@
 # -----------------------------------------------------------------------------
 # Repository CompteTresorerie (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.tresorerie.models import CompteTresorerie
 
 
@@ -24,23 +25,15 @@ class CompteTresorerieRepository:
         type_compte: str | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[CompteTresorerie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CompteTresorerie], int | None]:
         q = select(CompteTresorerie).where(CompteTresorerie.entreprise_id == entreprise_id)
         if actif_only:
             q = q.where(CompteTresorerie.actif.is_(True))
         if type_compte is not None:
             q = q.where(CompteTresorerie.type_compte == type_compte)
-        count_q = select(func.count()).select_from(CompteTresorerie).where(
-            CompteTresorerie.entreprise_id == entreprise_id
-        )
-        if actif_only:
-            count_q = count_q.where(CompteTresorerie.actif.is_(True))
-        if type_compte is not None:
-            count_q = count_q.where(CompteTresorerie.type_compte == type_compte)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(CompteTresorerie.libelle).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = q.order_by(CompteTresorerie.libelle)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: CompteTresorerie) -> CompteTresorerie:
         self._db.add(entity)
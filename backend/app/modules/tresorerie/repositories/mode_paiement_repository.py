@@ -2,9 +2,11 @@
 # -----------------------------------------------------------------------------
 # Repository ModePaiement (couche Infrastructure).
 # -----------------------------------------------------------------------------
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
+from app.core.query_cache import cached_query
 from app.modules.tresorerie.models import ModePaiement
 
 
@@ -28,6 +30,7 @@ class ModePaiementRepository:
         r = await self._db.execute(q)
         return r.scalar_one_or_none() is not None
 
+    @cached_query(ModePaiement, entreprise_arg="entreprise_id")
     async def find_all(
         self,
         entreprise_id: int,
@@ -35,17 +38,13 @@ class ModePaiementRepository:
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[ModePaiement], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[ModePaiement], int | None]:
         base = select(ModePaiement).where(ModePaiement.entreprise_id == entreprise_id)
         if actif_only:
             base = base.where(ModePaiement.actif.is_(True))
-        count_q = select(func.count()).select_from(ModePaiement).where(ModePaiement.entreprise_id == entreprise_id)
-        if actif_only:
-            count_q = count_q.where(ModePaiement.actif.is_(True))
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = base.order_by(ModePaiement.code).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        q = base.order_by(ModePaiement.code)
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
 
     async def add(self, entity: ModePaiement) -> ModePaiement:
         self._db.add(entity)
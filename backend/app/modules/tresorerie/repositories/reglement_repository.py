@@ -4,9 +4,10 @@
 # -----------------------------------------------------------------------------
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, paginate
 from app.modules.tresorerie.models import Reglement
 
 
@@ -18,17 +19,14 @@ class ReglementRepository:
         r = await self._db.execute(select(Reglement).where(Reglement.id == id))
         return r.scalar_one_or_none()
 
-    async def find_all(
+    def _base_query(
         self,
-        *,
         entreprise_id: int | None = None,
         type_reglement: str | None = None,
         tiers_id: int | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> tuple[list[Reglement], int]:
+    ) -> Select:
         q = select(Reglement)
         if entreprise_id is not None:
             q = q.where(Reglement.entreprise_id == entreprise_id)
@@ -40,21 +38,36 @@ class ReglementRepository:
             q = q.where(Reglement.date_reglement >= date_from)
         if date_to is not None:
             q = q.where(Reglement.date_reglement <= date_to)
-        count_q = select(func.count()).select_from(Reglement)
-        if entreprise_id is not None:
-            count_q = count_q.where(Reglement.entreprise_id == entreprise_id)
-        if type_reglement is not None:
-            count_q = count_q.where(Reglement.type_reglement == type_reglement)
-        if tiers_id is not None:
-            count_q = count_q.where(Reglement.tiers_id == tiers_id)
-        if date_from is not None:
-            count_q = count_q.where(Reglement.date_reglement >= date_from)
-        if date_to is not None:
-            count_q = count_q.where(Reglement.date_reglement <= date_to)
-        total = (await self._db.execute(count_q)).scalar_one() or 0
-        q = q.order_by(Reglement.date_reglement.desc()).offset(skip).limit(limit)
-        r = await self._db.execute(q)
-        return list(r.scalars().all()), total
+        return q
+
+    async def find_all(
+        self,
+        *,
+        entreprise_id: int | None = None,
+        type_reglement: str | None = None,
+        tiers_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Reglement], int | None]:
+        q = self._base_query(entreprise_id, type_reglement, tiers_id, date_from, date_to)
+        q = q.order_by(Reglement.date_reglement.desc())
+        return await paginate(self._db, q, skip=skip, limit=limit, include_total=include_total)
+
+    def export_query(
+        self,
+        *,
+        entreprise_id: int | None = None,
+        type_reglement: str | None = None,
+        tiers_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> Select:
+        """Requête de la liste (mêmes filtres, même ordre) pour un export en flux."""
+        q = self._base_query(entreprise_id, type_reglement, tiers_id, date_from, date_to)
+        return q.order_by(Reglement.date_reglement.desc(), Reglement.id.desc())
 
     async def add(self, entity: Reglement) -> Reglement:
         self._db.add(entity)
@@ -5,10 +5,12 @@
 # à l'entreprise de l'utilisateur. Adapté toute structure, tout secteur.
 # -----------------------------------------------------------------------------
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import ForbiddenError
+from app.core.export import EXPORT_RESPONSES, ExportFormat, ExportResponse
+from app.core.pagination import TotalMode
 from app.modules.parametrage.dependencies import CurrentUser, ValidatedEntrepriseId
 from app.modules.tresorerie import schemas
 from app.modules.tresorerie.services import (
@@ -35,7 +37,7 @@ async def list_modes_paiement(
     limit: int = Query(200, ge=1, le=500),
 ):
     items, _ = await ModePaiementService(db).get_all(
-        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit
+        entreprise_id=entreprise_id, actif_only=actif_only, skip=skip, limit=limit, include_total=TotalMode.none
     )
     return items
 
@@ -80,6 +82,7 @@ async def list_comptes_tresorerie(
         type_compte=type_compte,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
@@ -128,10 +131,34 @@ async def list_reglements(
         date_to=date_to,
         skip=skip,
         limit=limit,
+        include_total=TotalMode.none,
     )
     return items
 
 
+@router.get("/reglements/export", response_class=ExportResponse, responses=EXPORT_RESPONSES, tags=[TAG_REGLEMENTS])
+async def export_reglements(
+    db: DbSession,
+    current_user: CurrentUser,
+    entreprise_id: ValidatedEntrepriseId,
+    request: Request,
+    type_reglement: str | None = None,
+    tiers_id: int | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv ou ndjson"),
+):
+    """Tous les règlements filtrés, en flux (curseur serveur, gzip si accepté)."""
+    q = ReglementService(db).export_query(
+        entreprise_id=entreprise_id,
+        type_reglement=type_reglement,
+        tiers_id=tiers_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return ExportResponse(q, schema=schemas.ReglementResponse, request=request, filename="reglements", format=format)
+
+
 @router.get("/reglements/{id}", response_model=schemas.ReglementResponse, tags=[TAG_REGLEMENTS])
 async def get_reglement(db: DbSession, current_user: CurrentUser, id: int):
     ent = await ReglementService(db).get_or_404(id)
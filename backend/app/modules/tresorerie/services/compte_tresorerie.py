@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import DeviseRepository, EntrepriseRepository
 from app.modules.tresorerie.models import CompteTresorerie, TypeCompteTresorerie
 from app.modules.tresorerie.repositories import CompteTresorerieRepository
@@ -44,7 +45,8 @@ class CompteTresorerieService(BaseTresorerieService):
         type_compte: str | None = None,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[CompteTresorerie], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[CompteTresorerie], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -53,6 +55,7 @@ class CompteTresorerieService(BaseTresorerieService):
             type_compte=type_compte,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: CompteTresorerieCreate) -> CompteTresorerie:
@@ -5,6 +5,7 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.parametrage.repositories import EntrepriseRepository
 from app.modules.tresorerie.models import ModePaiement
 from app.modules.tresorerie.repositories import ModePaiementRepository
@@ -37,7 +38,8 @@ class ModePaiementService(BaseTresorerieService):
         actif_only: bool = False,
         skip: int = 0,
         limit: int = 200,
-    ) -> tuple[list[ModePaiement], int]:
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[ModePaiement], int | None]:
         if await self._entreprise_repo.find_by_id(entreprise_id) is None:
             self._raise_not_found(Messages.ENTREPRISE_NOT_FOUND)
         return await self._repo.find_all(
@@ -45,6 +47,7 @@ class ModePaiementService(BaseTresorerieService):
             actif_only=actif_only,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
     async def create(self, data: ModePaiementCreate) -> ModePaiement:
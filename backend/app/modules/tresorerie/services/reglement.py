@@ -3,8 +3,12 @@
 # Service métier : règlements (paiements clients / fournisseurs).
 # -----------------------------------------------------------------------------
 
+from datetime import date, datetime
+
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode
 from app.modules.achats.repositories import FactureFournisseurRepository
 from app.modules.commercial.repositories import FactureRepository
 from app.modules.parametrage.repositories import EntrepriseRepository
@@ -38,6 +42,16 @@ class ReglementService(BaseTresorerieService):
         if value not in valid:
             self._raise_bad_request(Messages.TYPE_REGLEMENT_INVALIDE.format(valeur=value))
 
+    @staticmethod
+    def _parse_date(value: str | None) -> date | None:
+        """Date ISO (ou date-heure) des filtres de période ; ignorée si invalide."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+        except (ValueError, AttributeError):
+            return None
+
     async def get_by_id(self, id: int) -> Reglement | None:
         return await self._repo.find_by_id(id)
 
@@ -57,28 +71,35 @@ class ReglementService(BaseTresorerieService):
         date_to: str | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Reglement], int]:
-        from datetime import datetime
-        date_from_d = None
-        date_to_d = None
-        if date_from:
-            try:
-                date_from_d = datetime.fromisoformat(date_from.replace("Z", "+00:00")).date()
-            except (ValueError, AttributeError):
-                date_from_d = None
-        if date_to:
-            try:
-                date_to_d = datetime.fromisoformat(date_to.replace("Z", "+00:00")).date()
-            except (ValueError, AttributeError):
-                date_to_d = None
+        include_total: TotalMode | str = TotalMode.exact,
+    ) -> tuple[list[Reglement], int | None]:
         return await self._repo.find_all(
             entreprise_id=entreprise_id,
             type_reglement=type_reglement,
             tiers_id=tiers_id,
-            date_from=date_from_d,
-            date_to=date_to_d,
+            date_from=self._parse_date(date_from),
+            date_to=self._parse_date(date_to),
             skip=skip,
             limit=limit,
+            include_total=include_total,
+        )
+
+    def export_query(
+        self,
+        *,
+        entreprise_id: int | None = None,
+        type_reglement: str | None = None,
+        tiers_id: int | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> Select:
+        """Requête d'export en flux (mêmes filtres que get_all)."""
+        return self._repo.export_query(
+            entreprise_id=entreprise_id,
+            type_reglement=type_reglement,
+            tiers_id=tiers_id,
+            date_from=self._parse_date(date_from),
+            date_to=self._parse_date(date_to),
         )
 
     async def create(self, data: ReglementCreate, created_by_id: int | None = None) -> Reglement:
@@ -3,6 +3,8 @@
 
 import sys
 
+from PyInstaller.utils.hooks import collect_submodules
+
 block_cipher = None
 
 # Chemins et données à inclure
@@ -11,6 +13,8 @@ datas = [
     ('scripts/install_demarrage_auto.ps1', 'scripts'),
     ('scripts/Lancer_Gesco.bat', '.'),
     ('.env.example', '.'),
+    # Schéma OpenAPI pré-calculé (scripts/export_openapi.py, lancé par build_windows.ps1)
+    ('build/openapi.json', '.'),
 ]
 # Dossier app/db créé à l'exécution par run_server.py
 
@@ -33,6 +37,8 @@ a = Analysis(
         'aiosqlite',
         'app.main',
         'app.config',
+        # Routeurs importés par nom (app.core.startup.LazyRouters), invisibles à l'analyse
+        *collect_submodules('app.modules'),
     ],
     hookspath=[],
     hooksconfig={},
@@ -31,9 +31,15 @@ def _main():
     # (évite l'erreur "Field required" avec un exe construit avant l'ajout du default dans config)
     if getattr(sys, "frozen", False) and not os.environ.get("SECRET_KEY"):
         os.environ["SECRET_KEY"] = _DEFAULT_SECRET_KEY
+    if getattr(sys, "frozen", False):
+        # Schéma OpenAPI embarqué au build : /docs sans génération ni import des routeurs
+        bundled_schema = os.path.join(getattr(sys, "_MEIPASS", base), "openapi.json")
+        if os.path.isfile(bundled_schema):
+            os.environ.setdefault("OPENAPI_SCHEMA_FILE", bundled_schema)
     # Créer app/db pour SQLite si besoin (exécutable portable)
     os.makedirs(os.path.join(base, "app", "db"), exist_ok=True)
     import uvicorn
+
     from app.config import get_settings
     s = get_settings()
     if getattr(sys, "frozen", False) and s.SECRET_KEY == _DEFAULT_SECRET_KEY:
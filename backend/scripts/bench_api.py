@@ -0,0 +1,453 @@
+# scripts/bench_api.py
+# -----------------------------------------------------------------------------
+# Banc de charge reproductible de l'API sur le jeu de données de seed_data
+# (LIGHT / FULL / STRESS). Étapes :
+# 1. Base : SQLite fichier temporaire par mode (réutilisée d'un run à l'autre)
+#    ou --database-url (ex. PostgreSQL local) ; schéma via alembic upgrade head
+#    puis seed (python -m scripts.seed_data <MODE>) si la base est vide.
+# 2. Application : en processus (httpx.ASGITransport) ou uvicorn (--server
+#    uvicorn, --workers N) ; rate limiting désactivé pour la mesure.
+# 3. Charge en boucle fermée : --concurrency clients, mix pondéré de scénarios
+#    (login, recherche catalogue, liste/création facture, liste/création
+#    mouvement de stock, tableau de bord), --warmup exclu des mesures.
+# 4. Rapport p50/p95/p99, débit et erreurs par scénario ; résultats JSON
+#    (--output) comparables à une référence (--baseline, --max-regression).
+# --login-storm N : N clients supplémentaires ne font que des connexions
+#    (prise de poste des caisses) ; comparé à un run sans tempête, le p95 des
+#    autres scénarios montre l'effet de bcrypt sur le reste de l'API.
+# Usage : python -m scripts.bench_api --mode STRESS --duration 60 --output bench/stress.json
+#         python -m scripts.bench_api --mode STRESS --baseline bench/stress.json
+#         python -m scripts.bench_api --login-storm 40 --baseline bench/light.json
+# Prérequis : dépendances de requirements.txt (uvicorn pour --server uvicorn).
+# -----------------------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+API = "/api/v1"
+LOGIN = {"login": "admin", "password": "gesco@1234"}
+
+# Scénario → poids dans le mix (proportion approximative d'un poste de caisse)
+MIX = {
+    "login": 2,
+    "catalogue_search": 25,
+    "factures_list": 20,
+    "facture_create": 10,
+    "mouvements_list": 15,
+    "mouvement_create": 8,
+    "dashboard": 5,
+}
+
+SEARCH_TERMS = ["Riz", "Huile", "Savon", "Lait", "Sardines", "Jus", "Biscuit", "Eau", "Sucre", "Café"]
+
+
+@dataclass
+class Fixture:
+    """Identifiants du jeu de données utilisés par les scénarios."""
+
+    entreprise_id: int
+    point_de_vente_id: int
+    depot_id: int
+    etat_facture_id: int
+    devise_id: int
+    client_ids: list[int]
+    produit_ids: list[int]
+
+
+@dataclass
+class Samples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+# --- Base de données ---------------------------------------------------------
+
+def _default_database_url(mode: str) -> str:
+    path = Path(tempfile.gettempdir()) / f"gesco_bench_{mode.lower()}.db"
+    return f"sqlite+aiosqlite:///{path.as_posix()}"
+
+
+def _sync_url(url: str) -> str:
+    return url.replace("+aiosqlite", "").replace("+asyncpg", "+psycopg2")
+
+
+def _bench_env(database_url: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env.update(
+        DATABASE_URL=database_url,
+        DATABASE_URL_SYNC=_sync_url(database_url),
+        RATE_LIMIT_PER_MINUTE="0",
+        RATE_LIMIT_PER_USER_PER_MINUTE="0",
+        RATE_LIMIT_ROUTES="",
+        LOG_LEVEL="WARNING",
+        LOG_ACCESS_ENABLED="false",
+    )
+    return env
+
+
+async def _load_fixture(database_url: str) -> Fixture | None:
+    """Lit les identifiants utiles ; None si la base n'est pas seedée."""
+    from sqlalchemy import select
+    from sqlalchemy.exc import DBAPIError
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.modules.achats.models import Depot
+    from app.modules.catalogue.models import Produit
+    from app.modules.commercial.models import EtatDocument
+    from app.modules.parametrage.models import Devise, Entreprise, PointDeVente
+    from app.modules.partenaires.models import Tiers
+
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.connect() as conn:
+            ent_id = (await conn.execute(select(Entreprise.id).order_by(Entreprise.id).limit(1))).scalar()
+            if ent_id is None:
+                return None
+            return Fixture(
+                entreprise_id=ent_id,
+                point_de_vente_id=(await conn.execute(
+                    select(PointDeVente.id).where(PointDeVente.entreprise_id == ent_id, PointDeVente.est_depot.is_(False)).limit(1)
+                )).scalar_one(),
+                depot_id=(await conn.execute(select(Depot.id).where(Depot.entreprise_id == ent_id).limit(1))).scalar_one(),
+                etat_facture_id=(await conn.execute(
+                    select(EtatDocument.id).where(EtatDocument.type_document == "facture").order_by(EtatDocument.ordre).limit(1)
+                )).scalar_one(),
+                devise_id=(await conn.execute(select(Devise.id).where(Devise.code == "XAF"))).scalar_one(),
+                client_ids=list((await conn.execute(select(Tiers.id).where(Tiers.entreprise_id == ent_id).limit(500))).scalars()),
+                produit_ids=list((await conn.execute(select(Produit.id).where(Produit.entreprise_id == ent_id).limit(500))).scalars()),
+            )
+    except DBAPIError:  # tables absentes
+        return None
+    finally:
+        await engine.dispose()
+
+
+def _prepare_database(database_url: str, mode: str) -> None:
+    """Schéma (alembic upgrade head) puis seed du mode demandé."""
+    env = _bench_env(database_url)
+    print(f"Migration et seed {mode} de {database_url} (peut être long en STRESS)...")
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, env=env, check=True)
+    subprocess.run([sys.executable, "-m", "scripts.seed_data", mode], cwd=BACKEND_DIR, env=env, check=True)
+
+
+# --- Scénarios -----------------------------------------------------------------
+
+class Scenarios:
+    """Requêtes du mix ; chaque méthode renvoie la réponse HTTP."""
+
+    def __init__(self, client, fixture: Fixture, headers: dict[str, str], worker: int, args, run_id: str) -> None:
+        self.client = client
+        self.f = fixture
+        self.headers = headers
+        self.rng = random.Random(args.seed + worker)
+        self.prefix = f"BENCH-{run_id}-{worker}"
+        self.seq = 0
+
+    async def login(self):
+        return await self.client.post(f"{API}/auth/login", json={"entreprise_id": self.f.entreprise_id, **LOGIN})
+
+    async def catalogue_search(self):
+        params = {"search": self.rng.choice(SEARCH_TERMS), "limit": 50}
+        return await self.client.get(f"{API}/catalogue/produits", params=params, headers=self.headers)
+
+    async def factures_list(self):
+        return await self.client.get(f"{API}/commercial/factures", params={"limit": 50}, headers=self.headers)
+
+    async def facture_create(self):
+        self.seq += 1
+        payload = {
+            "entreprise_id": self.f.entreprise_id,
+            "point_de_vente_id": self.f.point_de_vente_id,
+            "client_id": self.rng.choice(self.f.client_ids),
+            "numero": f"{self.prefix}-{self.seq}",
+            "date_facture": date.today().isoformat(),
+            "etat_id": self.f.etat_facture_id,
+            "type_facture": "facture",
+            "montant_ht": "10000.00",
+            "montant_tva": "1925.00",
+            "montant_ttc": "11925.00",
+            "montant_restant_du": "11925.00",
+            "devise_id": self.f.devise_id,
+        }
+        return await self.client.post(f"{API}/commercial/factures", json=payload, headers=self.headers)
+
+    async def mouvements_list(self):
+        params = {"depot_id": self.f.depot_id, "limit": 50}
+        return await self.client.get(f"{API}/stock/mouvements", params=params, headers=self.headers)
+
+    async def mouvement_create(self):
+        payload = {
+            "type_mouvement": "entree",
+            "depot_id": self.f.depot_id,
+            "produit_id": self.rng.choice(self.f.produit_ids),
+            "quantite": "1",
+            "reference_type": "manuel",
+            "notes": self.prefix,
+        }
+        return await self.client.post(f"{API}/stock/mouvements", json=payload, headers=self.headers)
+
+    async def dashboard(self):
+        return await self.client.get(f"{API}/rapports/dashboard", headers=self.headers)
+
+
+async def _worker(scenarios: Scenarios, samples: dict[str, Samples], t_measure: float, t_end: float) -> None:
+    names = list(MIX)
+    weights = [MIX[n] for n in names]
+    while (now := time.perf_counter()) < t_end:
+        name = scenarios.rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            response = await getattr(scenarios, name)()
+            ok = response.status_code < 400
+        except Exception:  # connexion refusée, timeout : compté comme erreur
+            ok = False
+        elapsed = time.perf_counter() - start
+        if now < t_measure:
+            continue
+        s = samples[name]
+        if ok:
+            s.latencies.append(elapsed)
+        else:
+            s.errors += 1
+
+
+async def _login_storm_worker(scenarios: Scenarios, samples: Samples, t_measure: float, t_end: float) -> None:
+    """Connexions en boucle, sans pause (hors mix) : mesurées sous login_storm."""
+    while (now := time.perf_counter()) < t_end:
+        start = time.perf_counter()
+        try:
+            ok = (await scenarios.login()).status_code < 400
+        except Exception:  # connexion refusée, timeout : compté comme erreur
+            ok = False
+        if now < t_measure:
+            continue
+        if ok:
+            samples.latencies.append(time.perf_counter() - start)
+        else:
+            samples.errors += 1
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # rang le plus proche : plus petite valeur couvrant p % des échantillons
+    k = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+def _summarize(samples: dict[str, Samples], duration: float) -> dict[str, dict]:
+    out = {}
+    for name, s in samples.items():
+        values = sorted(s.latencies)
+        out[name] = {
+            "requests": len(values),
+            "errors": s.errors,
+            "rps": round(len(values) / duration, 2),
+            "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+            "p50_ms": round(_percentile(values, 50) * 1000, 2),
+            "p95_ms": round(_percentile(values, 95) * 1000, 2),
+            "p99_ms": round(_percentile(values, 99) * 1000, 2),
+        }
+    total = sum(len(s.latencies) for s in samples.values())
+    out["_total"] = {
+        "requests": total,
+        "errors": sum(s.errors for s in samples.values()),
+        "rps": round(total / duration, 2),
+    }
+    return out
+
+
+async def _run_load(client, fixture: Fixture, args) -> dict[str, dict]:
+    response = await client.post(f"{API}/auth/login", json={"entreprise_id": fixture.entreprise_id, **LOGIN})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    run_id = datetime.now().strftime("%Y%m%d%H%M%S")
+    samples = {name: Samples() for name in MIX}
+    if args.login_storm:
+        samples["login_storm"] = Samples()
+    t0 = time.perf_counter()
+    t_measure = t0 + args.warmup
+    t_end = t_measure + args.duration
+    await asyncio.gather(
+        *(
+            _worker(Scenarios(client, fixture, headers, i, args, run_id), samples, t_measure, t_end)
+            for i in range(args.concurrency)
+        ),
+        *(
+            _login_storm_worker(Scenarios(client, fixture, headers, -1 - i, args, run_id), samples["login_storm"], t_measure, t_end)
+            for i in range(args.login_storm)
+        ),
+    )
+    return _summarize(samples, args.duration)
+
+
+async def _run_in_process(fixture: Fixture, args) -> dict[str, dict]:
+    from httpx import ASGITransport, AsyncClient
+
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", timeout=60) as client:
+        return await _run_load(client, fixture, args)
+
+
+async def _run_uvicorn(fixture: Fixture, args, database_url: str) -> dict[str, dict]:
+    from httpx import AsyncClient, Limits
+
+    cmd = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(args.port),
+        "--workers", str(args.workers), "--log-level", "warning", "--no-access-log",
+    ]
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=_bench_env(database_url))
+    base_url = f"http://127.0.0.1:{args.port}"
+    clients = args.concurrency + args.login_storm
+    limits = Limits(max_connections=clients, max_keepalive_connections=clients)
+    try:
+        async with AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+            for _ in range(100):
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except Exception:  # serveur pas encore à l'écoute
+                    pass
+                await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn n'a pas démarré")
+            return await _run_load(client, fixture, args)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+# --- Rapport -----------------------------------------------------------------
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_table(results: dict[str, dict], baseline: dict[str, dict] | None) -> None:
+    """Affiche le tableau par scénario, avec l'écart à la référence si fournie."""
+    print(f"\n{'scénario':<18}{'req':>8}{'err':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  vs référence")
+    for name, r in results.items():
+        if name == "_total":
+            continue
+        delta = ""
+        if baseline and name in baseline and baseline[name]["p95_ms"]:
+            ref = baseline[name]
+            p95 = (r["p95_ms"] - ref["p95_ms"]) / ref["p95_ms"] * 100
+            rps = (r["rps"] - ref["rps"]) / ref["rps"] * 100 if ref["rps"] else 0.0
+            delta = f"p95 {p95:+.1f} %, req/s {rps:+.1f} %"
+        print(
+            f"{name:<18}{r['requests']:>8}{r['errors']:>6}{r['rps']:>9.1f}"
+            f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}  {delta}"
+        )
+    total = results["_total"]
+    print(f"{'total':<18}{total['requests']:>8}{total['errors']:>6}{total['rps']:>9.1f}")
+
+
+def _regressions(results: dict[str, dict], baseline: dict[str, dict], max_regression: float) -> list[str]:
+    out = []
+    for name, r in results.items():
+        ref = baseline.get(name)
+        if name == "_total" or not ref or not ref.get("p95_ms"):
+            continue
+        if (r["p95_ms"] - ref["p95_ms"]) / ref["p95_ms"] * 100 > max_regression:
+            out.append(name)
+    return out
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Banc de charge de l'API Gesco")
+    parser.add_argument("--mode", default="LIGHT", choices=["LIGHT", "FULL", "STRESS"], help="Volume du seed")
+    parser.add_argument("--database-url", help="URL async (défaut : SQLite temporaire par mode)")
+    parser.add_argument("--server", default="inprocess", choices=["inprocess", "uvicorn"])
+    parser.add_argument("--workers", type=int, default=1, help="Workers uvicorn")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=20, help="Clients simultanés")
+    parser.add_argument("--login-storm", type=int, default=0, help="Clients supplémentaires ne faisant que des connexions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Durée mesurée (s)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Chauffe non mesurée (s)")
+    parser.add_argument("--seed", type=int, default=42, help="Graine du mix (reproductibilité)")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--baseline", help="Résultats JSON de référence à comparer")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="Régression p95 tolérée (%%) avec --baseline")
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    database_url = args.database_url or _default_database_url(args.mode)
+    # Avant tout import de app (get_settings lit l'environnement une fois)
+    os.environ.update(_bench_env(database_url))
+
+    fixture = await _load_fixture(database_url)
+    if fixture is None:
+        _prepare_database(database_url, args.mode)
+        fixture = await _load_fixture(database_url)
+        if fixture is None:
+            print("Seed introuvable après préparation de la base.", file=sys.stderr)
+            return 2
+
+    storm = f" + {args.login_storm} en tempête de connexions" if args.login_storm else ""
+    print(f"Charge : {args.concurrency} clients{storm}, {args.duration:.0f} s (+{args.warmup:.0f} s de chauffe), serveur {args.server}")
+    if args.server == "uvicorn":
+        results = await _run_uvicorn(fixture, args, database_url)
+    else:
+        results = await _run_in_process(fixture, args)
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["endpoints"]
+    _print_table(results, baseline)
+
+    if args.output:
+        report = {
+            "meta": {
+                "mode": args.mode,
+                "database": database_url.split("://", 1)[0],
+                "server": args.server,
+                "workers": args.workers if args.server == "uvicorn" else 1,
+                "concurrency": args.concurrency,
+                "login_storm": args.login_storm,
+                "duration_s": args.duration,
+                "seed": args.seed,
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "date": datetime.now(UTC).isoformat(timespec="seconds"),
+            },
+            "endpoints": results,
+        }
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nRésultats écrits dans {args.output}")
+
+    if baseline:
+        regressed = _regressions(results, baseline, args.max_regression)
+        if regressed:
+            print(f"Régression p95 > {args.max_regression:.0f} % : {', '.join(regressed)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
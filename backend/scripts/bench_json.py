@@ -0,0 +1,100 @@
+# scripts/bench_json.py
+# -----------------------------------------------------------------------------
+# Benchmark de l'encodage JSON des listes volumineuses : JSONResponse (json
+# standard, ancien comportement) contre ORJSONResponse (défaut de l'API) et
+# NDJSONResponse, sur des factures et des lignes du journal d'audit générées
+# en mémoire (aucune base requise).
+# Usage : python -m scripts.bench_json [nb_lignes] [repetitions]
+# Par défaut : 500 lignes, 200 répétitions.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import json
+import os
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import NDJSONResponse, ORJSONResponse
+from app.modules.commercial.schemas import FactureResponse
+from app.modules.systeme.schemas import JournalAuditResponse
+
+
+def _factures(n: int) -> list[FactureResponse]:
+    debut = date(2025, 1, 1)
+    return [
+        FactureResponse(
+            id=i,
+            entreprise_id=1,
+            client_id=i % 50 + 1,
+            numero=f"FAC-2025-{i:06d}",
+            date_facture=debut + timedelta(days=i % 365),
+            etat_id=2,
+            type_facture="facture",
+            montant_ttc=Decimal("119250.00") + i,
+            montant_restant_du=Decimal("0.00") if i % 3 else Decimal("59625.00"),
+            mention_legale="Exonéré de TVA - art. 131 CGI" if i % 10 == 0 else None,
+            created_at=datetime(2025, 1, 1, 8, 30) + timedelta(minutes=i),
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _audit(n: int) -> list[JournalAuditResponse]:
+    return [
+        JournalAuditResponse(
+            id=i,
+            entreprise_id=1,
+            utilisateur_id=i % 5 + 1,
+            action="modification",
+            module="commercial",
+            entite_type="facture",
+            entite_id=i,
+            details={"champ": "etat_id", "avant": 1, "apres": 2},
+            ip_address="192.168.1.10",
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            created_at=datetime(2025, 1, 1, 8, 30) + timedelta(seconds=i),
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+async def _drain(response: NDJSONResponse) -> int:
+    total = 0
+    async for chunk in response.body_iterator:
+        total += len(chunk)
+    return total
+
+
+def _bench(label: str, rows: list, repetitions: int) -> None:
+    # Même chemin que FastAPI : response_model → types JSON, puis render().
+    content = jsonable_encoder(rows)
+    json_s = timeit.timeit(lambda: JSONResponse(content), number=repetitions) / repetitions
+    orjson_s = timeit.timeit(lambda: ORJSONResponse(content), number=repetitions) / repetitions
+    ndjson_s = timeit.timeit(
+        lambda: asyncio.run(_drain(NDJSONResponse(rows, schema=type(rows[0])))),
+        number=repetitions,
+    ) / repetitions
+    # Sortie identique (au formatage près) : même document décodé.
+    assert json.loads(JSONResponse(content).body) == json.loads(ORJSONResponse(content).body)
+    print(f"{label} ({len(rows)} lignes)")
+    print(f"  JSONResponse   : {json_s * 1000:8.3f} ms")
+    print(f"  ORJSONResponse : {orjson_s * 1000:8.3f} ms  (x{json_s / orjson_s:.1f})")
+    print(f"  NDJSONResponse : {ndjson_s * 1000:8.3f} ms  (validation du schéma incluse)")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    _bench("Factures", _factures(n), repetitions)
+    _bench("Journal d'audit", _audit(n), repetitions)
+
+
+if __name__ == "__main__":
+    main()
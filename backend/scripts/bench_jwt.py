@@ -0,0 +1,56 @@
+# scripts/bench_jwt.py
+# -----------------------------------------------------------------------------
+# Benchmark des tokens JWT d'accès : création et vérification avec python-jose
+# (JWT_BACKEND=jose) contre le backend natif (JWT_BACKEND=native, HMAC de la
+# bibliothèque standard), puis decode_access_token servi par le cache des
+# tokens vérifiés (même token rejoué, cas d'un écran qui enchaîne les appels).
+# Aucune base requise.
+# Usage : python -m scripts.bench_jwt [repetitions]
+# Par défaut : 20000 répétitions.
+# -----------------------------------------------------------------------------
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_settings
+from app.core import security
+
+
+def _per_call_us(fn, repetitions: int) -> float:
+    return timeit.timeit(fn, number=repetitions) / repetitions * 1_000_000
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    s = get_settings()
+    secret, algorithm = s.SECRET_KEY, s.ALGORITHM
+    claims = {"sub": "1", "exp": 4_102_444_800, "iat": 1_735_689_600, "type": "access", "entreprise_id": 1}
+
+    jose_token = security.jose_jwt_encode(claims, secret, algorithm)
+    native_token = security.native_jwt_encode(claims, secret, algorithm)
+    # Tokens interchangeables : chaque backend lit ceux de l'autre.
+    assert security.native_jwt_decode(jose_token, secret, algorithm) == claims
+    assert security.jose_jwt_decode(native_token, secret, algorithm) == claims
+
+    jose_enc = _per_call_us(lambda: security.jose_jwt_encode(claims, secret, algorithm), repetitions)
+    native_enc = _per_call_us(lambda: security.native_jwt_encode(claims, secret, algorithm), repetitions)
+    jose_dec = _per_call_us(lambda: security.jose_jwt_decode(jose_token, secret, algorithm), repetitions)
+    native_dec = _per_call_us(lambda: security.native_jwt_decode(native_token, secret, algorithm), repetitions)
+
+    security.clear_token_cache()
+    security.decode_access_token(jose_token)
+    cached = _per_call_us(lambda: security.decode_access_token(jose_token), repetitions)
+
+    print(f"Tokens {algorithm} ({repetitions} répétitions, JWT_CACHE_MAX_ENTRIES={s.JWT_CACHE_MAX_ENTRIES})")
+    print(f"  création  jose   : {jose_enc:8.2f} µs")
+    print(f"  création  native : {native_enc:8.2f} µs  (x{jose_enc / native_enc:.1f})")
+    print(f"  décodage  jose   : {jose_dec:8.2f} µs")
+    print(f"  décodage  native : {native_dec:8.2f} µs  (x{jose_dec / native_dec:.1f})")
+    print(f"  décodage  cache  : {cached:8.2f} µs  (x{jose_dec / cached:.1f}, decode_access_token)")
+
+
+if __name__ == "__main__":
+    main()
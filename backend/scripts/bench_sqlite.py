@@ -0,0 +1,94 @@
+# scripts/bench_sqlite.py
+# -----------------------------------------------------------------------------
+# Benchmark du profil SQLite : comportement historique (NullPool, sans pragma,
+# écritures concurrentes libres) contre le profil haut débit (WAL, pragmas,
+# pool, écrivain unique). Simule des postes de caisse concurrents : chaque
+# « requête » ouvre une session, lit (liste + détail) et, une fois sur
+# ratio_ecriture, insère une ligne puis commit.
+# Usage : python -m scripts.bench_sqlite [clients] [requetes_par_client] [ratio_ecriture]
+# Par défaut : 20 clients, 200 requêtes, 1 écriture sur 5.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import Column, Integer, MetaData, Numeric, String, Table, func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import Settings
+from app.core.sqlite import (
+    SerializedWriteSession,
+    install_pragmas,
+    sqlite_engine_kwargs,
+    sqlite_pragmas,
+)
+
+metadata = MetaData()
+ventes = Table(
+    "bench_ventes",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("numero", String(50), nullable=False),
+    Column("montant", Numeric(18, 2), nullable=False),
+)
+
+
+async def _client(factory, n: int, ratio: int, offset: int) -> tuple[int, int]:
+    ok = errors = 0
+    for i in range(n):
+        try:
+            async with factory() as session:
+                await session.execute(select(ventes).order_by(ventes.c.id.desc()).limit(20))
+                await session.execute(select(func.count()).select_from(ventes))
+                if i % ratio == 0:
+                    await session.execute(insert(ventes).values(numero=f"V-{offset}-{i}", montant=1000))
+                    await session.commit()
+            ok += 1
+        except OperationalError:  # database is locked
+            errors += 1
+    return ok, errors
+
+
+async def _run(label: str, tuned: bool, path: str, clients: int, n: int, ratio: int) -> None:
+    settings = Settings(
+        DATABASE_URL=f"sqlite+aiosqlite:///{path}",
+        SQLITE_TUNED=tuned,
+    )
+    engine = create_async_engine(settings.DATABASE_URL, **sqlite_engine_kwargs(settings))
+    if tuned:
+        install_pragmas(engine.sync_engine, sqlite_pragmas(settings))
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+    factory = async_sessionmaker(
+        bind=engine,
+        class_=SerializedWriteSession if tuned else AsyncSession,
+        expire_on_commit=False,
+    )
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(_client(factory, n, ratio, c) for c in range(clients)))
+    elapsed = time.perf_counter() - t0
+    await engine.dispose()
+    ok = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    print(f"{label:<12}: {ok / elapsed:8.1f} req/s  ({ok} ok, {errors} « database is locked », {elapsed:.2f} s)")
+
+
+async def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    ratio = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fichiers distincts : le mode WAL est persistant dans le fichier
+        await _run("historique", False, os.path.join(tmp, "historique.db"), clients, n, ratio)
+        await _run("optimisé", True, os.path.join(tmp, "optimise.db"), clients, n, ratio)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
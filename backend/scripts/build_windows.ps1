@@ -24,6 +24,14 @@ if (Test-Path "build") {
     Remove-Item -Recurse -Force "build"
 }
 
+# Schéma OpenAPI pré-calculé (servi par /docs sans génération au démarrage)
+Write-Host "Export du schéma OpenAPI..." -ForegroundColor Yellow
+python -m scripts.export_openapi build\openapi.json
+if ($LASTEXITCODE -ne 0) {
+    Write-Host "Erreur export OpenAPI." -ForegroundColor Red
+    exit 1
+}
+
 # Build
 Write-Host "Lancement de PyInstaller..." -ForegroundColor Yellow
 pyinstaller gesco.spec
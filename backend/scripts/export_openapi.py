@@ -0,0 +1,39 @@
+# scripts/export_openapi.py
+# -----------------------------------------------------------------------------
+# Sérialise le schéma OpenAPI complet (tous les routeurs) dans un fichier JSON,
+# à servir tel quel via OPENAPI_SCHEMA_FILE : /docs ne génère plus le schéma
+# au premier appel et n'importe pas les routeurs non encore chargés.
+# Usage : python -m scripts.export_openapi [chemin]   (défaut : openapi.json)
+# Utilisé par scripts/build_windows.ps1 (schéma embarqué dans l'exécutable).
+# À régénérer après toute modification de route ou de schéma.
+# -----------------------------------------------------------------------------
+
+import os
+import sys
+
+if os.path.isfile(".env"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Générer depuis les routes, jamais depuis un schéma pré-calculé existant
+os.environ["OPENAPI_SCHEMA_FILE"] = ""
+os.environ["LAZY_ROUTERS"] = "false"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+
+from app.main import app
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    schema = app.openapi()
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(schema))
+    print("Schema OpenAPI ecrit : {} ({} chemins)".format(path, len(schema.get("paths", {}))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# scripts/rebuild_ventes_journalieres.py
+# -----------------------------------------------------------------------------
+# Reconstruit la table de faits ventes_journalieres depuis factures (backfill,
+# après un import ou un seed qui n'est pas passé par FactureService).
+# Usage : python -m scripts.rebuild_ventes_journalieres [entreprise_id]
+# Sans argument : toutes les entreprises.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import os
+import sys
+
+if os.path.isfile(".env"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+from app.modules.rapports.repositories import VenteJournaliereRepository
+
+
+async def main() -> None:
+    entreprise_id = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    settings = get_settings()
+    engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        nb = await VenteJournaliereRepository(session).reconstruire(entreprise_id)
+        await session.commit()
+    cible = f"entreprise {entreprise_id}" if entreprise_id is not None else "toutes les entreprises"
+    print(f"ventes_journalieres reconstruite ({cible}) : {nb} ligne(s) agregee(s)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
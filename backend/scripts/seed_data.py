@@ -4,50 +4,51 @@
 # Période : 3 ans = (aujourd'hui - 2 ans) → aujourd'hui.
 # Modes : LIGHT (~50k), FULL (~400k), STRESS (~2M) pour montée en charge.
 #
-# Exécution : python -m scripts.seed_data [LIGHT|FULL|STRESS]
+# Chemin rapide : hors référentiels (ORM, quelques centaines de lignes), les
+# tables volumineuses sont générées en dicts par lots, dans des processus
+# workers, puis insérées en masse (executemany Core ; COPY sous PostgreSQL
+# asyncpg). Les clés primaires sont pré-attribuées (plages d'id par table),
+# chaque lot a sa propre graine (--seed, type de lot, n° de lot) : le résultat
+# ne dépend ni du nombre de workers ni des reprises.
+# Reprise : chaque lot est commité avec sa marque dans seed_progress ; relancer
+# la même commande après une interruption reprend au premier lot manquant.
+# La table seed_progress est supprimée à la fin du seed.
+#
+# Exécution : python -m scripts.seed_data [LIGHT|FULL|STRESS] [--seed 42] [--workers N]
 # Prérequis : migrations appliquées, .env (DATABASE_URL, DATABASE_URL_SYNC, SECRET_KEY).
 # -----------------------------------------------------------------------------
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import json
 import os
 import random
 import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import date, timedelta
 from decimal import Decimal
 
-# Période : 3 ans = maintenant - 2 ans → maintenant
-_TODAY = date.today()
-DATE_FIN = _TODAY
-DATE_DEBUT = date(_TODAY.year - 2, 1, 1) if _TODAY.month == 1 and _TODAY.day == 1 else date(_TODAY.year - 2, _TODAY.month, _TODAY.day)
-ANNEE_DEBUT = DATE_DEBUT.year
-ANNEE_FIN = DATE_FIN.year
-
-# Mode seed : LIGHT (rapide) | FULL (volume moyen) | STRESS (~2M enregistrements)
-SEED_MODE = (sys.argv[1] if len(sys.argv) > 1 else os.environ.get("SEED_MODE", "LIGHT")).upper()
-if SEED_MODE not in ("LIGHT", "FULL", "STRESS"):
-    SEED_MODE = "LIGHT"
-
-# Volumes par mode (bazard : nombreux clients, factures, mouvements)
-if SEED_MODE == "LIGHT":
-    N_CLIENTS, N_FOURNISSEURS, N_PRODUITS = 150, 40, 180
-    N_DEVIS_PAR_AN, N_COMMANDES_PAR_AN, N_FACTURES_PAR_AN = 450, 420, 420
-    N_EMPLOYES, N_CF_FOURNISSEUR_PAR_AN = 28, 90
-    BATCH_FLUSH = 500
-elif SEED_MODE == "FULL":
-    N_CLIENTS, N_FOURNISSEURS, N_PRODUITS = 1200, 120, 800
-    N_DEVIS_PAR_AN, N_COMMANDES_PAR_AN, N_FACTURES_PAR_AN = 4000, 3800, 3800
-    N_EMPLOYES, N_CF_FOURNISSEUR_PAR_AN = 45, 400
-    BATCH_FLUSH = 2000
-else:  # STRESS ~2M
-    N_CLIENTS, N_FOURNISSEURS, N_PRODUITS = 6000, 300, 2500
-    N_DEVIS_PAR_AN, N_COMMANDES_PAR_AN, N_FACTURES_PAR_AN = 22000, 20000, 20000
-    N_EMPLOYES, N_CF_FOURNISSEUR_PAR_AN = 60, 2500
-    BATCH_FLUSH = 5000
-
-N_ANNEES = ANNEE_FIN - ANNEE_DEBUT + 1
-N_PERIODES_PAIE = N_ANNEES * 12
+# Volumes par mode (bazard : nombreux clients, factures, mouvements) ; batch = lignes par lot
+VOLUMES = {
+    "LIGHT": {
+        "clients": 150, "fournisseurs": 40, "produits": 180, "devis_par_an": 450, "commandes_par_an": 420,
+        "factures_par_an": 420, "employes": 28, "cf_par_an": 90, "reglements": 600, "ecritures": 400,
+        "mouvements": 300, "batch": 500,
+    },
+    "FULL": {
+        "clients": 1200, "fournisseurs": 120, "produits": 800, "devis_par_an": 4000,
+        "commandes_par_an": 3800, "factures_par_an": 3800, "employes": 45, "cf_par_an": 400,
+        "reglements": 5000, "ecritures": 3000, "mouvements": 1500, "batch": 2000,
+    },
+    "STRESS": {  # ~2M
+        "clients": 6000, "fournisseurs": 300, "produits": 2500, "devis_par_an": 22000,
+        "commandes_par_an": 20000, "factures_par_an": 20000, "employes": 60, "cf_par_an": 2500,
+        "reglements": 5000, "ecritures": 3000, "mouvements": 1500, "batch": 5000,
+    },
+}
 
 # Charger .env avant app
 if os.path.isfile(".env"):
@@ -59,11 +60,6 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from faker import Faker
 
-# Faker : français + seed pour reproductibilité
-FAKER = Faker("fr_FR")
-FAKER.seed_instance(42)
-random.seed(42)
-
 # Référentiels géo Cameroun (bazard = ventes nationales)
 VILLES_REGIONS_CMR = [
     ("Douala", "Littoral"), ("Yaoundé", "Centre"), ("Garoua", "Nord"),
@@ -107,47 +103,60 @@ LIBELLES_BAZARD = [
 ]
 
 
-def _date_alea(debut: date, fin: date) -> date:
+def _periode(today: date | None = None) -> tuple[date, date]:
+    """Période : 3 ans = maintenant - 2 ans → maintenant."""
+    today = today or date.today()
+    if today.month == 2 and today.day == 29:
+        return date(today.year - 2, 2, 28), today
+    return date(today.year - 2, today.month, today.day), today
+
+
+def _date_alea(rng: random.Random, debut: date, fin: date) -> date:
     delta = (fin - debut).days
-    return debut + timedelta(days=random.randint(0, max(0, delta))) if delta > 0 else debut
+    return debut + timedelta(days=rng.randint(0, max(0, delta))) if delta > 0 else debut
 
 
-def _niu_cameroun() -> str:
+def _niu_cameroun(rng: random.Random) -> str:
     """NIU format DGI Cameroun : M + 9 chiffres + lettre."""
-    return "M{:09d}{}".format(random.randint(1, 999999999), random.choice("ABCDEFGHJKLMNPQRSTUVWXYZ"))
+    return "M{:09d}{}".format(rng.randint(1, 999999999), rng.choice("ABCDEFGHJKLMNPQRSTUVWXYZ"))
 
 
-def _phone_cmr() -> str:
+def _phone_cmr(rng: random.Random) -> str:
     """Téléphone Cameroun : +237 2/6 XX XX XX XX."""
-    prefix = "2" if random.random() > 0.5 else "6"
-    return "+237 {} {:02d} {:02d} {:02d} {:02d}".format(
-        prefix, random.randint(20, 99), random.randint(10, 99),
-        random.randint(10, 99), random.randint(10, 99)
+    prefix = "2" if rng.random() > 0.5 else "6"
+    return (
+        f"+237 {prefix} {rng.randint(20, 99):02d} {rng.randint(10, 99):02d} "
+        f"{rng.randint(10, 99):02d} {rng.randint(10, 99):02d}"
     )
 
 
-def _raison_sociale_client_bazard() -> str:
+def _raison_sociale_client_bazard(rng: random.Random, fk: Faker) -> str:
     templates = [
         "Boutique {}", "Épicerie {}", "Mini-market {}", "Supérette {}",
         "Commerce {}", "Dépôt {}", "Supermarché {}", "Grossiste {}",
     ]
-    return FAKER.company() if random.random() > 0.5 else random.choice(templates).format(FAKER.last_name())
+    return fk.company() if rng.random() > 0.5 else rng.choice(templates).format(fk.last_name())
 
 
-def _raison_sociale_fournisseur() -> str:
-    return FAKER.company() + " " + random.choice(["Cameroun", "SA", "SARL", "Distribution"])
+def _raison_sociale_fournisseur(rng: random.Random, fk: Faker) -> str:
+    return fk.company() + " " + rng.choice(["Cameroun", "SA", "SARL", "Distribution"])
 
 
-def _libelle_produit_bazard() -> str:
-    base = random.choice(LIBELLES_BAZARD)
-    if N_PRODUITS > 200:
-        return "{} ({})".format(base, FAKER.ean8() if random.random() > 0.7 else FAKER.word())
+def _libelle_produit_bazard(rng: random.Random, fk: Faker, n_produits: int) -> str:
+    base = rng.choice(LIBELLES_BAZARD)
+    if n_produits > 200:
+        return f"{base} ({fk.ean8() if rng.random() > 0.7 else fk.word()})"
     return base
 
 
+def _tva(mt_ht: Decimal) -> tuple[Decimal, Decimal]:
+    mt_tva = (mt_ht * Decimal("0.1925")).quantize(Decimal("0.01"))
+    return mt_tva, mt_ht + mt_tva
+
+
 # Imports SQLAlchemy et app
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import Column, MetaData, String, Table, Text, delete, func, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import get_settings
 from app.core.security import hash_password
@@ -176,54 +185,439 @@ from app.modules.paie.models import PeriodePaie, TypeElementPaie, BulletinPaie,
 from app.modules.immobilisations.models import CategorieImmobilisation, Immobilisation, LigneAmortissement
 from app.modules.systeme.models import ParametreSysteme, JournalAudit, Notification, LicenceLogicielle
 
+# Avancement du seed (hors schéma applicatif, supprimée en fin de seed)
+_progress_metadata = MetaData()
+seed_progress = Table(
+    "seed_progress",
+    _progress_metadata,
+    Column("cle", String(100), primary_key=True),
+    Column("valeur", Text, nullable=False),
+)
+
+Rows = dict[str, list[dict]]
+
+
+# =============================================================================
+# Insertion en masse et avancement
+# =============================================================================
+
+def _column_defaults(table: Table) -> dict[str, object]:
+    """Valeurs par défaut Python des colonnes (une évaluation par lot)."""
+    out: dict[str, object] = {}
+    for col in table.columns:
+        default = col.default
+        if default is None:
+            continue
+        if default.is_scalar:
+            out[col.name] = default.arg
+        elif default.is_callable:
+            out[col.name] = default.arg(None)
+    return out
+
+
+async def _bulk_insert(conn: AsyncConnection, table: Table, rows: list[dict]) -> None:
+    """
+    Insère des lignes (dicts) : COPY sous PostgreSQL/asyncpg, sinon executemany.
+    Colonnes absentes complétées par leur défaut Python (ou NULL) : COPY
+    n'applique pas les défauts SQLAlchemy et executemany exige des clés homogènes.
+    """
+    if not rows:
+        return
+    explicit_ids = "id" in rows[0]
+    names = [
+        c.name for c in table.columns
+        if (explicit_ids or c.name != "id") and (c.name in rows[0] or c.server_default is None)
+    ]
+    defaults = _column_defaults(table)
+    records = [tuple(row[n] if n in row else defaults.get(n) for n in names) for row in rows]
+    dialect = conn.dialect
+    if dialect.name == "postgresql" and dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(table.name, records=records, columns=names)
+    else:
+        await conn.execute(insert(table), [dict(zip(names, r, strict=True)) for r in records])
+    if explicit_ids and dialect.name == "postgresql":
+        # Ids fournis : aligner la séquence pour les insertions suivantes sans id
+        await conn.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), (SELECT MAX(id) FROM {table.name}))")
+        )
+
+
+async def _insert_rows(conn: AsyncConnection, rows: Rows) -> None:
+    """Insère un lot multi-tables dans l'ordre des clés (parents d'abord)."""
+    from app.core.database import Base
+
+    for table_name, table_rows in rows.items():
+        await _bulk_insert(conn, Base.metadata.tables[table_name], table_rows)
+
+
+async def _progress_done(conn: AsyncConnection) -> dict[str, str]:
+    result = await conn.execute(select(seed_progress.c.cle, seed_progress.c.valeur))
+    return dict(result.all())
+
+
+async def _mark(conn: AsyncConnection, cle: str, valeur: object = True) -> None:
+    await conn.execute(insert(seed_progress).values(cle=cle, valeur=json.dumps(valeur)))
+
+
+async def _next_id(conn: AsyncConnection, model) -> int:
+    return (await conn.execute(select(func.coalesce(func.max(model.id), 0)))).scalar_one() + 1
+
+
+# =============================================================================
+# Génération par lots (exécutée dans les workers : fonctions de module pures)
+# =============================================================================
+
+_FAKER: Faker | None = None
+
+
+def _rng(task: dict, kind: str) -> tuple[random.Random, Faker]:
+    """Générateurs du lot : graine = (--seed, type, n° de lot), indépendante du worker."""
+    global _FAKER
+    if _FAKER is None:
+        _FAKER = Faker("fr_FR")
+    graine = "{}:{}:{}".format(task["seed"], kind, task["chunk"])
+    _FAKER.seed_instance(graine)
+    return random.Random(graine), _FAKER
+
+
+def _annee(ctx: dict, g: int, par_an: int) -> tuple[int, int, date, date]:
+    """Indice global → (rang de l'année, année, 1er janvier, 31 décembre)."""
+    idx = g // par_an
+    an = ctx["annee_debut"] + idx
+    return idx, an, date(an, 1, 1), date(an, 12, 31)
+
+
+def _gen_produits(task: dict) -> Rows:
+    rng, fk = _rng(task, "produits")
+    ctx, vol = task["ctx"], task["vol"]
+    ids = ctx["ids"]
+    debut = date.fromisoformat(ctx["date_debut"])
+    rows: Rows = {
+        Produit.__tablename__: [], PrixProduit.__tablename__: [], Stock.__tablename__: [],
+        ProduitConditionnement.__tablename__: [], VarianteProduit.__tablename__: [],
+    }
+    for g in range(task["start"], task["start"] + task["count"]):
+        i = g + 1
+        pid = ids["produits"] + g
+        code = f"PROD-{i:05d}"
+        unite_id = rng.choice(ctx["unites"])
+        prix_achat = Decimal(str(rng.randint(100, 12000)))
+        marge = Decimal(str(rng.uniform(1.12, 1.40)))
+        prix_vente = (prix_achat * marge).quantize(Decimal("1"))
+        rows[Produit.__tablename__].append({
+            "id": pid, "entreprise_id": ctx["entreprise"], "famille_id": rng.choice(ctx["familles"]), "code": code,
+            "code_barre": f"613{i:010d}" if i % 2 == 0 else None,
+            "libelle": _libelle_produit_bazard(rng, fk, vol["produits"])[:255], "type": "produit",
+            "unite_vente_id": unite_id, "unite_achat_id": unite_id,
+            "coefficient_achat_vente": Decimal("1"), "prix_achat_ht": prix_achat, "prix_vente_ttc": prix_vente,
+            "taux_tva_id": ctx["tva19"] if i % 5 != 0 else ctx["tva0"],
+            "seuil_alerte_min": Decimal(str(rng.randint(5, 50))), "gerer_stock": True, "actif": True,
+        })
+        rows[PrixProduit.__tablename__].append({"produit_id": pid, "canal_vente_id": ctx["canal_det"], "prix_ttc": prix_vente, "date_debut": debut})
+        rows[Stock.__tablename__].append({"depot_id": ctx["depot"], "produit_id": pid, "variante_id": None, "quantite": Decimal(str(rng.randint(30, 1500))), "unite_id": unite_id})
+        if g < 25:
+            rows[ProduitConditionnement.__tablename__].append({"produit_id": pid, "conditionnement_id": ctx["cond_caisse"], "quantite_unites": Decimal("12"), "prix_vente_ttc": (prix_vente * 12 * Decimal("0.95")).quantize(Decimal("1"))})
+        if 2 <= g < 15:
+            rows[VarianteProduit.__tablename__].append({"produit_id": pid, "code": f"VAR-{code}-1", "libelle": "Nature", "prix_ttc_supplement": Decimal("0"), "stock_separe": False, "actif": True})
+    return rows
+
+
+def _gen_clients(task: dict) -> Rows:
+    rng, fk = _rng(task, "clients")
+    ctx = task["ctx"]
+    rows: Rows = {Tiers.__tablename__: [], Contact.__tablename__: []}
+    for g in range(task["start"], task["start"] + task["count"]):
+        i = g + 1
+        tid = ctx["ids"]["clients"] + g
+        ville, region = rng.choice(VILLES_REGIONS_CMR)
+        rows[Tiers.__tablename__].append({
+            "id": tid, "entreprise_id": ctx["entreprise"], "type_tiers_id": ctx["type_client"], "code": f"CLI-{i:05d}",
+            "raison_sociale": _raison_sociale_client_bazard(rng, fk)[:255],
+            "niu": _niu_cameroun(rng) if i % 3 != 0 else None,
+            "adresse": fk.street_address()[:200] if i % 2 == 0 else None,
+            "ville": ville, "region": region, "pays": "CMR", "telephone": _phone_cmr(rng),
+            "email": fk.company_email() if i % 4 != 0 else None,
+            "canal_vente_id": ctx["canal_gros"] if i % 3 == 0 else ctx["canal_det"],
+            "limite_credit": Decimal(str(rng.choice([0, 500000, 1000000, 5000000]))),
+            "delai_paiement_jours": rng.choice([0, 7, 15, 30, 45, 60]),
+            "mobile_money_numero": f"6{rng.randint(70000000, 79999999):08d}" if i % 2 == 0 else None,
+            "mobile_money_operateur": rng.choice(OPERATEURS_MOMO) if i % 2 == 0 else None,
+            "actif": True,
+        })
+        if g < 60:
+            rows[Contact.__tablename__].append({"tiers_id": tid, "nom": fk.last_name(), "prenom": fk.first_name(), "fonction": rng.choice(["Acheteur", "Directeur", "Gérant", "Responsable"]), "telephone": _phone_cmr(rng), "est_principal": (g == 0), "actif": True})
+    return rows
+
+
+def _gen_fournisseurs(task: dict) -> Rows:
+    rng, fk = _rng(task, "fournisseurs")
+    ctx = task["ctx"]
+    rows: Rows = {Tiers.__tablename__: [], Contact.__tablename__: []}
+    for g in range(task["start"], task["start"] + task["count"]):
+        tid = ctx["ids"]["fournisseurs"] + g
+        ville, region = rng.choice(VILLES_REGIONS_CMR)
+        rows[Tiers.__tablename__].append({
+            "id": tid, "entreprise_id": ctx["entreprise"], "type_tiers_id": ctx["type_fourn"], "code": f"FOU-{g + 1:05d}",
+            "raison_sociale": _raison_sociale_fournisseur(rng, fk)[:255],
+            "niu": _niu_cameroun(rng), "ville": ville, "region": region, "pays": "CMR",
+            "telephone": _phone_cmr(rng), "delai_paiement_jours": rng.choice([30, 45, 60]), "actif": True,
+        })
+        if g < 25:
+            rows[Contact.__tablename__].append({"tiers_id": tid, "nom": fk.last_name(), "prenom": fk.first_name(), "fonction": "Commercial", "telephone": _phone_cmr(rng), "est_principal": True, "actif": True})
+    return rows
+
+
+def _client_alea(rng: random.Random, ctx: dict, vol: dict) -> int:
+    return ctx["ids"]["clients"] + rng.randrange(vol["clients"])
+
+
+def _gen_devis(task: dict) -> Rows:
+    rng, _ = _rng(task, "devis")
+    ctx, vol = task["ctx"], task["vol"]
+    rows: Rows = {Devis.__tablename__: []}
+    for g in range(task["start"], task["start"] + task["count"]):
+        _, an, debut_an, fin_an = _annee(ctx, g, vol["devis_par_an"])
+        dt = _date_alea(rng, debut_an, fin_an)
+        mt_ht = Decimal(str(rng.randint(8000, 3500000)))
+        mt_tva, mt_ttc = _tva(mt_ht)
+        rows[Devis.__tablename__].append({
+            "id": ctx["ids"]["devis"] + g, "entreprise_id": ctx["entreprise"], "point_de_vente_id": ctx["pdv_principal"],
+            "client_id": _client_alea(rng, ctx, vol), "numero": f"DEV-{an}-{g + 1:05d}", "date_devis": dt,
+            "date_validite": dt + timedelta(days=30), "etat_id": ctx["etat_devis_valide"], "montant_ht": mt_ht,
+            "montant_tva": mt_tva, "montant_ttc": mt_ttc, "devise_id": ctx["xaf"], "taux_change": Decimal("1"),
+        })
+    return rows
+
+
+def _gen_commandes(task: dict) -> Rows:
+    rng, _ = _rng(task, "commandes")
+    ctx, vol = task["ctx"], task["vol"]
+    rows: Rows = {Commande.__tablename__: []}
+    for g in range(task["start"], task["start"] + task["count"]):
+        idx, an, debut_an, fin_an = _annee(ctx, g, vol["commandes_par_an"])
+        dt = _date_alea(rng, debut_an, fin_an)
+        # Devis de l'année en cours ou des précédentes
+        devis_id = ctx["ids"]["devis"] + rng.randrange((idx + 1) * vol["devis_par_an"]) if rng.random() > 0.3 else None
+        mt_ht = Decimal(str(rng.randint(10000, 3000000)))
+        mt_tva, mt_ttc = _tva(mt_ht)
+        rows[Commande.__tablename__].append({
+            "id": ctx["ids"]["commandes"] + g, "entreprise_id": ctx["entreprise"], "point_de_vente_id": ctx["pdv_principal"],
+            "client_id": _client_alea(rng, ctx, vol), "devis_id": devis_id, "numero": f"CDE-{an}-{g + 1:05d}",
+            "date_commande": dt, "date_livraison_prevue": dt + timedelta(days=rng.randint(3, 14)), "etat_id": ctx["etat_cde_valide"],
+            "montant_ht": mt_ht, "montant_tva": mt_tva, "montant_ttc": mt_ttc, "devise_id": ctx["xaf"],
+            "adresse_livraison": f"{rng.choice(VILLES_REGIONS_CMR)[0]}, CMR",
+        })
+    return rows
+
+
+def _reglements_client(rng: random.Random, ctx: dict, fac: dict, montant_total: Decimal, date_regl: date) -> list[dict]:
+    """Un ou deux règlements : cash seul, mobile seul (MTN ou Orange), ou cash + mobile avec montants."""
+    if montant_total <= 0:
+        return []
+    base = {"entreprise_id": ctx["entreprise"], "type_reglement": "client", "facture_id": fac["id"], "tiers_id": fac["client_id"], "date_reglement": date_regl, "compte_tresorerie_id": ctx["cpte_caisse"], "created_by_id": ctx["user_admin"]}
+    mtn = lambda: f"MTN 6{rng.randint(70000000, 79999999):08d}"  # noqa: E731
+    orange = lambda: f"OM 6{rng.randint(69000000, 69999999):08d}"  # noqa: E731
+    choix = rng.choice(["cash", "mobile_mtn", "mobile_orange", "cash_et_mobile"])
+    if choix == "cash":
+        return [dict(base, montant=montant_total, mode_paiement_id=ctx["mode_esp"], reference=None)]
+    if choix == "mobile_mtn":
+        return [dict(base, montant=montant_total, mode_paiement_id=ctx["mode_mtn"], reference=mtn())]
+    if choix == "mobile_orange":
+        return [dict(base, montant=montant_total, mode_paiement_id=ctx["mode_orange"], reference=orange())]
+    # Cash + Mobile : répartition des montants (ex. 40% cash, 60% mobile)
+    part_cash = (montant_total * Decimal(str(rng.uniform(0.2, 0.8)))).quantize(Decimal("0.01"))
+    part_mobile = montant_total - part_cash
+    out = []
+    if part_cash > 0:
+        out.append(dict(base, montant=part_cash, mode_paiement_id=ctx["mode_esp"], reference="Espèces"))
+    if part_mobile > 0:
+        op = rng.choice(["MTN", "Orange"])
+        ref = mtn() if op == "MTN" else orange()
+        out.append(dict(base, montant=part_mobile, mode_paiement_id=ctx["mode_mtn"] if op == "MTN" else ctx["mode_orange"], reference=ref))
+    return out
+
+
+def _gen_factures(task: dict) -> Rows:
+    """Factures avec leurs BL, règlements (premières factures) et écritures de vente."""
+    rng, _ = _rng(task, "factures")
+    ctx, vol = task["ctx"], task["vol"]
+    ids = ctx["ids"]
+    rows: Rows = {
+        Facture.__tablename__: [], BonLivraison.__tablename__: [], Reglement.__tablename__: [],
+        EcritureComptable.__tablename__: [], LigneEcriture.__tablename__: [],
+    }
+    for g in range(task["start"], task["start"] + task["count"]):
+        idx, an, debut_an, fin_an = _annee(ctx, g, vol["factures_par_an"])
+        dt = _date_alea(rng, debut_an, fin_an)
+        commande_id = ids["commandes"] + rng.randrange((idx + 1) * vol["commandes_par_an"]) if rng.random() > 0.2 else None
+        mt_ht = Decimal(str(rng.randint(12000, 2800000)))
+        mt_tva, mt_ttc = _tva(mt_ht)
+        fac = {
+            "id": ids["factures"] + g, "entreprise_id": ctx["entreprise"], "point_de_vente_id": ctx["pdv_principal"],
+            "client_id": _client_alea(rng, ctx, vol), "commande_id": commande_id, "numero": f"FAC-{an}-{g + 1:05d}",
+            "date_facture": dt, "date_echeance": dt + timedelta(days=rng.choice([30, 45, 60])), "etat_id": ctx["etat_fact_valide"],
+            "type_facture": "facture", "montant_ht": mt_ht, "montant_tva": mt_tva, "montant_ttc": mt_ttc,
+            "montant_restant_du": mt_ttc if rng.random() > 0.4 else Decimal("0"), "devise_id": ctx["xaf"],
+        }
+        rows[Facture.__tablename__].append(fac)
+        rows[BonLivraison.__tablename__].append({
+            "entreprise_id": ctx["entreprise"], "point_de_vente_id": ctx["pdv_principal"], "client_id": fac["client_id"],
+            "commande_id": commande_id, "facture_id": fac["id"], "numero": f"BL-{an}-{g + 1:05d}",
+            "date_livraison": dt + timedelta(days=rng.randint(0, 3)), "adresse_livraison": "Livraison client", "etat_id": ctx["etat_bl_valide"],
+        })
+        if g == 0:
+            rows[Reglement.__tablename__].append({
+                "entreprise_id": ctx["entreprise"], "type_reglement": "client", "facture_id": fac["id"], "tiers_id": fac["client_id"],
+                "montant": Decimal("10000"), "date_reglement": dt + timedelta(days=5), "mode_paiement_id": ctx["mode_mtn"],
+                "compte_tresorerie_id": ctx["cpte_caisse"], "reference": "MTN 670000001", "created_by_id": ctx["user_admin"],
+            })
+        elif g < vol["reglements"] and rng.random() > 0.5:
+            montant = mt_ttc if rng.random() > 0.3 else (mt_ttc * Decimal(str(rng.uniform(0.3, 0.9)))).quantize(Decimal("0.01"))
+            rows[Reglement.__tablename__].extend(_reglements_client(rng, ctx, fac, montant, dt + timedelta(days=rng.randint(1, 60))))
+        if g < vol["ecritures"]:
+            eid = ids["ecritures"] + g
+            periodes = ctx["periodes_compta"]
+            rows[EcritureComptable.__tablename__].append({
+                "id": eid, "entreprise_id": ctx["entreprise"], "journal_id": ctx["journal_vt"], "periode_id": periodes[idx % len(periodes)],
+                "date_ecriture": dt, "numero_piece": fac["numero"], "libelle": "Vente " + fac["numero"], "created_by_id": ctx["user_admin"],
+            })
+            rows[LigneEcriture.__tablename__].append({"ecriture_id": eid, "compte_id": ctx["cpt_411"], "libelle_ligne": "Client", "debit": mt_ttc, "credit": Decimal("0")})
+            rows[LigneEcriture.__tablename__].append({"ecriture_id": eid, "compte_id": ctx["cpt_711"], "libelle_ligne": "Ventes", "debit": Decimal("0"), "credit": mt_ttc})
+    return rows
+
+
+def _gen_achats(task: dict) -> Rows:
+    """Commandes fournisseurs, réceptions et factures fournisseurs (1:1:1), mouvements des premières réceptions."""
+    rng, _ = _rng(task, "achats")
+    ctx, vol = task["ctx"], task["vol"]
+    ids = ctx["ids"]
+    rows: Rows = {
+        CommandeFournisseur.__tablename__: [], Reception.__tablename__: [],
+        FactureFournisseur.__tablename__: [], MouvementStock.__tablename__: [],
+    }
+    for g in range(task["start"], task["start"] + task["count"]):
+        _, an, debut_an, fin_an = _annee(ctx, g, vol["cf_par_an"])
+        dt = _date_alea(rng, debut_an, fin_an)
+        mt_ht = Decimal(str(rng.randint(50000, 4000000)))
+        mt_tva, mt_ttc = _tva(mt_ht)
+        cf_id, rec_id = ids["commandes_fournisseurs"] + g, ids["receptions"] + g
+        fournisseur_id = ids["fournisseurs"] + rng.randrange(vol["fournisseurs"])
+        rows[CommandeFournisseur.__tablename__].append({
+            "id": cf_id, "entreprise_id": ctx["entreprise"], "fournisseur_id": fournisseur_id, "depot_id": ctx["depot"],
+            "numero": f"CF-{an}-{g + 1:05d}", "numero_fournisseur": f"CF-EXT-{an}-{g + 1}", "date_commande": dt,
+            "date_livraison_prevue": dt + timedelta(days=rng.randint(5, 20)), "etat_id": ctx["etat_cde_valide"],
+            "montant_ht": mt_ht, "montant_tva": mt_tva, "montant_ttc": mt_ttc, "devise_id": ctx["xaf"],
+        })
+        rows[Reception.__tablename__].append({
+            "id": rec_id, "commande_fournisseur_id": cf_id, "depot_id": ctx["depot"], "numero": f"REC-{an}-{g + 1:05d}",
+            "date_reception": dt + timedelta(days=rng.randint(2, 10)), "etat": "validee",
+        })
+        statut = rng.choice(["non_paye", "non_paye", "partiel", "paye"])
+        restant = mt_ttc if statut != "paye" else Decimal("0")
+        if statut == "partiel":
+            restant = (mt_ttc * Decimal("0.4")).quantize(Decimal("0.01"))
+        rows[FactureFournisseur.__tablename__].append({
+            "entreprise_id": ctx["entreprise"], "fournisseur_id": fournisseur_id, "commande_fournisseur_id": cf_id,
+            "numero_fournisseur": f"FAC-{an}-{g + 1:05d}", "date_facture": dt + timedelta(days=rng.randint(5, 15)),
+            "date_echeance": dt + timedelta(days=rng.randint(45, 90)), "montant_ht": mt_ht, "montant_tva": mt_tva, "montant_ttc": mt_ttc,
+            "montant_restant_du": restant, "devise_id": ctx["xaf"], "statut_paiement": statut,
+        })
+        if g < vol["mouvements"]:
+            for _ in range(rng.randint(1, 4)):
+                rows[MouvementStock.__tablename__].append({
+                    "type_mouvement": "entree", "depot_id": ctx["depot"], "produit_id": ids["produits"] + rng.randrange(vol["produits"]),
+                    "variante_id": None, "quantite": Decimal(str(rng.randint(10, 200))), "reference_type": "reception",
+                    "reference_id": rec_id, "notes": "Réception fournisseur", "created_by_id": ctx["user_admin"],
+                })
+    return rows
+
+
+def _tasks(step: str, total: int, batch: int, seed: int, ctx: dict, vol: dict) -> list[dict]:
+    return [
+        {"step": step, "chunk": n, "start": start, "count": min(batch, total - start), "seed": seed, "ctx": ctx, "vol": vol}
+        for n, start in enumerate(range(0, total, batch))
+    ]
+
 
-async def run_seed(session: AsyncSession) -> None:
-    """Seed complet : entreprise Bazard, Faker, période 3 ans, volume selon SEED_MODE."""
-    # Base déjà seedée ? (évite doublon si on relance par erreur)
-    existing = await session.execute(select(Devise).where(Devise.code == "XAF").limit(1))
-    if existing.scalar_one_or_none() is not None:
-        print("Base deja seedee (devise XAF presente). Pour repartir de zero : fermez l'app, supprimez app/db/gesco.db, relancez 'alembic upgrade head' puis ce script.")
+def _generated(executor: Executor | None, fn: Callable[[dict], Rows], tasks: list[dict], window: int) -> Iterator[tuple[dict, Rows]]:
+    """Lots générés dans l'ordre des tâches ; au plus `window` lots en avance (mémoire bornée)."""
+    if executor is None:
+        for task in tasks:
+            yield task, fn(task)
         return
+    pending = []
+    for task in tasks:
+        pending.append((task, executor.submit(fn, task)))
+        if len(pending) >= window:
+            head, future = pending.pop(0)
+            yield head, future.result()
+    for head, future in pending:
+        yield head, future.result()
+
+
+async def _run_chunked(engine, executor, done: dict, step: str, fn, total: int, seed: int, ctx: dict, vol: dict, window: int) -> None:
+    """Génère et insère les lots d'une étape ; chaque lot est commité avec sa marque d'avancement."""
+    tasks = [t for t in _tasks(step, total, vol["batch"], seed, ctx, vol) if f"{step}:{t['chunk']}" not in done]
+    if not tasks:
+        return
+    loop = asyncio.get_running_loop()
+    iterator = _generated(executor, fn, tasks, window)
+    n_rows = 0
+    while True:
+        # La génération bloque (attente des workers) : hors de la boucle d'événements
+        item = await loop.run_in_executor(None, next, iterator, None)
+        if item is None:
+            break
+        task, rows = item
+        async with engine.begin() as conn:
+            await _insert_rows(conn, rows)
+            await _mark(conn, f"{step}:{task['chunk']}")
+        n_rows += sum(len(r) for r in rows.values())
+    print(f"  {step:<12} {n_rows:>9} lignes ({len(tasks)} lots)")
+
+
+# =============================================================================
+# Étapes exécutées dans le processus principal
+# =============================================================================
+
+async def _seed_referentiels(session: AsyncSession, seed: int, vol: dict) -> dict:
+    """Référentiels et paramétrage (ORM, quelques centaines de lignes) ; renvoie le contexte d'ids."""
+    rng = random.Random(f"{seed}:referentiels")
+    fk = Faker("fr_FR")
+    fk.seed_instance(f"{seed}:referentiels")
+    date_debut, date_fin = _periode()
+    annee_debut, annee_fin = date_debut.year, date_fin.year
+
     # ----- 1. Référentiels globaux -----
     devises = [
         Devise(code="XAF", libelle="Franc CFA (CEMAC)", symbole="FCFA", decimales=0, actif=True),
         Devise(code="EUR", libelle="Euro", symbole="€", decimales=2, actif=True),
         Devise(code="USD", libelle="Dollar US", symbole="$", decimales=2, actif=True),
     ]
-    for d in devises:
-        session.add(d)
-    await session.flush()
-
     unites = [
         UniteMesure(code="PCE", libelle="Pièce", symbole="pce", type="unite", actif=True),
         UniteMesure(code="KG", libelle="Kilogramme", symbole="kg", type="poids", actif=True),
         UniteMesure(code="L", libelle="Litre", symbole="L", type="volume", actif=True),
         UniteMesure(code="CARTON", libelle="Carton", symbole="ct", type="unite", actif=True),
     ]
-    for u in unites:
-        session.add(u)
-    await session.flush()
-
     taux_tva = [
         TauxTva(code="TVA0", taux=Decimal("0"), libelle="Exonéré", actif=True),
         TauxTva(code="TVA19", taux=Decimal("19.25"), libelle="TVA 19,25% CGI", actif=True),
     ]
-    for t in taux_tva:
-        session.add(t)
+    session.add_all(devises + unites + taux_tva)
     await session.flush()
-
     xaf_id = next(d.id for d in devises if d.code == "XAF")
     eur_id = next(d.id for d in devises if d.code == "EUR")
-    for an in range(ANNEE_DEBUT, ANNEE_FIN + 1):
-        session.add(TauxChange(devise_from_id=eur_id, devise_to_id=xaf_id, taux=655.957 + (an - ANNEE_DEBUT) * 2, date_effet=date(an, 1, 1)))
-    await session.flush()
+    for an in range(annee_debut, annee_fin + 1):
+        session.add(TauxChange(devise_from_id=eur_id, devise_to_id=xaf_id, taux=655.957 + (an - annee_debut) * 2, date_effet=date(an, 1, 1)))
 
     # ----- 2. Entreprise : Bazard (commerce détail varié) -----
     ent = Entreprise(
         code="BAZARD-BON",
         raison_sociale="Bazard du Marché Bonabéri",
         sigle="BAZARD BONABÉRI",
-        niu=_niu_cameroun(),
+        niu=_niu_cameroun(rng),
         regime_fiscal="reel_simplifie",
         mode_gestion="standard",
         adresse="Marché Bonabéri, face gare routière",
@@ -254,11 +648,8 @@ async def run_seed(session: AsyncSession) -> None:
         latitude=Decimal("4.081200"), longitude=Decimal("9.672100"),
         est_depot=True, actif=True,
     )
-    session.add(pdv_principal)
-    session.add(pdv_depot)
+    session.add_all([pdv_principal, pdv_depot])
     await session.flush()
-    pdv_principal_id = pdv_principal.id
-    pdv_depot_id = pdv_depot.id
 
     # ----- 4. Rôles et permissions -----
     perms_data = [
@@ -269,162 +660,51 @@ async def run_seed(session: AsyncSession) -> None:
         ("comptabilite", "read", "Comptabilité - Lecture"), ("comptabilite", "write", "Comptabilité - Écriture"),
         ("rh", "read", "RH - Lecture"), ("rh", "write", "RH - Écriture"),
     ]
-    permissions = []
-    for mod, act, lib in perms_data:
-        p = Permission(module=mod, action=act, libelle=lib)
-        session.add(p)
-        permissions.append(p)
-    await session.flush()
-
+    permissions = [Permission(module=mod, action=act, libelle=lib) for mod, act, lib in perms_data]
     role_admin = Role(entreprise_id=ent_id, code="ADMIN", libelle="Administrateur")
     role_compta = Role(entreprise_id=ent_id, code="COMPTA", libelle="Comptable")
     role_commercial = Role(entreprise_id=ent_id, code="COMMERCIAL", libelle="Commercial")
-    for r in (role_admin, role_compta, role_commercial):
-        session.add(r)
+    session.add_all(permissions + [role_admin, role_compta, role_commercial])
     await session.flush()
     for p in permissions:
         session.add(PermissionRole(role_id=role_admin.id, permission_id=p.id))
-    for p in permissions:
         if p.module in ("comptabilite", "parametrage") and p.action == "read":
             session.add(PermissionRole(role_id=role_compta.id, permission_id=p.id))
-    await session.flush()
 
     # ----- 5. Utilisateurs -----
     pwd_hash = hash_password("gesco@1234")
     user_admin = Utilisateur(
-        entreprise_id=ent_id, point_de_vente_id=pdv_principal_id, role_id=role_admin.id,
+        entreprise_id=ent_id, point_de_vente_id=pdv_principal.id, role_id=role_admin.id,
         login="admin", mot_de_passe_hash=pwd_hash, email="admin@bazard-bonaberi.cm",
-        nom=FAKER.last_name(), prenom=FAKER.first_name(), telephone=_phone_cmr(), actif=True,
+        nom=fk.last_name(), prenom=fk.first_name(), telephone=_phone_cmr(rng), actif=True,
     )
     user_compta = Utilisateur(
-        entreprise_id=ent_id, point_de_vente_id=pdv_principal_id, role_id=role_compta.id,
+        entreprise_id=ent_id, point_de_vente_id=pdv_principal.id, role_id=role_compta.id,
         login="compta", mot_de_passe_hash=pwd_hash, email="compta@bazard-bonaberi.cm",
-        nom=FAKER.last_name(), prenom=FAKER.first_name(), actif=True,
+        nom=fk.last_name(), prenom=fk.first_name(), actif=True,
     )
-    session.add(user_admin)
-    session.add(user_compta)
-    await session.flush()
-    session.add(AffectationUtilisateurPdv(utilisateur_id=user_admin.id, point_de_vente_id=pdv_principal_id, est_principal=True))
-    session.add(AffectationUtilisateurPdv(utilisateur_id=user_compta.id, point_de_vente_id=pdv_principal_id, est_principal=True))
+    session.add_all([user_admin, user_compta])
     await session.flush()
+    session.add(AffectationUtilisateurPdv(utilisateur_id=user_admin.id, point_de_vente_id=pdv_principal.id, est_principal=True))
+    session.add(AffectationUtilisateurPdv(utilisateur_id=user_compta.id, point_de_vente_id=pdv_principal.id, est_principal=True))
 
-    # ----- 6. Catalogue : familles (bazard), conditionnements, canaux, produits -----
+    # ----- 6. Catalogue : familles (bazard), conditionnements, canaux -----
     familles_data = [
         ("ALIM", "Alimentaire", 1), ("BOIS", "Boissons", 2), ("HYG", "Hygiène", 3),
         ("CONS", "Conserves", 4), ("LAIT", "Laitiers", 5), ("EPIC", "Epicerie", 6), ("QUIN", "Quincaillerie", 7),
     ]
-    familles = []
-    for code, lib, ord in familles_data:
-        f = FamilleProduit(entreprise_id=ent_id, parent_id=None, code=code, libelle=lib, niveau=1, ordre_affichage=ord, actif=True)
-        session.add(f)
-        familles.append(f)
-    await session.flush()
-
+    familles = [
+        FamilleProduit(entreprise_id=ent_id, parent_id=None, code=code, libelle=lib, niveau=1, ordre_affichage=ordre, actif=True)
+        for code, lib, ordre in familles_data
+    ]
     cond_caisse = Conditionnement(entreprise_id=ent_id, code="CAISSE12", libelle="Caisse de 12", quantite_unites=Decimal("12"), unite_id=unites[0].id, actif=True)
     cond_carton = Conditionnement(entreprise_id=ent_id, code="CARTON24", libelle="Carton 24", quantite_unites=Decimal("24"), unite_id=unites[3].id, actif=True)
-    session.add(cond_caisse)
-    session.add(cond_carton)
-    await session.flush()
-
     canal_det = CanalVente(entreprise_id=ent_id, code="DET", libelle="Détail", ordre=1, actif=True)
     canal_gros = CanalVente(entreprise_id=ent_id, code="GROS", libelle="Gros", ordre=2, actif=True)
-    session.add(canal_det)
-    session.add(canal_gros)
-    await session.flush()
-
-    tva19_id = next(t.id for t in taux_tva if t.code == "TVA19")
-    tva0_id = next(t.id for t in taux_tva if t.code == "TVA0")
-    produits = []
-    for i in range(1, N_PRODUITS + 1):
-        lib = _libelle_produit_bazard()
-        famille = random.choice(familles)
-        unite = random.choice(unites)
-        prix_achat = Decimal(str(random.randint(100, 12000)))
-        marge = Decimal(str(random.uniform(1.12, 1.40)))
-        prix_vente = (prix_achat * marge).quantize(Decimal("1"))
-        pr = Produit(
-            entreprise_id=ent_id, famille_id=famille.id, code="PROD-{:05d}".format(i),
-            code_barre="613{:010d}".format(i) if i % 2 == 0 else None,
-            libelle=lib[:255], type="produit", unite_vente_id=unite.id, unite_achat_id=unite.id,
-            coefficient_achat_vente=Decimal("1"), prix_achat_ht=prix_achat, prix_vente_ttc=prix_vente,
-            taux_tva_id=tva19_id if i % 5 != 0 else tva0_id,
-            seuil_alerte_min=Decimal(str(random.randint(5, 50))), gerer_stock=True, actif=True,
-        )
-        session.add(pr)
-        produits.append(pr)
-        if (i % BATCH_FLUSH) == 0:
-            await session.flush()
-    await session.flush()
 
-    for pr in produits[: min(25, len(produits))]:
-        session.add(ProduitConditionnement(produit_id=pr.id, conditionnement_id=cond_caisse.id, quantite_unites=Decimal("12"), prix_vente_ttc=(pr.prix_vente_ttc * 12 * Decimal("0.95")).quantize(Decimal("1"))))
-    await session.flush()
-
-    date_debut_prix = DATE_DEBUT
-    for pr in produits:
-        session.add(PrixProduit(produit_id=pr.id, canal_vente_id=canal_det.id, prix_ttc=pr.prix_vente_ttc, date_debut=date_debut_prix))
-        if pr.id % BATCH_FLUSH == 0:
-            await session.flush()
-    await session.flush()
-
-    for pr in produits[2: min(15, len(produits))]:
-        session.add(VarianteProduit(produit_id=pr.id, code="VAR-{}-1".format(pr.code), libelle="Nature", prix_ttc_supplement=Decimal("0"), stock_separe=False, actif=True))
-    await session.flush()
-
-    # ----- 7. Partenaires : clients et fournisseurs (Faker) -----
+    # ----- 7. Types de tiers, 8. États document, 10. Dépôt -----
     type_client = TypeTiers(code="CLI", libelle="Client")
     type_fourn = TypeTiers(code="FOU", libelle="Fournisseur")
-    session.add(type_client)
-    session.add(type_fourn)
-    await session.flush()
-
-    clients = []
-    for i in range(1, N_CLIENTS + 1):
-        ville, region = random.choice(VILLES_REGIONS_CMR)
-        t = Tiers(
-            entreprise_id=ent_id, type_tiers_id=type_client.id, code="CLI-{:05d}".format(i),
-            raison_sociale=_raison_sociale_client_bazard()[:255],
-            niu=_niu_cameroun() if i % 3 != 0 else None,
-            adresse=FAKER.street_address()[:200] if i % 2 == 0 else None,
-            ville=ville, region=region, pays="CMR", telephone=_phone_cmr(),
-            email=FAKER.company_email() if i % 4 != 0 else None,
-            canal_vente_id=canal_gros.id if i % 3 == 0 else canal_det.id,
-            limite_credit=Decimal(str(random.choice([0, 500000, 1000000, 5000000]))),
-            delai_paiement_jours=random.choice([0, 7, 15, 30, 45, 60]),
-            mobile_money_numero="6{:08d}".format(random.randint(70000000, 79999999)) if i % 2 == 0 else None,
-            mobile_money_operateur=random.choice(OPERATEURS_MOMO) if i % 2 == 0 else None,
-            actif=True,
-        )
-        session.add(t)
-        clients.append(t)
-        if (i % BATCH_FLUSH) == 0:
-            await session.flush()
-    await session.flush()
-
-    fournisseurs = []
-    for i in range(1, N_FOURNISSEURS + 1):
-        ville, region = random.choice(VILLES_REGIONS_CMR)
-        t = Tiers(
-            entreprise_id=ent_id, type_tiers_id=type_fourn.id, code="FOU-{:05d}".format(i),
-            raison_sociale=_raison_sociale_fournisseur()[:255],
-            niu=_niu_cameroun(), ville=ville, region=region, pays="CMR",
-            telephone=_phone_cmr(), delai_paiement_jours=random.choice([30, 45, 60]), actif=True,
-        )
-        session.add(t)
-        fournisseurs.append(t)
-    await session.flush()
-    client1_id = clients[0].id
-    fourn1_id = fournisseurs[0].id
-
-    n_contacts_cli = min(60, len(clients))
-    for i in range(n_contacts_cli):
-        c = clients[i]
-        session.add(Contact(tiers_id=c.id, nom=FAKER.last_name(), prenom=FAKER.first_name(), fonction=random.choice(["Acheteur", "Directeur", "Gérant", "Responsable"]), telephone=_phone_cmr(), est_principal=(i == 0), actif=True))
-    for i, f in enumerate(fournisseurs[: min(25, len(fournisseurs))]):
-        session.add(Contact(tiers_id=f.id, nom=FAKER.last_name(), prenom=FAKER.first_name(), fonction="Commercial", telephone=_phone_cmr(), est_principal=True, actif=True))
-    await session.flush()
-
-    # ----- 8. États document -----
     etats = [
         EtatDocument(type_document="devis", code="BROUILLON", libelle="Brouillon", ordre=0),
         EtatDocument(type_document="devis", code="VALIDE", libelle="Validé", ordre=1),
@@ -433,178 +713,17 @@ async def run_seed(session: AsyncSession) -> None:
         EtatDocument(type_document="facture", code="VALIDE", libelle="Validé", ordre=1),
         EtatDocument(type_document="bon_livraison", code="VALIDE", libelle="Validé", ordre=1),
     ]
-    for e in etats:
-        session.add(e)
-    await session.flush()
-    etat_devis_valide = next(e.id for e in etats if e.type_document == "devis" and e.code == "VALIDE")
-    etat_cde_valide = next(e.id for e in etats if e.type_document == "commande" and e.code == "VALIDE")
-    etat_fact_valide = next(e.id for e in etats if e.type_document == "facture" and e.code == "VALIDE")
-    etat_bl_valide = next(e.id for e in etats if e.type_document == "bon_livraison" and e.code == "VALIDE")
-
-    # ----- 9. Commercial : devis, commandes, factures, BL (3 ans, batch) -----
-    devis_list, commande_list, facture_list, bl_list = [], [], [], []
-    seq_devis, seq_cde, seq_fac, seq_bl = 0, 0, 0, 0
-    for an in range(ANNEE_DEBUT, ANNEE_FIN + 1):
-        debut_an = date(an, 1, 1)
-        fin_an = date(an, 12, 31)
-        n_devis = N_DEVIS_PAR_AN
-        n_cde = N_COMMANDES_PAR_AN
-        n_fac = N_FACTURES_PAR_AN
-
-        for _ in range(n_devis):
-            seq_devis += 1
-            dt = _date_alea(debut_an, fin_an)
-            client = random.choice(clients)
-            mt_ht = Decimal(str(random.randint(8000, 3500000)))
-            mt_tva = (mt_ht * Decimal("0.1925")).quantize(Decimal("0.01"))
-            mt_ttc = mt_ht + mt_tva
-            dev = Devis(entreprise_id=ent_id, point_de_vente_id=pdv_principal_id, client_id=client.id, numero="DEV-{}-{:05d}".format(an, seq_devis), date_devis=dt, date_validite=dt + timedelta(days=30), etat_id=etat_devis_valide, montant_ht=mt_ht, montant_tva=mt_tva, montant_ttc=mt_ttc, devise_id=xaf_id, taux_change=Decimal("1"))
-            session.add(dev)
-            devis_list.append(dev)
-            if len(devis_list) % BATCH_FLUSH == 0:
-                await session.flush()
-        await session.flush()
-
-        for _ in range(n_cde):
-            seq_cde += 1
-            dt = _date_alea(debut_an, fin_an)
-            client = random.choice(clients)
-            dev_ref = random.choice(devis_list) if devis_list and random.random() > 0.3 else None
-            mt_ht = Decimal(str(random.randint(10000, 3000000)))
-            mt_tva = (mt_ht * Decimal("0.1925")).quantize(Decimal("0.01"))
-            mt_ttc = mt_ht + mt_tva
-            cmd = Commande(entreprise_id=ent_id, point_de_vente_id=pdv_principal_id, client_id=client.id, devis_id=dev_ref.id if dev_ref else None, numero="CDE-{}-{:05d}".format(an, seq_cde), date_commande=dt, date_livraison_prevue=dt + timedelta(days=random.randint(3, 14)), etat_id=etat_cde_valide, montant_ht=mt_ht, montant_tva=mt_tva, montant_ttc=mt_ttc, devise_id=xaf_id, adresse_livraison="{}, CMR".format(random.choice(VILLES_REGIONS_CMR)[0]))
-            session.add(cmd)
-            commande_list.append(cmd)
-            if len(commande_list) % BATCH_FLUSH == 0:
-                await session.flush()
-        await session.flush()
-
-        for _ in range(n_fac):
-            seq_fac += 1
-            dt = _date_alea(debut_an, fin_an)
-            client = random.choice(clients)
-            cmd_ref = random.choice(commande_list) if commande_list and random.random() > 0.2 else None
-            mt_ht = Decimal(str(random.randint(12000, 2800000)))
-            mt_tva = (mt_ht * Decimal("0.1925")).quantize(Decimal("0.01"))
-            mt_ttc = mt_ht + mt_tva
-            restant = mt_ttc if random.random() > 0.4 else Decimal("0")
-            fac = Facture(entreprise_id=ent_id, point_de_vente_id=pdv_principal_id, client_id=client.id, commande_id=cmd_ref.id if cmd_ref else None, numero="FAC-{}-{:05d}".format(an, seq_fac), date_facture=dt, date_echeance=dt + timedelta(days=random.choice([30, 45, 60])), etat_id=etat_fact_valide, type_facture="facture", montant_ht=mt_ht, montant_tva=mt_tva, montant_ttc=mt_ttc, montant_restant_du=restant, devise_id=xaf_id)
-            session.add(fac)
-            facture_list.append(fac)
-            if len(facture_list) % BATCH_FLUSH == 0:
-                await session.flush()
-        await session.flush()
-
-        for fac in facture_list[-n_fac:]:
-            seq_bl += 1
-            bl = BonLivraison(entreprise_id=ent_id, point_de_vente_id=pdv_principal_id, client_id=fac.client_id, commande_id=fac.commande_id, facture_id=fac.id, numero="BL-{}-{:05d}".format(an, seq_bl), date_livraison=fac.date_facture + timedelta(days=random.randint(0, 3)), adresse_livraison="Livraison client", etat_id=etat_bl_valide)
-            session.add(bl)
-            bl_list.append(bl)
-        await session.flush()
-
-    devis = devis_list[0]
-    commande = commande_list[0]
-    facture = facture_list[0]
-
-    # ----- 10. Achats : dépôt, commandes fournisseurs, réceptions, factures fournisseurs -----
-    depot = Depot(entreprise_id=ent_id, code="DEP-01", libelle="Entrepôt Bonabéri", point_de_vente_id=pdv_depot_id)
-    session.add(depot)
-    await session.flush()
-    etat_cde_fou = next(e.id for e in etats if e.type_document == "commande" and e.code == "VALIDE")
-    cf_list, recept_list, fact_fou_list = [], [], []
-    seq_cf, seq_rec, seq_ff = 0, 0, 0
-    for an in range(ANNEE_DEBUT, ANNEE_FIN + 1):
-        debut_an, fin_an = date(an, 1, 1), date(an, 12, 31)
-        for _ in range(N_CF_FOURNISSEUR_PAR_AN):
-            seq_cf += 1
-            fourn = random.choice(fournisseurs)
-            dt = _date_alea(debut_an, fin_an)
-            mt_ht = Decimal(str(random.randint(50000, 4000000)))
-            mt_tva = (mt_ht * Decimal("0.1925")).quantize(Decimal("0.01"))
-            mt_ttc = mt_ht + mt_tva
-            cde_fou = CommandeFournisseur(entreprise_id=ent_id, fournisseur_id=fourn.id, depot_id=depot.id, numero="CF-{}-{:05d}".format(an, seq_cf), numero_fournisseur="CF-EXT-{}-{}".format(an, seq_cf), date_commande=dt, date_livraison_prevue=dt + timedelta(days=random.randint(5, 20)), etat_id=etat_cde_fou, montant_ht=mt_ht, montant_tva=mt_tva, montant_ttc=mt_ttc, devise_id=xaf_id)
-            session.add(cde_fou)
-            cf_list.append(cde_fou)
-        await session.flush()
-        for cde_fou in cf_list[-N_CF_FOURNISSEUR_PAR_AN:]:
-            seq_rec += 1
-            recept = Reception(commande_fournisseur_id=cde_fou.id, depot_id=depot.id, numero="REC-{}-{:05d}".format(an, seq_rec), date_reception=cde_fou.date_commande + timedelta(days=random.randint(2, 10)), etat="validee")
-            session.add(recept)
-            recept_list.append(recept)
-        await session.flush()
-        for cde_fou in cf_list[-N_CF_FOURNISSEUR_PAR_AN:]:
-            seq_ff += 1
-            statut = random.choice(["non_paye", "non_paye", "partiel", "paye"])
-            restant = cde_fou.montant_ttc if statut != "paye" else Decimal("0")
-            if statut == "partiel":
-                restant = (cde_fou.montant_ttc * Decimal("0.4")).quantize(Decimal("0.01"))
-            fact_fou = FactureFournisseur(entreprise_id=ent_id, fournisseur_id=cde_fou.fournisseur_id, commande_fournisseur_id=cde_fou.id, numero_fournisseur="FAC-{}-{:05d}".format(an, seq_ff), date_facture=cde_fou.date_commande + timedelta(days=random.randint(5, 15)), date_echeance=cde_fou.date_commande + timedelta(days=random.randint(45, 90)), montant_ht=cde_fou.montant_ht, montant_tva=cde_fou.montant_tva, montant_ttc=cde_fou.montant_ttc, montant_restant_du=restant, devise_id=xaf_id, statut_paiement=statut)
-            session.add(fact_fou)
-            fact_fou_list.append(fact_fou)
-        await session.flush()
-
-    # ----- 11. Stock et mouvements -----
-    for pr in produits:
-        qte = Decimal(str(random.randint(30, 1500)))
-        session.add(Stock(depot_id=depot.id, produit_id=pr.id, variante_id=None, quantite=qte, unite_id=pr.unite_vente_id))
-        if pr.id % BATCH_FLUSH == 0:
-            await session.flush()
-    await session.flush()
-
-    n_mvt = min(300, len(recept_list)) if SEED_MODE == "LIGHT" else min(1500, len(recept_list))
-    for recept in recept_list[:n_mvt]:
-        for _ in range(random.randint(1, 4)):
-            pr = random.choice(produits)
-            session.add(MouvementStock(type_mouvement="entree", depot_id=depot.id, produit_id=pr.id, variante_id=None, quantite=Decimal(str(random.randint(10, 200))), reference_type="reception", reference_id=recept.id, notes="Réception fournisseur", created_by_id=user_admin.id))
-    await session.flush()
+    depot = Depot(entreprise_id=ent_id, code="DEP-01", libelle="Entrepôt Bonabéri", point_de_vente_id=pdv_depot.id)
 
-    # ----- 12. Trésorerie : Cash, Mobile (MTN / Orange), ou Cash + Mobile (montants par méthode) -----
+    # ----- 12. Trésorerie : Cash, Mobile (MTN / Orange), virement -----
     mode_esp = ModePaiement(entreprise_id=ent_id, code="ESP", libelle="Espèces (cash)", actif=True)
     mode_mtn = ModePaiement(entreprise_id=ent_id, code="MTN", libelle="Mobile Money MTN", code_operateur="MTN", actif=True)
     mode_orange = ModePaiement(entreprise_id=ent_id, code="ORANGE", libelle="Mobile Money Orange", code_operateur="Orange", actif=True)
     mode_vir = ModePaiement(entreprise_id=ent_id, code="VIR", libelle="Virement bancaire", actif=True)
-    for m in (mode_esp, mode_mtn, mode_orange, mode_vir):
-        session.add(m)
-    await session.flush()
     cpte_caisse = CompteTresorerie(entreprise_id=ent_id, type_compte="caisse", libelle="Caisse principale XAF", devise_id=xaf_id, actif=True)
     cpte_banque = CompteTresorerie(entreprise_id=ent_id, type_compte="bancaire", libelle="Compte BICEC", devise_id=xaf_id, actif=True)
-    session.add(cpte_caisse)
-    session.add(cpte_banque)
-    await session.flush()
-
-    def _add_reglement_client(fac, montant_total, date_regl):
-        """Enregistre un ou deux règlements : cash seul, mobile seul (MTN ou Orange), ou cash + mobile avec montants."""
-        if montant_total <= 0:
-            return
-        choix = random.choice(["cash", "mobile_mtn", "mobile_orange", "cash_et_mobile"])
-        if choix == "cash":
-            session.add(Reglement(entreprise_id=ent_id, type_reglement="client", facture_id=fac.id, tiers_id=fac.client_id, montant=montant_total, date_reglement=date_regl, mode_paiement_id=mode_esp.id, compte_tresorerie_id=cpte_caisse.id, reference=None, created_by_id=user_admin.id))
-        elif choix == "mobile_mtn":
-            session.add(Reglement(entreprise_id=ent_id, type_reglement="client", facture_id=fac.id, tiers_id=fac.client_id, montant=montant_total, date_reglement=date_regl, mode_paiement_id=mode_mtn.id, compte_tresorerie_id=cpte_caisse.id, reference="MTN 6{:08d}".format(random.randint(70000000, 79999999)), created_by_id=user_admin.id))
-        elif choix == "mobile_orange":
-            session.add(Reglement(entreprise_id=ent_id, type_reglement="client", facture_id=fac.id, tiers_id=fac.client_id, montant=montant_total, date_reglement=date_regl, mode_paiement_id=mode_orange.id, compte_tresorerie_id=cpte_caisse.id, reference="OM 6{:08d}".format(random.randint(69000000, 69999999)), created_by_id=user_admin.id))
-        else:
-            # Cash + Mobile : répartition des montants (ex. 40% cash, 60% mobile)
-            part_cash = (montant_total * Decimal(str(random.uniform(0.2, 0.8)))).quantize(Decimal("0.01"))
-            part_mobile = montant_total - part_cash
-            if part_cash > 0:
-                session.add(Reglement(entreprise_id=ent_id, type_reglement="client", facture_id=fac.id, tiers_id=fac.client_id, montant=part_cash, date_reglement=date_regl, mode_paiement_id=mode_esp.id, compte_tresorerie_id=cpte_caisse.id, reference="Espèces", created_by_id=user_admin.id))
-            if part_mobile > 0:
-                op = random.choice(["MTN", "Orange"])
-                ref = "MTN 6{:08d}".format(random.randint(70000000, 79999999)) if op == "MTN" else "OM 6{:08d}".format(random.randint(69000000, 69999999))
-                session.add(Reglement(entreprise_id=ent_id, type_reglement="client", facture_id=fac.id, tiers_id=fac.client_id, montant=part_mobile, date_reglement=date_regl, mode_paiement_id=mode_mtn.id if op == "MTN" else mode_orange.id, compte_tresorerie_id=cpte_caisse.id, reference=ref, created_by_id=user_admin.id))
-
-    session.add(Reglement(entreprise_id=ent_id, type_reglement="client", facture_id=facture.id, tiers_id=client1_id, montant=Decimal("10000"), date_reglement=facture.date_facture + timedelta(days=5), mode_paiement_id=mode_mtn.id, compte_tresorerie_id=cpte_caisse.id, reference="MTN 670000001", created_by_id=user_admin.id))
-    n_regl = min(600, len(facture_list)) if SEED_MODE == "LIGHT" else min(5000, len(facture_list))
-    for fac in facture_list[1:n_regl]:
-        if random.random() > 0.5:
-            montant = fac.montant_ttc if random.random() > 0.3 else (fac.montant_ttc * Decimal(str(random.uniform(0.3, 0.9)))).quantize(Decimal("0.01"))
-            date_regl = fac.date_facture + timedelta(days=random.randint(1, 60))
-            _add_reglement_client(fac, montant, date_regl)
-    await session.flush()
 
-    # ----- 13. Comptabilité -----
+    # ----- 13. Comptabilité : plan, journaux, exercices -----
     comptes = [
         CompteComptable(entreprise_id=ent_id, numero="411", libelle="Clients", sens_normal="debit", actif=True),
         CompteComptable(entreprise_id=ent_id, numero="401", libelle="Fournisseurs", sens_normal="credit", actif=True),
@@ -615,13 +734,6 @@ async def run_seed(session: AsyncSession) -> None:
         CompteComptable(entreprise_id=ent_id, numero="2250", libelle="Matériel informatique", sens_normal="debit", actif=True),
         CompteComptable(entreprise_id=ent_id, numero="2820", libelle="Amortissement matériel", sens_normal="credit", actif=True),
     ]
-    for c in comptes:
-        session.add(c)
-    await session.flush()
-    cpt_411 = next(c.id for c in comptes if c.numero == "411")
-    cpt_53 = next(c.id for c in comptes if c.numero == "53")
-    cpt_2250 = next(c.id for c in comptes if c.numero == "2250")
-    cpt_2820 = next(c.id for c in comptes if c.numero == "2820")
     journaux = [
         JournalComptable(entreprise_id=ent_id, code="VT", libelle="Ventes", actif=True),
         JournalComptable(entreprise_id=ent_id, code="AC", libelle="Achats", actif=True),
@@ -629,181 +741,287 @@ async def run_seed(session: AsyncSession) -> None:
         JournalComptable(entreprise_id=ent_id, code="CA", libelle="Caisse", actif=True),
         JournalComptable(entreprise_id=ent_id, code="OD", libelle="Opérations diverses", actif=True),
     ]
-    for j in journaux:
-        session.add(j)
-    await session.flush()
-    j_vt_id = next(j.id for j in journaux if j.code == "VT")
-    j_ca_id = next(j.id for j in journaux if j.code == "CA")
-
-    periodes_compta = []
-    for an in range(ANNEE_DEBUT, ANNEE_FIN + 1):
-        p = PeriodeComptable(entreprise_id=ent_id, date_debut=date(an, 1, 1), date_fin=date(an, 12, 31), libelle="Exercice {}".format(an), cloturee=(an < ANNEE_FIN))
-        session.add(p)
-        periodes_compta.append(p)
-    await session.flush()
-    periode_compta = periodes_compta[0]
-
-    ecriture = EcritureComptable(entreprise_id=ent_id, journal_id=j_ca_id, periode_id=periode_compta.id, date_ecriture=DATE_DEBUT + timedelta(days=28), numero_piece="ENC-001", libelle="Encaissement client", created_by_id=user_admin.id)
-    session.add(ecriture)
-    await session.flush()
-    session.add(LigneEcriture(ecriture_id=ecriture.id, compte_id=cpt_53, libelle_ligne="Caisse", debit=Decimal("10000"), credit=Decimal("0")))
-    session.add(LigneEcriture(ecriture_id=ecriture.id, compte_id=cpt_411, libelle_ligne="Client", debit=Decimal("0"), credit=Decimal("10000")))
-    n_ecr = min(400, len(facture_list)) if SEED_MODE == "LIGHT" else min(3000, len(facture_list))
-    for idx, fac in enumerate(facture_list[:n_ecr]):
-        per = periodes_compta[(fac.date_facture.year - ANNEE_DEBUT) % len(periodes_compta)]
-        e = EcritureComptable(entreprise_id=ent_id, journal_id=j_vt_id, periode_id=per.id, date_ecriture=fac.date_facture, numero_piece=fac.numero, libelle="Vente " + fac.numero, created_by_id=user_admin.id)
-        session.add(e)
-        await session.flush()
-        session.add(LigneEcriture(ecriture_id=e.id, compte_id=cpt_411, libelle_ligne="Client", debit=fac.montant_ttc, credit=Decimal("0")))
-        session.add(LigneEcriture(ecriture_id=e.id, compte_id=next(c.id for c in comptes if c.numero == "711"), libelle_ligne="Ventes", debit=Decimal("0"), credit=fac.montant_ttc))
-        if n_ecr > 500 and (idx + 1) % BATCH_FLUSH == 0:
-            await session.flush()
-    await session.flush()
+    periodes_compta = [
+        PeriodeComptable(entreprise_id=ent_id, date_debut=date(an, 1, 1), date_fin=date(an, 12, 31), libelle=f"Exercice {an}", cloturee=(an < annee_fin))
+        for an in range(annee_debut, annee_fin + 1)
+    ]
 
-    # ----- 14. RH : départements, postes, employés, congés, objectifs, commissions, avances -----
+    # ----- 14. RH, 15. Paie, 16. Immobilisations : référentiels -----
     dept_com = Departement(entreprise_id=ent_id, code="COM", libelle="Commercial", actif=True)
     dept_compta = Departement(entreprise_id=ent_id, code="COMPTA", libelle="Comptabilité", actif=True)
     dept_rh = Departement(entreprise_id=ent_id, code="RH", libelle="Ressources humaines", actif=True)
-    for d in (dept_com, dept_compta, dept_rh):
-        session.add(d)
-    await session.flush()
-    poste_com = Poste(entreprise_id=ent_id, departement_id=dept_com.id, code="COMM", libelle="Commercial", actif=True)
-    poste_compta = Poste(entreprise_id=ent_id, departement_id=dept_compta.id, code="COMPTA", libelle="Comptable", actif=True)
-    poste_rh = Poste(entreprise_id=ent_id, departement_id=dept_rh.id, code="RESP-RH", libelle="Responsable RH", actif=True)
-    for p in (poste_com, poste_compta, poste_rh):
-        session.add(p)
-    await session.flush()
     type_cdi = TypeContrat(entreprise_id=ent_id, code="CDI", libelle="CDI", actif=True)
     type_cdd = TypeContrat(entreprise_id=ent_id, code="CDD", libelle="CDD", actif=True)
-    session.add(type_cdi)
-    session.add(type_cdd)
-    await session.flush()
-
-    employes = []
-    emp1 = Employe(entreprise_id=ent_id, utilisateur_id=user_admin.id, departement_id=dept_compta.id, poste_id=poste_compta.id, type_contrat_id=type_cdi.id, matricule="EMP001", nom=FAKER.last_name(), prenom=FAKER.first_name(), date_naissance=FAKER.date_of_birth(minimum_age=25, maximum_age=55), lieu_naissance="Douala", genre="M", nationalite="Camerounaise", niu=_niu_cameroun(), numero_cnps="CNPS123456", email="jean@bazard-bonaberi.cm", telephone=_phone_cmr(), adresse="Bonabéri, Douala", date_embauche=date(ANNEE_DEBUT, 3, 1), salaire_base=Decimal("280000"), devise_id=xaf_id, actif=True)
-    session.add(emp1)
-    employes.append(emp1)
-    await session.flush()
-    for i in range(2, N_EMPLOYES + 1):
-        dept = random.choice([dept_com, dept_compta, dept_rh])
-        poste = poste_com if dept == dept_com else (poste_compta if dept == dept_compta else poste_rh)
-        emp = Employe(entreprise_id=ent_id, utilisateur_id=None, departement_id=dept.id, poste_id=poste.id, type_contrat_id=type_cdi.id if random.random() > 0.2 else type_cdd.id, matricule="EMP{:05d}".format(i), nom=FAKER.last_name(), prenom=FAKER.first_name(), date_naissance=FAKER.date_of_birth(minimum_age=22, maximum_age=50), lieu_naissance=random.choice(VILLES_REGIONS_CMR)[0], genre="F" if i % 3 == 0 else "M", nationalite="Camerounaise", niu=_niu_cameroun(), numero_cnps="CNPS{:06d}".format(100000 + i), email="emp{}@bazard-bonaberi.cm".format(i), telephone=_phone_cmr(), adresse=FAKER.address()[:200], date_embauche=_date_alea(DATE_DEBUT, DATE_FIN - timedelta(days=365)), salaire_base=Decimal(str(random.randint(120000, 380000))), devise_id=xaf_id, actif=True)
-        session.add(emp)
-        employes.append(emp)
-    await session.flush()
-
     type_conge_annuel = TypeConge(entreprise_id=ent_id, code="ANN", libelle="Congé annuel", paye=True, actif=True)
     type_conge_maladie = TypeConge(entreprise_id=ent_id, code="MAL", libelle="Congé maladie", paye=True, actif=True)
-    session.add(type_conge_annuel)
-    session.add(type_conge_maladie)
-    await session.flush()
-    for emp in employes[: min(18, len(employes))]:
-        an = random.randint(ANNEE_DEBUT, ANNEE_FIN)
-        session.add(DemandeConge(entreprise_id=ent_id, employe_id=emp.id, type_conge_id=type_conge_annuel.id, date_debut=date(an, random.randint(6, 8), 1), date_fin=date(an, random.randint(6, 8), 14), nombre_jours=10, statut=random.choice(["approuve", "approuve", "refuse"]), created_by_id=user_admin.id))
-        session.add(SoldeConge(entreprise_id=ent_id, employe_id=emp.id, type_conge_id=type_conge_annuel.id, annee=an, droits_acquis=22, jours_pris=random.randint(0, 15)))
-    for emp in employes[1: min(14, len(employes))]:
-        an = random.randint(ANNEE_DEBUT, ANNEE_FIN)
-        session.add(Objectif(entreprise_id=ent_id, employe_id=emp.id, libelle="CA trimestre", date_debut=date(an, 1, 1), date_fin=date(an, 3, 31), montant_cible=Decimal(str(random.randint(5000000, 20000000))), atteint=random.random() > 0.6))
     taux_comm = TauxCommission(entreprise_id=ent_id, code="VENTE", libelle="Commission vente", taux_pct=Decimal("5"), actif=True)
-    session.add(taux_comm)
-    await session.flush()
-    for emp in employes[1: min(18, len(employes))]:
-        for an in range(ANNEE_DEBUT, ANNEE_FIN + 1):
-            for mois in range(1, 13):
-                session.add(Commission(entreprise_id=ent_id, employe_id=emp.id, taux_commission_id=taux_comm.id, date_debut=date(an, mois, 1), date_fin=date(an, mois, 28), montant=Decimal(str(random.randint(5000, 45000))), libelle="Commission {}/{}".format(mois, an), payee=random.random() > 0.3))
-    for emp in employes[2: min(22, len(employes))]:
-        session.add(Avance(entreprise_id=ent_id, employe_id=emp.id, date_avance=_date_alea(DATE_DEBUT, DATE_FIN), montant=Decimal(str(random.randint(20000, 120000))), motif="Avance traitement", rembourse=random.random() > 0.5, created_by_id=user_admin.id))
-    await session.flush()
-
-    # ----- 15. Paie : périodes, types élément, bulletins -----
-    periodes_paie_list = []
-    for an in range(ANNEE_DEBUT, ANNEE_FIN + 1):
+    periodes_paie = []
+    for an in range(annee_debut, annee_fin + 1):
         for mois in range(1, 13):
-            d_debut = date(an, mois, 1)
             d_fin = date(an, 12, 31) if mois == 12 else date(an, mois + 1, 1) - timedelta(days=1)
-            pp = PeriodePaie(entreprise_id=ent_id, annee=an, mois=mois, date_debut=d_debut, date_fin=d_fin, cloturee=True)
-            session.add(pp)
-            periodes_paie_list.append(pp)
+            periodes_paie.append(PeriodePaie(entreprise_id=ent_id, annee=an, mois=mois, date_debut=date(an, mois, 1), date_fin=d_fin, cloturee=True))
+    types_paie = [
+        TypeElementPaie(entreprise_id=ent_id, code="SAL_BASE", libelle="Salaire de base", type="gain", ordre_affichage=1, actif=True),
+        TypeElementPaie(entreprise_id=ent_id, code="CNPS_PAT", libelle="CNPS patronal 4,2%", type="gain", ordre_affichage=2, actif=True),
+        TypeElementPaie(entreprise_id=ent_id, code="CNPS_SAL", libelle="CNPS salarié 2,8%", type="retenue", ordre_affichage=10, actif=True),
+        TypeElementPaie(entreprise_id=ent_id, code="IR", libelle="Impôt sur le revenu", type="retenue", ordre_affichage=11, actif=True),
+    ]
+    cat_info = CategorieImmobilisation(entreprise_id=ent_id, code="INFO", libelle="Matériel informatique", duree_amortissement_annees=3, taux_amortissement=Decimal("33.33"))
+    cat_vehic = CategorieImmobilisation(entreprise_id=ent_id, code="VEH", libelle="Véhicules", duree_amortissement_annees=5, taux_amortissement=Decimal("20"))
+    session.add_all(
+        familles + [cond_caisse, cond_carton, canal_det, canal_gros, type_client, type_fourn] + etats
+        + [depot, mode_esp, mode_mtn, mode_orange, mode_vir, cpte_caisse, cpte_banque] + comptes + journaux
+        + periodes_compta + [dept_com, dept_compta, dept_rh, type_cdi, type_cdd, type_conge_annuel, type_conge_maladie, taux_comm]
+        + periodes_paie + types_paie + [cat_info, cat_vehic]
+    )
     await session.flush()
-    type_salaire = TypeElementPaie(entreprise_id=ent_id, code="SAL_BASE", libelle="Salaire de base", type="gain", ordre_affichage=1, actif=True)
-    type_cnps_sal = TypeElementPaie(entreprise_id=ent_id, code="CNPS_SAL", libelle="CNPS salarié 2,8%", type="retenue", ordre_affichage=10, actif=True)
-    type_cnps_pat = TypeElementPaie(entreprise_id=ent_id, code="CNPS_PAT", libelle="CNPS patronal 4,2%", type="gain", ordre_affichage=2, actif=True)
-    type_ir = TypeElementPaie(entreprise_id=ent_id, code="IR", libelle="Impôt sur le revenu", type="retenue", ordre_affichage=11, actif=True)
-    for t in (type_salaire, type_cnps_pat, type_cnps_sal, type_ir):
-        session.add(t)
+    postes = [
+        Poste(entreprise_id=ent_id, departement_id=dept_com.id, code="COMM", libelle="Commercial", actif=True),
+        Poste(entreprise_id=ent_id, departement_id=dept_compta.id, code="COMPTA", libelle="Comptable", actif=True),
+        Poste(entreprise_id=ent_id, departement_id=dept_rh.id, code="RESP-RH", libelle="Responsable RH", actif=True),
+    ]
+    session.add_all(postes)
     await session.flush()
 
-    for emp in employes:
-        salaire = emp.salaire_base
-        for pp in periodes_paie_list:
-            cnps_pat = (salaire * Decimal("0.042")).quantize(Decimal("0.01"))
-            cnps_sal = (salaire * Decimal("0.028")).quantize(Decimal("0.01"))
-            ir = (salaire * Decimal("0.05")).quantize(Decimal("0.01"))
-            total_gains = salaire + cnps_pat
-            total_retenues = cnps_sal + ir
-            net = total_gains - total_retenues
-            bull = BulletinPaie(entreprise_id=ent_id, employe_id=emp.id, periode_paie_id=pp.id, salaire_brut=salaire, total_gains=total_gains, total_retenues=total_retenues, net_a_payer=net, statut=random.choice(["valide", "valide", "paye"]), date_paiement=date(pp.annee, pp.mois, min(5, 28)))
-            session.add(bull)
-            await session.flush()
-            session.add(LigneBulletinPaie(bulletin_paie_id=bull.id, type_element_paie_id=type_salaire.id, libelle="Salaire de base", type="gain", montant=salaire, ordre=1))
-            session.add(LigneBulletinPaie(bulletin_paie_id=bull.id, type_element_paie_id=type_cnps_pat.id, libelle="CNPS patronal", type="gain", montant=cnps_pat, ordre=2))
-            session.add(LigneBulletinPaie(bulletin_paie_id=bull.id, type_element_paie_id=type_cnps_sal.id, libelle="CNPS salarié", type="retenue", montant=cnps_sal, ordre=10))
-            session.add(LigneBulletinPaie(bulletin_paie_id=bull.id, type_element_paie_id=type_ir.id, libelle="IR", type="retenue", montant=ir, ordre=11))
-    await session.flush()
+    etat = {(e.type_document, e.code): e.id for e in etats}
+    compte = {c.numero: c.id for c in comptes}
+    journal = {j.code: j.id for j in journaux}
+    return {
+        "date_debut": date_debut.isoformat(), "date_fin": date_fin.isoformat(),
+        "annee_debut": annee_debut, "annee_fin": annee_fin,
+        "entreprise": ent_id, "xaf": xaf_id, "pdv_principal": pdv_principal.id,
+        "user_admin": user_admin.id, "user_compta": user_compta.id,
+        "unites": [u.id for u in unites], "familles": [f.id for f in familles],
+        "tva19": next(t.id for t in taux_tva if t.code == "TVA19"), "tva0": next(t.id for t in taux_tva if t.code == "TVA0"),
+        "cond_caisse": cond_caisse.id, "canal_det": canal_det.id, "canal_gros": canal_gros.id,
+        "type_client": type_client.id, "type_fourn": type_fourn.id,
+        "etat_devis_valide": etat[("devis", "VALIDE")], "etat_cde_valide": etat[("commande", "VALIDE")],
+        "etat_fact_valide": etat[("facture", "VALIDE")], "etat_bl_valide": etat[("bon_livraison", "VALIDE")],
+        "depot": depot.id, "mode_esp": mode_esp.id, "mode_mtn": mode_mtn.id, "mode_orange": mode_orange.id, "cpte_caisse": cpte_caisse.id,
+        "cpt_411": compte["411"], "cpt_53": compte["53"], "cpt_711": compte["711"], "cpt_2250": compte["2250"], "cpt_2820": compte["2820"],
+        "journal_vt": journal["VT"], "journal_ca": journal["CA"], "periodes_compta": [p.id for p in periodes_compta],
+        "departements": [dept_com.id, dept_compta.id, dept_rh.id], "postes": [p.id for p in postes],
+        "type_cdi": type_cdi.id, "type_cdd": type_cdd.id, "type_conge_annuel": type_conge_annuel.id, "taux_comm": taux_comm.id,
+        "periodes_paie": [(p.id, p.annee, p.mois) for p in periodes_paie], "types_paie": [t.id for t in types_paie],
+        "cat_info": cat_info.id, "cat_vehic": cat_vehic.id,
+    }
+
+
+async def _id_bases(conn: AsyncConnection, vol: dict) -> dict[str, int]:
+    """Plages d'ids pré-attribuées des tables volumineuses (enfants référencent sans relecture)."""
+    ids = {
+        "produits": await _next_id(conn, Produit),
+        "clients": await _next_id(conn, Tiers),
+        "devis": await _next_id(conn, Devis),
+        "commandes": await _next_id(conn, Commande),
+        "factures": await _next_id(conn, Facture),
+        "ecritures": await _next_id(conn, EcritureComptable),
+        "commandes_fournisseurs": await _next_id(conn, CommandeFournisseur),
+        "receptions": await _next_id(conn, Reception),
+        "employes": await _next_id(conn, Employe),
+        "bulletins": await _next_id(conn, BulletinPaie),
+        "immobilisations": await _next_id(conn, Immobilisation),
+    }
+    ids["fournisseurs"] = ids["clients"] + vol["clients"]
+    return ids
+
+
+def _rows_rh_paie(ctx: dict, vol: dict, seed: int) -> Rows:
+    """14. RH et 15. Paie : employés, congés, objectifs, commissions, avances, bulletins."""
+    rng = random.Random(f"{seed}:rh")
+    fk = Faker("fr_FR")
+    fk.seed_instance(f"{seed}:rh")
+    date_debut, date_fin = date.fromisoformat(ctx["date_debut"]), date.fromisoformat(ctx["date_fin"])
+    annee_debut, annee_fin = ctx["annee_debut"], ctx["annee_fin"]
+    ent_id, ids = ctx["entreprise"], ctx["ids"]
+    rows: Rows = {
+        Employe.__tablename__: [], DemandeConge.__tablename__: [], SoldeConge.__tablename__: [],
+        Objectif.__tablename__: [], Commission.__tablename__: [], Avance.__tablename__: [],
+        BulletinPaie.__tablename__: [], LigneBulletinPaie.__tablename__: [],
+    }
+    employes = rows[Employe.__tablename__]
+    employes.append({"id": ids["employes"], "entreprise_id": ent_id, "utilisateur_id": ctx["user_admin"], "departement_id": ctx["departements"][1], "poste_id": ctx["postes"][1], "type_contrat_id": ctx["type_cdi"], "matricule": "EMP001", "nom": fk.last_name(), "prenom": fk.first_name(), "date_naissance": fk.date_of_birth(minimum_age=25, maximum_age=55), "lieu_naissance": "Douala", "genre": "M", "nationalite": "Camerounaise", "niu": _niu_cameroun(rng), "numero_cnps": "CNPS123456", "email": "jean@bazard-bonaberi.cm", "telephone": _phone_cmr(rng), "adresse": "Bonabéri, Douala", "date_embauche": date(annee_debut, 3, 1), "salaire_base": Decimal("280000"), "devise_id": ctx["xaf"], "actif": True})
+    for i in range(2, vol["employes"] + 1):
+        k = rng.randrange(3)  # département et poste associés
+        employes.append({"id": ids["employes"] + i - 1, "entreprise_id": ent_id, "utilisateur_id": None, "departement_id": ctx["departements"][k], "poste_id": ctx["postes"][k], "type_contrat_id": ctx["type_cdi"] if rng.random() > 0.2 else ctx["type_cdd"], "matricule": f"EMP{i:05d}", "nom": fk.last_name(), "prenom": fk.first_name(), "date_naissance": fk.date_of_birth(minimum_age=22, maximum_age=50), "lieu_naissance": rng.choice(VILLES_REGIONS_CMR)[0], "genre": "F" if i % 3 == 0 else "M", "nationalite": "Camerounaise", "niu": _niu_cameroun(rng), "numero_cnps": f"CNPS{100000 + i:06d}", "email": f"emp{i}@bazard-bonaberi.cm", "telephone": _phone_cmr(rng), "adresse": fk.address()[:200], "date_embauche": _date_alea(rng, date_debut, date_fin - timedelta(days=365)), "salaire_base": Decimal(str(rng.randint(120000, 380000))), "devise_id": ctx["xaf"], "actif": True})
+
+    for emp in employes[:18]:
+        an = rng.randint(annee_debut, annee_fin)
+        rows[DemandeConge.__tablename__].append({"entreprise_id": ent_id, "employe_id": emp["id"], "type_conge_id": ctx["type_conge_annuel"], "date_debut": date(an, rng.randint(6, 8), 1), "date_fin": date(an, rng.randint(6, 8), 14), "nombre_jours": 10, "statut": rng.choice(["approuve", "approuve", "refuse"]), "created_by_id": ctx["user_admin"]})
+        rows[SoldeConge.__tablename__].append({"entreprise_id": ent_id, "employe_id": emp["id"], "type_conge_id": ctx["type_conge_annuel"], "annee": an, "droits_acquis": 22, "jours_pris": rng.randint(0, 15)})
+    for emp in employes[1:14]:
+        an = rng.randint(annee_debut, annee_fin)
+        rows[Objectif.__tablename__].append({"entreprise_id": ent_id, "employe_id": emp["id"], "libelle": "CA trimestre", "date_debut": date(an, 1, 1), "date_fin": date(an, 3, 31), "montant_cible": Decimal(str(rng.randint(5000000, 20000000))), "atteint": rng.random() > 0.6})
+    for emp in employes[1:18]:
+        for an in range(annee_debut, annee_fin + 1):
+            for mois in range(1, 13):
+                rows[Commission.__tablename__].append({"entreprise_id": ent_id, "employe_id": emp["id"], "taux_commission_id": ctx["taux_comm"], "date_debut": date(an, mois, 1), "date_fin": date(an, mois, 28), "montant": Decimal(str(rng.randint(5000, 45000))), "libelle": f"Commission {mois}/{an}", "payee": rng.random() > 0.3})
+    for emp in employes[2:22]:
+        rows[Avance.__tablename__].append({"entreprise_id": ent_id, "employe_id": emp["id"], "date_avance": _date_alea(rng, date_debut, date_fin), "montant": Decimal(str(rng.randint(20000, 120000))), "motif": "Avance traitement", "rembourse": rng.random() > 0.5, "created_by_id": ctx["user_admin"]})
 
-    # ----- 16. Immobilisations -----
-    cat_info = CategorieImmobilisation(entreprise_id=ent_id, code="INFO", libelle="Matériel informatique", duree_amortissement_annees=3, taux_amortissement=Decimal("33.33"))
-    cat_vehic = CategorieImmobilisation(entreprise_id=ent_id, code="VEH", libelle="Véhicules", duree_amortissement_annees=5, taux_amortissement=Decimal("20"))
-    session.add(cat_info)
-    session.add(cat_vehic)
-    await session.flush()
+    type_salaire, type_cnps_pat, type_cnps_sal, type_ir = ctx["types_paie"]
+    bulletin_id = ids["bulletins"]
+    for emp in employes:
+        salaire = emp["salaire_base"]
+        cnps_pat = (salaire * Decimal("0.042")).quantize(Decimal("0.01"))
+        cnps_sal = (salaire * Decimal("0.028")).quantize(Decimal("0.01"))
+        ir = (salaire * Decimal("0.05")).quantize(Decimal("0.01"))
+        total_gains = salaire + cnps_pat
+        total_retenues = cnps_sal + ir
+        for periode_id, annee, mois in ctx["periodes_paie"]:
+            rows[BulletinPaie.__tablename__].append({"id": bulletin_id, "entreprise_id": ent_id, "employe_id": emp["id"], "periode_paie_id": periode_id, "salaire_brut": salaire, "total_gains": total_gains, "total_retenues": total_retenues, "net_a_payer": total_gains - total_retenues, "statut": rng.choice(["valide", "valide", "paye"]), "date_paiement": date(annee, mois, 5)})
+            rows[LigneBulletinPaie.__tablename__].extend([
+                {"bulletin_paie_id": bulletin_id, "type_element_paie_id": type_salaire, "libelle": "Salaire de base", "type": "gain", "montant": salaire, "ordre": 1},
+                {"bulletin_paie_id": bulletin_id, "type_element_paie_id": type_cnps_pat, "libelle": "CNPS patronal", "type": "gain", "montant": cnps_pat, "ordre": 2},
+                {"bulletin_paie_id": bulletin_id, "type_element_paie_id": type_cnps_sal, "libelle": "CNPS salarié", "type": "retenue", "montant": cnps_sal, "ordre": 10},
+                {"bulletin_paie_id": bulletin_id, "type_element_paie_id": type_ir, "libelle": "IR", "type": "retenue", "montant": ir, "ordre": 11},
+            ])
+            bulletin_id += 1
+    return rows
+
+
+def _rows_divers(ctx: dict, seed: int) -> Rows:
+    """16. Immobilisations, 17. Système, écriture d'encaissement initiale."""
+    rng = random.Random(f"{seed}:divers")
+    date_debut, date_fin = date.fromisoformat(ctx["date_debut"]), date.fromisoformat(ctx["date_fin"])
+    annee_debut, annee_fin = ctx["annee_debut"], ctx["annee_fin"]
+    ent_id, admin_id = ctx["entreprise"], ctx["user_admin"]
+    rows: Rows = {
+        Immobilisation.__tablename__: [], LigneAmortissement.__tablename__: [], ParametreSysteme.__tablename__: [],
+        JournalAudit.__tablename__: [], Notification.__tablename__: [], LicenceLogicielle.__tablename__: [],
+        EcritureComptable.__tablename__: [], LigneEcriture.__tablename__: [],
+    }
     for i in range(1, 12):
-        an_acq = random.randint(ANNEE_DEBUT, ANNEE_FIN - 1)
-        cat = cat_info if i % 3 != 0 else cat_vehic
-        val = Decimal(str(random.randint(300000, 6000000)))
-        duree = 3 if cat == cat_info else 5
-        immo = Immobilisation(entreprise_id=ent_id, categorie_id=cat.id, compte_comptable_id=cpt_2250, compte_amortissement_id=cpt_2820, code="IMMO-{:05d}".format(i), designation="Matériel informatique" if cat == cat_info else "Véhicule livraison", date_acquisition=date(an_acq, random.randint(1, 12), 1), valeur_acquisition=val, duree_amortissement_annees=duree, date_mise_en_service=date(an_acq, random.randint(1, 12), 15), notes="Siège", actif=True)
-        session.add(immo)
-        await session.flush()
+        an_acq = rng.randint(annee_debut, annee_fin - 1)
+        info = i % 3 != 0
+        val = Decimal(str(rng.randint(300000, 6000000)))
+        duree = 3 if info else 5
+        immo_id = ctx["ids"]["immobilisations"] + i - 1
+        rows[Immobilisation.__tablename__].append({"id": immo_id, "entreprise_id": ent_id, "categorie_id": ctx["cat_info"] if info else ctx["cat_vehic"], "compte_comptable_id": ctx["cpt_2250"], "compte_amortissement_id": ctx["cpt_2820"], "code": f"IMMO-{i:05d}", "designation": "Matériel informatique" if info else "Véhicule livraison", "date_acquisition": date(an_acq, rng.randint(1, 12), 1), "valeur_acquisition": val, "duree_amortissement_annees": duree, "date_mise_en_service": date(an_acq, rng.randint(1, 12), 15), "notes": "Siège", "actif": True})
         dot = (val / (duree * 12)).quantize(Decimal("0.01"))
-        session.add(LigneAmortissement(immobilisation_id=immo.id, annee=an_acq, mois=12, montant_dotation=dot, cumul_amortissement=dot, valeur_nette=val - dot))
-    await session.flush()
-
-    # ----- 17. Système -----
-    session.add(ParametreSysteme(entreprise_id=ent_id, categorie="general", cle="langue", valeur="fr", description="Langue interface"))
-    session.add(ParametreSysteme(entreprise_id=ent_id, categorie="general", cle="devise_affichage", valeur="XAF", description="Devise affichage"))
-    session.add(ParametreSysteme(entreprise_id=ent_id, categorie="compta", cle="plan_comptable", valeur="OHADA", description="Plan comptable CEMAC"))
-    session.add(JournalAudit(entreprise_id=ent_id, utilisateur_id=user_admin.id, action="login", module="auth", entite_type="utilisateur", entite_id=user_admin.id, ip_address="127.0.0.1"))
-    session.add(Notification(utilisateur_id=user_admin.id, titre="Bienvenue", message="Seed Bazard Bonabéri chargé.", lue=False))
-    session.add(LicenceLogicielle(entreprise_id=ent_id, cle_licence="GESCO-XXXXX-XXXXX-XXXXX-XXXXX", type_licence="standard", date_debut=DATE_DEBUT, date_fin=DATE_FIN, actif=True, nombre_prolongations=0))
-    for i in range(200):
-        session.add(JournalAudit(entreprise_id=ent_id, utilisateur_id=user_admin.id, action=random.choice(["login", "read", "create", "update"]), module=random.choice(["commercial", "catalogue", "parametrage"]), entite_type="document", entite_id=random.randint(1, 500), ip_address="192.168.1.{}".format(random.randint(1, 254))))
-    for u_id in [user_admin.id, user_compta.id]:
+        rows[LigneAmortissement.__tablename__].append({"immobilisation_id": immo_id, "annee": an_acq, "mois": 12, "montant_dotation": dot, "cumul_amortissement": dot, "valeur_nette": val - dot})
+
+    rows[ParametreSysteme.__tablename__].extend([
+        {"entreprise_id": ent_id, "categorie": "general", "cle": "langue", "valeur": "fr", "description": "Langue interface"},
+        {"entreprise_id": ent_id, "categorie": "general", "cle": "devise_affichage", "valeur": "XAF", "description": "Devise affichage"},
+        {"entreprise_id": ent_id, "categorie": "compta", "cle": "plan_comptable", "valeur": "OHADA", "description": "Plan comptable CEMAC"},
+    ])
+    audit = rows[JournalAudit.__tablename__]
+    audit.append({"entreprise_id": ent_id, "utilisateur_id": admin_id, "action": "login", "module": "auth", "entite_type": "utilisateur", "entite_id": admin_id, "ip_address": "127.0.0.1"})
+    for _ in range(200):
+        audit.append({"entreprise_id": ent_id, "utilisateur_id": admin_id, "action": rng.choice(["login", "read", "create", "update"]), "module": rng.choice(["commercial", "catalogue", "parametrage"]), "entite_type": "document", "entite_id": rng.randint(1, 500), "ip_address": f"192.168.1.{rng.randint(1, 254)}"})
+    notifications = rows[Notification.__tablename__]
+    notifications.append({"utilisateur_id": admin_id, "titre": "Bienvenue", "message": "Seed Bazard Bonabéri chargé.", "lue": False})
+    for u_id in (admin_id, ctx["user_compta"]):
         for i in range(50):
-            session.add(Notification(utilisateur_id=u_id, titre="Notification {}".format(i), message="Message test.", lue=random.random() > 0.5))
-    await session.flush()
+            notifications.append({"utilisateur_id": u_id, "titre": f"Notification {i}", "message": "Message test.", "lue": rng.random() > 0.5})
+    rows[LicenceLogicielle.__tablename__].append({"entreprise_id": ent_id, "cle_licence": "GESCO-XXXXX-XXXXX-XXXXX-XXXXX", "type_licence": "standard", "date_debut": date_debut, "date_fin": date_fin, "actif": True, "nombre_prolongations": 0})
+
+    # Encaissement client initial (id après la plage des écritures de vente)
+    ecriture_id = ctx["ids"]["ecritures"] + ctx["n_ecritures"]
+    rows[EcritureComptable.__tablename__].append({"id": ecriture_id, "entreprise_id": ent_id, "journal_id": ctx["journal_ca"], "periode_id": ctx["periodes_compta"][0], "date_ecriture": date_debut + timedelta(days=28), "numero_piece": "ENC-001", "libelle": "Encaissement client", "created_by_id": admin_id})
+    rows[LigneEcriture.__tablename__].extend([
+        {"ecriture_id": ecriture_id, "compte_id": ctx["cpt_53"], "libelle_ligne": "Caisse", "debit": Decimal("10000"), "credit": Decimal("0")},
+        {"ecriture_id": ecriture_id, "compte_id": ctx["cpt_411"], "libelle_ligne": "Client", "debit": Decimal("0"), "credit": Decimal("10000")},
+    ])
+    return rows
+
+
+# =============================================================================
+# Orchestration
+# =============================================================================
+
+async def run_seed(engine, mode: str, seed: int, workers: int) -> None:
+    """Seed complet : entreprise Bazard, Faker, période 3 ans, volume selon le mode ; reprend un seed interrompu."""
+    vol = VOLUMES[mode]
+    async with engine.begin() as conn:
+        has_progress = await conn.run_sync(lambda c: inspect(c).has_table(seed_progress.name))
+        # Base déjà seedée ? (évite doublon si on relance par erreur)
+        seeded = (await conn.execute(select(Devise.id).where(Devise.code == "XAF").limit(1))).scalar() is not None
+        if seeded and not has_progress:
+            print("Base deja seedee (devise XAF presente). Pour repartir de zero : fermez l'app, supprimez app/db/gesco.db, relancez 'alembic upgrade head' puis ce script.")
+            return
+        await conn.run_sync(_progress_metadata.create_all)
+        done = await _progress_done(conn)
 
-    await session.commit()
-    total_approx = (
-        N_CLIENTS + N_FOURNISSEURS + N_PRODUITS + len(devis_list) + len(commande_list) + len(facture_list) + len(bl_list)
-        + len(cf_list) + len(recept_list) + len(fact_fou_list) + len(produits) + N_EMPLOYES * (1 + len(periodes_paie_list) * 5)
-    )
-    print("Seed termine : Bazard du Marche Bonaberi | Periode {} -> {} ({} ans) | Mode {} | ~{} enregistrements".format(DATE_DEBUT, DATE_FIN, N_ANNEES, SEED_MODE, total_approx))
+    if "contexte" in done:
+        ctx = json.loads(done["contexte"])
+        if ctx["mode"] != mode or ctx["seed"] != seed:
+            print("Seed interrompu en mode {} (--seed {}) : relancez avec les mêmes options.".format(ctx["mode"], ctx["seed"]))
+            return
+        print(f"Reprise du seed interrompu ({len(done) - 1} lots déjà insérés).")
+    else:
+        session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+        async with session_factory() as session:
+            ctx = await _seed_referentiels(session, seed, vol)
+            conn = await session.connection()
+            n_annees = ctx["annee_fin"] - ctx["annee_debut"] + 1
+            ctx.update(mode=mode, seed=seed, n_annees=n_annees, ids=await _id_bases(conn, vol))
+            ctx["n_ecritures"] = min(vol["ecritures"], vol["factures_par_an"] * n_annees)
+            await _mark(conn, "contexte", ctx)
+            await session.commit()
+        print("  referentiels ok")
+
+    n_annees = ctx["n_annees"]
+    steps = [
+        ("produits", _gen_produits, vol["produits"]),
+        ("clients", _gen_clients, vol["clients"]),
+        ("fournisseurs", _gen_fournisseurs, vol["fournisseurs"]),
+        ("devis", _gen_devis, vol["devis_par_an"] * n_annees),
+        ("commandes", _gen_commandes, vol["commandes_par_an"] * n_annees),
+        ("factures", _gen_factures, vol["factures_par_an"] * n_annees),
+        ("achats", _gen_achats, vol["cf_par_an"] * n_annees),
+    ]
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for step, fn, total in steps:
+            await _run_chunked(engine, executor, done, step, fn, total, seed, ctx, vol, window=2 * max(workers, 1))
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    for step, build in (("rh_paie", lambda: _rows_rh_paie(ctx, vol, seed)), ("divers", lambda: _rows_divers(ctx, seed))):
+        if step in done:
+            continue
+        async with engine.begin() as conn:
+            await _insert_rows(conn, build())
+            await _mark(conn, step)
+        print(f"  {step} ok")
+
+    # Table de faits des rapports (les factures du seed ne passent pas par FactureService)
+    from app.modules.rapports.repositories import VenteJournaliereRepository
+
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    async with session_factory() as session:
+        await VenteJournaliereRepository(session).reconstruire()
+        await session.execute(delete(seed_progress))
+        await session.commit()
+    async with engine.begin() as conn:
+        await conn.run_sync(_progress_metadata.drop_all)
+
+    print("Seed termine : Bazard du Marche Bonaberi | Periode {} -> {} ({} ans) | Mode {} | seed {}".format(ctx["date_debut"], ctx["date_fin"], n_annees, mode, seed))
     print("Comptes : admin / gesco@1234  |  compta / gesco@1234")
 
 
-async def main() -> None:
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Seed de démonstration / montée en charge Gesco")
+    parser.add_argument("mode", nargs="?", default=os.environ.get("SEED_MODE", "LIGHT"), type=str.upper, choices=list(VOLUMES), help="Volume (défaut : SEED_MODE ou LIGHT)")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des données (même graine = mêmes données)")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="Processus de génération (1 = sans worker)")
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
     settings = get_settings()
     engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
-    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
-    async with session_factory() as session:
-        try:
-            await run_seed(session)
-        except Exception as e:
-            await session.rollback()
-            print("Erreur seed:", e)
-            raise
-    await engine.dispose()
+    try:
+        await run_seed(engine, args.mode, args.seed, args.workers)
+    except Exception as e:
+        print("Erreur seed (relancer la même commande pour reprendre) :", e)
+        raise
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,33 @@
 # tests/api/test_auth.py
 # -----------------------------------------------------------------------------
-# Tests d'authentification : login et refresh token.
+# Tests d'authentification : login et refresh token, bcrypt hors boucle
+# d'événements et hash recalculé à la connexion si BCRYPT_ROUNDS a changé,
+# cache des tokens d'accès vérifiés et backend JWT natif compatible jose.
 # -----------------------------------------------------------------------------
 
+import asyncio
+from datetime import timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.core import security
+from app.core.database import get_session_factory
+from app.core.security import (
+    InvalidTokenError,
+    create_access_token,
+    decode_access_token,
+    hash_password,
+    jose_jwt_decode,
+    jose_jwt_encode,
+    native_jwt_decode,
+    native_jwt_encode,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.modules.parametrage.models import Utilisateur
 
 
 @pytest.mark.asyncio
@@ -94,3 +117,91 @@ async def test_refresh_invalid_token(client: AsyncClient):
     )
     assert response.status_code == 401
 
+
+@pytest.mark.asyncio
+async def test_verify_password_does_not_block_loop():
+    """Pendant la vérification bcrypt, la boucle d'événements continue de tourner."""
+    hashed = hash_password("secret")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        assert await verify_password_async("secret", hashed)
+        assert not await verify_password_async("autre", hashed)
+    finally:
+        task.cancel()
+    assert ticks > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("delta", [-1, 1], ids=["cout-inferieur", "cout-superieur"])
+async def test_login_rehashes_on_rounds_change(client: AsyncClient, monkeypatch, delta: int):
+    """Hash d'un autre coût : mot_de_passe_hash réécrit au coût courant lors d'une connexion réussie."""
+    rounds = get_settings().BCRYPT_ROUNDS
+    old_rounds = rounds + delta
+    if old_rounds < 4:
+        pytest.skip("BCRYPT_ROUNDS déjà au coût minimal de bcrypt")
+    monkeypatch.setattr(get_settings(), "BCRYPT_ROUNDS", old_rounds)
+    old_hash = hash_password("password")
+    monkeypatch.setattr(get_settings(), "BCRYPT_ROUNDS", rounds)
+    assert password_needs_rehash(old_hash)
+    async with get_session_factory()() as session:
+        user = (await session.execute(select(Utilisateur).where(Utilisateur.login == "test"))).scalar_one()
+        user.mot_de_passe_hash = old_hash
+        await session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+
+    async with get_session_factory()() as session:
+        user = (await session.execute(select(Utilisateur).where(Utilisateur.login == "test"))).scalar_one()
+        assert user.mot_de_passe_hash != old_hash
+        assert user.mot_de_passe_hash.split("$")[2] == f"{rounds:02d}"
+        assert not password_needs_rehash(user.mot_de_passe_hash)
+        assert await verify_password_async("password", user.mot_de_passe_hash)
+
+
+def test_decode_access_token_cached(monkeypatch):
+    """Token déjà vérifié : payload servi par le cache ; token expiré jamais servi."""
+    security.clear_token_cache()
+    token = create_access_token(1, extra_claims={"entreprise_id": 1})
+    payload = decode_access_token(token)
+    assert payload["sub"] == "1"
+
+    def no_verification(token):
+        raise AssertionError("signature revérifiée")
+
+    monkeypatch.setattr(security, "_decode", no_verification)
+    assert decode_access_token(token) is payload
+    monkeypatch.undo()
+
+    expired = create_access_token(1, expires_delta=timedelta(seconds=-1))
+    assert decode_access_token(expired) is None
+    assert decode_access_token(token[:-2] + "xx") is None
+    security.clear_token_cache()
+
+
+def test_native_jwt_backend_compatible_with_jose():
+    """Tokens natifs lus par jose et inversement ; signature, algorithme et exp vérifiés."""
+    secret = get_settings().SECRET_KEY
+    claims = {"sub": "7", "exp": 4_102_444_800, "type": "access", "entreprise_id": 1}
+    assert jose_jwt_decode(native_jwt_encode(claims, secret, "HS256"), secret, "HS256") == claims
+    assert native_jwt_decode(jose_jwt_encode(claims, secret, "HS256"), secret, "HS256") == claims
+
+    token = native_jwt_encode(claims, secret, "HS256")
+    for bad in (token[:-2] + "xx", "invalid.jwt.token", "sans-point"):
+        with pytest.raises(InvalidTokenError):
+            native_jwt_decode(bad, secret, "HS256")
+    with pytest.raises(InvalidTokenError):
+        native_jwt_decode(token, secret, "HS512")
+    with pytest.raises(InvalidTokenError):
+        native_jwt_decode(native_jwt_encode({**claims, "exp": 1}, secret, "HS256"), secret, "HS256")
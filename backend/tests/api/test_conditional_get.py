@@ -0,0 +1,82 @@
+# tests/api/test_conditional_get.py
+# -----------------------------------------------------------------------------
+# GET conditionnels (ConditionalGet) : ETag et Cache-Control sur les listes de
+# référentiels et du catalogue, 304 sans requête SQL si If-None-Match
+# correspond, nouvel ETag après une écriture commitée, pas d'ETag si les
+# compteurs de version ne sont pas partagés entre workers.
+# -----------------------------------------------------------------------------
+
+import pytest
+from httpx import AsyncClient
+
+from app.core import report_cache
+from app.core.report_cache import ReportCache
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_referentiel_not_modified_without_query(client: AsyncClient, max_queries):
+    """If-None-Match égal à l'ETag : 304 sans corps ni requête SQL."""
+    headers = await _get_auth_headers(client)
+    url = "/api/v1/catalogue/taux-tva"
+    first = await client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, max-age=60, must-revalidate"
+
+    with max_queries(0):
+        second = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+    other = await client.get(url + "?actif_only=true", headers={**headers, "If-None-Match": etag})
+    assert other.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_after_write(client: AsyncClient):
+    """Création d'une famille : l'ancien ETag ne correspond plus, la liste est relue."""
+    headers = await _get_auth_headers(client)
+    url = "/api/v1/catalogue/familles-produits"
+    first = await client.get(url, headers=headers)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert (await client.get(url, headers={**headers, "If-None-Match": etag})).status_code == 304
+
+    created = await client.post(
+        "/api/v1/catalogue/familles-produits",
+        json={"entreprise_id": 1, "code": "ETAG", "libelle": "Famille ETag"},
+        headers=headers,
+    )
+    assert created.status_code == 201
+    third = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
+    assert "ETAG" in [f["code"] for f in third.json()]
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_requires_auth(client: AsyncClient):
+    """Sans token : 401, jamais 304."""
+    response = await client.get("/api/v1/parametrage/devises", headers={"If-None-Match": "*"})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_no_etag_with_workers_without_shared_backend(client: AsyncClient, monkeypatch):
+    """Plusieurs workers sans REDIS_URL : ni ETag ni 304 (compteurs propres au processus)."""
+    monkeypatch.setattr(report_cache, "_report_cache", ReportCache(ttl_seconds=300, max_entries=16, workers=2))
+    headers = await _get_auth_headers(client)
+    response = await client.get("/api/v1/catalogue/taux-tva", headers={**headers, "If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
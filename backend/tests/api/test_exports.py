@@ -0,0 +1,108 @@
+# tests/api/test_exports.py
+# -----------------------------------------------------------------------------
+# Exports en flux (GET .../export) : mêmes lignes et même ordre que la liste,
+# lecture par lots (curseur serveur), CSV ou NDJSON, gzip selon
+# Accept-Encoding, filtres de la liste appliqués.
+# -----------------------------------------------------------------------------
+
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _create_factures(client: AsyncClient, headers: dict, prefix: str, count: int) -> None:
+    for i in range(count):
+        payload = {
+            "entreprise_id": 1,
+            "point_de_vente_id": 1,
+            "client_id": 1,
+            "numero": f"{prefix}-{i:03d}",
+            "date_facture": date.today().isoformat(),
+            "etat_id": 1,
+            "type_facture": "facture",
+            "montant_ht": "1000.00",
+            "montant_tva": "192.50",
+            "montant_ttc": "1192.50",
+            "montant_restant_du": "1192.50",
+            "devise_id": 1,
+        }
+        response = await client.post("/api/v1/commercial/factures", json=payload, headers=headers)
+        assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_export_factures_ndjson_matches_list(client: AsyncClient, monkeypatch):
+    """Lots de 2 lignes : l'export NDJSON reproduit la liste JSON, dans le même ordre."""
+    monkeypatch.setattr(get_settings(), "EXPORT_YIELD_PER", 2)
+    headers = await _get_auth_headers(client)
+    await _create_factures(client, headers, "FAC-EXP", 5)
+
+    listing = (await client.get("/api/v1/commercial/factures?limit=200", headers=headers)).json()
+    response = await client.get("/api/v1/commercial/factures/export?format=ndjson", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="factures.ndjson"' in response.headers["content-disposition"]
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert exported == listing
+    assert len(exported) >= 5
+
+
+@pytest.mark.asyncio
+async def test_export_csv_gzip_negotiation(client: AsyncClient):
+    """CSV compressé si le client accepte gzip, en clair sinon ; en-tête = champs du schéma."""
+    headers = await _get_auth_headers(client)
+    await _create_factures(client, headers, "FAC-CSV", 2)
+    url = "/api/v1/commercial/factures/export?client_id=1"
+
+    gz = await client.get(url, headers={**headers, "Accept-Encoding": "gzip"})
+    assert gz.status_code == 200
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.headers["content-type"].startswith("text/csv")
+
+    plain = await client.get(url, headers={**headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == gz.content  # httpx décompresse
+
+    rows = list(csv.reader(io.StringIO(plain.content.decode("utf-8-sig")), delimiter=";"))
+    assert rows[0][:4] == ["id", "entreprise_id", "client_id", "numero"]
+    assert all(row[2] == "1" for row in rows[1:])
+
+
+@pytest.mark.asyncio
+async def test_export_audit_filters(client: AsyncClient):
+    """Journal d'audit : filtre module appliqué, détails JSON sérialisés dans une cellule."""
+    headers = await _get_auth_headers(client)
+    for action in ("create", "update"):
+        created = await client.post(
+            "/api/v1/systeme/audit",
+            json={"entreprise_id": 1, "action": action, "module": "export-test", "details": {"n": 1}},
+            headers=headers,
+        )
+        assert created.status_code == 201
+
+    response = await client.get("/api/v1/systeme/audit/export?module=export-test", headers=headers)
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.content.decode("utf-8-sig")), delimiter=";"))
+    assert [r["action"] for r in rows] == ["update", "create"]
+    assert json.loads(rows[0]["details"]) == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_export_requires_auth(client: AsyncClient):
+    response = await client.get("/api/v1/tresorerie/reglements/export")
+    assert response.status_code in (401, 403)
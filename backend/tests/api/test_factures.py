@@ -1,8 +1,12 @@
 # tests/api/test_factures.py
 # -----------------------------------------------------------------------------
 # Tests des endpoints factures (liste, détail, création) avec authentification.
+# Pagination par curseur : parcours stable malgré les dates ex aequo, pas de
+# X-Next-Cursor en fin de liste, curseur altéré refusé (400 INVALID_CURSOR).
 # -----------------------------------------------------------------------------
 
+import base64
+import json
 from datetime import date
 
 import pytest
@@ -73,3 +77,81 @@ async def test_create_facture_success(client: AsyncClient):
     assert "id" in data
     assert data["entreprise_id"] == 1
 
+
+
+@pytest.mark.asyncio
+async def test_list_factures_ndjson(client: AsyncClient):
+    """Avec Accept: application/x-ndjson, la liste est renvoyée en flux NDJSON (un objet par ligne)."""
+    headers = await _get_auth_headers(client)
+    headers["Accept"] = "application/x-ndjson"
+    response = await client.get("/api/v1/commercial/factures", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    del headers["Accept"]
+    assert lines == (await client.get("/api/v1/commercial/factures", headers=headers)).json()
+
+
+async def _create_factures_dates(client: AsyncClient, headers: dict, prefix: str, dates: list[date]) -> None:
+    for i, jour in enumerate(dates):
+        payload = {
+            "entreprise_id": 1,
+            "point_de_vente_id": 1,
+            "client_id": 1,
+            "numero": f"{prefix}-{i:02d}",
+            "date_facture": jour.isoformat(),
+            "etat_id": 1,
+            "type_facture": "facture",
+            "montant_ht": "100.00",
+            "montant_tva": "19.25",
+            "montant_ttc": "119.25",
+            "montant_restant_du": "119.25",
+            "devise_id": 1,
+        }
+        response = await client.post("/api/v1/commercial/factures", json=payload, headers=headers)
+        assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_list_factures_cursor_walk(client: AsyncClient):
+    """Pages de 2 par curseur, dates ex aequo : chaque facture une seule fois, dans l'ordre de la liste complète."""
+    headers = await _get_auth_headers(client)
+    dates = [date(2020, 5, 4)] * 3 + [date(2020, 5, 3)] * 4 + [date(2020, 5, 2)]
+    await _create_factures_dates(client, headers, "FAC-KS", dates)
+    url = "/api/v1/commercial/factures"
+    full = await client.get(url, params={"limit": 200}, headers=headers)
+    assert "X-Next-Cursor" not in full.headers  # liste entière sur une page
+    attendu = [f["id"] for f in full.json()]
+
+    vus, params = [], {"limit": 2}
+    while True:
+        page = await client.get(url, params=params, headers=headers)
+        assert page.status_code == 200
+        vus += [f["id"] for f in page.json()]
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        assert len(page.json()) == 2
+        params = {"limit": 2, "cursor": cursor}
+    assert len(page.json()) < 2  # dernière page : incomplète, sans curseur
+    assert vus == attendu
+    assert len(set(vus)) == len(vus)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "pas-un-curseur!",
+        base64.urlsafe_b64encode(b"{}").decode().rstrip("="),
+        base64.urlsafe_b64encode(b'["2020-05-04"]').decode().rstrip("="),
+        base64.urlsafe_b64encode(b'["2020-13-45",1]').decode().rstrip("="),
+        base64.urlsafe_b64encode(b'["2020-05-04","abc"]').decode().rstrip("="),
+    ],
+    ids=["garbage", "not-a-list", "wrong-length", "bad-date", "bad-id"],
+)
+async def test_list_factures_invalid_cursor(client: AsyncClient, cursor: str):
+    headers = await _get_auth_headers(client)
+    response = await client.get("/api/v1/commercial/factures", params={"cursor": cursor}, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_CURSOR"
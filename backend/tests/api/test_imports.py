@@ -0,0 +1,141 @@
+# tests/api/test_imports.py
+# -----------------------------------------------------------------------------
+# Import en masse (POST /systeme/imports) : références résolues par code,
+# lignes rejetées détaillées (référence inconnue, doublon, valeur invalide),
+# lignes vides ignorées, reprise d'un import interrompu après la dernière
+# ligne traitée.
+# -----------------------------------------------------------------------------
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.core.database import get_session_factory
+from app.modules.catalogue.models import Produit, TauxTva, UniteMesure
+from app.modules.partenaires.models import Tiers
+from app.modules.systeme.models import ImportDonnees
+from app.modules.systeme.services.import_donnees import resume_pending_imports, running_import
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _ensure_referentiels() -> None:
+    async with get_session_factory()() as session:
+        unites = select(UniteMesure.id).where(UniteMesure.code == "PCE-IMP")
+        if (await session.execute(unites)).scalar_one_or_none() is None:
+            session.add(UniteMesure(code="PCE-IMP", libelle="Pièce", type="unite"))
+        taux = select(TauxTva.id).where(TauxTva.code == "TVA-IMP")
+        if (await session.execute(taux)).scalar_one_or_none() is None:
+            session.add(TauxTva(code="TVA-IMP", taux=Decimal("19.25"), libelle="TVA normale"))
+        await session.commit()
+
+
+async def _wait(import_id: int) -> None:
+    task = running_import(import_id)
+    if task is not None:
+        await task
+
+
+@pytest.fixture
+def import_settings(monkeypatch, tmp_path):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_import_produits_csv(client: AsyncClient, import_settings):
+    """Lots de 2 lignes : valides insérées, rejets numérotés, ligne vide ignorée."""
+    await _ensure_referentiels()
+    headers = await _get_auth_headers(client)
+    contenu = (
+        "code;libelle;unite_vente_code;taux_tva_code;prix_vente_ttc\n"
+        'IMP-001;Riz 25 kg;PCE-IMP;TVA-IMP;"15 500,00"\n'
+        "IMP-002;Huile 5 L;PCE-IMP;;4200\n"
+        "IMP-003;Sucre;INCONNUE;;1000\n"
+        "IMP-001;Doublon;PCE-IMP;;1000\n"
+        ";;;;\n"
+        "IMP-004;Sel;PCE-IMP;;abc\n"
+    )
+    response = await client.post(
+        "/api/v1/systeme/imports",
+        data={"type_import": "produits"},
+        files={"fichier": ("produits.csv", contenu.encode("utf-8"), "text/csv")},
+        headers=headers,
+    )
+    assert response.status_code == 202
+    import_id = response.json()["id"]
+    await _wait(import_id)
+
+    detail = (await client.get(f"/api/v1/systeme/imports/{import_id}", headers=headers)).json()
+    assert detail["statut"] == "termine"
+    compteurs = (detail["lignes_traitees"], detail["lignes_importees"], detail["lignes_en_erreur"])
+    assert compteurs == (6, 2, 3)
+    assert [e["ligne"] for e in detail["erreurs"]] == [4, 5, 7]
+    assert "unite_vente_code inconnu" in detail["erreurs"][0]["erreur"]
+    assert "en double" in detail["erreurs"][1]["erreur"]
+
+    async with get_session_factory()() as session:
+        riz = (await session.execute(select(Produit).where(Produit.code == "IMP-001"))).scalar_one()
+    assert riz.prix_vente_ttc == Decimal("15500")
+    assert riz.taux_tva_id is not None and riz.actif
+
+
+@pytest.mark.asyncio
+async def test_import_invalid_type_and_format(client: AsyncClient, import_settings):
+    headers = await _get_auth_headers(client)
+    files = {"fichier": ("tiers.csv", b"code\nX\n", "text/csv")}
+    url = "/api/v1/systeme/imports"
+    response = await client.post(url, data={"type_import": "factures"}, files=files, headers=headers)
+    assert response.status_code == 400
+    files = {"fichier": ("tiers.pdf", b"%PDF", "application/pdf")}
+    response = await client.post(url, data={"type_import": "tiers"}, files=files, headers=headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_resumes_after_interruption(client: AsyncClient, import_settings):
+    """Import interrompu après 1 ligne : la reprise commence à la ligne suivante."""
+    await _ensure_referentiels()
+    path = import_settings / "reprise.csv"
+    path.write_text(
+        "code,raison_sociale,type_tiers_code\n"
+        "REP-DEJA,Ligne déjà traitée,CLI\n"
+        "REP-002,Client repris,CLI\n",
+        encoding="utf-8",
+    )
+    async with get_session_factory()() as session:
+        job = ImportDonnees(
+            entreprise_id=1,
+            type_import="tiers",
+            nom_fichier="reprise.csv",
+            chemin=str(path),
+            statut="interrompu",
+            lignes_traitees=1,
+            lignes_importees=1,
+        )
+        session.add(job)
+        await session.commit()
+        import_id = job.id
+
+    assert await resume_pending_imports() >= 1
+    await _wait(import_id)
+
+    async with get_session_factory()() as session:
+        job = await session.get(ImportDonnees, import_id)
+        tiers = set((await session.execute(select(Tiers.code).where(Tiers.code.like("REP-%")))).scalars())
+    assert job.statut == "termine"
+    assert (job.lignes_traitees, job.lignes_importees) == (2, 2)
+    assert tiers == {"REP-002"}
+    assert not path.exists()
@@ -0,0 +1,76 @@
+# tests/api/test_logging.py
+# -----------------------------------------------------------------------------
+# Tests du logging structuré : JSON valide quel que soit le message, contexte
+# de requête, X-Request-ID renvoyé, échantillonnage DEBUG, route liée dès le
+# routage (routes publiques comprises).
+# -----------------------------------------------------------------------------
+
+import json
+import logging
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.logging_config import (
+    JsonFormatter,
+    _DebugSamplingFilter,
+    _log_context,
+    bind_log_context,
+    get_log_context,
+)
+from app.modules.auth import router as auth_router
+
+
+def _record(msg: str, *args, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("gesco.test", level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter_escapes_and_carries_context():
+    """Guillemets et retours ligne ne cassent pas le JSON ; le contexte est inclus."""
+    token = _log_context.set({"request_id": "r-1"})
+    try:
+        bind_log_context(user_id=7, entreprise_id=1)
+        record = _record('Facture "%s"\nligne 2', "FAC-001")
+        for key, value in _log_context.get().items():
+            setattr(record, key, value)
+        data = json.loads(JsonFormatter().format(record))
+    finally:
+        _log_context.reset(token)
+    assert data["message"] == 'Facture "FAC-001"\nligne 2'
+    assert data["request_id"] == "r-1"
+    assert data["user_id"] == 7
+    assert data["level"] == "INFO"
+
+
+def test_debug_sampling():
+    """Taux 0 : DEBUG écartés, niveaux supérieurs conservés."""
+    sampling = _DebugSamplingFilter(0.0)
+    assert not sampling.filter(_record("x", level=logging.DEBUG))
+    assert sampling.filter(_record("x", level=logging.INFO))
+
+
+@pytest.mark.asyncio
+async def test_request_id_header(client: AsyncClient):
+    """X-Request-ID est repris s'il est fourni, généré sinon."""
+    response = await client.get("/health", headers={"X-Request-ID": "abc-123"})
+    assert response.headers["x-request-id"] == "abc-123"
+    response = await client.get("/health")
+    assert len(response.headers["x-request-id"]) == 32
+
+
+@pytest.mark.asyncio
+async def test_route_bound_before_handler(client: AsyncClient, monkeypatch):
+    """Route publique (sans get_current_user) : le modèle de route est dans le contexte pendant le handler."""
+    seen: list[dict] = []
+    login = auth_router.auth_login
+
+    async def _login(*args, **kwargs):
+        seen.append(get_log_context())
+        return await login(*args, **kwargs)
+
+    monkeypatch.setattr(auth_router, "auth_login", _login)
+    response = await client.post(
+        "/api/v1/auth/login", json={"entreprise_id": 1, "login": "test", "password": "password"}
+    )
+    assert response.status_code == 200
+    assert seen[0]["route"] == "/api/v1/auth/login"
@@ -0,0 +1,77 @@
+# tests/api/test_metrics.py
+# -----------------------------------------------------------------------------
+# Tests de l'endpoint /metrics : format Prometheus, libellé de route modèle
+# (pas le chemin brut), requêtes SQL comptées par requête HTTP, logs perdus,
+# endpoint absent avec plusieurs workers.
+# -----------------------------------------------------------------------------
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.config import get_settings
+from app.core import metrics
+from app.core.metrics import HTTP_SQL_STATEMENTS
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposition(client: AsyncClient):
+    """Après quelques requêtes, /metrics expose latence, SQL, pool et caches."""
+    headers = await _get_auth_headers(client)
+    await client.get("/health")
+    await client.get("/api/v1/commercial/factures/999999", headers=headers)
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'gesco_http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert 'route="/api/v1/commercial/factures/{id}"' in body
+    assert "/factures/999999" not in body
+    assert "gesco_http_requests_in_flight" in body
+    assert 'gesco_sql_statement_duration_seconds_count{statement="SELECT"}' in body
+    assert "# TYPE gesco_cache_hit_ratio gauge" in body
+
+
+@pytest.mark.asyncio
+async def test_sql_statements_counted_per_request(client: AsyncClient):
+    """Une requête authentifiée exécute au moins une requête SQL, /health aucune."""
+    headers = await _get_auth_headers(client)
+    route = "/api/v1/commercial/factures"
+    before = HTTP_SQL_STATEMENTS.count("GET", route)
+    await client.get(route, headers=headers)
+    assert HTTP_SQL_STATEMENTS.count("GET", route) == before + 1
+    series = HTTP_SQL_STATEMENTS._series[("GET", route)]
+    assert series[1] >= 1
+
+    health_before = HTTP_SQL_STATEMENTS._series.get(("GET", "/health"), [None, 0.0])[1]
+    await client.get("/health")
+    assert HTTP_SQL_STATEMENTS._series[("GET", "/health")][1] == health_before
+
+
+@pytest.mark.asyncio
+async def test_dropped_log_records_exported(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(metrics, "dropped_records", lambda: 3)
+    body = (await client.get("/metrics")).text
+    assert "# TYPE gesco_log_records_dropped_total counter" in body
+    assert "gesco_log_records_dropped_total 3" in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_with_several_workers(monkeypatch):
+    """WEB_CONCURRENCY > 1 : registre propre à chaque worker, /metrics non exposé."""
+    from app.main import create_app
+
+    monkeypatch.setattr(get_settings(), "WEB_CONCURRENCY", 2)
+    assert not get_settings().metrics_active()
+    async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://test") as ac:
+        assert (await ac.get("/metrics")).status_code == 404
+        assert (await ac.get("/docs")).status_code == 200
@@ -0,0 +1,118 @@
+# tests/api/test_principal_cache.py
+# -----------------------------------------------------------------------------
+# Cache principal / permissions (parametrage.principal_cache) : une écriture
+# commitée par un autre worker (sans invalidation explicite, seulement les
+# compteurs de version partagés) s'applique dès la requête suivante —
+# utilisateur désactivé, permission retirée du rôle. Cache désactivé avec
+# plusieurs workers sans backend partagé.
+# -----------------------------------------------------------------------------
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core import report_cache
+from app.core.database import get_session_factory
+from app.core.report_cache import ReportCache, apply_pending_invalidations
+from app.core.security import hash_password
+from app.modules.parametrage import principal_cache
+from app.modules.parametrage.models import Entreprise, Permission, PermissionRole, Role, Utilisateur
+from app.modules.parametrage.principal_cache import ROLE_TABLES, USER_TABLES, get_principal_cache
+
+URL = "/api/v1/parametrage/roles"
+
+
+async def _permission(session, module: str, action: str) -> Permission:
+    perm = await session.scalar(select(Permission).where(Permission.module == module, Permission.action == action))
+    if perm is None:
+        perm = Permission(module=module, action=action, libelle=f"{module}.{action}")
+        session.add(perm)
+        await session.flush()
+    return perm
+
+
+async def _user_with_role(login: str) -> tuple[int, int, int]:
+    """Utilisateur et rôle dédiés (parametrage.read + une autre permission) : (user_id, role_id, entreprise_id)."""
+    async with get_session_factory()() as session:
+        entreprise_id = await session.scalar(select(Entreprise.id).limit(1))
+        role = Role(entreprise_id=entreprise_id, code=f"R-{login}", libelle=f"Rôle {login}")
+        session.add(role)
+        await session.flush()
+        for module, action in (("parametrage", "read"), ("rapports", "read")):
+            perm = await _permission(session, module, action)
+            session.add(PermissionRole(role_id=role.id, permission_id=perm.id))
+        user = Utilisateur(
+            entreprise_id=entreprise_id,
+            role_id=role.id,
+            login=login,
+            mot_de_passe_hash=hash_password("password"),
+            nom="Cache",
+            prenom="Principal",
+            actif=True,
+        )
+        session.add(user)
+        await session.commit()
+        await apply_pending_invalidations(session)
+        return user.id, role.id, entreprise_id
+
+
+async def _headers(client: AsyncClient, entreprise_id: int, login: str) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": entreprise_id, "login": login, "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _commit_elsewhere(statement) -> None:
+    """Écriture d'un autre worker : commit puis compteurs partagés, sans invalidate_user / invalidate_role."""
+    async with get_session_factory()() as session:
+        await statement(session)
+        await session.commit()
+        await apply_pending_invalidations(session)
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_rejected_on_next_request(client: AsyncClient):
+    user_id, _, entreprise_id = await _user_with_role("pc-actif")
+    headers = await _headers(client, entreprise_id, "pc-actif")
+    assert (await client.get(URL, headers=headers)).status_code == 200
+    cache = get_principal_cache()
+    versions = await cache.versions(entreprise_id, USER_TABLES)
+    assert cache.get_principal(user_id, versions) is not None  # chemin en cache
+
+    async def _deactivate(session) -> None:
+        user = await session.get(Utilisateur, user_id)
+        user.actif = False
+
+    await _commit_elsewhere(_deactivate)
+    assert (await client.get(URL, headers=headers)).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_removed_permission_rejected_on_next_request(client: AsyncClient):
+    _, role_id, entreprise_id = await _user_with_role("pc-perm")
+    headers = await _headers(client, entreprise_id, "pc-perm")
+    assert (await client.get(URL, headers=headers)).status_code == 200
+    cache = get_principal_cache()
+    versions = await cache.versions(entreprise_id, ROLE_TABLES)
+    assert ("parametrage", "read") in cache.get_permissions(role_id, versions)
+
+    async def _revoke(session) -> None:
+        liaison = await session.scalar(
+            select(PermissionRole)
+            .join(Permission, Permission.id == PermissionRole.permission_id)
+            .where(PermissionRole.role_id == role_id, Permission.module == "parametrage")
+        )
+        await session.delete(liaison)
+
+    await _commit_elsewhere(_revoke)
+    response = await client.get(URL, headers=headers)
+    assert response.status_code == 403
+
+
+def test_cache_disabled_with_workers_without_shared_backend(monkeypatch):
+    monkeypatch.setattr(report_cache, "_report_cache", ReportCache(ttl_seconds=300, max_entries=16, workers=2))
+    monkeypatch.setattr(principal_cache, "_principal_cache", None)
+    assert not get_principal_cache().enabled
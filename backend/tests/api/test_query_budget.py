@@ -0,0 +1,75 @@
+# tests/api/test_query_budget.py
+# -----------------------------------------------------------------------------
+# Budgets de requêtes SQL par endpoint (fixture max_queries), en-tête
+# Server-Timing et détection des formes répétées (N+1).
+# -----------------------------------------------------------------------------
+
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.query_stats import QueryStats, server_timing
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_list_factures_query_budget(client: AsyncClient, max_queries):
+    """La liste des factures reste sous 5 requêtes (utilisateur en cache, page, total)."""
+    headers = await _get_auth_headers(client)
+    with max_queries(5):
+        response = await client.get("/api/v1/commercial/factures", headers=headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_create_facture_query_budget(client: AsyncClient, max_queries):
+    """Création d'une facture : contrôles d'existence, insertion, agrégats, audit."""
+    headers = await _get_auth_headers(client)
+    payload = {
+        "entreprise_id": 1,
+        "point_de_vente_id": 1,
+        "client_id": 1,
+        "numero": "FAC-BUDGET-001",
+        "date_facture": date.today().isoformat(),
+        "etat_id": 1,
+        "type_facture": "facture",
+        "montant_ht": "1000.00",
+        "montant_tva": "192.50",
+        "montant_ttc": "1192.50",
+        "montant_restant_du": "1192.50",
+        "devise_id": 1,
+    }
+    with max_queries(15):
+        response = await client.post("/api/v1/commercial/factures", json=payload, headers=headers)
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client: AsyncClient):
+    """Chaque réponse porte Server-Timing avec le temps DB et le nombre de requêtes."""
+    headers = await _get_auth_headers(client)
+    response = await client.get("/api/v1/commercial/factures", headers=headers)
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert 'SQL"' in timing and "app;dur=" in timing
+
+
+def test_repeated_shapes_are_reported():
+    """Les formes exécutées au moins `threshold` fois sont signalées, imbrication cumulée."""
+    parent = QueryStats(collect_shapes=True)
+    stats = QueryStats(collect_shapes=True, parent=parent)
+    for _ in range(6):
+        stats.record("SELECT * FROM produits\n  WHERE id = ?", 0.001)
+    stats.record("SELECT * FROM factures WHERE id = ?", 0.001)
+    assert stats.repeated(5) == [("SELECT * FROM produits WHERE id = ?", 6)]
+    assert parent.statements == 7
+    assert server_timing(stats, 0.01).startswith('db;dur=7.00;desc="7 SQL"')
@@ -0,0 +1,60 @@
+# tests/api/test_rate_limit.py
+# -----------------------------------------------------------------------------
+# Tests du middleware de limitation du débit (GCRA, backend mémoire) sur une
+# application minimale : limite IP, limite par route, éviction LRU des clés.
+# -----------------------------------------------------------------------------
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.rate_limit import MemoryRateLimitBackend, RateLimitMiddleware, parse_route_limits
+
+
+def _app(**kwargs) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/login")
+    async def login():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, **kwargs)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_per_ip_returns_429_with_retry_after():
+    """Au-delà de la rafale autorisée, 429 avec Retry-After."""
+    app = _app(requests_per_minute=3, backend=MemoryRateLimitBackend())
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        statuses = [(await client.get("/ping")).status_code for _ in range(4)]
+        assert statuses == [200, 200, 200, 429]
+        response = await client.get("/ping")
+        assert response.json()["code"] == "RATE_LIMIT_EXCEEDED"
+        assert int(response.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_per_route():
+    """Une limite de route ne s'applique qu'aux chemins du préfixe."""
+    app = _app(
+        requests_per_minute=0,
+        route_limits=parse_route_limits("/login=1"),
+        backend=MemoryRateLimitBackend(),
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/login")).status_code == 200
+        assert (await client.get("/login")).status_code == 429
+        assert (await client.get("/ping")).status_code == 200
+
+
+def test_memory_backend_is_bounded():
+    """Le backend mémoire ne garde pas plus de max_keys clients."""
+    backend = MemoryRateLimitBackend(max_keys=10)
+    for i in range(100):
+        assert backend.hit_nowait(f"ip:10.0.0.{i}", 60) == 0
+    assert len(backend) == 10
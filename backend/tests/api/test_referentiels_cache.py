@@ -0,0 +1,45 @@
+# tests/api/test_referentiels_cache.py
+# -----------------------------------------------------------------------------
+# Tests du cache applicatif des référentiels (cached_query) : deuxième lecture
+# servie par le cache, invalidation après une écriture commitée.
+# -----------------------------------------------------------------------------
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.cache import cache_stats
+from app.modules.commercial.models import EtatDocument
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _hits() -> int:
+    return cache_stats().get(f"query:{EtatDocument.__table__.name}", {}).get("hits", 0)
+
+
+@pytest.mark.asyncio
+async def test_etats_document_list_is_cached_and_invalidated(client: AsyncClient):
+    """La liste est servie par le cache puis relue après création d'un état."""
+    headers = await _get_auth_headers(client)
+    url = "/api/v1/commercial/etats-document?type_document=facture"
+    first = await client.get(url, headers=headers)
+    hits = _hits()
+    second = await client.get(url, headers=headers)
+    assert second.json() == first.json()
+    assert _hits() == hits + 1
+
+    created = await client.post(
+        "/api/v1/commercial/etats-document",
+        json={"type_document": "facture", "code": "CACHE_TEST", "libelle": "Test cache", "ordre": 99},
+        headers=headers,
+    )
+    assert created.status_code == 201
+    third = await client.get(url, headers=headers)
+    assert "CACHE_TEST" in [e["code"] for e in third.json()]
@@ -0,0 +1,145 @@
+# tests/api/test_report_cache.py
+# -----------------------------------------------------------------------------
+# Cache des rapports (app.core.report_cache) : un rapport en cache est
+# recalculé après une écriture commitée sur une table lue (facture, tiers,
+# employé), une écriture annulée n'incrémente aucune version, cache désactivé
+# avec plusieurs workers sans backend partagé.
+# -----------------------------------------------------------------------------
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+from app.core import report_cache
+from app.core.cache import MemoryCacheBackend
+from app.core.database import get_session_factory
+from app.core.report_cache import ReportCache, apply_pending_invalidations, get_report_cache
+from app.modules.partenaires.models import Tiers
+from app.modules.rapports.schemas import ChiffreAffairesPeriode
+
+
+async def _get_auth_headers(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"entreprise_id": 1, "login": "test", "password": "password"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _create_facture(client: AsyncClient, headers: dict, numero: str, ttc: str = "1192.50") -> None:
+    payload = {
+        "entreprise_id": 1,
+        "point_de_vente_id": 1,
+        "client_id": 1,
+        "numero": numero,
+        "date_facture": date.today().isoformat(),
+        "date_echeance": date.today().isoformat(),
+        "etat_id": 1,
+        "type_facture": "facture",
+        "montant_ht": "1000.00",
+        "montant_tva": "192.50",
+        "montant_ttc": ttc,
+        "montant_restant_du": ttc,
+        "devise_id": 1,
+    }
+    response = await client.post("/api/v1/commercial/factures", json=payload, headers=headers)
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_chiffre_affaires_recomputed_after_facture(client: AsyncClient):
+    headers = await _get_auth_headers(client)
+    jour = date.today().isoformat()
+    url = f"/api/v1/rapports/chiffre-affaires?entreprise_id=1&date_debut={jour}&date_fin={jour}"
+    first = (await client.get(url, headers=headers)).json()
+    assert (await client.get(url, headers=headers)).json() == first
+
+    await _create_facture(client, headers, "FAC-RC-001", ttc="500.00")
+    after = (await client.get(url, headers=headers)).json()
+    assert after["nombre_factures"] == first["nombre_factures"] + 1
+    assert Decimal(after["montant_total_ttc"]) == Decimal(first["montant_total_ttc"]) + Decimal("500.00")
+
+
+@pytest.mark.asyncio
+async def test_balance_agee_recomputed_after_tiers_update(client: AsyncClient):
+    headers = await _get_auth_headers(client)
+    await _create_facture(client, headers, "FAC-RC-002")
+    url = "/api/v1/rapports/balance-agee?entreprise_id=1&client_id=1"
+    first = (await client.get(url, headers=headers)).json()
+    assert first["lignes"][0]["client_raison_sociale"] != "Client renommé"
+
+    updated = await client.patch("/api/v1/partenaires/tiers/1", json={"raison_sociale": "Client renommé"}, headers=headers)
+    assert updated.status_code == 200
+    after = (await client.get(url, headers=headers)).json()
+    assert after["lignes"][0]["client_raison_sociale"] == "Client renommé"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_recomputed_after_employe(client: AsyncClient):
+    headers = await _get_auth_headers(client)
+    url = "/api/v1/rapports/dashboard?entreprise_id=1"
+    first = (await client.get(url, headers=headers)).json()
+    assert first["metriques_indisponibles"] == []
+
+    created = await client.post(
+        "/api/v1/rh/employes",
+        json={
+            "entreprise_id": 1,
+            "matricule": "EMP-RC-1",
+            "nom": "Ngono",
+            "prenom": "Paul",
+            "date_embauche": date.today().isoformat(),
+        },
+        headers=headers,
+    )
+    assert created.status_code == 201
+    after = (await client.get(url, headers=headers)).json()
+    assert after["nb_employes_actifs"] == first["nb_employes_actifs"] + 1
+
+
+@pytest.mark.asyncio
+async def test_rollback_does_not_bump_versions(client: AsyncClient):
+    """Écriture flushée puis annulée : aucune version incrémentée, le rapport reste en cache."""
+    versions = await get_report_cache().versions(1, ("tiers",))
+    async with get_session_factory()() as session:
+        session.add(Tiers(entreprise_id=1, type_tiers_id=1, code="RC-ROLLBACK", raison_sociale="Annulé", actif=True))
+        await session.flush()
+        await session.rollback()
+        await apply_pending_invalidations(session)
+    assert await get_report_cache().versions(1, ("tiers",)) == versions
+
+
+def _rapport(n: int) -> ChiffreAffairesPeriode:
+    jour = date(2025, 1, 1)
+    return ChiffreAffairesPeriode(
+        entreprise_id=1, date_debut=jour, date_fin=jour, montant_total_ttc=Decimal(n), nombre_factures=n
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_with_workers_without_shared_backend(monkeypatch):
+    """WEB_CONCURRENCY > 1 sans REDIS_URL : compteurs non partagés, chaque lecture est recalculée."""
+    monkeypatch.setattr(get_settings(), "WEB_CONCURRENCY", 2)
+    monkeypatch.setattr(get_settings(), "REDIS_URL", None)
+    monkeypatch.setattr(report_cache, "_report_cache", None)
+    cache = get_report_cache()
+    assert not cache.consistent
+    assert not cache.enabled
+
+    calls = []
+
+    async def _compute() -> ChiffreAffairesPeriode:
+        calls.append(1)
+        return _rapport(len(calls))
+
+    params = {"report": "ca", "entreprise_id": 1, "params": {}, "tables": ("factures",)}
+    for _ in range(2):
+        await cache.get_or_compute(**params, schema=ChiffreAffairesPeriode, compute=_compute)
+    assert len(calls) == 2
+
+    shared = ReportCache(ttl_seconds=300, max_entries=16, shared=MemoryCacheBackend(16), workers=2)
+    assert shared.consistent and shared.enabled
@@ -0,0 +1,41 @@
+# tests/api/test_startup.py
+# -----------------------------------------------------------------------------
+# Démarrage rapide : routeurs chargés au premier appel de leur préfixe,
+# schéma OpenAPI pré-calculé relu depuis le disque, durées d'import mesurées.
+# -----------------------------------------------------------------------------
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.startup import LazyRouters, load_openapi_schema, startup_timings
+from app.main import ROUTER_MODULES
+
+
+@pytest.mark.asyncio
+async def test_lazy_router_loaded_on_first_call():
+    """Aucun routeur au démarrage ; le premier appel d'un préfixe charge son module."""
+    app = FastAPI()
+    routers = LazyRouters(app, "/api/v1", ROUTER_MODULES)
+    routers.install()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert not routers.loaded
+        response = await client.get("/api/v1/catalogue/produits")
+        assert response.status_code == 401  # route trouvée (authentification requise), pas 404
+        assert routers.loaded == {"catalogue"}
+        response = await client.get("/api/v1/inconnu/ressource")
+        assert response.status_code == 404
+        assert routers.loaded == {"catalogue"}
+    assert "import:app.modules.catalogue.router" in startup_timings()
+
+
+@pytest.mark.asyncio
+async def test_precomputed_openapi_schema(client: AsyncClient, tmp_path):
+    """Le schéma exporté est relu à l'identique ; fichier absent = None."""
+    schema = (await client.get("/openapi.json")).json()
+    path = tmp_path / "openapi.json"
+    path.write_bytes(orjson.dumps(schema))
+    assert load_openapi_schema(path) == schema
+    assert "BearerAuth" in schema["components"]["securitySchemes"]
+    assert load_openapi_schema(tmp_path / "absent.json") is None
@@ -1,10 +1,11 @@
 # tests/conftest.py
 # -----------------------------------------------------------------------------
 # Fixtures pytest : base SQLite en mémoire, création des tables, seed minimal,
-# client HTTP async pour les tests d'API.
+# client HTTP async pour les tests d'API, budget de requêtes SQL (max_queries).
 # -----------------------------------------------------------------------------
 
 import os
+from contextlib import contextmanager
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -15,8 +16,11 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
 os.environ["DATABASE_URL_SYNC"] = "sqlite:///:memory:"
 os.environ.setdefault("SECRET_KEY", "0123456789abcdef0123456789abcdef")
+# Limiteur global désactivé : toute la suite partage une IP (tests dédiés : test_rate_limit)
+os.environ["RATE_LIMIT_PER_MINUTE"] = "0"
 
 from app.core.database import Base, get_engine
+from app.core.query_stats import track_queries
 from app.core.security import hash_password
 from app.modules.commercial.models import EtatDocument
 from app.modules.partenaires.models import TypeTiers, Tiers
@@ -141,3 +145,21 @@ async def client(_engine_and_tables):
     ) as ac:
         yield ac
 
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Budget SQL : `with max_queries(3): await client.get(...)` échoue si le bloc
+    exécute plus de 3 requêtes (formes répétées listées dans le message).
+    """
+
+    @contextmanager
+    def _budget(limit: int):
+        with track_queries(collect_shapes=True) as stats:
+            yield stats
+        if stats.statements > limit:
+            repeated = "\n".join(f"  {n} × {shape[:200]}" for shape, n in stats.repeated(2))
+            pytest.fail(f"{stats.statements} requêtes SQL exécutées (budget : {limit})\n{repeated}")
+
+    return _budget
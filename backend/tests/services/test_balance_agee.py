@@ -0,0 +1,112 @@
+# tests/services/test_balance_agee.py
+# -----------------------------------------------------------------------------
+# Balance âgée (BalanceAgeeRepository) : bornes des tranches (échéance au jour
+# de référence, 30/31, 60/61, 90/91 jours), repli sur date_facture sans
+# échéance, avoirs, proformas et factures soldées exclus.
+# -----------------------------------------------------------------------------
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.modules.achats import models as _achats_models  # noqa: F401
+from app.modules.catalogue import models as _catalogue_models  # noqa: F401
+from app.modules.commercial.models import EtatDocument, Facture
+from app.modules.comptabilite import models as _comptabilite_models  # noqa: F401
+from app.modules.immobilisations import models as _immobilisations_models  # noqa: F401
+from app.modules.paie import models as _paie_models  # noqa: F401
+from app.modules.parametrage.models import Devise, Entreprise, PointDeVente
+from app.modules.partenaires.models import Tiers, TypeTiers
+from app.modules.rapports.repositories import BalanceAgeeRepository
+from app.modules.rh import models as _rh_models  # noqa: F401
+from app.modules.stock import models as _stock_models  # noqa: F401
+from app.modules.systeme import models as _systeme_models  # noqa: F401
+from app.modules.tresorerie import models as _tresorerie_models  # noqa: F401
+
+REFERENCE = date(2025, 6, 30)
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Devise(id=1, code="XAF", libelle="Franc CFA"))
+        session.add(Entreprise(id=1, code="ENT", raison_sociale="Ent", regime_fiscal="reel", mode_gestion="standard"))
+        session.add(PointDeVente(id=1, entreprise_id=1, code="PDV", libelle="PDV", type="vente"))
+        session.add(TypeTiers(id=1, code="CLI", libelle="Client"))
+        session.add(Tiers(id=1, entreprise_id=1, type_tiers_id=1, code="CLI1", raison_sociale="Client 1"))
+        session.add(EtatDocument(id=1, type_document="facture", code="VALIDE", libelle="Validée"))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+def _facture(
+    numero: str,
+    reste_du: str,
+    *,
+    retard: int | None,
+    date_facture: date | None = None,
+    type_facture: str = "facture",
+) -> Facture:
+    """Facture dont l'échéance précède REFERENCE de retard jours (None : sans échéance)."""
+    montant = Decimal(reste_du)
+    return Facture(
+        entreprise_id=1,
+        point_de_vente_id=1,
+        client_id=1,
+        numero=numero,
+        date_facture=date_facture or REFERENCE - timedelta(days=120),
+        date_echeance=None if retard is None else REFERENCE - timedelta(days=retard),
+        etat_id=1,
+        type_facture=type_facture,
+        montant_ht=montant,
+        montant_ttc=montant,
+        montant_restant_du=montant,
+        devise_id=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tranches_bornes(db):
+    """Chaque retard limite (0, 1, 30, 31, 60, 61, 90, 91 jours) tombe dans sa tranche."""
+    for i, (retard, montant) in enumerate(
+        ((0, "1"), (1, "2"), (30, "4"), (31, "8"), (60, "16"), (61, "32"), (90, "64"), (91, "128"))
+    ):
+        db.add(_facture(f"B{i}", montant, retard=retard))
+    await db.commit()
+
+    lignes, totaux = await BalanceAgeeRepository(db).get_balance(1, REFERENCE)
+    assert len(lignes) == 1
+    attendu = {"non_echu": "1", "echu_0_30": "6", "echu_31_60": "24", "echu_61_90": "96", "echu_plus_90": "128"}
+    assert {tranche: lignes[0][tranche] for tranche in attendu} == {t: Decimal(m) for t, m in attendu.items()}
+    assert lignes[0]["echu"] == Decimal("254")
+    assert totaux["total"] == Decimal("255.00")
+    assert totaux["nombre_factures"] == 8
+
+
+@pytest.mark.asyncio
+async def test_sans_echeance_et_types_exclus(db):
+    """Sans échéance : date_facture ; avoir, proforma et facture soldée absents de la balance."""
+    db.add_all([
+        _facture("S1", "100", retard=None, date_facture=REFERENCE - timedelta(days=45)),
+        _facture("S2", "10", retard=None, date_facture=REFERENCE),
+        _facture("A1", "500", retard=100, type_facture="avoir"),
+        _facture("P1", "700", retard=100, type_facture="proforma"),
+        _facture("Z1", "0", retard=100),
+    ])
+    await db.commit()
+
+    lignes, totaux = await BalanceAgeeRepository(db).get_balance(1, REFERENCE)
+    assert len(lignes) == 1
+    assert lignes[0]["echu_31_60"] == Decimal("100.00")
+    assert lignes[0]["non_echu"] == Decimal("10.00")
+    assert lignes[0]["echu_plus_90"] == Decimal("0.00")
+    assert totaux["total"] == Decimal("110.00")
+    assert totaux["nombre_factures"] == 2
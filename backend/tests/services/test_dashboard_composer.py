@@ -0,0 +1,68 @@
+# tests/services/test_dashboard_composer.py
+# -----------------------------------------------------------------------------
+# Composition du tableau de bord (DashboardComposer) : parallélisme borné par
+# le sémaphore partagé, délai par indicateur compté hors attente d'une place,
+# indicateur hors délai listé comme indisponible.
+# -----------------------------------------------------------------------------
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.modules.rapports.services.composer import ContexteDashboard, DashboardComposer
+
+CTX = ContexteDashboard(entreprise_id=1, date_debut=None, date_fin=None, date_reference=date.today())
+
+
+class _Session:
+    async def connection(self) -> None:
+        return None
+
+    async def __aenter__(self) -> "_Session":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_fan_out_bounded_and_wait_outside_timeout():
+    """2 places, 6 indicateurs de 30 ms, délai 50 ms : jamais plus de 2 en cours, aucun hors délai."""
+    en_cours = max_en_cours = 0
+
+    def _metrique(nom: str):
+        async def _fn(_db, _ctx) -> dict:
+            nonlocal en_cours, max_en_cours
+            en_cours += 1
+            max_en_cours = max(max_en_cours, en_cours)
+            await asyncio.sleep(0.03)
+            en_cours -= 1
+            return {nom: 1}
+        return _fn
+
+    composer = DashboardComposer(
+        _Session,
+        timeout=0.05,
+        metriques={f"m{i}": _metrique(f"m{i}") for i in range(6)},
+        slots=asyncio.Semaphore(2),
+    )
+    valeurs, indisponibles = await composer.composer(CTX)
+    assert indisponibles == []
+    assert len(valeurs) == 6
+    assert max_en_cours == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_metric_is_unavailable():
+    async def _lent(_db, _ctx) -> dict:
+        await asyncio.sleep(1)
+        return {"lent": 1}
+
+    async def _rapide(_db, _ctx) -> dict:
+        return {"rapide": 1}
+
+    composer = DashboardComposer(_Session, timeout=0.02, metriques={"lent": _lent, "rapide": _rapide})
+    valeurs, indisponibles = await composer.composer(CTX)
+    assert valeurs == {"rapide": 1}
+    assert indisponibles == ["lent"]
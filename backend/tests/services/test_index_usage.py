@@ -0,0 +1,103 @@
+# tests/services/test_index_usage.py
+# -----------------------------------------------------------------------------
+# Vérifie par EXPLAIN QUERY PLAN (SQLite) que la requête principale de chaque
+# repository à fort volume utilise un index du pack multi-tenant : la requête
+# réellement émise par le repository est capturée puis expliquée. Balance
+# âgée : lecture des factures par l'index seul (couvrant).
+# -----------------------------------------------------------------------------
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.pagination import TotalMode
+from app.modules.achats import models as _achats_models  # noqa: F401
+from app.modules.catalogue import models as _catalogue_models  # noqa: F401
+from app.modules.catalogue.repositories import ProduitRepository
+from app.modules.commercial.repositories import FactureRepository
+from app.modules.comptabilite.repositories import (
+    EcritureComptableRepository,
+    LigneEcritureRepository,
+)
+from app.modules.immobilisations import models as _immobilisations_models  # noqa: F401
+from app.modules.paie import models as _paie_models  # noqa: F401
+from app.modules.partenaires.repositories import TiersRepository
+from app.modules.rapports import models as _rapports_models  # noqa: F401
+from app.modules.rapports.repositories import BalanceAgeeRepository
+from app.modules.rh import models as _rh_models  # noqa: F401
+from app.modules.stock.repositories import MouvementStockRepository
+from app.modules.systeme.repositories import JournalAuditRepository
+from app.modules.tresorerie.repositories import ReglementRepository
+
+_NONE = TotalMode.none
+
+CASES = [
+    ("factures", "ix_factures_entreprise_date",
+     lambda db: FactureRepository(db).find_all(entreprise_id=1, include_total=_NONE)),
+    ("reglements", "ix_reglements_entreprise_date",
+     lambda db: ReglementRepository(db).find_all(entreprise_id=1, include_total=_NONE)),
+    ("ecritures_comptables", "ix_ecritures_comptables_entreprise_date",
+     lambda db: EcritureComptableRepository(db).find_all(entreprise_id=1, include_total=_NONE)),
+    ("journaux_audit", "ix_journaux_audit_entreprise_created",
+     lambda db: JournalAuditRepository(db).find_all(entreprise_id=1, include_total=_NONE)),
+    ("mouvements_stock", "ix_mouvements_stock_produit_date",
+     lambda db: MouvementStockRepository(db).find_all(produit_id=1, include_total=_NONE)),
+    ("lignes_ecritures", "ix_lignes_ecritures_ecriture",
+     lambda db: LigneEcritureRepository(db).find_by_ecriture(1)),
+    ("produits", "ix_produits_entreprise_libelle_actifs",
+     lambda db: ProduitRepository(db).find_all(entreprise_id=1, include_total=_NONE)),
+    ("tiers", "ix_tiers_entreprise_raison_sociale_actifs",
+     lambda db: TiersRepository(db).find_all(entreprise_id=1, include_total=_NONE)),
+]
+
+
+@pytest.fixture
+async def engine():
+    eng = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield eng
+    await eng.dispose()
+
+
+async def _plan(engine, table: str, query) -> str:
+    """Plan (EXPLAIN QUERY PLAN) de la dernière requête SELECT émise sur table par query."""
+    captured: list[tuple[str, tuple]] = []
+
+    def _capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    try:
+        async with AsyncSession(engine) as db:
+            await query(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+    assert captured, f"aucune requête capturée sur {table}"
+
+    statement, parameters = captured[-1]
+    async with engine.connect() as conn:
+        rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+    return " | ".join(str(row[-1]) for row in rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("table", "index", "query"), CASES, ids=[c[0] for c in CASES])
+async def test_repository_main_query_uses_index(engine, table, index, query):
+    """Le plan de la requête principale passe par l'index attendu (ni SCAN complet ni tri temporaire)."""
+    plan = await _plan(engine, table, query)
+    assert f"INDEX {index}" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_balance_agee_uses_covering_index(engine):
+    """Totaux de la balance âgée : factures lues dans ix_factures_balance_agee seul (entreprise, type)."""
+    plan = await _plan(engine, "factures", lambda db: BalanceAgeeRepository(db).get_balance(1, date(2025, 6, 30)))
+    assert "COVERING INDEX ix_factures_balance_agee (entreprise_id=? AND type_facture=?)" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
@@ -0,0 +1,105 @@
+# tests/services/test_pagination.py
+# -----------------------------------------------------------------------------
+# paginate() selon include_total : none (total None, aucun COUNT), exact
+# (COUNT sur la requête filtrée), estimate (repli sur exact sous SQLite et,
+# sous PostgreSQL, quand l'estimation du planificateur est sous le seuil).
+# -----------------------------------------------------------------------------
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import registry
+from sqlalchemy.pool import StaticPool
+
+from app.core import pagination
+from app.core.pagination import TotalMode, paginate
+from app.core.query_stats import install_query_tracking
+
+metadata = MetaData()
+lignes = Table("lignes", metadata, Column("id", Integer, primary_key=True), Column("groupe", String(10)))
+
+
+class Ligne:
+    def __init__(self, groupe: str) -> None:
+        self.groupe = groupe
+
+
+registry(metadata=metadata).map_imperatively(Ligne, lignes)
+
+Q = select(Ligne).where(Ligne.groupe == "a").order_by(Ligne.id)
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    install_query_tracking(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([Ligne("a") for _ in range(7)] + [Ligne("b") for _ in range(3)])
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_total_none_runs_no_count(db, max_queries):
+    with max_queries(1):
+        items, total = await paginate(db, Q, limit=5, include_total=TotalMode.none)
+    assert total is None
+    assert len(items) == 5
+
+
+@pytest.mark.asyncio
+async def test_total_exact_counts_filtered_query(db, max_queries):
+    with max_queries(2):
+        items, total = await paginate(db, Q, skip=5, limit=5, include_total="exact")
+    assert total == 7
+    assert len(items) == 2
+
+
+@pytest.mark.asyncio
+async def test_total_estimate_falls_back_to_exact_on_sqlite(db, max_queries):
+    with max_queries(2):
+        _, total = await paginate(db, Q, limit=5, include_total=TotalMode.estimate)
+    assert total == 7
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self._value = value
+
+    def scalar_one(self):
+        return self._value
+
+
+class _PostgresSession:
+    """Session PostgreSQL simulée : EXPLAIN (FORMAT JSON) estime rows lignes."""
+
+    def __init__(self, rows: int) -> None:
+        self._rows = rows
+        self.explained: list[str] = []
+
+    def get_bind(self):
+        return type("_Bind", (), {"dialect": postgresql.dialect()})()
+
+    async def connection(self) -> "_PostgresSession":
+        return self
+
+    async def exec_driver_sql(self, sql: str) -> _Result:
+        self.explained.append(sql)
+        return _Result([{"Plan": {"Plan Rows": self._rows}}])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("rows", "attendu"), [(12, 7), (250_000, 250_000)], ids=["sous-seuil", "estimation"])
+async def test_total_estimate_threshold(monkeypatch, rows, attendu):
+    """Sous le seuil, l'estimation est remplacée par le COUNT exact ; au-dessus elle est renvoyée."""
+    async def _count_exact(_db, _q) -> int:
+        return 7
+
+    monkeypatch.setattr(pagination, "_count_exact", _count_exact)
+    session = _PostgresSession(rows)
+    assert await pagination._count_estimate(session, Q) == attendu
+    assert session.explained and session.explained[0].startswith("EXPLAIN (FORMAT JSON) SELECT")
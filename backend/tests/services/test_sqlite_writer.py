@@ -0,0 +1,50 @@
+# tests/services/test_sqlite_writer.py
+# -----------------------------------------------------------------------------
+# Écrivain unique SQLite (SerializedWriteSession) : l'autoflush déclenché par
+# une lecture prend le verrou d'écriture, rendu au commit.
+# -----------------------------------------------------------------------------
+
+import asyncio
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import registry
+
+from app.core.sqlite import SerializedWriteSession
+
+metadata = MetaData()
+notes = Table("notes", metadata, Column("id", Integer, primary_key=True), Column("texte", String(50)))
+
+
+class Note:
+    def __init__(self, texte: str) -> None:
+        self.texte = texte
+
+
+registry(metadata=metadata).map_imperatively(Note, notes)
+
+
+@pytest.mark.asyncio
+async def test_autoflush_on_read_takes_write_lock(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    factory = async_sessionmaker(bind=engine, class_=SerializedWriteSession, expire_on_commit=False)
+    try:
+        async with factory() as first, factory() as second:
+            first.add(Note("a"))
+            await first.execute(select(Note.id))  # autoflush : INSERT
+            assert first.sync_session.write_lock is not None
+
+            second.add(Note("b"))
+            waiting = asyncio.create_task(second.commit())
+            await asyncio.sleep(0.05)
+            assert not waiting.done()  # le second écrivain attend le verrou
+
+            await first.commit()
+            assert first.sync_session.write_lock is None
+            await asyncio.wait_for(waiting, 5)
+            assert (await first.scalar(select(Note.id).where(Note.texte == "b"))) is not None
+    finally:
+        await engine.dispose()
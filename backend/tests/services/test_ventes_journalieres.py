@@ -0,0 +1,228 @@
+# tests/services/test_ventes_journalieres.py
+# -----------------------------------------------------------------------------
+# Table de faits ventes_journalieres : maintenance incrémentale par
+# FactureService (création, modification des champs agrégés : ancien et
+# nouvel agrégat), identique à reconstruire() sur les deux chemins de
+# l'upsert (insertion d'une clé nouvelle, ON CONFLICT sur une clé existante).
+# Séries CA : comparaison N-1 autour du 29 février, pas semaine et trimestre.
+# -----------------------------------------------------------------------------
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from pydantic import Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core import report_cache
+from app.core.database import Base
+from app.core.report_cache import ReportCache
+from app.modules.achats import models as _achats_models  # noqa: F401
+from app.modules.catalogue import models as _catalogue_models  # noqa: F401
+from app.modules.commercial.models import EtatDocument
+from app.modules.commercial.schemas import FactureCreate, FactureUpdate
+from app.modules.commercial.services import FactureService
+from app.modules.comptabilite import models as _comptabilite_models  # noqa: F401
+from app.modules.immobilisations import models as _immobilisations_models  # noqa: F401
+from app.modules.paie import models as _paie_models  # noqa: F401
+from app.modules.parametrage.models import Devise, Entreprise, PointDeVente
+from app.modules.partenaires.models import Tiers, TypeTiers
+from app.modules.rapports.models import VenteJournaliere
+from app.modules.rapports.repositories import VenteJournaliereRepository
+from app.modules.rapports.services import RapportsService
+from app.modules.rh import models as _rh_models  # noqa: F401
+from app.modules.stock import models as _stock_models  # noqa: F401
+from app.modules.systeme import models as _systeme_models  # noqa: F401
+from app.modules.tresorerie import models as _tresorerie_models  # noqa: F401
+
+JOUR = date(2025, 3, 10)
+LENDEMAIN = date(2025, 3, 11)
+
+
+class _FactureUpdateAgregats(FactureUpdate):
+    """Mise à jour des champs agrégés (non exposés par l'API, gérés par FactureService.update)."""
+    date_facture: date | None = None
+    client_id: int | None = None
+    type_facture: str | None = None
+    montant_ht: Decimal | None = Field(None, ge=0)
+    montant_tva: Decimal | None = Field(None, ge=0)
+    montant_ttc: Decimal | None = Field(None, ge=0)
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Devise(id=1, code="XAF", libelle="Franc CFA"))
+        session.add(Entreprise(id=1, code="ENT", raison_sociale="Ent", regime_fiscal="reel", mode_gestion="standard"))
+        session.add(PointDeVente(id=1, entreprise_id=1, code="PDV", libelle="PDV", type="vente"))
+        session.add(TypeTiers(id=1, code="CLI", libelle="Client"))
+        session.add_all(
+            Tiers(id=i, entreprise_id=1, type_tiers_id=1, code=f"CLI{i}", raison_sociale=f"Client {i}")
+            for i in (1, 2)
+        )
+        session.add(EtatDocument(id=1, type_document="facture", code="VALIDE", libelle="Validée"))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def _facture(db: AsyncSession, numero: str, ttc: str, *, client_id: int = 1, jour: date = JOUR):
+    ttc = Decimal(ttc)
+    ht = (ttc / Decimal("1.1925")).quantize(Decimal("0.01"))
+    return await FactureService(db).create(
+        FactureCreate(
+            entreprise_id=1,
+            point_de_vente_id=1,
+            client_id=client_id,
+            numero=numero,
+            date_facture=jour,
+            etat_id=1,
+            type_facture="facture",
+            montant_ht=ht,
+            montant_tva=ttc - ht,
+            montant_ttc=ttc,
+            montant_restant_du=ttc,
+            devise_id=1,
+        )
+    )
+
+
+async def _agregats(db: AsyncSession) -> dict[tuple, tuple[Decimal, int]]:
+    """(date, client, type) → (TTC, nombre de factures), hors agrégats vidés par une modification."""
+    rows = await db.execute(
+        select(
+            VenteJournaliere.date_vente,
+            VenteJournaliere.client_id,
+            VenteJournaliere.type_facture,
+            VenteJournaliere.montant_ttc,
+            VenteJournaliere.nombre_factures,
+        ).where(VenteJournaliere.nombre_factures != 0)
+    )
+    return {
+        (jour, client, type_facture): (Decimal(str(ttc)).quantize(Decimal("0.01")), nb)
+        for jour, client, type_facture, ttc, nb in rows
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_same_and_different_keys(db):
+    await _facture(db, "F1", "1000")
+    await _facture(db, "F2", "250.50")  # même clé : ON CONFLICT DO UPDATE
+    await _facture(db, "F3", "400", client_id=2)  # clé nouvelle : insertion
+    await _facture(db, "F4", "100", jour=LENDEMAIN)
+    assert await _agregats(db) == {
+        (JOUR, 1, "facture"): (Decimal("1250.50"), 2),
+        (JOUR, 2, "facture"): (Decimal("400.00"), 1),
+        (LENDEMAIN, 1, "facture"): (Decimal("100.00"), 1),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("changement", "attendu"),
+    [
+        ({"date_facture": LENDEMAIN}, {(JOUR, 1, "facture"): ("300.00", 1), (LENDEMAIN, 1, "facture"): ("1000.00", 1)}),
+        ({"client_id": 2}, {(JOUR, 1, "facture"): ("300.00", 1), (JOUR, 2, "facture"): ("1000.00", 1)}),
+        ({"type_facture": "avoir"}, {(JOUR, 1, "facture"): ("300.00", 1), (JOUR, 1, "avoir"): ("1000.00", 1)}),
+        ({"montant_ht": "1200.00", "montant_tva": "231.00", "montant_ttc": "1431.00"},
+         {(JOUR, 1, "facture"): ("1731.00", 2)}),
+    ],
+    ids=["date_facture", "client_id", "type_facture", "montants"],
+)
+async def test_update_moves_contribution(db, changement, attendu):
+    """L'ancien agrégat perd la facture, le nouveau la reçoit ; l'autre facture du jour reste en place."""
+    facture = await _facture(db, "F1", "1000")
+    await _facture(db, "F2", "300")
+    await FactureService(db).update(facture.id, _FactureUpdateAgregats(**changement))
+    assert await _agregats(db) == {k: (Decimal(ttc), nb) for k, (ttc, nb) in attendu.items()}
+
+
+@pytest.mark.asyncio
+async def test_update_other_fields_keeps_aggregates(db):
+    facture = await _facture(db, "F1", "1000")
+    avant = await _agregats(db)
+    await FactureService(db).update(facture.id, FactureUpdate(notes="relance", montant_restant_du=Decimal("0")))
+    assert await _agregats(db) == avant
+
+
+@pytest.mark.asyncio
+async def test_reconstruire_matches_incremental(db):
+    """Insertions, ON CONFLICT et déplacements incrémentaux = reconstruction complète depuis factures."""
+    f1 = await _facture(db, "F1", "1000")
+    await _facture(db, "F2", "500")
+    f3 = await _facture(db, "F3", "200", client_id=2)
+    await _facture(db, "F4", "80", jour=LENDEMAIN)
+    service = FactureService(db)
+    await service.update(f1.id, _FactureUpdateAgregats(date_facture=LENDEMAIN))  # ON CONFLICT sur F4
+    await service.update(f3.id, _FactureUpdateAgregats(client_id=1, montant_ttc=Decimal("250")))
+    incremental = await _agregats(db)
+
+    assert await VenteJournaliereRepository(db).reconstruire(1) == len(incremental)
+    assert await _agregats(db) == incremental
+
+
+@pytest.fixture
+def no_report_cache(monkeypatch):
+    """Séries recalculées à chaque appel (les bases des tests réutilisent les mêmes versions)."""
+    monkeypatch.setattr(report_cache, "_report_cache", ReportCache(ttl_seconds=0, max_entries=1))
+
+
+async def _serie(db: AsyncSession, debut: date, fin: date, granularite: str, *, n1: bool = True):
+    serie = await RapportsService(db).get_serie_chiffre_affaires(
+        1, debut, fin, granularite=granularite, comparer_annee_precedente=n1
+    )
+    return {p.periode_debut: (p.montant_ttc, p.montant_ttc_annee_precedente) for p in serie.points}
+
+
+@pytest.mark.asyncio
+async def test_serie_n1_fevrier_non_bissextile(db, no_report_cache):
+    """Février 2025 vs 2024 : le 29 février 2024 est compté au 28 février, dans la période."""
+    for numero, jour, ttc in (
+        ("B1", date(2024, 2, 28), "10"), ("B2", date(2024, 2, 29), "100"),
+        ("B3", date(2024, 3, 1), "1000"), ("B4", date(2025, 2, 28), "5"),
+    ):
+        await _facture(db, numero, ttc, jour=jour)
+    jours = await _serie(db, date(2025, 2, 1), date(2025, 2, 28), "jour")
+    assert jours == {date(2025, 2, 28): (Decimal("5"), Decimal("110"))}
+    mois = await _serie(db, date(2025, 2, 1), date(2025, 2, 28), "mois")
+    assert mois == {date(2025, 2, 1): (Decimal("5"), Decimal("110"))}
+
+
+@pytest.mark.asyncio
+async def test_serie_n1_debut_29_fevrier(db, no_report_cache):
+    """Période N ouverte au 29 février 2024 : le 28 février 2023 (ramené au 28 février 2024) est exclu."""
+    for numero, jour, ttc in (
+        ("C1", date(2023, 2, 28), "7"), ("C2", date(2023, 3, 1), "3"),
+        ("C3", date(2024, 2, 29), "100"), ("C4", date(2024, 3, 1), "1000"),
+    ):
+        await _facture(db, numero, ttc, jour=jour)
+    jours = await _serie(db, date(2024, 2, 29), date(2024, 3, 1), "jour")
+    assert jours == {
+        date(2024, 2, 29): (Decimal("100"), Decimal("0")),
+        date(2024, 3, 1): (Decimal("1000"), Decimal("3")),
+    }
+
+
+@pytest.mark.asyncio
+async def test_serie_semaine_et_trimestre(db, no_report_cache):
+    """Semaine ISO (lundi) et trimestre civil : début de pas et sommes par pas."""
+    for numero, jour, ttc in (
+        ("D1", date(2025, 3, 9), "1"), ("D2", date(2025, 3, 10), "10"),  # dimanche, lundi
+        ("D3", date(2025, 3, 31), "100"), ("D4", date(2025, 4, 1), "1000"),  # même semaine, trimestres différents
+    ):
+        await _facture(db, numero, ttc, jour=jour)
+    debut, fin = date(2025, 1, 1), date(2025, 6, 30)
+    assert await _serie(db, debut, fin, "semaine", n1=False) == {
+        date(2025, 3, 3): (Decimal("1"), Decimal("0")),
+        date(2025, 3, 10): (Decimal("10"), Decimal("0")),
+        date(2025, 3, 31): (Decimal("1100"), Decimal("0")),
+    }
+    assert await _serie(db, debut, fin, "trimestre", n1=False) == {
+        date(2025, 1, 1): (Decimal("111"), Decimal("0")),
+        date(2025, 4, 1): (Decimal("1000"), Decimal("0")),
+    }